@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+成就规则引擎 v1.0
+徽章和每日挑战都是"条件满足就发一次"的规则。原来每答一题都把所有徽章条件
+对整份学习数据跑一遍，徽章越多越慢。这里改成按依赖的计数器索引规则：
+- 每条规则声明自己依赖哪些计数器（星星、连对、学习天数、某模块答题……）
+- 数据变化时 touch 对应的计数器，只把订阅了它们的规则标记为待检查
+- collect 只检查待检查的规则，满足条件的规则返回并移除（只发一次）
+
+每题的检查量只和"这题改了哪些计数器、有几条规则订阅"有关，和徽章总数无关。
+没有声明依赖的规则订阅 ANY，任何变化都会检查（兼容旧写法，但会变慢）。
+
+使用方法：
+    rules = RuleEngine()
+    rules.add("ten_stars", lambda d: d["stars"] >= 10, watch=("stars",), payload=badge)
+    rules.touch("stars")
+    for rule_id, payload in rules.collect(data):
+        ...                                  # 发徽章
+"""
+
+from collections import defaultdict
+
+# 订阅所有变化
+ANY = "*"
+
+# 常用计数器名
+STARS = "stars"
+STREAK = "streak"
+DAYS_LEARNED = "days_learned"
+TODAY_QUESTIONS = "today_questions"
+TODAY_CORRECT = "today_correct"
+DAILY_TARGET = "daily_target"
+CHALLENGES = "challenges"
+FLAGS = "flags"
+EXPLORED_MODES = "explored_modes"
+CLOCK = "clock"
+
+
+def module_key(module):
+    """某个模块的答题计数器（正确/错误数、正确率）"""
+    return "module:" + module
+
+
+class RuleEngine:
+    """按依赖计数器索引的一次性规则集合"""
+
+    def __init__(self):
+        self._rules = {}                       # 规则ID -> (条件, 附带数据, 依赖, 序号)
+        self._watchers = defaultdict(set)      # 计数器 -> 规则ID集合
+        self._pending = set()                  # 待检查的规则ID
+        self._order = 0
+        self.evaluated = 0                     # 累计检查次数（统计用）
+
+    def add(self, rule_id, condition, watch=None, payload=None):
+        """添加规则；新规则先标记为待检查（数据可能早已满足条件）"""
+        self.remove(rule_id)
+        watch = tuple(watch) if watch else (ANY,)
+        self._order += 1
+        self._rules[rule_id] = (condition, payload, watch, self._order)
+        for key in watch:
+            self._watchers[key].add(rule_id)
+        self._pending.add(rule_id)
+
+    def remove(self, rule_id):
+        rule = self._rules.pop(rule_id, None)
+        if rule is None:
+            return False
+        for key in rule[2]:
+            watchers = self._watchers.get(key)
+            if watchers is not None:
+                watchers.discard(rule_id)
+                if not watchers:
+                    del self._watchers[key]
+        self._pending.discard(rule_id)
+        return True
+
+    def clear(self):
+        self._rules.clear()
+        self._watchers.clear()
+        self._pending.clear()
+
+    def touch(self, *keys):
+        """这些计数器变了：订阅它们的规则（和订阅 ANY 的规则）待检查"""
+        for key in keys:
+            watchers = self._watchers.get(key)
+            if watchers:
+                self._pending.update(watchers)
+        if keys and ANY in self._watchers:
+            self._pending.update(self._watchers[ANY])
+
+    def touch_all(self):
+        self._pending.update(self._rules)
+
+    def collect(self, data):
+        """检查待检查的规则，返回满足条件的 [(规则ID, 附带数据)]（按添加顺序）
+
+        满足的规则会被移除，条件出错的规则当作不满足。
+        """
+        if not self._pending:
+            return []
+        pending = sorted(self._pending, key=lambda rule_id: self._rules[rule_id][3])
+        self._pending.clear()
+        fired = []
+        for rule_id in pending:
+            condition, payload = self._rules[rule_id][:2]
+            self.evaluated += 1
+            try:
+                ok = condition(data)
+            except Exception:
+                ok = False
+            if ok:
+                fired.append((rule_id, payload))
+        for rule_id, _ in fired:
+            self.remove(rule_id)
+        return fired
+
+    def pending_count(self):
+        return len(self._pending)
+
+    def __contains__(self, rule_id):
+        return rule_id in self._rules
+
+    def __len__(self):
+        return len(self._rules)
+
+
+__all__ = [
+    'RuleEngine',
+    'module_key',
+    'ANY',
+    'STARS',
+    'STREAK',
+    'DAYS_LEARNED',
+    'TODAY_QUESTIONS',
+    'TODAY_CORRECT',
+    'DAILY_TARGET',
+    'CHALLENGES',
+    'FLAGS',
+    'EXPLORED_MODES',
+    'CLOCK',
+]
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+本地预生成音频索引 v1.0
+启动时扫描一次 audio/generated，之后查找都在内存字典里完成：
+- 按 (类型, 编码) 索引：char_4e00.mp3 -> ("char", "4e00")
+- 单字按编码精确匹配；词组、欢迎语等只按 manifest.json 记录的文字整句匹配，
+  没有清单时不匹配（交给 TTS），不再"同一个首字""含有欢迎二字"就播错的音频
+- 表扬/鼓励语按编号列出，随机挑选不再逐个 stat
+- 同时读取 audio/generated.pack 资源包，目录里的散文件优先
+
+使用方法：
+    from audio_index import get_audio_index
+
+    path = get_audio_index().find_text("大")
+    path = get_audio_index().random_clip("praise")
+"""
+
+import os
+import re
+import json
+import random
+import threading
+
+from audio_pack import open_pack
+
+MANIFEST_NAME = "manifest.json"
+
+# 生成脚本的默认语音和语速（清单里没有记录的文件按这个算）
+GENERATED_VOICE = "zh-CN-XiaoyiNeural"
+GENERATED_RATE = "+0%"
+AUDIO_EXTS = ('.mp3', '.wav', '.ogg')
+
+# 有编号的短语类型（praise_00.mp3 ...）
+NUMBERED_KINDS = ('praise', 'encourage', 'short_praise', 'short_encourage')
+
+# 按汉字编码命名的类型（char_4e00.mp3 ...）
+CODED_KINDS = ('char', 'pinyin', 'word')
+
+_FILE_RE = re.compile(r'^(short_praise|short_encourage|praise|encourage|char|pinyin|word)_([0-9a-f]+)$')
+
+
+def char_to_code(char):
+    """将汉字转换为Unicode编码字符串（十六进制）"""
+    return format(ord(char), 'x')
+
+
+class LocalAudioIndex:
+    """本地音频索引 - 只在构建/失效后扫描一次目录"""
+
+    def __init__(self, audio_dir=None):
+        self.audio_dir = audio_dir
+        self.pack = None          # AudioPack（没有资源包时为 None）
+        self._lock = threading.Lock()
+        self._index = None        # (kind, code) -> 文件名
+        self._loose = {}          # 文件名 -> 目录中的散文件路径
+        self._numbered = {}       # kind -> [文件名, ...]
+        self._texts = {}          # 清单记录的文字 -> 文件名
+        self._entries = {}        # 文件名 -> 清单记录（文字、语音、语速）
+
+    def invalidate(self, audio_dir=None):
+        """音频目录内容变化后调用，下次查找时重新扫描"""
+        with self._lock:
+            if audio_dir is not None:
+                self.audio_dir = audio_dir
+            self._index = None
+
+    def _ensure(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._build()
+        return self._index
+
+    def _build(self):
+        index = {}
+        numbered = {kind: [] for kind in NUMBERED_KINDS}
+        audio_dir = self.audio_dir
+        loose = {}
+        pack = None
+        if audio_dir:
+            try:
+                loose = {name: os.path.join(audio_dir, name) for name in os.listdir(audio_dir)}
+            except OSError:
+                loose = {}
+            pack = open_pack(audio_dir)
+        if self.pack is not None:
+            self.pack.close()
+
+        names = set(loose)
+        if pack is not None:
+            names.update(pack.names())
+
+        for name in sorted(names):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() not in AUDIO_EXTS:
+                continue
+            if stem == 'welcome':
+                index[('welcome', '')] = name
+                continue
+            m = _FILE_RE.match(stem)
+            if not m:
+                continue
+            kind, code = m.group(1), m.group(2)
+            index[(kind, code)] = name
+            if kind in numbered:
+                numbered[kind].append(name)
+
+        # 有清单时，按生成时的完整文字建立索引
+        texts = {}
+        entries = {}
+        manifest = self._read_manifest(loose, pack)
+        for name, entry in manifest.items():
+            if not isinstance(entry, dict) or name not in names:
+                continue
+            entries[name] = entry
+            text = entry.get('text', '')
+            if text and os.path.splitext(name)[1].lower() in AUDIO_EXTS:
+                texts.setdefault(text, name)
+
+        self.pack = pack
+        self._loose = loose
+        self._index = index
+        self._numbered = numbered
+        self._texts = texts
+        self._entries = entries
+
+    def _read_manifest(self, loose, pack):
+        """读取生成脚本写的清单（散文件优先，其次资源包）"""
+        try:
+            if MANIFEST_NAME in loose:
+                with open(loose[MANIFEST_NAME], 'r', encoding='utf-8') as f:
+                    return json.load(f).get('files', {})
+            if pack is not None and MANIFEST_NAME in pack:
+                return json.loads(pack.read(MANIFEST_NAME).decode('utf-8')).get('files', {})
+        except (OSError, ValueError) as e:
+            print(f"[audio_index] 读取清单失败: {e}")
+        return {}
+
+    def _resolve(self, name):
+        """文件名 -> 可播放的路径（资源包中的文件按需解出）"""
+        if name is None:
+            return None
+        path = self._loose.get(name)
+        if path is None and self.pack is not None:
+            path = self.pack.extract(name)
+        return path
+
+    def source(self, name):
+        """可交给 pygame 播放的来源：散文件返回路径，资源包中的返回只读文件对象（不解出）"""
+        self._ensure()
+        path = self._loose.get(name)
+        if path is not None:
+            return path
+        if self.pack is not None:
+            return self.pack.open(name)
+        return None
+
+    # ---------- 查找 ----------
+
+    def lookup_name(self, kind, code=''):
+        """按 (类型, 编码) 查找，返回文件名或 None"""
+        return self._ensure().get((kind, code))
+
+    def lookup(self, kind, code=''):
+        """按 (类型, 编码) 查找，返回路径或 None"""
+        return self._resolve(self.lookup_name(kind, code))
+
+    def find_char(self, char):
+        """单个汉字的读音"""
+        if len(char) != 1:
+            return None
+        return self.lookup('char', char_to_code(char))
+
+    def find_pinyin(self, char):
+        """汉字对应的拼音读音"""
+        if len(char) != 1:
+            return None
+        return self.lookup('pinyin', char_to_code(char))
+
+    def find_word(self, text):
+        """词组读音：只按清单记录的整个词匹配（没有清单时返回 None）"""
+        name = self.text_name(text)
+        return self._resolve(name) if name and name.startswith('word_') else None
+
+    def text_name(self, text):
+        """清单中文字正好是 text 的文件名"""
+        self._ensure()
+        return self._texts.get(text)
+
+    def same_voice(self, name, voice, rate=GENERATED_RATE):
+        """文件是不是用这个语音和语速生成的（清单里没有记录时按生成脚本默认值）"""
+        self._ensure()
+        entry = self._entries.get(name, {})
+        return (entry.get('voice', GENERATED_VOICE) == voice
+                and entry.get('rate', GENERATED_RATE) == rate)
+
+    def find_text_name(self, text):
+        """按文字精确查找本地音频，返回文件名
+
+        单字按编码查 char_ 文件；其他文字（词组、欢迎语、表扬语）
+        必须和清单记录的文字完全一样，找不到返回 None 交给 TTS。
+        """
+        if not text:
+            return None
+        if len(text) == 1:
+            name = self.lookup_name('char', char_to_code(text))
+            if name:
+                return name
+        return self.text_name(text)
+
+    def find_text(self, text):
+        """按文字查找合适的本地音频，返回路径"""
+        return self._resolve(self.find_text_name(text))
+
+    def path(self, name):
+        """文件名 -> 可播放的路径（资源包中的文件这时才解出）"""
+        self._ensure()
+        return self._resolve(name)
+
+    def clip_names(self, kind):
+        """某类有编号短语的全部文件名（不解出）"""
+        self._ensure()
+        return list(self._numbered.get(kind, ()))
+
+    def clips(self, kind):
+        """某类有编号短语的全部文件路径"""
+        self._ensure()
+        paths = (self._resolve(name) for name in self._numbered.get(kind, ()))
+        return [path for path in paths if path]
+
+    def random_clip(self, kind):
+        """随机挑选一个有编号的短语文件"""
+        self._ensure()
+        names = self._numbered.get(kind)
+        return self._resolve(random.choice(names)) if names else None
+
+    def count(self):
+        """索引中的文件数"""
+        return len(self._ensure())
+
+
+# 全局索引实例
+_audio_index = LocalAudioIndex()
+
+
+def get_audio_index():
+    """获取全局本地音频索引"""
+    return _audio_index
+
+
+def invalidate_audio_index(audio_dir=None):
+    """让全局索引失效（音频文件更新后调用）"""
+    _audio_index.invalidate(audio_dir)
+
+
+__all__ = [
+    'LocalAudioIndex',
+    'get_audio_index',
+    'invalidate_audio_index',
+    'char_to_code',
+    'GENERATED_VOICE',
+    'GENERATED_RATE',
+]
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+音频资源包 v1.0
+把 audio/generated 里几百个小 mp3 合成一个文件（audio/generated.pack）：
+- 打包/安装时只有一个文件，不用逐个处理
+- 文件头是索引：文件名 -> (偏移, 长度)
+- 运行时用 mmap 打开，按需取出片段，不用整个读进内存
+
+文件格式：
+    8 字节  魔数 b"LELEPAK1"
+    4 字节  索引长度 N（小端 uint32）
+    N 字节  索引 JSON {"version": 1, "entries": {文件名: [偏移, 长度]}}
+    之后    各文件内容依次排列（偏移从这里开始计算）
+
+打包：
+    python audio_pack.py                          # audio/generated -> audio/generated.pack
+    python audio_pack.py 目录 --output x.pack
+
+读取：
+    from audio_pack import AudioPack
+
+    pack = AudioPack("audio/generated.pack")
+    data = pack.view("char_4e00.mp3")     # memoryview，不复制
+    f = pack.open("char_4e00.mp3")        # 只读文件对象（pygame 可直接 load）
+    path = pack.extract("char_4e00.mp3")  # 需要文件路径时（kivy SoundLoader）
+"""
+
+import io
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+import threading
+
+# 尝试导入UI配置模块
+try:
+    from ui_config import get_data_path
+    UI_CONFIG_AVAILABLE = True
+except ImportError:
+    UI_CONFIG_AVAILABLE = False
+
+MAGIC = b"LELEPAK1"
+PACK_VERSION = 1
+PACK_EXT = ".pack"
+_HEAD = struct.Struct("<8sI")
+
+# 打包的文件类型（manifest.json 一起打包，词组索引需要它）
+PACK_EXTS = ('.mp3', '.wav', '.ogg', '.json')
+
+# 需要文件路径时，片段解出到这里
+if UI_CONFIG_AVAILABLE:
+    EXTRACT_DIR = get_data_path("audio_pack")
+else:
+    EXTRACT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "audio_pack")
+
+
+def pack_path_for(audio_dir):
+    """音频目录对应的资源包路径（audio/generated -> audio/generated.pack）"""
+    return os.path.normpath(audio_dir) + PACK_EXT
+
+
+class PackError(Exception):
+    """资源包格式错误"""
+    pass
+
+
+# ============================================================
+# 打包
+# ============================================================
+def build_pack(src_dir, pack_path=None):
+    """把目录中的音频打成一个资源包
+
+    Returns:
+        (资源包路径, 文件数)
+    """
+    pack_path = pack_path or pack_path_for(src_dir)
+    names = sorted(name for name in os.listdir(src_dir)
+                   if os.path.splitext(name)[1].lower() in PACK_EXTS)
+
+    entries = {}
+    offset = 0
+    for name in names:
+        size = os.path.getsize(os.path.join(src_dir, name))
+        entries[name] = [offset, size]
+        offset += size
+
+    header = json.dumps({"version": PACK_VERSION, "entries": entries},
+                        ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    temp_path = pack_path + ".tmp"
+    with open(temp_path, "wb") as out:
+        out.write(_HEAD.pack(MAGIC, len(header)))
+        out.write(header)
+        for name in names:
+            with open(os.path.join(src_dir, name), "rb") as f:
+                out.write(f.read())
+    os.replace(temp_path, pack_path)
+    return pack_path, len(names)
+
+
+# ============================================================
+# 读取
+# ============================================================
+class PackClip(io.RawIOBase):
+    """资源包中一个片段的只读文件对象（直接读 mmap，不复制整个片段）"""
+
+    def __init__(self, view):
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), len(self._view) - self._pos)
+        if n <= 0:
+            return 0
+        buffer[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+class AudioPack:
+    """mmap 方式打开的音频资源包"""
+
+    def __init__(self, pack_path, extract_dir=None):
+        self.pack_path = pack_path
+        self._lock = threading.Lock()
+        self._extracted = {}  # 文件名 -> 解出的路径
+
+        with open(pack_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, header_len = _HEAD.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise PackError(f"不是音频资源包: {pack_path}")
+            start = _HEAD.size
+            header = self._mm[start:start + header_len]
+            info = json.loads(header.decode("utf-8"))
+        except (struct.error, ValueError) as e:
+            self._mm.close()
+            raise PackError(f"资源包索引损坏: {pack_path}: {e}")
+        except PackError:
+            self._mm.close()
+            raise
+
+        self._data_start = start + header_len
+        self._entries = {name: tuple(pos) for name, pos in info.get("entries", {}).items()}
+        # 按索引内容区分不同版本的包，解出的文件不会混用
+        digest = hashlib.sha1(header).hexdigest()[:12]
+        self.extract_dir = os.path.join(extract_dir or EXTRACT_DIR, digest)
+
+    def names(self):
+        """包中所有文件名"""
+        return list(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def view(self, name):
+        """文件内容的 memoryview（不复制），不存在返回 None"""
+        pos = self._entries.get(name)
+        if pos is None:
+            return None
+        offset, length = pos
+        start = self._data_start + offset
+        return memoryview(self._mm)[start:start + length]
+
+    def read(self, name):
+        """文件内容（bytes）"""
+        data = self.view(name)
+        return None if data is None else bytes(data)
+
+    def open(self, name):
+        """只读文件对象，可交给 pygame.mixer.music.load"""
+        data = self.view(name)
+        return None if data is None else io.BufferedReader(PackClip(data))
+
+    def extract(self, name):
+        """解出到磁盘并返回路径（同一个文件只解一次）"""
+        with self._lock:
+            path = self._extracted.get(name)
+        if path:
+            return path
+        data = self.view(name)
+        if data is None:
+            return None
+        path = os.path.join(self.extract_dir, name)
+        try:
+            if not os.path.exists(path) or os.path.getsize(path) != len(data):
+                os.makedirs(self.extract_dir, exist_ok=True)
+                temp_path = f"{path}.tmp-{threading.get_ident()}"
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+        except OSError as e:
+            print(f"[audio_pack] 解出失败: {name}: {e}")
+            return None
+        with self._lock:
+            self._extracted[name] = path
+        return path
+
+    def close(self):
+        """关闭 mmap"""
+        try:
+            self._mm.close()
+        except BufferError:
+            # 还有 memoryview 在用，留给进程退出时释放
+            pass
+
+
+def open_pack(audio_dir):
+    """打开音频目录对应的资源包，没有或损坏时返回 None"""
+    pack_path = pack_path_for(audio_dir)
+    if not os.path.isfile(pack_path):
+        return None
+    try:
+        return AudioPack(pack_path)
+    except (OSError, PackError) as e:
+        print(f"[audio_pack] 打开资源包失败: {e}")
+        return None
+
+
+# ============================================================
+# 命令行
+# ============================================================
+def main(argv=None):
+    root = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="把预生成音频打成一个资源包")
+    parser.add_argument("src", nargs="?", default=os.path.join(root, "audio", "generated"),
+                        help="音频目录（默认 audio/generated）")
+    parser.add_argument("--output", help="输出文件（默认 <目录>.pack）")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.src):
+        print(f"目录不存在: {args.src}")
+        return 1
+
+    pack_path, count = build_pack(args.src, args.output)
+    if count == 0:
+        print(f"目录中没有音频文件: {args.src}")
+        return 1
+    total = sum(os.path.getsize(os.path.join(args.src, n)) for n in os.listdir(args.src)
+                if os.path.splitext(n)[1].lower() in PACK_EXTS)
+    print(f"已打包 {count} 个文件: {pack_path}")
+    print(f"原始大小: {total / 1024:.1f} KB, 资源包: {os.path.getsize(pack_path) / 1024:.1f} KB")
+    return 0
+
+
+__all__ = [
+    'AudioPack',
+    'PackClip',
+    'PackError',
+    'build_pack',
+    'open_pack',
+    'pack_path_for',
+    'EXTRACT_DIR',
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
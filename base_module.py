@@ -11,14 +11,14 @@
 import tkinter as tk
 from tkinter import messagebox
 import threading
-import asyncio
 import os
 import tempfile
-import uuid
 import time
 import atexit
 import logging
 
+import startup_profiler
+
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -27,14 +27,15 @@ logging.basicConfig(
 logger = logging.getLogger('LearningApp')
 
 # 导入依赖
-try:
-    import edge_tts
-    import pygame
-    pygame.mixer.init()
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
-    logger.warning("edge-tts 或 pygame 未安装，语音功能不可用")
+with startup_profiler.phase("audio_init"):
+    try:
+        import edge_tts
+        import pygame
+        pygame.mixer.init()
+        TTS_AVAILABLE = True
+    except ImportError:
+        TTS_AVAILABLE = False
+        logger.warning("edge-tts 或 pygame 未安装，语音功能不可用")
 
 try:
     from ui_config import UI, Colors, ScreenConfig, get_path, get_data_path, IS_MOBILE
@@ -49,6 +50,10 @@ try:
 except ImportError:
     VOICE_CONFIG_AVAILABLE = False
 
+from tts_service import get_tts_service
+from sound_pool import SoundPool, PygameSoundBackend
+from audio_index import LocalAudioIndex
+
 
 class TempFileManager:
     """临时文件管理器 - 确保临时文件被正确清理"""
@@ -127,9 +132,19 @@ class AudioManager:
         else:
             self.audio_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "audio")
         
+        # 预生成的字词读音（audio/generated 目录或 generated.pack 资源包）
+        self.local_audio = LocalAudioIndex(os.path.join(self.audio_dir, "generated"))
+        
         # 扫描预录音频
         self.praise_audios = self._scan_audio_folder("praise")
         self.encourage_audios = self._scan_audio_folder("encourage")
+        
+        # 表扬/鼓励音效池：每个文件只解码一次，后台预加载
+        self.sound_pool = SoundPool(PygameSoundBackend())
+        self.sound_pool.register("praise", self.praise_audios)
+        self.sound_pool.register("encourage", self.encourage_audios)
+        if TTS_AVAILABLE:
+            threading.Thread(target=self.sound_pool.preload, daemon=True).start()
     
     def _scan_audio_folder(self, folder_name):
         """扫描音频文件夹"""
@@ -156,53 +171,52 @@ class AudioManager:
         # 停止当前播放
         self._stop_current()
         
+        # 有完全对得上的预生成读音（同样的文字、语音、语速）就直接播放，
+        # 资源包中的片段不用解出到磁盘；对不上的交给 TTS
+        if lang == "cn":
+            name = self.local_audio.find_text_name(text)
+            if name and not self.local_audio.same_voice(name, self.voice, rate):
+                name = None
+            clip = self.local_audio.source(name) if name else None
+            if clip is not None:
+                threading.Thread(target=self._play_speech, args=(clip, current_id, callback),
+                                 daemon=True).start()
+                return
+        
         # 选择语音
         if lang == "en":
             voice = "en-US-AnaNeural"
         else:
             voice = self.voice
         
-        # 在新线程中播放
-        thread = threading.Thread(
-            target=self._speak_thread,
-            args=(text, rate, current_id, callback, voice),
-            daemon=True
+        # 交给常驻 TTS 服务生成，完成后在后台线程池中播放
+        get_tts_service().submit(
+            text, voice, rate, lang=lang,
+            on_ready=lambda path: self._play_speech(path, current_id, callback)
         )
-        thread.start()
-        thread.start()
     
-    def _speak_thread(self, text, rate, speech_id, callback=None, voice=None):
-        """语音播放线程"""
-        if voice is None:
-            voice = self.voice
-        audio_file = None
+    def prefetch(self, texts, rate="+0%", lang="cn"):
+        """预先生成接下来要朗读的文字，speak 时直接命中缓存"""
+        if not self.tts_available:
+            return
+        voice = "en-US-AnaNeural" if lang == "en" else self.voice
+        get_tts_service().prefetch(texts, voice, rate, lang)
+    
+    def cancel_prefetch(self):
+        """取消尚未完成的预取"""
+        get_tts_service().cancel_prefetch()
+    
+    def _play_speech(self, audio_file, speech_id, callback=None):
+        """播放生成好的语音（在 TTS 服务的线程池中执行）
+        
+        audio_file 可以是文件路径，也可以是已打开的文件对象
+        """
         try:
             # 检查是否被取消
             with self.speech_lock:
                 if speech_id != self.speech_id:
                     return
             
-            # 生成音频文件
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            temp_manager.register(audio_file)
-            
-            # 异步生成语音
-            async def generate():
-                communicate = edge_tts.Communicate(text, voice, rate=rate)
-                await communicate.save(audio_file)
-            
-            asyncio.run(generate())
-            
-            # 再次检查是否被取消
-            with self.speech_lock:
-                if speech_id != self.speech_id:
-                    return
-            
-            # 检查文件是否生成成功
-            if not os.path.exists(audio_file):
-                logger.error(f"音频文件生成失败: {audio_file}")
-                return
-            
             # 播放音频
             self._stop_current()
             pygame.mixer.music.load(audio_file)
@@ -222,11 +236,6 @@ class AudioManager:
                 
         except Exception as e:
             logger.error(f"语音播放错误: {e}")
-        finally:
-            # 清理临时文件
-            if audio_file:
-                time.sleep(0.1)  # 等待文件释放
-                temp_manager.unregister(audio_file)
     
     def _stop_current(self):
         """停止当前播放"""
@@ -239,6 +248,8 @@ class AudioManager:
     def play_praise(self):
         """播放表扬语"""
         import random
+        if self._play_feedback("praise"):
+            return
         if self.praise_audios:
             self._play_audio_file(random.choice(self.praise_audios))
         else:
@@ -247,11 +258,24 @@ class AudioManager:
     def play_encourage(self):
         """播放鼓励语"""
         import random
+        if self._play_feedback("encourage"):
+            return
         if self.encourage_audios:
             self._play_audio_file(random.choice(self.encourage_audios))
         else:
             self.speak(random.choice(self.encourages), "+0%")
     
+    def _play_feedback(self, group):
+        """从音效池播放预录音频（已解码，几乎没有延迟）"""
+        if not self.tts_available or not self.sound_pool.has(group):
+            return False
+        try:
+            self._stop_current()
+            return self.sound_pool.play_random(group)
+        except Exception as e:
+            logger.error(f"播放音效失败: {e}")
+            return False
+    
     def _play_audio_file(self, filepath):
         """播放音频文件"""
         def _play():
@@ -268,7 +292,10 @@ class AudioManager:
         """停止所有音频"""
         with self.speech_lock:
             self.speech_id += 1
+        get_tts_service().cancel()
+        get_tts_service().cancel_prefetch()
         self._stop_current()
+        self.sound_pool.stop_all()
 
 
 class BaseGameModule:
@@ -452,6 +479,9 @@ class BaseGameModule:
                 pass
         self.pending_timers.clear()
         
+        # 离开当前游戏，取消预取
+        self.audio.cancel_prefetch()
+        
         # 清空窗口
         for widget in self.window.winfo_children():
             widget.destroy()
@@ -485,6 +515,8 @@ class BaseGameModule:
     def run(self):
         """运行应用"""
         self.create_main_menu()
+        # 进入主循环后第一次空闲时窗口已画好，记为首帧
+        self.window.after_idle(startup_profiler.first_frame)
         self.window.mainloop()
 
 
@@ -22,6 +22,15 @@ def build():
         subprocess.run(["pip", "install", "pyinstaller"], check=True)
         print("✓ PyInstaller 安装完成")
     
+    # 检查 Pillow（sprite_cache 需要，没有时打出来的程序绘图不缓存）
+    try:
+        import PIL
+        print("✓ Pillow 已安装")
+    except ImportError:
+        print("✗ Pillow 未安装，正在安装...")
+        subprocess.run(["pip", "install", "pillow"], check=True)
+        print("✓ Pillow 安装完成")
+    
     # 打包命令
     cmd = [
         "pyinstaller",
@@ -29,10 +38,26 @@ def build():
         "--windowed",          # 无控制台窗口
         "--name", "乐乐学习乐园",
         "--add-data", "voice_config_shared.py;.",
+        "--add-data", "config_manager.py;.",
         "--add-data", "learning_data.py;.",
+        "--add-data", "data_journal.py;.",
+        "--add-data", "progress_store.py;.",
+        "--add-data", "review_scheduler.py;.",
+        "--add-data", "achievement_rules.py;.",
+        "--add-data", "rolling_stats.py;.",
         "--add-data", "learning_base.py;.",
+        "--add-data", "tts_cache.py;.",
+        "--add-data", "tts_service.py;.",
+        "--add-data", "audio_index.py;.",
+        "--add-data", "sound_pool.py;.",
+        "--add-data", "audio_pack.py;.",
+        "--add-data", "startup_profiler.py;.",
         "--add-data", "word_database.py;.",
         "--add-data", "drawing_utils.py;.",
+        "--add-data", "canvas_scene.py;.",
+        "--add-data", "game_loop.py;.",
+        "--add-data", "sprite_cache.py;.",
+        "--add-data", "core;core",
         "--add-data", "kids_game_v3.py;.",
         "--add-data", "kids_pinyin.py;.",
         "--add-data", "kids_math.py;.",
@@ -42,6 +67,7 @@ def build():
         "--hidden-import", "edge_tts",
         "--hidden-import", "pygame",
         "--hidden-import", "pypinyin",
+        "--hidden-import", "PIL.ImageTk",   # sprite_cache 把狗狗/车辆绘图光栅化成图片
         "--clean",
         "kids_learning_main.py"
     ]
@@ -4,8 +4,9 @@ package.name = lelehanzi
 package.domain = com.lele
 
 source.dir = .
-source.include_exts = py,png,jpg,jpeg,kv,atlas,json,ttc,ttf,mp3
-source.include_patterns = 汪汪队图片/*,core/*,ui_kivy/*,audio/generated/*,stroke_data/*
+source.include_exts = py,png,jpg,jpeg,kv,atlas,json,ttc,ttf,mp3,pack
+# 预生成音频打成一个资源包（python audio_pack.py），不再逐个打包几百个 mp3
+source.include_patterns = 汪汪队图片/*,core/*,ui_kivy/*,audio/generated.pack,stroke_data/*
 source.exclude_patterns = backup_*,build,dist,__pycache__,.git,.github,*.pyc,*.pyo
 source.main = main.py
 
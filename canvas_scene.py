@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Canvas 保留模式场景 v1.0
+小游戏以前每一帧 canvas.delete("all") 再把赛道、障碍物、车子、文字全部重画，
+画面越复杂越卡。这里让画布上的图形一直保留，每帧只改变动的部分：
+- layer：静态背景（赛道、天空、铁轨），只在参数变化（如窗口缩放）时重画
+- sprite：一组图形（赛车、小鸟、金币），位置变了用 canvas.move 整体平移，
+          外观参数变了才删掉重画
+- item：单个图形（分数文字、燃料条），只改变化了的坐标和属性
+- 每帧 begin_frame() / end_frame()，这一帧没有再出现的图形自动删除
+- z 值决定前后顺序，新建的图形会插到正确的层次，不会盖住前面的东西
+
+原来的绘图函数 draw_xxx(canvas, x, y, ...) 不用改，场景会给它创建的
+每个图形自动加上标签。
+
+使用方法：
+    scene = CanvasScene(canvas)
+
+    def loop():
+        scene.begin_frame()
+        cw, ch = scene.size()
+        scene.layer("track", draw_track, cw, ch)                  # 只画一次
+        for obs in obstacles:
+            scene.sprite(("obs", id(obs)), draw_obstacle, obs["x"], obs["y"], z=2)
+        scene.sprite("car", draw_car, car_x, car_y, 1.0, "#FF0000", z=3)
+        scene.item("hud", "text", (cx, 30), z=9, text=f"距离: {d}m", fill="white")
+        scene.end_frame()                                         # 删掉消失的障碍物
+"""
+
+import tkinter as tk
+
+# 场景使用的标签前缀（不和游戏自己的标签冲突）
+TAG_PREFIX = "scene_"
+
+
+class TaggedCanvas:
+    """包装 Canvas：所有 create_xxx 创建的图形都加上指定标签"""
+
+    def __init__(self, canvas, tag):
+        self._canvas = canvas
+        self._tag = tag
+
+    def __getattr__(self, name):
+        attr = getattr(self._canvas, name)
+        if not name.startswith("create_"):
+            return attr
+
+        def create(*args, **kwargs):
+            tags = kwargs.get("tags", ())
+            if isinstance(tags, str):
+                tags = (tags,) if tags else ()
+            kwargs["tags"] = tuple(tags) + (self._tag,)
+            return attr(*args, **kwargs)
+        return create
+
+
+class Sprite:
+    """场景中保留的一组图形"""
+
+    __slots__ = ("name", "tag", "x", "y", "z", "signature", "frame")
+
+    def __init__(self, name, tag, x, y, z, signature):
+        self.name = name
+        self.tag = tag
+        self.x = x
+        self.y = y
+        self.z = z
+        self.signature = signature
+        self.frame = 0
+
+
+class CanvasScene:
+    """tk.Canvas 上的保留模式场景
+
+    Args:
+        canvas: tk.Canvas
+        fallback_size: 画布还没显示（宽度很小）时使用的尺寸
+    """
+
+    def __init__(self, canvas, fallback_size=(900, 550)):
+        self.canvas = canvas
+        self.fallback_size = fallback_size
+        self._sprites = {}       # 名字 -> Sprite
+        self._items = {}         # 名字 -> [图形 id, z, 坐标, 属性, 帧号]
+        self._z_counts = {}      # z -> 该层的元素数
+        self._next_id = 0
+        self._frame = 0
+        # 最近一帧的画布操作数（新建 / 移动 / 修改 / 删除），用来观察每帧开销
+        self.stats = {"created": 0, "moved": 0, "changed": 0, "deleted": 0}
+
+    # ---------- 帧 ----------
+
+    def begin_frame(self):
+        self._frame += 1
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def end_frame(self):
+        """删除这一帧没有再画的 sprite 和 item"""
+        frame = self._frame
+        for name in [n for n, s in self._sprites.items() if s.frame != frame]:
+            self.remove(name)
+        for name in [n for n, i in self._items.items() if i[4] != frame]:
+            self.remove(name)
+
+    def size(self):
+        """画布当前尺寸（还没显示时用 fallback_size）"""
+        cw = self.canvas.winfo_width()
+        ch = self.canvas.winfo_height()
+        if cw < 100:
+            return self.fallback_size
+        return cw, ch
+
+    # ---------- 图形 ----------
+
+    def layer(self, name, draw, *args, z=0, **kwargs):
+        """静态背景：draw(canvas, *args, **kwargs) 只在参数变化时重画"""
+        return self._retain(name, lambda c: draw(c, *args, **kwargs),
+                            (draw, args, tuple(sorted(kwargs.items()))), 0, 0, z)
+
+    def sprite(self, name, draw, x, y, *args, z=1, key=None, **kwargs):
+        """一组会移动的图形：draw(canvas, x, y, *args, **kwargs)
+
+        位置变化时整体平移；args/kwargs/key 变化时重画（key 用来表达
+        参数里看不出来的外观变化，例如翅膀上下、火焰闪烁）。
+        """
+        return self._retain(name, lambda c: draw(c, x, y, *args, **kwargs),
+                            (draw, args, tuple(sorted(kwargs.items())), key), x, y, z)
+
+    def item(self, name, kind, coords, z=1, **options):
+        """单个图形（kind 为 "text"、"rectangle"、"oval"、"line"、"polygon" 等）"""
+        coords = tuple(coords)
+        entry = self._items.get(name)
+        if entry is None:
+            tag = self._new_tag()
+            item_id = getattr(self.canvas, "create_" + kind)(
+                *coords, tags=(tag, self._z_tag(z)), **options)
+            self._items[name] = [item_id, z, coords, dict(options), self._frame]
+            self._add_z(z, tag)
+            self.stats["created"] += 1
+            return item_id
+
+        item_id, _, old_coords, old_options, _ = entry
+        entry[4] = self._frame
+        if coords != old_coords:
+            self.canvas.coords(item_id, *coords)
+            entry[2] = coords
+            self.stats["moved"] += 1
+        changed = {k: v for k, v in options.items() if old_options.get(k) != v}
+        if changed:
+            self.canvas.itemconfigure(item_id, **changed)
+            old_options.update(changed)
+            self.stats["changed"] += 1
+        return item_id
+
+    def remove(self, name):
+        """删除一个 sprite 或 item"""
+        sprite = self._sprites.pop(name, None)
+        if sprite is not None:
+            self.canvas.delete(sprite.tag)
+            self._z_counts[sprite.z] -= 1
+            self.stats["deleted"] += 1
+        entry = self._items.pop(name, None)
+        if entry is not None:
+            self.canvas.delete(entry[0])
+            self._z_counts[entry[1]] -= 1
+            self.stats["deleted"] += 1
+
+    def clear(self):
+        """删除场景中的全部图形"""
+        for name in list(self._sprites) + list(self._items):
+            self.remove(name)
+
+    def __contains__(self, name):
+        return name in self._sprites or name in self._items
+
+    def __len__(self):
+        return len(self._sprites) + len(self._items)
+
+    # ---------- 内部 ----------
+
+    def _retain(self, name, draw_call, signature, x, y, z):
+        sprite = self._sprites.get(name)
+        if sprite is not None and sprite.signature == signature and sprite.z == z:
+            sprite.frame = self._frame
+            dx, dy = x - sprite.x, y - sprite.y
+            if dx or dy:
+                self.canvas.move(sprite.tag, dx, dy)
+                sprite.x, sprite.y = x, y
+                self.stats["moved"] += 1
+            return sprite
+
+        if sprite is not None:
+            self.remove(name)
+        tag = self._new_tag()
+        draw_call(TaggedCanvas(self.canvas, tag))
+        self.canvas.addtag_withtag(self._z_tag(z), tag)
+        sprite = Sprite(name, tag, x, y, z, signature)
+        sprite.frame = self._frame
+        self._sprites[name] = sprite
+        self._add_z(z, tag)
+        self.stats["created"] += 1
+        return sprite
+
+    def _new_tag(self):
+        self._next_id += 1
+        return f"{TAG_PREFIX}{self._next_id}"
+
+    @staticmethod
+    def _z_tag(z):
+        return f"{TAG_PREFIX}z{z}"
+
+    def _add_z(self, z, tag):
+        """新建的图形在最上面，把它移到比它 z 大的图形下面"""
+        self._z_counts[z] = self._z_counts.get(z, 0) + 1
+        above = [level for level, count in self._z_counts.items() if level > z and count > 0]
+        if above:
+            try:
+                self.canvas.tag_lower(tag, self._z_tag(min(above)))
+            except tk.TclError:
+                # 上面那层只有空的 sprite（没有画出任何图形）
+                pass
+
+
+__all__ = ['CanvasScene', 'Sprite', 'TaggedCanvas']
@@ -1,13 +1,33 @@
 # -*- coding: utf-8 -*-
 """
-配置管理模块 v1.0
+配置管理模块 v1.1
 统一管理所有配置文件
+优化：每个配置是一份只读快照，改配置时整份换掉，读配置不加锁、不复制
+优化：修复 set() 在持锁时调用 load() 导致的死锁（锁不可重入）
+优化：set() 只标记修改，用 BatchSaver 合并保存；写文件改为临时文件 + 原子替换，
+      备份每次运行只做一次（原来每次 set 都备份、写入、读回校验、改名）
+新增：subscribe() 订阅配置变化，主题、语音、音效设置改了直接推给监听者，不用轮询
+
+使用方法：
+    from config_manager import config_manager, subscribe
+
+    config_manager.get("sound", "volume", 0.8)        # 不加锁、不复制
+    config_manager.set("sound", "volume", 0.5)        # 通知监听者，稍后合并保存
+    config_manager.update("sound", {"sound_enabled": False, "volume": 0.3})
+    snap = config_manager.snapshot("theme")           # 只读快照
+
+    def on_voice(name, changes, snapshot):
+        print(name, changes)                          # {"style": "温柔姐姐"}
+    unsubscribe = subscribe("voice", on_voice)
+
+    config_manager.save_all()                         # 立即写入所有修改（退出时自动调用）
 """
 
 import os
 import json
 import threading
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 
 try:
     from ui_config import get_data_path, get_path
@@ -15,13 +35,35 @@ try:
 except ImportError:
     UI_CONFIG_AVAILABLE = False
 
+# 尝试导入BatchSaver
+try:
+    from learning_base import BatchSaver
+    BATCH_SAVER_AVAILABLE = True
+except ImportError:
+    BATCH_SAVER_AVAILABLE = False
+
+
+# 监听者：callback(配置名, 改动的键值, 改动后的快照)
+Listener = Callable[[str, Dict[str, Any], Mapping[str, Any]], None]
+
+# 订阅所有配置时用的配置名
+ALL_CONFIGS = "*"
+
+_MISSING = object()
+
 
 class ConfigManager:
-    """统一配置管理器 - 线程安全的单例"""
-    
+    """统一配置管理器 - 线程安全的单例
+
+    读：self._snapshots[name] 是 MappingProxyType，发布后不再修改，
+        读的时候直接取引用（字典取值在 GIL 下是原子的），不用锁。
+    写：持 _config_lock 复制一份、改好、换掉快照，标记为待保存；
+        监听者在锁外通知，回调里再读写配置不会死锁。
+    """
+
     _instance = None
     _lock = threading.Lock()
-    
+
     # 配置文件定义
     CONFIG_FILES = {
         "voice": "voice_config.json",
@@ -30,7 +72,7 @@ class ConfigManager:
         "mastery": "char_mastery.json",
         "progress": "learning_progress.json",
     }
-    
+
     # 默认配置
     DEFAULT_CONFIGS = {
         "voice": {"style": "汪汪队风格"},
@@ -38,7 +80,10 @@ class ConfigManager:
         "sound": {"sound_enabled": True, "music_enabled": False, "volume": 0.8},
         "mastery": {},
     }
-    
+
+    # 合并保存的间隔（秒）：这段时间内的多次 set 只写一次文件
+    SAVE_INTERVAL = 1.0
+
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -46,55 +91,92 @@ class ConfigManager:
                     cls._instance = super().__new__(cls)
                     cls._instance._initialized = False
         return cls._instance
-    
+
     def __init__(self):
         if self._initialized:
             return
         self._initialized = True
-        self._configs: Dict[str, Dict] = {}
-        self._dirty: Dict[str, bool] = {}
+        self._snapshots: Dict[str, Mapping[str, Any]] = {}
+        self._dirty = set()
         self._config_lock = threading.Lock()
-        
-        # 确定配置目录
-        if UI_CONFIG_AVAILABLE:
-            self._config_dir = get_path()
+        self._io_lock = threading.Lock()       # 同一时间只有一个线程写文件
+        self._backed_up = set()                # 本次运行已经备份过的配置
+        self._retry_timer = None               # 写入失败后的重试
+        self._listeners: Dict[str, tuple] = {}
+
+        # 确定配置目录（未使用 ui_config 时）
+        self._config_dir = os.path.dirname(os.path.abspath(__file__))
+
+        # 合并保存
+        if BATCH_SAVER_AVAILABLE:
+            self._batch_saver = BatchSaver(self._save_dirty, interval_seconds=self.SAVE_INTERVAL)
         else:
-            self._config_dir = os.path.dirname(os.path.abspath(__file__))
-    
+            self._batch_saver = None
+
     def _get_config_path(self, config_name: str) -> str:
-        """获取配置文件路径"""
+        """获取配置文件路径（和各模块用同一个用户数据目录）"""
         filename = self.CONFIG_FILES.get(config_name, f"{config_name}.json")
+        if UI_CONFIG_AVAILABLE:
+            return get_data_path(filename)
         return os.path.join(self._config_dir, filename)
-    
+
+    # =====================================================
+    # 读取
+    # =====================================================
+
+    def snapshot(self, config_name: str) -> Mapping[str, Any]:
+        """获取配置的只读快照（不复制；之后的修改不会影响已取到的快照）"""
+        snap = self._snapshots.get(config_name)
+        if snap is None:
+            with self._config_lock:
+                snap = self._load_locked(config_name)
+        return snap
+
     def load(self, config_name: str) -> Dict:
         """加载配置
-        
+
         Args:
             config_name: 配置名称 (voice, theme, sound, mastery, progress)
-        
+
         Returns:
-            配置字典
+            配置字典（副本，可以随意修改；只读时用 snapshot() 更省）
         """
-        with self._config_lock:
-            # 如果已加载，直接返回
-            if config_name in self._configs:
-                return self._configs[config_name].copy()
-            
-            # 从文件加载
-            config_path = self._get_config_path(config_name)
-            config = self._load_from_file(config_path)
-            
-            # 合并默认值
-            if config_name in self.DEFAULT_CONFIGS:
-                default = self.DEFAULT_CONFIGS[config_name].copy()
-                default.update(config)
-                config = default
-            
-            self._configs[config_name] = config
-            self._dirty[config_name] = False
-            
-            return config.copy()
-    
+        return dict(self.snapshot(config_name))
+
+    def get(self, config_name: str, key: str, default: Any = None) -> Any:
+        """获取配置项（不加锁、不复制）
+
+        Args:
+            config_name: 配置名称
+            key: 配置键
+            default: 默认值
+
+        Returns:
+            配置值
+        """
+        return self.snapshot(config_name).get(key, default)
+
+    def _load_locked(self, config_name: str) -> Mapping[str, Any]:
+        """读文件并发布快照（调用方持有 _config_lock）"""
+        snap = self._snapshots.get(config_name)
+        if snap is not None:
+            return snap
+        config = self._read_config(config_name)
+        snap = MappingProxyType(config)
+        self._snapshots[config_name] = snap
+        return snap
+
+    def _read_config(self, config_name: str) -> Dict:
+        """从文件读配置并合并默认值"""
+        config = self._load_from_file(self._get_config_path(config_name))
+        if not isinstance(config, dict):
+            config = {}
+        if config_name in self.DEFAULT_CONFIGS:
+            merged = dict(self.DEFAULT_CONFIGS[config_name])
+            merged.update(config)
+            config = merged
+        return config
+
     def _load_from_file(self, filepath: str) -> Dict:
         """从文件加载配置"""
         try:
@@ -113,116 +195,236 @@ class ConfigManager:
                     pass
         except Exception as e:
             print(f"加载配置失败: {filepath}, {e}")
-        
+
         return {}
-    
+
+    # =====================================================
+    # 修改
+    # =====================================================
+
+    def set(self, config_name: str, key: str, value: Any, auto_save: bool = True) -> None:
+        """设置配置项
+
+        Args:
+            config_name: 配置名称
+            key: 配置键
+            value: 配置值
+            auto_save: 是否自动保存（合并保存，不是每次都写文件）
+        """
+        self.update(config_name, {key: value}, auto_save)
+
+    def update(self, config_name: str, values: Dict[str, Any], auto_save: bool = True) -> Dict[str, Any]:
+        """一次改多个配置项，只换一次快照、只通知一次
+
+        Returns:
+            实际变化了的键值（值没变的不算）
+        """
+        with self._config_lock:
+            old = self._load_locked(config_name)
+            changes = {k: v for k, v in values.items() if old.get(k, _MISSING) != v}
+            if not changes:
+                return {}
+            config = dict(old)
+            config.update(changes)
+            snap = MappingProxyType(config)
+            self._snapshots[config_name] = snap
+            self._dirty.add(config_name)
+
+        self._notify(config_name, changes, snap)
+        if auto_save:
+            self._schedule_save(config_name)
+        return changes
+
+    def reload(self, config_name: str) -> Dict:
+        """重新加载配置（文件被别处改了），变化了的键通知监听者"""
+        with self._config_lock:
+            old = self._snapshots.get(config_name)
+            snap = MappingProxyType(self._read_config(config_name))
+            self._snapshots[config_name] = snap
+            self._dirty.discard(config_name)
+
+        if old is not None:
+            changes = _diff(old, snap)
+            if changes:
+                self._notify(config_name, changes, snap)
+        return dict(snap)
+
+    # =====================================================
+    # 保存
+    # =====================================================
+
     def save(self, config_name: str, config: Optional[Dict] = None) -> bool:
-        """保存配置
-        
+        """立即保存配置
+
         Args:
             config_name: 配置名称
             config: 要保存的配置（如果为None，保存缓存的配置）
-        
+
         Returns:
             是否保存成功
         """
+        changes = None
         with self._config_lock:
+            old = self._snapshots.get(config_name)
             if config is not None:
-                self._configs[config_name] = config.copy()
-            
-            if config_name not in self._configs:
+                snap = MappingProxyType(dict(config))
+                self._snapshots[config_name] = snap
+                changes = _diff(old or {}, snap)
+            elif old is None:
                 return False
-            
-            config_path = self._get_config_path(config_name)
-            return self._save_to_file(config_path, self._configs[config_name])
-    
-    def _save_to_file(self, filepath: str, config: Dict) -> bool:
-        """保存配置到文件（带备份）"""
+            else:
+                snap = old
+            self._dirty.discard(config_name)
+
+        if changes:
+            self._notify(config_name, changes, snap)
+        return self._write(config_name, snap)
+
+    def save_all(self) -> None:
+        """保存所有已修改的配置"""
+        if self._batch_saver:
+            self._batch_saver.force_save()
+        self._save_dirty()
+
+    def flush(self) -> None:
+        """立即写入所有待保存的修改（同 save_all）"""
+        self.save_all()
+
+    def has_pending_save(self, config_name: Optional[str] = None) -> bool:
+        """是否还有没写入文件的修改"""
+        with self._config_lock:
+            return bool(self._dirty) if config_name is None else config_name in self._dirty
+
+    def _schedule_save(self, config_name: str) -> None:
+        if self._batch_saver:
+            self._batch_saver.mark_dirty()
+        else:
+            self._save_dirty()
+
+    def _save_dirty(self) -> None:
+        """把所有待保存的配置写入文件（BatchSaver 回调）"""
+        with self._config_lock:
+            pending = [(name, self._snapshots[name]) for name in self._dirty]
+            self._dirty.clear()
+
+        failed = False
+        for config_name, snap in pending:
+            if not self._write(config_name, snap):
+                with self._config_lock:
+                    self._dirty.add(config_name)
+                failed = True
+        if failed:
+            self._schedule_retry()
+
+    def _schedule_retry(self) -> None:
+        """写入失败：过一个保存间隔再试
+
+        这里可能在 BatchSaver 的回调里（持有它的锁），不能直接 mark_dirty，
+        所以另起一个定时器。
+        """
+        with self._config_lock:
+            if self._retry_timer is not None:
+                return
+            self._retry_timer = threading.Timer(self.SAVE_INTERVAL, self._retry_save)
+            self._retry_timer.daemon = True
+            self._retry_timer.start()
+
+    def _retry_save(self) -> None:
+        with self._config_lock:
+            self._retry_timer = None
+            if not self._dirty:
+                return
+        if self._batch_saver:
+            self._batch_saver.mark_dirty()
+        else:
+            self._save_dirty()
+
+    def _write(self, config_name: str, snap: Mapping[str, Any]) -> bool:
+        with self._io_lock:
+            # 写文件期间配置又被改了：这份已经过时，等下一次保存
+            if self._snapshots.get(config_name) is not snap:
+                return True
+            backup = config_name not in self._backed_up
+            ok = self._save_to_file(self._get_config_path(config_name), dict(snap), backup)
+            if ok and backup:
+                self._backed_up.add(config_name)
+            return ok
+
+    def _save_to_file(self, filepath: str, config: Dict, backup: bool = True) -> bool:
+        """保存配置到文件（临时文件 + 原子替换，backup 时先备份原文件）"""
         try:
-            # 创建备份
-            if os.path.exists(filepath):
-                backup_path = filepath + ".bak"
+            if backup and os.path.exists(filepath):
                 try:
                     import shutil
-                    shutil.copy2(filepath, backup_path)
+                    shutil.copy2(filepath, filepath + ".bak")
                 except:
                     pass
-            
-            # 写入临时文件
+
             temp_path = filepath + ".tmp"
             with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, ensure_ascii=False, indent=2)
-            
-            # 验证
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                json.load(f)
-            
-            # 替换原文件
-            if os.path.exists(filepath):
-                os.remove(filepath)
-            os.rename(temp_path, filepath)
-            
+            os.replace(temp_path, filepath)
             return True
         except Exception as e:
             print(f"保存配置失败: {filepath}, {e}")
             return False
-    
-    def get(self, config_name: str, key: str, default: Any = None) -> Any:
-        """获取配置项
-        
+
+    # =====================================================
+    # 订阅
+    # =====================================================
+
+    def subscribe(self, config_name: str, callback: Listener) -> Callable[[], None]:
+        """订阅配置变化
+
         Args:
-            config_name: 配置名称
-            key: 配置键
-            default: 默认值
-        
+            config_name: 配置名称（ALL_CONFIGS 表示所有配置）
+            callback: callback(配置名, 改动的键值, 改动后的快照)，在改配置的线程里调用
+
         Returns:
-            配置值
-        """
-        config = self.load(config_name)
-        return config.get(key, default)
-    
-    def set(self, config_name: str, key: str, value: Any, auto_save: bool = True) -> None:
-        """设置配置项
-        
-        Args:
-            config_name: 配置名称
-            key: 配置键
-            value: 配置值
-            auto_save: 是否自动保存
+            取消订阅的函数
         """
         with self._config_lock:
-            if config_name not in self._configs:
-                self.load(config_name)
-            
-            self._configs[config_name][key] = value
-            self._dirty[config_name] = True
-        
-        if auto_save:
-            self.save(config_name)
-    
-    def save_all(self) -> None:
-        """保存所有已修改的配置"""
-        with self._config_lock:
-            dirty_configs = [name for name, is_dirty in self._dirty.items() if is_dirty]
-        
-        for config_name in dirty_configs:
-            self.save(config_name)
-    
-    def reload(self, config_name: str) -> Dict:
-        """重新加载配置"""
-        with self._config_lock:
-            if config_name in self._configs:
-                del self._configs[config_name]
-            if config_name in self._dirty:
-                del self._dirty[config_name]
-        
-        return self.load(config_name)
+            self._listeners[config_name] = self._listeners.get(config_name, ()) + (callback,)
+
+        def unsubscribe():
+            with self._config_lock:
+                listeners = list(self._listeners.get(config_name, ()))
+                if callback in listeners:
+                    listeners.remove(callback)
+                if listeners:
+                    self._listeners[config_name] = tuple(listeners)
+                else:
+                    self._listeners.pop(config_name, None)
+
+        return unsubscribe
+
+    def _notify(self, config_name: str, changes: Dict[str, Any], snap: Mapping[str, Any]) -> None:
+        listeners = self._listeners.get(config_name, ()) + self._listeners.get(ALL_CONFIGS, ())
+        for callback in listeners:
+            try:
+                callback(config_name, changes, snap)
+            except Exception as e:
+                print(f"配置监听回调出错: {config_name}, {e}")
+
+
+def _diff(old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[str, Any]:
+    """new 相对 old 变化了的键值（删掉的键值为 None）"""
+    changes = {k: v for k, v in new.items() if old.get(k, _MISSING) != v}
+    for k in old:
+        if k not in new:
+            changes[k] = None
+    return changes
 
 
 # 全局配置管理器实例
 config_manager = ConfigManager()
 
 
+def get_config_manager() -> ConfigManager:
+    """获取配置管理器实例"""
+    return config_manager
+
+
 # 便捷函数
 def get_config(config_name: str) -> Dict:
     """获取配置"""
@@ -240,13 +442,20 @@ def set_setting(config_name: str, key: str, value: Any) -> None:
     """设置配置项"""
     config_manager.set(config_name, key, value)
 
+def subscribe(config_name: str, callback: Listener) -> Callable[[], None]:
+    """订阅配置变化，返回取消订阅的函数"""
+    return config_manager.subscribe(config_name, callback)
+
 
 # 导出
 __all__ = [
     'ConfigManager',
     'config_manager',
+    'get_config_manager',
     'get_config',
     'save_config',
     'get_setting',
     'set_setting',
+    'subscribe',
+    'ALL_CONFIGS',
 ]
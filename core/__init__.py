@@ -12,9 +12,12 @@ from .data_thinking import ThinkingData
 from .data_vehicles import VehiclesData
 from .game_logic import GameLogic, GameSession
 from .audio_interface import AudioInterface
+from .collision import SpatialHash, EntityPool, EntityGroup
+from .sampling import sample_distinct, pick_options, AliasSampler, FenwickSampler
 
 __all__ = [
     'PinyinData', 'MathData', 'EnglishData', 'ChineseData', 
     'ThinkingData', 'VehiclesData', 'GameLogic', 'GameSession',
-    'AudioInterface'
+    'AudioInterface', 'SpatialHash', 'EntityPool', 'EntityGroup',
+    'sample_distinct', 'pick_options', 'AliasSampler', 'FenwickSampler'
 ]
@@ -54,6 +54,18 @@ class AudioInterface(ABC):
         """停止当前播放"""
         pass
     
+    def prefetch(self, texts: List[str], rate: str = "+0%", lang: str = "cn"):
+        """
+        预先生成接下来要朗读的文字，之后 speak 时可以立即播放
+        默认不做任何事，支持 TTS 缓存的实现可以覆盖
+        :param texts: 接下来会朗读的文字列表
+        """
+        pass
+    
+    def cancel_prefetch(self):
+        """取消尚未完成的预取（离开页面时调用）"""
+        pass
+    
     def play_praise(self):
         """播放随机表扬语"""
         message = random.choice(self.PRAISE_MESSAGES)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+碰撞检测模块 - 与UI无关的纯逻辑 v1.0
+小游戏里障碍物、金币、水柱越来越多时，每帧拿每一个去和玩家比一遍，
+还在循环里 list.remove()，数量一多就卡。这里提供：
+- SpatialHash：均匀网格空间哈希，查询只看附近几个格子
+- EntityPool：实体（dict）对象池，消失的障碍物/金币回收再用
+- EntityGroup：列表 + 对象池 + 网格，一次遍历完成移动后的筛选和删除
+
+坐标方向不限（Tk 的 y 向下、Kivy 的 y 向上都可以），桌面版和 Kivy 版通用。
+
+使用方法：
+    coins = EntityGroup(cell_size=64)
+    coins.spawn(x=120, y=-30)
+    for coin in coins:
+        coin["y"] += 5
+    coins.retain(lambda c: c["y"] < height + 50)    # 删掉出界的，重建网格
+    got = coins.hits(car_x, car_y, 40, 40)           # 和 abs(dx) < 40 and abs(dy) < 40 一样
+    coins.remove(got)
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 默认网格边长（像素），和小游戏里常见的碰撞半径差不多大
+DEFAULT_CELL_SIZE = 64
+
+# 对象池最多保留多少个空闲实体
+DEFAULT_POOL_LIMIT = 256
+
+
+class SpatialHash:
+    """均匀网格空间哈希
+
+    实体可以是点（hw = hh = 0），也可以带半宽/半高，跨多个格子时每个格子都登记。
+    查询条件和原来的 abs() 判断一致：abs(ex - x) < hw + rx and abs(ey - y) < hh + ry
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], list] = {}
+        self._count = 0
+
+    def _range(self, lo: float, hi: float) -> range:
+        size = self.cell_size
+        return range(int(lo // size), int(hi // size) + 1)
+
+    def clear(self):
+        self._cells.clear()
+        self._count = 0
+
+    def insert(self, entity, x: float, y: float, hw: float = 0, hh: float = 0):
+        """登记一个实体"""
+        box = (entity, x, y, hw, hh)
+        cells = self._cells
+        self._count += 1
+        if not hw and not hh:
+            # 点实体只落在一个格子里（最常见的情况，走快速路径）
+            size = self.cell_size
+            key = (int(x // size), int(y // size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [box]
+            else:
+                cell.append(box)
+            return
+        for cy in self._range(y - hh, y + hh):
+            for cx in self._range(x - hw, x + hw):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [box]
+                else:
+                    cell.append(box)
+
+    def query(self, x: float, y: float, rx: float, ry: float) -> list:
+        """返回和以 (x, y) 为中心、半宽 rx、半高 ry 的框重叠的实体"""
+        result = []
+        seen = set()
+        cells = self._cells
+        for cy in self._range(y - ry, y + ry):
+            for cx in self._range(x - rx, x + rx):
+                cell = cells.get((cx, cy))
+                if not cell:
+                    continue
+                for entity, ex, ey, hw, hh in cell:
+                    if abs(ex - x) < hw + rx and abs(ey - y) < hh + ry:
+                        key = id(entity)
+                        if key not in seen:
+                            seen.add(key)
+                            result.append(entity)
+        return result
+
+    def __len__(self):
+        return self._count
+
+
+class EntityPool:
+    """实体对象池：实体就是 dict（和现在小游戏里的一样），用完放回来再用"""
+
+    def __init__(self, limit: int = DEFAULT_POOL_LIMIT):
+        self.limit = limit
+        self._free: List[dict] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, **fields) -> dict:
+        """取一个实体并设置字段"""
+        if self._free:
+            entity = self._free.pop()
+            entity.update(fields)
+            self.reused += 1
+        else:
+            entity = dict(fields)
+            self.created += 1
+        return entity
+
+    def release(self, entity: dict):
+        """放回池子（超过上限就丢给垃圾回收）"""
+        if len(self._free) < self.limit:
+            entity.clear()
+            self._free.append(entity)
+
+    def __len__(self):
+        return len(self._free)
+
+
+class EntityGroup:
+    """一类实体（障碍物、金币、陨石……）：列表 + 对象池 + 空间哈希
+
+    可以像列表一样 for 遍历；每帧移动后调用一次 retain() 重建网格，
+    之后 hits() 查询碰撞，remove() 一次遍历删除。
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE,
+                 pool_limit: int = DEFAULT_POOL_LIMIT):
+        self.items: List[dict] = []
+        self.pool = EntityPool(pool_limit)
+        self.grid = SpatialHash(cell_size)
+        # 上次 retain 之后删掉的实体（还在网格里，查询时跳过）；
+        # 它们等网格重建后才放回池子，免得被 spawn 复用后出现在旧位置
+        self._removed = set()
+        self._dead: List[dict] = []
+
+    def spawn(self, **fields) -> dict:
+        """生成一个实体（优先用池子里回收的）"""
+        entity = self.pool.acquire(**fields)
+        self.items.append(entity)
+        return entity
+
+    def retain(self, keep: Optional[Callable[[dict], bool]] = None):
+        """只保留 keep(entity) 为真的实体，其余回收；然后按新位置重建网格"""
+        grid = self.grid
+        grid.clear()
+        self._release_dead()
+        kept = []
+        for entity in self.items:
+            if keep is None or keep(entity):
+                kept.append(entity)
+                grid.insert(entity, entity["x"], entity["y"])
+            else:
+                self.pool.release(entity)
+        self.items = kept
+
+    def hits(self, x: float, y: float, rx: float, ry: float) -> list:
+        """和 (x, y) 距离在 rx / ry 以内的实体（基于最近一次 retain 的位置）"""
+        found = self.grid.query(x, y, rx, ry)
+        if self._removed:
+            found = [e for e in found if id(e) not in self._removed]
+        return found
+
+    def remove(self, entities: Iterable[dict]):
+        """删除并回收一批实体（一次遍历，不在循环里 list.remove）"""
+        dead = {id(e) for e in entities}
+        if not dead:
+            return
+        kept = []
+        for entity in self.items:
+            if id(entity) in dead:
+                self._dead.append(entity)
+            else:
+                kept.append(entity)
+        self.items = kept
+        # 不重建网格，下次 retain 之前查询时跳过这些
+        self._removed |= dead
+
+    def _release_dead(self):
+        """网格重建/清空后，把 remove() 删掉的实体放回池子"""
+        for entity in self._dead:
+            self.pool.release(entity)
+        self._dead = []
+        self._removed.clear()
+
+    def clear(self):
+        for entity in self.items:
+            self.pool.release(entity)
+        self.items = []
+        self.grid.clear()
+        self._release_dead()
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+
+__all__ = ['SpatialHash', 'EntityPool', 'EntityGroup']
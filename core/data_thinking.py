@@ -4,6 +4,11 @@
 """
 import random
 
+try:
+    from .sampling import sample_distinct
+except ImportError:  # 在 core 目录里直接运行/测试时
+    from sampling import sample_distinct
+
 class ThinkingData:
     """思维训练数据类"""
     
@@ -38,7 +43,7 @@ class ThinkingData:
         base = random.choice(cls.SHAPES)
         items = [base] * count
         diff_idx = random.randint(0, count - 1)
-        different = random.choice([s for s in cls.SHAPES if s != base])
+        different = sample_distinct(cls.SHAPES, 1, exclude=(base,))[0]
         items[diff_idx] = different
         return (items, diff_idx)
     
@@ -54,9 +59,7 @@ class ThinkingData:
         for i in range(length):
             pattern.append(a if i % 2 == 0 else b)
         answer = a if length % 2 == 0 else b
-        options = random.sample(cls.SHAPES, 4)
-        if answer not in options:
-            options[0] = answer
+        options = [answer] + sample_distinct(cls.SHAPES, 3, exclude=(answer,))
         random.shuffle(options)
         return (pattern, answer, options)
     
@@ -68,8 +71,7 @@ class ThinkingData:
         """
         cat_name, cat_items = random.choice(cls.CATEGORIES)
         correct = random.sample(cat_items, 3)
-        other_cats = [c for c in cls.CATEGORIES if c[0] != cat_name]
-        wrong_cat = random.choice(other_cats)
+        wrong_cat = sample_distinct(cls.CATEGORIES, 1, exclude=(cat_name,), key=lambda c: c[0])[0]
         wrong = random.choice(wrong_cat[1])
         return (cat_name, correct, wrong)
     
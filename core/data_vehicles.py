@@ -4,6 +4,11 @@
 """
 import random
 
+try:
+    from .sampling import sample_distinct
+except ImportError:  # 在 core 目录里直接运行/测试时
+    from sampling import sample_distinct
+
 class VehiclesData:
     """交通工具数据类"""
     
@@ -80,7 +85,7 @@ class VehiclesData:
         生成交通工具认知题目
         返回: (target_vehicle, options)
         """
-        selected = random.sample(cls.VEHICLES, count)
+        selected = sample_distinct(cls.VEHICLES, count)
         target = random.choice(selected)
         return (target, selected)
     
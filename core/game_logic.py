@@ -8,6 +8,11 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
 
+try:
+    from .sampling import pick_options
+except ImportError:  # 在 core 目录里直接运行/测试时
+    from sampling import pick_options
+
 
 class GameType(Enum):
     """游戏类型枚举"""
@@ -96,13 +101,12 @@ class GameLogic:
         return is_correct
     
     def get_random_options(self, correct: Any, all_items: List, 
-                           count: int = 4) -> List:
-        """生成随机选项（包含正确答案）"""
-        options = [correct]
-        others = [item for item in all_items if item != correct]
-        options.extend(random.sample(others, min(count - 1, len(others))))
-        random.shuffle(options)
-        return options
+                           count: int = 4, key: Optional[Callable] = None) -> List:
+        """生成随机选项（包含正确答案）
+        
+        key 给出时 all_items 是原始数据，选项取 key(item)（不用每题建一个新列表）
+        """
+        return pick_options(correct, all_items, count, key=key)
     
     # ==================== 配对游戏逻辑 ====================
     
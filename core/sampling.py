@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+抽题/抽选项模块 - 与UI无关的纯逻辑 v1.0
+各个游戏出题时都是"先把整个字库过滤一遍，再 random.sample"，
+自适应出题还要把加权列表展开后逐个累加。字库到几千字时每题都是 O(n)。
+这里提供桌面版和 Kivy 版通用的抽样工具：
+- sample_distinct：不放回均匀抽 k 个，按条件排除目标，不用复制过滤整个列表
+- pick_options：正确答案 + 干扰项，打乱顺序（选择题、打地鼠）
+- AliasSampler：Vose 别名表，权重不变时 O(1) 抽样
+- FenwickSampler：树状数组，改单个权重 O(log n)，抽样 O(log n)，可不放回抽多个
+
+使用方法：
+    others = sample_distinct(words, 3, exclude=(target_char,), key=lambda w: w[0])
+    options = pick_options(char, words, count=4, key=lambda w: w[0])
+
+    sampler = FenwickSampler([50, 30, 15, 5])
+    sampler.update(2, 40)            # 第 3 个字的权重变了
+    i = sampler.sample()
+    picked = sampler.sample_k(3)     # 不放回抽 3 个下标
+"""
+import random
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+# 列表不大时直接过滤再抽（比随机下标拒绝采样更省事）
+SMALL_POPULATION = 64
+
+
+def _excluded(item, exclude, key):
+    return (key(item) if key else item) in exclude
+
+
+def sample_distinct(items: Sequence, k: int, exclude: Iterable = (),
+                    key: Optional[Callable] = None, rng=random) -> List:
+    """从 items 中不放回均匀抽 k 个（按位置不重复），key(item) 在 exclude 中的不要
+
+    和 random.sample([x for x in items if x not in exclude], k) 的分布一样，
+    但大列表只随机取下标，不复制过滤；合格的不够 k 个时有多少返回多少。
+    """
+    exclude = tuple(exclude)
+    n = len(items)
+    if k <= 0 or n == 0:
+        return []
+    if n <= SMALL_POPULATION or n <= 4 * (k + len(exclude)):
+        pool = [item for item in items if not _excluded(item, exclude, key)]
+        return rng.sample(pool, min(k, len(pool)))
+
+    chosen = set()
+    picked = []
+    tries = 0
+    while len(picked) < k and tries < 8 * (k + len(exclude)) + 16:
+        tries += 1
+        i = rng.randrange(n)
+        if i in chosen:
+            continue
+        chosen.add(i)
+        if not _excluded(items[i], exclude, key):
+            picked.append(items[i])
+    if len(picked) < k:
+        # 排除的太多（很少见）：剩下的逐个筛选
+        rest = [items[i] for i in range(n)
+                if i not in chosen and not _excluded(items[i], exclude, key)]
+        picked += rng.sample(rest, min(k - len(picked), len(rest)))
+    return picked
+
+
+def pick_options(correct: Any, items: Sequence, count: int = 4,
+                 key: Optional[Callable] = None, rng=random) -> List:
+    """生成选项：正确答案 + (count-1) 个和它不同的干扰项，打乱顺序
+
+    key 给出时 items 是原始数据（如 (字, 拼音, ...)），选项是 key(item)，
+    调用方不用再为每道题建一个 [w[0] for w in words] 列表。
+    """
+    distractors = sample_distinct(items, count - 1, exclude=(correct,), key=key, rng=rng)
+    options = [correct] + [key(d) if key else d for d in distractors]
+    rng.shuffle(options)
+    return options
+
+
+class AliasSampler:
+    """Vose 别名表：按权重抽下标，建表 O(n)，每次抽样 O(1)
+
+    Args:
+        weights: 非负权重列表（全为 0 时 sample 返回 None）
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        self.n = n
+        self.total = total
+        self._prob = [1.0] * n
+        self._alias = list(range(n))
+        if n == 0 or total <= 0:
+            return
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large[-1]
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if scaled[l] < 1.0:
+                small.append(large.pop())
+        # 剩下的（含浮点误差）概率为 1
+        for i in small + large:
+            self._prob[i] = 1.0
+
+    def sample(self, rng=random) -> Optional[int]:
+        if self.n == 0 or self.total <= 0:
+            return None
+        i = int(rng.random() * self.n)
+        if i >= self.n:
+            i = self.n - 1
+        return i if rng.random() < self._prob[i] else self._alias[i]
+
+
+class FenwickSampler:
+    """树状数组加权抽样：改单个权重 O(log n)，抽样 O(log n)
+
+    适合权重经常一个一个变的场景（每答一题改一个字的权重），
+    不用像别名表那样整表重建。
+    """
+
+    def __init__(self, weights: Iterable[float] = ()):
+        self._weights: List[float] = []
+        self._tree: List[float] = [0.0]
+        for w in weights:
+            self.append(w)
+
+    def __len__(self):
+        return len(self._weights)
+
+    @property
+    def total(self) -> float:
+        return self._prefix(len(self._weights))
+
+    def weight(self, i: int) -> float:
+        return self._weights[i]
+
+    def append(self, weight: float):
+        """末尾加一个权重（O(log n)）"""
+        weight = max(0.0, float(weight))
+        self._weights.append(weight)
+        n = len(self._weights)
+        # 新节点 n 管 (n - lowbit(n), n] 这一段
+        low = n & -n
+        self._tree.append(weight + self._prefix(n - 1) - self._prefix(n - low))
+
+    def update(self, i: int, weight: float):
+        """把第 i 个的权重改成 weight"""
+        weight = max(0.0, float(weight))
+        delta = weight - self._weights[i]
+        if delta == 0:
+            return
+        self._weights[i] = weight
+        j = i + 1
+        n = len(self._weights)
+        while j <= n:
+            self._tree[j] += delta
+            j += j & -j
+
+    def _prefix(self, count: int) -> float:
+        """前 count 个的权重和"""
+        s = 0.0
+        while count > 0:
+            s += self._tree[count]
+            count -= count & -count
+        return s
+
+    def find(self, target: float) -> int:
+        """前缀和刚超过 target 的下标"""
+        n = len(self._weights)
+        pos = 0
+        step = 1 << n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= n and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(pos, n - 1)
+
+    def sample(self, rng=random) -> Optional[int]:
+        total = self.total
+        if total <= 0:
+            return None
+        i = self.find(rng.random() * total)
+        # 浮点误差可能落到权重为 0 的项上，往前找一个有权重的
+        while self._weights[i] <= 0 and i > 0:
+            i -= 1
+        return i if self._weights[i] > 0 else None
+
+    def sample_k(self, k: int, rng=random) -> List[int]:
+        """不放回地按权重抽 k 个下标（抽中的暂时置 0，抽完恢复）"""
+        picked = []
+        saved = []
+        for _ in range(k):
+            i = self.sample(rng)
+            if i is None:
+                break
+            picked.append(i)
+            saved.append((i, self._weights[i]))
+            self.update(i, 0)
+        for i, w in saved:
+            self.update(i, w)
+        return picked
+
+
+__all__ = [
+    'sample_distinct',
+    'pick_options',
+    'AliasSampler',
+    'FenwickSampler',
+]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+碰撞检测模块测试
+"""
+import random
+import time
+
+from collision import SpatialHash, EntityPool, EntityGroup
+
+
+def _brute_force(entities, x, y, rx, ry):
+    """原来小游戏里的写法：逐个 abs() 比较"""
+    return [e for e in entities if abs(e["x"] - x) < rx and abs(e["y"] - y) < ry]
+
+
+def test_spatial_hash_matches_brute_force():
+    """网格查询结果和逐个比较完全一致（包括格子边界和负坐标）"""
+    rng = random.Random(7)
+    grid = SpatialHash(cell_size=64)
+    entities = [{"x": rng.uniform(-100, 1000), "y": rng.uniform(-100, 700)} for _ in range(500)]
+    for e in entities:
+        grid.insert(e, e["x"], e["y"])
+    assert len(grid) == 500
+    for _ in range(200):
+        x, y = rng.uniform(-100, 1000), rng.uniform(-100, 700)
+        rx, ry = rng.choice([(35, 30), (40, 40), (50, 40), (150, 20)])
+        got = {id(e) for e in grid.query(x, y, rx, ry)}
+        assert got == {id(e) for e in _brute_force(entities, x, y, rx, ry)}
+    # 刚好在边界上的不算碰到（和 abs() < r 一致）
+    grid.clear()
+    edge = {"x": 64, "y": 0}
+    grid.insert(edge, 64, 0)
+    assert grid.query(24, 0, 40, 10) == []
+    assert grid.query(25, 0, 40, 10) == [edge]
+    print("✅ 网格查询和逐个比较一致")
+
+
+def test_spatial_hash_boxes():
+    """带大小的实体跨多个格子时只返回一次"""
+    grid = SpatialHash(cell_size=32)
+    building = {"name": "楼"}
+    grid.insert(building, 100, 200, hw=50, hh=120)
+    assert grid.query(140, 90, 5, 5) == [building]
+    assert grid.query(160, 200, 5, 5) == []
+    print("✅ 带大小的实体")
+
+
+def test_entity_pool_reuse():
+    """消失的实体回收再用，字段重新设置"""
+    pool = EntityPool(limit=2)
+    a = pool.acquire(x=1, y=2, hit=True)
+    pool.release(a)
+    b = pool.acquire(x=3, y=4)
+    assert b is a and b == {"x": 3, "y": 4}
+    assert pool.created == 1 and pool.reused == 1
+    for e in [pool.acquire(x=0, y=0) for _ in range(5)]:
+        pool.release(e)
+    assert len(pool) == 2
+    print("✅ 对象池")
+
+
+def test_entity_group_frame():
+    """一帧的流程：移动 -> retain 删除出界 -> hits -> remove"""
+    group = EntityGroup(cell_size=64)
+    for i in range(10):
+        group.spawn(x=100 + i * 100, y=i * 10)
+    for e in group:
+        e["y"] += 5
+    group.retain(lambda e: e["x"] < 800)
+    assert len(group) == 7
+    got = group.hits(300, 30, 40, 40)
+    assert [e["x"] for e in got] == [300]
+    group.remove(got)
+    assert len(group) == 6 and not group.hits(300, 30, 40, 40)
+    assert 300 not in [e["x"] for e in group]
+    # 下一次 spawn 用回收的实体
+    reused_before = group.pool.reused
+    group.spawn(x=0, y=0)
+    assert group.pool.reused == reused_before + 1
+    group.clear()
+    assert not group and len(group.pool) == 10
+    print("✅ 实体组")
+
+
+def test_removed_entity_not_reused_at_old_position():
+    """remove 之后马上 spawn：新实体不会出现在被删实体的旧位置"""
+    group = EntityGroup(cell_size=64, pool_limit=1)
+    group.spawn(x=100, y=100)
+    group.retain()
+    group.remove(group.hits(100, 100, 10, 10))
+    coin = group.spawn(x=500, y=500)
+    assert group.hits(100, 100, 10, 10) == []
+    assert len(group.pool) == 0
+    # 网格重建后被删的实体才放回池子
+    group.retain()
+    assert group.hits(500, 500, 10, 10) == [coin] and group.hits(100, 100, 10, 10) == []
+    assert len(group.pool) == 1
+    print("✅ 删掉的实体等网格重建后才复用")
+
+
+def test_many_entities_cheap():
+    """实体多的时候，每帧 retain + 查询比逐个比较 + list.remove 快"""
+    rng = random.Random(1)
+    n, frames = 2000, 30
+    spawn = [(rng.uniform(0, 900), rng.uniform(0, 550)) for _ in range(n)]
+    players = [(rng.uniform(0, 900), rng.uniform(0, 550)) for _ in range(frames)]
+
+    # 原来的写法
+    items = [{"x": x, "y": y} for x, y in spawn]
+    start = time.perf_counter()
+    old_hits = 0
+    for px, py in players:
+        items = [e for e in items if e["y"] < 600]
+        for e in items[:]:
+            if abs(e["x"] - px) < 40 and abs(e["y"] - py) < 40:
+                items.remove(e)
+                old_hits += 1
+        # 模拟多个检测对象（例如一群水柱对每栋楼）
+        for qx, qy in spawn[:50]:
+            _brute_force(items, qx, qy, 40, 40)
+    old_time = time.perf_counter() - start
+
+    group = EntityGroup(cell_size=64)
+    for x, y in spawn:
+        group.spawn(x=x, y=y)
+    start = time.perf_counter()
+    new_hits = 0
+    for px, py in players:
+        group.retain(lambda e: e["y"] < 600)
+        got = group.hits(px, py, 40, 40)
+        group.remove(got)
+        new_hits += len(got)
+        for qx, qy in spawn[:50]:
+            group.hits(qx, qy, 40, 40)
+    new_time = time.perf_counter() - start
+
+    assert new_hits == old_hits
+    print(f"✅ {n} 个实体 x {frames} 帧: 逐个比较 {old_time*1000:.0f}ms, 空间哈希 {new_time*1000:.0f}ms")
+    assert new_time < old_time
+
+
+if __name__ == "__main__":
+    test_spatial_hash_matches_brute_force()
+    test_spatial_hash_boxes()
+    test_entity_pool_reuse()
+    test_entity_group_frame()
+    test_removed_entity_not_reused_at_old_position()
+    test_many_entities_cheap()
+    print("\n🎉 所有测试通过!")
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+抽题/抽选项模块测试
+- 不放回抽样、选项生成、别名表、树状数组的正确性
+- 3000 字字库上每出一题的开销：原来的展开加权列表 + 过滤抽选项 vs 现在
+"""
+import random
+import time
+from collections import Counter
+
+from sampling import sample_distinct, pick_options, AliasSampler, FenwickSampler
+
+LIBRARY = 3000
+QUESTIONS = 2000
+LEVEL_WEIGHTS = {0: 50, 1: 30, 2: 15, 3: 5}
+
+
+def _library(n=LIBRARY):
+    return [(chr(0x4E00 + i), f"py{i}", "") for i in range(n)]
+
+
+def test_sample_distinct_uniform_and_excludes():
+    """大列表（随机下标）和小列表（过滤）两条路都均匀、不重复、不含排除项"""
+    rng = random.Random(3)
+    for n in (10, 500):
+        items = list(range(n))
+        counts = Counter()
+        for _ in range(20000):
+            picked = sample_distinct(items, 3, exclude=(0,), rng=rng)
+            assert len(set(picked)) == 3 and 0 not in picked
+            counts.update(picked)
+        expected = 20000 * 3 / (n - 1)
+        assert all(abs(counts[i] - expected) < expected * 0.35 + 5 for i in range(1, n))
+    # 按 key 排除；合格的不够时有多少给多少
+    words = _library(200)
+    assert all(w[0] != "一" for w in sample_distinct(words, 50, exclude=("一",), key=lambda w: w[0]))
+    assert sorted(sample_distinct([1, 2, 2, 3], 5, exclude=(2,))) == [1, 3]
+    assert sample_distinct([], 3) == [] and sample_distinct([1], 0) == []
+    print("✅ 不放回均匀抽样")
+
+
+def test_pick_options():
+    words = _library()
+    for _ in range(200):
+        options = pick_options("一", words, count=4, key=lambda w: w[0])
+        assert len(options) == 4 and options.count("一") == 1 and len(set(options)) == 4
+    assert sorted(pick_options("a", ["a", "b"], count=4)) == ["a", "b"]
+    print("✅ 选项生成")
+
+
+def test_alias_distribution():
+    rng = random.Random(1)
+    weights = [50, 30, 15, 5, 0]
+    sampler = AliasSampler(weights)
+    counts = Counter(sampler.sample(rng) for _ in range(100000))
+    for i, w in enumerate(weights):
+        assert abs(counts[i] / 100000 - w / 100) < 0.01
+    assert AliasSampler([]).sample(rng) is None
+    print("✅ 别名表")
+
+
+def test_fenwick_updates_and_draws():
+    """改权重后前缀和、抽样分布、不放回抽样都对"""
+    rng = random.Random(5)
+    weights = [rng.randint(0, 9) for _ in range(37)]
+    tree = FenwickSampler(weights)
+    for _ in range(200):
+        i = rng.randrange(len(weights))
+        weights[i] = rng.randint(0, 9)
+        tree.update(i, weights[i])
+    assert tree.total == sum(weights)
+    for count in range(len(weights) + 1):
+        assert tree._prefix(count) == sum(weights[:count])
+
+    counts = Counter(tree.sample(rng) for _ in range(100000))
+    for i, w in enumerate(weights):
+        assert abs(counts[i] / 100000 - w / sum(weights)) < 0.01
+
+    nonzero = sum(1 for w in weights if w > 0)
+    picked = tree.sample_k(nonzero + 5, rng)
+    assert len(picked) == nonzero == len(set(picked))
+    assert all(weights[i] > 0 for i in picked) and tree.total == sum(weights)
+    assert FenwickSampler().sample(rng) is None and FenwickSampler([0, 0]).sample(rng) is None
+    print("✅ 树状数组")
+
+
+def _old_adaptive_word(words, level_of, exclude):
+    """原来 get_adaptive_word：分组 -> 展开加权列表 -> 累加查找"""
+    groups = {0: [], 1: [], 2: [], 3: []}
+    for w in words:
+        if w[0] in exclude:
+            continue
+        groups[level_of[w[0]]].append(w)
+    pool = []
+    for level, group in groups.items():
+        pool.extend([(w, LEVEL_WEIGHTS[level]) for w in group])
+    r = random.uniform(0, sum(weight for _, weight in pool))
+    cumulative = 0
+    for word, weight in pool:
+        cumulative += weight
+        if r <= cumulative:
+            return word
+    return pool[-1][0]
+
+
+def _old_options(correct, all_items, count=4):
+    """原来 GameLogic.get_random_options（调用方每题先建 all_chars 列表）"""
+    others = [item for item in all_items if item != correct]
+    options = [correct] + random.sample(others, min(count - 1, len(others)))
+    random.shuffle(options)
+    return options
+
+
+def test_benchmark_3000_characters():
+    """3000 字字库，每题：按掌握度加权选字 + 选出 3 个干扰项（每题答完改一个字的权重）"""
+    words = _library()
+    rng = random.Random(11)
+    level_of = {w[0]: rng.randrange(4) for w in words}
+
+    random.seed(1)
+    start = time.perf_counter()
+    last = words[0]
+    for _ in range(QUESTIONS):
+        last = _old_adaptive_word(words, level_of, [last[0]])
+        _old_options(last[0], [w[0] for w in words])
+    old = (time.perf_counter() - start) / QUESTIONS
+
+    # 树状数组：每个字一个权重，答完一题只改这个字
+    tree = FenwickSampler(LEVEL_WEIGHTS[level_of[w[0]]] for w in words)
+    start = time.perf_counter()
+    last = 0
+    for q in range(QUESTIONS):
+        i = tree.sample()
+        while i == last:
+            i = tree.sample()
+        pick_options(words[i][0], words, count=4, key=lambda w: w[0])
+        tree.update(i, LEVEL_WEIGHTS[(q + i) % 4])
+        last = i
+    fenwick = (time.perf_counter() - start) / QUESTIONS
+
+    # 别名表：权重不变时建一次表
+    alias = AliasSampler([LEVEL_WEIGHTS[level_of[w[0]]] for w in words])
+    start = time.perf_counter()
+    for _ in range(QUESTIONS):
+        i = alias.sample()
+        pick_options(words[i][0], words, count=4, key=lambda w: w[0])
+    alias_time = (time.perf_counter() - start) / QUESTIONS
+
+    print(f"✅ {LIBRARY} 字每题: 原来 {old * 1e6:.0f}us, 树状数组 {fenwick * 1e6:.1f}us, "
+          f"别名表 {alias_time * 1e6:.1f}us")
+    assert fenwick * 10 < old and alias_time * 10 < old
+
+
+if __name__ == "__main__":
+    test_sample_distinct_uniform_and_excludes()
+    test_pick_options()
+    test_alias_distribution()
+    test_fenwick_updates_and_draws()
+    test_benchmark_3000_characters()
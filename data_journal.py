@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 数据日志 v1.0
+学习数据每次保存不再整份重写，而是追加一条增量记录：
+- 快照文件：完整的 JSON（和以前的 learning_progress.json 格式一样）
+- 日志文件：<快照>.journal，每行一条 {"seq": n, "ops": [...]}
+- 保存时只比较上次保存后变化的部分，写入的数据量只和改动大小有关
+- 调用方用 touch() 标出改过的路径时只比较这些子树，保存的计算量也只和改动大小有关；
+  没有标记（或 touch_all()）时比较整份数据
+- 日志超过上限时合并回快照（写临时文件 + 校验 + 替换，保留 .bak）
+- 加载时先读快照再按顺序重放日志，最后一行没写完（崩溃/断电）会被丢弃
+
+记录的操作：
+    {"op": "set", "path": [...], "value": ...}     设置字段
+    {"op": "del", "path": [...]}                   删除字段
+    {"op": "append", "path": [...], "values": [...]}  列表末尾追加
+
+使用方法：
+    journal = JsonJournal("learning_progress.json")
+    data = journal.load()            # 没有数据返回 None
+    journal.touch(("overall",))      # 可选：只改了这些子树
+    journal.record(data)             # 追加这次改动
+    journal.compact(data)            # 立即合并成快照
+"""
+
+import os
+import copy
+import json
+import shutil
+
+JOURNAL_EXT = ".journal"
+
+# 快照中记录已合并的日志序号
+SEQ_KEY = "_journal_seq"
+
+# 日志超过 256KB 时合并回快照
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+
+# ============================================================
+# 增量计算与重放
+# ============================================================
+def diff(old, new, path=()):
+    """计算从 old 到 new 的操作列表
+
+    字典逐层比较；列表如果只是在末尾追加，记为 append，否则整体替换。
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "set", "path": list(path) + [key], "value": value})
+            else:
+                ops.extend(diff(old[key], value, path + (key,)))
+        for key in old:
+            if key not in new:
+                ops.append({"op": "del", "path": list(path) + [key]})
+        return ops
+    if isinstance(old, list) and isinstance(new, list) \
+            and len(new) > len(old) and new[:len(old)] == old:
+        return [{"op": "append", "path": list(path), "values": new[len(old):]}]
+    return [{"op": "set", "path": list(path), "value": new}]
+
+
+_MISSING = object()
+
+
+def _lookup(data, path):
+    """按路径取值，中间不是字典或没有这个键时返回 _MISSING"""
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return _MISSING
+        data = data[key]
+    return data
+
+
+def _outermost(paths):
+    """去掉被更短路径包含的路径（("a",) 已包含 ("a", "b")）"""
+    result = []
+    for path in sorted(set(paths), key=len):
+        if not any(path[:len(p)] == p for p in result):
+            result.append(path)
+    return result
+
+
+def diff_paths(old, new, paths):
+    """只比较 paths 下的子树，计算从 old 到 new 的操作列表"""
+    ops = []
+    for path in _outermost(paths):
+        before = _lookup(old, path)
+        after = _lookup(new, path)
+        if after is _MISSING:
+            if before is not _MISSING:
+                ops.append({"op": "del", "path": list(path)})
+        elif before is _MISSING:
+            ops.append({"op": "set", "path": list(path), "value": after})
+        else:
+            ops.extend(diff(before, after, path))
+    return ops
+
+
+def apply_ops(data, ops):
+    """把操作应用到 data 上（原地修改），返回 data"""
+    for op in ops:
+        path = op["path"]
+        if not path:
+            # 根节点整体替换
+            data.clear()
+            data.update(copy.deepcopy(op["value"]))
+            continue
+        parent = data
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        key = path[-1]
+        kind = op["op"]
+        if kind == "set":
+            parent[key] = copy.deepcopy(op["value"])
+        elif kind == "del":
+            parent.pop(key, None)
+        elif kind == "append":
+            parent.setdefault(key, []).extend(copy.deepcopy(op["values"]))
+    return data
+
+
+# ============================================================
+# 日志文件
+# ============================================================
+class JsonJournal:
+    """快照 + 追加日志
+
+    Args:
+        snapshot_path: 快照文件路径
+        compact_bytes: 日志超过这个大小时合并回快照
+    """
+
+    def __init__(self, snapshot_path, compact_bytes=DEFAULT_COMPACT_BYTES):
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + JOURNAL_EXT
+        self.backup_path = snapshot_path + ".bak"
+        self.compact_bytes = compact_bytes
+        self._seq = 0            # 最后写入的记录序号
+        self._shadow = None      # 已持久化的数据（用来计算增量）
+        self._journal_size = 0
+        self._touched = set()    # 上次保存后改过的路径
+        self._touched_all = False
+
+    def load(self):
+        """读取快照并重放日志，没有任何数据时返回 None"""
+        data = self._read_snapshot(self.snapshot_path)
+        if data is None:
+            data = self._read_snapshot(self.backup_path)
+        snap_seq = data.pop(SEQ_KEY, 0) if data is not None else 0
+        self._seq = snap_seq
+
+        replayed = 0
+        good_size = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line.decode('utf-8'))
+                        seq, ops = record["seq"], record["ops"]
+                    except (ValueError, KeyError, TypeError):
+                        # 没写完的最后一行（崩溃时留下的），之后的都不要
+                        print("[data_journal] 日志末尾不完整，已丢弃")
+                        break
+                    good_size += len(line)
+                    if seq <= snap_seq:
+                        # 已经合并进快照（合并后、清空日志前崩溃）
+                        continue
+                    if data is None:
+                        data = {}
+                    apply_ops(data, ops)
+                    self._seq = seq
+                    replayed += 1
+            self._truncate_journal(good_size)
+        self._journal_size = good_size
+
+        if replayed:
+            print(f"[data_journal] 已重放 {replayed} 条日志")
+        self._shadow = copy.deepcopy(data) if data is not None else {}
+        return data
+
+    def touch(self, *paths):
+        """标记改过的路径（键的元组），下次 record 只比较这些子树"""
+        self._touched.update(tuple(path) for path in paths)
+
+    def touch_all(self):
+        """改动位置不确定：下次 record 比较整份数据"""
+        self._touched_all = True
+
+    def record(self, data):
+        """把和上次保存相比的改动追加到日志，返回写入的操作数
+
+        标记过路径时只比较这些子树；没有标记时比较整份数据。
+        """
+        if self._shadow is None:
+            self._shadow = {}
+        touched, touched_all = self._touched, self._touched_all
+        self._touched, self._touched_all = set(), False
+        try:
+            if touched_all or not touched:
+                ops = diff(self._shadow, data)
+            else:
+                ops = diff_paths(self._shadow, data, touched)
+            if not ops:
+                return 0
+
+            line = (json.dumps({"seq": self._seq + 1, "ops": ops}, ensure_ascii=False,
+                               separators=(",", ":")) + "\n").encode('utf-8')
+            with open(self.journal_path, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            # 写入失败时保留标记，下次保存还会比较这些路径
+            self._touched |= touched
+            self._touched_all = self._touched_all or touched_all
+            raise
+        self._seq += 1
+        self._journal_size += len(line)
+        apply_ops(self._shadow, ops)
+
+        if self._journal_size >= self.compact_bytes:
+            self.compact(data)
+        return len(ops)
+
+    def compact(self, data):
+        """把当前数据写成快照并清空日志"""
+        # 先创建备份
+        if os.path.exists(self.snapshot_path):
+            try:
+                shutil.copy2(self.snapshot_path, self.backup_path)
+            except Exception as e:
+                print(f"创建备份失败: {e}")
+
+        # 写入临时文件并验证
+        snapshot = dict(data)
+        snapshot[SEQ_KEY] = self._seq
+        temp_file = self.snapshot_path + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        with open(temp_file, 'r', encoding='utf-8') as f:
+            json.load(f)
+        os.replace(temp_file, self.snapshot_path)
+
+        # 快照里已记录序号，此时崩溃重放也会跳过旧记录
+        self._truncate_journal(0)
+        self._journal_size = 0
+        self._shadow = copy.deepcopy(data)
+        self._touched, self._touched_all = set(), False
+
+    def _read_snapshot(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except Exception as e:
+            print(f"加载数据失败: {path}: {e}")
+            return None
+
+    def _truncate_journal(self, size):
+        try:
+            if size == 0:
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+            elif os.path.getsize(self.journal_path) != size:
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(size)
+        except OSError as e:
+            print(f"[data_journal] 清理日志失败: {e}")
+
+
+__all__ = ['JsonJournal', 'diff', 'diff_paths', 'apply_ops', 'DEFAULT_COMPACT_BYTES']
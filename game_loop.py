@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+固定步长游戏循环 v1.0
+以前每个小游戏自己 window.after(50, loop)，每次调用前进固定距离，
+电脑画得慢时整个游戏就跟着变慢。这里把"更新"和"绘制"分开：
+- update() 按固定步长（例如 50ms）执行，速度不再受绘制快慢影响
+- render() 每次调度只画一次；落后太多时连续执行几次 update，跳过中间的画面
+- 每帧的间隔、更新耗时、绘制耗时记录到环形缓冲区（FrameStats）
+- 可选的 FPS 角标（F3 切换或 LELE_SHOW_FPS=1）和日志（LELE_FRAME_LOG=1）
+
+使用方法：
+    loop = FixedStepLoop(window, update=self.race_update, render=self.race_render,
+                         step_ms=50, scene=self.race_scene, name="race",
+                         active=lambda: self.game_running)
+    loop.start()
+    loop.stats.summary()     # {"fps": ..., "update_ms": ..., "render_ms": ..., ...}
+"""
+
+import os
+import math
+import time
+
+SHOW_FPS_ENV = "LELE_SHOW_FPS"
+FRAME_LOG_ENV = "LELE_FRAME_LOG"
+
+# 环形缓冲区保存最近多少帧
+DEFAULT_CAPACITY = 120
+
+# 开启日志时每隔多少帧打印一次
+LOG_EVERY = 100
+
+# after() 的精度只有 1ms，差这么一点到期也算到期（否则会多空转一次）
+TIMER_SLACK_MS = 1.0
+
+# FPS 角标是否显示（全局开关，F3 切换）
+_overlay_enabled = os.environ.get(SHOW_FPS_ENV, "") not in ("", "0")
+
+
+def overlay_enabled():
+    return _overlay_enabled
+
+
+def toggle_overlay(event=None):
+    """切换 FPS 角标（可以直接绑定到按键）"""
+    global _overlay_enabled
+    _overlay_enabled = not _overlay_enabled
+    return _overlay_enabled
+
+
+def frame_log_enabled():
+    return os.environ.get(FRAME_LOG_ENV, "") not in ("", "0")
+
+
+# ============================================================
+# 帧时间统计
+# ============================================================
+class FrameStats:
+    """最近 capacity 帧的时间记录（环形缓冲区，不分配新对象）"""
+
+    FIELDS = ("interval", "update", "render", "steps")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._data = {field: [0.0] * capacity for field in self.FIELDS}
+        self._index = 0
+        self.count = 0          # 一共记录了多少帧
+        self.skipped = 0        # 因为落后而跳过的画面数
+        self.dropped_steps = 0  # 落后太多直接丢弃的更新步数
+
+    def record(self, interval_ms, update_ms, render_ms, steps):
+        i = self._index
+        self._data["interval"][i] = interval_ms
+        self._data["update"][i] = update_ms
+        self._data["render"][i] = render_ms
+        self._data["steps"][i] = steps
+        self._index = (i + 1) % self.capacity
+        self.count += 1
+        if steps > 1:
+            self.skipped += steps - 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def values(self, field):
+        """按时间顺序返回某个字段的记录"""
+        n = len(self)
+        data = self._data[field]
+        if n < self.capacity:
+            return data[:n]
+        return data[self._index:] + data[:self._index]
+
+    def mean(self, field):
+        values = self.values(field)
+        return sum(values) / len(values) if values else 0.0
+
+    def percentile(self, field, p):
+        values = sorted(self.values(field))
+        if not values:
+            return 0.0
+        k = min(len(values) - 1, max(0, int(round(p / 100 * (len(values) - 1)))))
+        return values[k]
+
+    def fps(self):
+        interval = self.mean("interval")
+        return 1000 / interval if interval > 0 else 0.0
+
+    def summary(self):
+        return {
+            "frames": self.count,
+            "fps": round(self.fps(), 1),
+            "update_ms": round(self.mean("update"), 2),
+            "render_ms": round(self.mean("render"), 2),
+            "render_p95_ms": round(self.percentile("render", 95), 2),
+            "interval_p95_ms": round(self.percentile("interval", 95), 2),
+            "skipped": self.skipped,
+            "dropped_steps": self.dropped_steps,
+        }
+
+
+# ============================================================
+# 循环驱动
+# ============================================================
+class FixedStepLoop:
+    """用 widget.after 驱动的固定步长循环
+
+    Args:
+        widget: 提供 after() 的 Tk 控件（一般是主窗口）
+        update: 每个固定步长调用一次的函数
+        render: 每帧调用一次的绘制函数（可以为 None）
+        step_ms: 固定步长（毫秒）
+        max_steps: 一帧里最多补几次 update，再多就丢弃，避免越落越多
+        scene: CanvasScene，给了就自动 begin_frame / end_frame 并画 FPS 角标
+        name: 日志里显示的名字
+        active: 返回 False 时循环停止（例如 lambda: self.game_running）
+    """
+
+    def __init__(self, widget, update, render=None, step_ms=50, max_steps=5,
+                 scene=None, name="loop", active=None, capacity=DEFAULT_CAPACITY):
+        self.widget = widget
+        self.update = update
+        self.render = render
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.scene = scene
+        self.name = name
+        self.active = active or (lambda: True)
+        self.stats = FrameStats(capacity)
+        self.running = False
+        self._after_id = None
+        self._last = None
+        self._last_frame = None
+        self._accumulator = 0.0
+
+    def start(self):
+        """先执行一步并画出第一帧，之后按步长调度"""
+        self.running = True
+        self._last = time.perf_counter()
+        self._last_frame = None
+        self._accumulator = self.step_ms
+        self._tick()
+
+    def stop(self):
+        self.running = False
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if frame_log_enabled() and self.stats.count:
+            print(f"[loop] {self.name} 结束: {self.stats.summary()}")
+
+    def _tick(self):
+        self._after_id = None
+        if not self.running:
+            return
+        if not self.active():
+            self.stop()
+            return
+
+        now = time.perf_counter()
+        self._accumulator += (now - self._last) * 1000
+        self._last = now
+
+        # 按固定步长补上落后的更新
+        due = self.step_ms - TIMER_SLACK_MS
+        steps = 0
+        while self._accumulator >= due and steps < self.max_steps:
+            self.update()
+            self._accumulator -= self.step_ms
+            steps += 1
+            if not self.active():
+                break
+        if self._accumulator >= due and steps == self.max_steps:
+            # 落后太多（例如窗口被拖动时卡住），剩下的直接丢掉
+            dropped = int((self._accumulator + TIMER_SLACK_MS) // self.step_ms)
+            self.stats.dropped_steps += dropped
+            self._accumulator -= dropped * self.step_ms
+        update_done = time.perf_counter()
+
+        if steps:
+            self._render()
+        render_done = time.perf_counter()
+
+        if steps:
+            # 帧间隔按两次绘制之间算（中间提前醒来的空转不算一帧）
+            if self._last_frame is None:
+                interval = self.step_ms
+            else:
+                interval = (now - self._last_frame) * 1000
+            self._last_frame = now
+            self.stats.record(interval, (update_done - now) * 1000,
+                              (render_done - update_done) * 1000, steps)
+            if frame_log_enabled() and self.stats.count % LOG_EVERY == 0:
+                print(f"[loop] {self.name}: {self.stats.summary()}")
+
+        if not self.active():
+            self.stop()
+            return
+        # 下一步到期时再来，至少留 1ms 给界面事件
+        delay = max(1, math.ceil(self.step_ms - self._accumulator - (render_done - now) * 1000))
+        self._after_id = self.widget.after(delay, self._tick)
+
+    def _render(self):
+        scene = self.scene
+        if scene is not None:
+            scene.begin_frame()
+        if self.render is not None:
+            self.render()
+        if scene is not None:
+            if _overlay_enabled:
+                self._draw_overlay()
+            scene.end_frame()
+
+    def _draw_overlay(self):
+        stats = self.stats
+        text = (f"{stats.fps():.0f} FPS  更新 {stats.mean('update'):.1f}ms  "
+                f"绘制 {stats.mean('render'):.1f}ms  跳帧 {stats.skipped}")
+        cw, ch = self.scene.size()
+        self.scene.item("_fps_overlay", "text", (cw - 8, ch - 8), z=1000,
+                        text=text, anchor="se", fill="#00FF00", font=("Consolas", 10))
+
+
+__all__ = [
+    'FixedStepLoop',
+    'FrameStats',
+    'overlay_enabled',
+    'toggle_overlay',
+    'frame_log_enabled',
+]
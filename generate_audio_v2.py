@@ -1,18 +1,38 @@
 # -*- coding: utf-8 -*-
 """
-语音预生成脚本 v2
+语音预生成脚本 v3
 使用Unicode编码作为文件名，避免Android上的中文文件名问题
+v3: 并发生成 + manifest.json 清单，只重新生成文字/语音/语速变化了的文件
+
+用法：
+    python generate_audio_v2.py               # 增量生成
+    python generate_audio_v2.py --dry-run     # 只显示需要生成/删除的文件
+    python generate_audio_v2.py --jobs 8      # 并发数
+    python generate_audio_v2.py --adopt       # 把已有文件记入清单（不重新生成）
+    python generate_audio_v2.py --prune       # 删除已不在列表中的旧文件
 """
 import os
+import sys
+import json
 import asyncio
-import edge_tts
+import hashlib
+import argparse
+
+from tts_cache import edge_tts_save, EDGE_TTS_AVAILABLE
 
 # 语音配置
 VOICE = "zh-CN-XiaoyiNeural"
+RATE = "+0%"
 
 # 输出目录
 OUTPUT_DIR = "audio/generated"
 
+# 清单文件（记录每个输出文件的文字、语音、语速和内容哈希）
+MANIFEST_NAME = "manifest.json"
+
+# 默认并发数
+DEFAULT_JOBS = 4
+
 # 汉字列表
 def load_characters():
     """从汉字表.txt加载汉字"""
@@ -100,92 +120,227 @@ ENCOURAGES = [
 SHORT_PRAISES = ['真棒！', '好！', '对了！', '厉害！', '棒！', '耶！']
 SHORT_ENCOURAGES = ['再试！', '加油！', '没事！']
 
-async def generate_audio(text, filename):
-    """生成单个音频文件"""
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    if os.path.exists(filepath):
-        print(f"  跳过（已存在）: {filename}")
-        return True
-    
+WELCOME_MSG = "欢迎来到乐乐的识字乐园"
+
+
+def build_plan(characters):
+    """生成任务列表：[(文件名, 文字), ...]"""
+    plan = []
+    for item in characters:
+        plan.append((f"char_{char_to_code(item['char'])}.mp3", item["char"]))
+    for item in characters:
+        plan.append((f"pinyin_{char_to_code(item['char'])}.mp3", item["pinyin"]))
+    for item in characters:
+        plan.append((f"word_{char_to_code(item['char'])}.mp3", item["word"]))
+    for i, text in enumerate(PRAISES):
+        plan.append((f"praise_{i:02d}.mp3", text))
+    for i, text in enumerate(ENCOURAGES):
+        plan.append((f"encourage_{i:02d}.mp3", text))
+    for i, text in enumerate(SHORT_PRAISES):
+        plan.append((f"short_praise_{i:02d}.mp3", text))
+    for i, text in enumerate(SHORT_ENCOURAGES):
+        plan.append((f"short_encourage_{i:02d}.mp3", text))
+    plan.append(("welcome.mp3", WELCOME_MSG))
+    return plan
+
+
+def file_sha1(filepath):
+    """计算文件内容哈希"""
+    h = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_manifest(output_dir):
+    """读取清单，不存在或损坏时返回空清单"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
     try:
-        communicate = edge_tts.Communicate(text, VOICE)
-        await communicate.save(filepath)
-        print(f"  生成: {filename} <- {text}")
-        return True
-    except Exception as e:
-        print(f"  失败: {filename} - {e}")
-        return False
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("files", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, files):
+    """原子写入清单"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "files": dict(sorted(files.items()))},
+                  f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, path)
+
+
+def diff_plan(plan, manifest, output_dir, voice=VOICE, rate=RATE):
+    """对比任务列表和清单
+
+    Returns:
+        dict: new（新文件）、changed（输入变化或文件被改动）、
+              unchanged（无需处理）、removed（清单中有但已不在列表中）
+    """
+    result = {"new": [], "changed": [], "unchanged": [], "removed": []}
+    planned = set()
+    for filename, text in plan:
+        planned.add(filename)
+        entry = manifest.get(filename)
+        filepath = os.path.join(output_dir, filename)
+        if entry is None or not os.path.exists(filepath):
+            result["new"].append((filename, text, entry))
+        elif (entry.get("text"), entry.get("voice"), entry.get("rate")) != (text, voice, rate):
+            result["changed"].append((filename, text, entry))
+        elif entry.get("sha1") != file_sha1(filepath):
+            result["changed"].append((filename, text, entry))
+        else:
+            result["unchanged"].append((filename, text, entry))
+    for filename in manifest:
+        if filename not in planned:
+            result["removed"].append((filename, manifest[filename].get("text"), manifest[filename]))
+    return result
+
+
+def print_diff(diff):
+    """打印对比结果"""
+    for filename, text, _ in diff["new"]:
+        print(f"  + {filename} <- {text}")
+    for filename, text, entry in diff["changed"]:
+        old = f"{entry.get('text')} ({entry.get('voice')}, {entry.get('rate')})"
+        print(f"  ~ {filename}: {old} -> {text}")
+    for filename, text, _ in diff["removed"]:
+        print(f"  - {filename} ({text})")
+    print(f"新增 {len(diff['new'])}，变化 {len(diff['changed'])}，"
+          f"不变 {len(diff['unchanged'])}，已移除 {len(diff['removed'])}")
+
+
+async def generate_all(tasks, output_dir, manifest, synthesizer=None,
+                       voice=VOICE, rate=RATE, jobs=DEFAULT_JOBS):
+    """并发生成音频，每完成一个就更新清单（中断后可以续跑）
+
+    Args:
+        tasks: [(文件名, 文字), ...]
+        synthesizer: async (text, voice, rate, filepath)，默认 edge-tts
+        jobs: 最大并发数
+
+    Returns:
+        失败的文件名列表
+    """
+    synthesizer = synthesizer or edge_tts_save
+    queue = asyncio.Queue()
+    for task in tasks:
+        queue.put_nowait(task)
+    failed = []
+
+    async def worker():
+        while not queue.empty():
+            filename, text = queue.get_nowait()
+            filepath = os.path.join(output_dir, filename)
+            temp_path = filepath + ".part"
+            try:
+                await synthesizer(text, voice, rate, temp_path)
+                os.replace(temp_path, filepath)
+                manifest[filename] = {
+                    "text": text,
+                    "voice": voice,
+                    "rate": rate,
+                    "sha1": file_sha1(filepath),
+                }
+                save_manifest(output_dir, manifest)
+                print(f"  生成: {filename} <- {text}")
+            except Exception as e:
+                failed.append(filename)
+                print(f"  失败: {filename} - {e}")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, jobs))))
+    return failed
+
+
+def adopt_existing(plan, output_dir, manifest, voice=VOICE, rate=RATE):
+    """把已存在但不在清单中的文件记入清单（假定它们和当前配置一致）"""
+    count = 0
+    for filename, text in plan:
+        filepath = os.path.join(output_dir, filename)
+        if filename not in manifest and os.path.exists(filepath):
+            manifest[filename] = {"text": text, "voice": voice, "rate": rate,
+                                  "sha1": file_sha1(filepath)}
+            count += 1
+    return count
 
-async def main():
+
+def cleanup_chinese_filenames(output_dir):
+    """删除旧的中文文件名文件"""
+    for f in os.listdir(output_dir):
+        has_chinese = any('\u4e00' <= c <= '\u9fff' for c in f)
+        if has_chinese:
+            os.remove(os.path.join(output_dir, f))
+            print(f"  删除: {f}")
+
+
+def main(argv=None):
     """主函数"""
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    parser = argparse.ArgumentParser(description="语音预生成脚本 v3")
+    parser.add_argument("--dry-run", action="store_true", help="只显示差异，不生成")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="并发数")
+    parser.add_argument("--adopt", action="store_true", help="把已有文件记入清单")
+    parser.add_argument("--prune", action="store_true", help="删除已不在列表中的文件")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="输出目录")
+    args = parser.parse_args(argv)
+    output_dir = args.output
+
+    os.makedirs(output_dir, exist_ok=True)
     
     print("=" * 50)
-    print("语音预生成脚本 v2 (Unicode文件名)")
+    print("语音预生成脚本 v3 (增量 + 并发)")
     print(f"语音: {VOICE}")
-    print(f"输出目录: {OUTPUT_DIR}")
+    print(f"输出目录: {output_dir}")
     print("=" * 50)
     
-    # 先删除旧的中文文件名文件
-    print("\n清理旧的中文文件名文件...")
-    for f in os.listdir(OUTPUT_DIR):
-        # 检查是否包含中文字符
-        has_chinese = any('\u4e00' <= c <= '\u9fff' for c in f)
-        if has_chinese:
-            os.remove(os.path.join(OUTPUT_DIR, f))
-            print(f"  删除: {f}")
-    
     characters = load_characters()
     print(f"\n加载了 {len(characters)} 个汉字")
-    
-    # 生成汉字语音 (使用Unicode编码)
-    print("\n[1/6] 生成汉字语音...")
-    for item in characters:
-        char = item["char"]
-        code = char_to_code(char)
-        await generate_audio(char, f"char_{code}.mp3")
-    
-    # 生成拼音语音
-    print("\n[2/6] 生成拼音语音...")
-    for item in characters:
-        char = item["char"]
-        pinyin = item["pinyin"]
-        code = char_to_code(char)
-        await generate_audio(pinyin, f"pinyin_{code}.mp3")
-    
-    # 生成词组语音
-    print("\n[3/6] 生成词组语音...")
-    for item in characters:
-        char = item["char"]
-        word = item["word"]
-        code = char_to_code(char)
-        await generate_audio(word, f"word_{code}.mp3")
-    
-    # 生成表扬语
-    print("\n[4/6] 生成表扬语...")
-    for i, text in enumerate(PRAISES):
-        await generate_audio(text, f"praise_{i:02d}.mp3")
-    
-    # 生成鼓励语
-    print("\n[5/6] 生成鼓励语...")
-    for i, text in enumerate(ENCOURAGES):
-        await generate_audio(text, f"encourage_{i:02d}.mp3")
-    
-    # 生成简短表扬/鼓励语
-    print("\n[6/6] 生成简短表扬语和欢迎语...")
-    for i, text in enumerate(SHORT_PRAISES):
-        await generate_audio(text, f"short_praise_{i:02d}.mp3")
-    for i, text in enumerate(SHORT_ENCOURAGES):
-        await generate_audio(text, f"short_encourage_{i:02d}.mp3")
-    
-    # 欢迎语
-    await generate_audio("欢迎来到乐乐的识字乐园", "welcome.mp3")
+    plan = build_plan(characters)
+    manifest = load_manifest(output_dir)
+
+    if args.adopt:
+        count = adopt_existing(plan, output_dir, manifest)
+        if not args.dry_run:
+            save_manifest(output_dir, manifest)
+        print(f"\n已记入清单: {count} 个文件")
+
+    diff = diff_plan(plan, manifest, output_dir)
+    print("\n对比清单:")
+    print_diff(diff)
+    if args.dry_run:
+        return 0
+
+    # 先删除旧的中文文件名文件
+    print("\n清理旧的中文文件名文件...")
+    cleanup_chinese_filenames(output_dir)
+
+    if args.prune:
+        for filename, _, _ in diff["removed"]:
+            filepath = os.path.join(output_dir, filename)
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            manifest.pop(filename, None)
+            print(f"  删除: {filename}")
+        save_manifest(output_dir, manifest)
+
+    tasks = [(filename, text) for filename, text, _ in diff["new"] + diff["changed"]]
+    if tasks and not EDGE_TTS_AVAILABLE:
+        print("\nedge-tts 未安装，无法生成")
+        return 1
+    print(f"\n需要生成 {len(tasks)} 个文件（并发 {args.jobs}）...")
+    failed = asyncio.run(generate_all(tasks, output_dir, manifest, jobs=args.jobs))
     
     # 统计
-    files = [f for f in os.listdir(OUTPUT_DIR) if f.endswith(".mp3")]
+    files = [f for f in os.listdir(output_dir) if f.endswith(".mp3")]
     print("\n" + "=" * 50)
-    print(f"完成！共生成 {len(files)} 个音频文件")
+    print(f"完成！共 {len(files)} 个音频文件，本次生成 {len(tasks) - len(failed)} 个，失败 {len(failed)} 个")
     print("=" * 50)
+    return 1 if failed else 0
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(main())
@@ -4,24 +4,33 @@
 适合3岁幼儿的趣味英语学习
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_english")
+
 import tkinter as tk
 from tkinter import messagebox
 import random
 import threading
-import asyncio
 import os
 import tempfile
-import uuid
 import time
 import atexit
 
-try:
-    import edge_tts
-    import pygame
-    pygame.mixer.init()
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+with startup_profiler.phase("audio_init"):
+    try:
+        import edge_tts
+        import pygame
+        pygame.mixer.init()
+        TTS_AVAILABLE = True
+    except ImportError:
+        TTS_AVAILABLE = False
+
+from tts_service import get_tts_service, DEFAULT_CHANNEL
+from core.sampling import sample_distinct
+
+# 英文+中文连读时中文那句的通道（英文用默认通道），新的朗读会取代/取消它
+CN_FOLLOW_CHANNEL = "speech_cn"
 
 # 导入UI配置模块
 try:
@@ -316,50 +325,29 @@ class KidsEnglishApp:
             except:
                 pass
             voice = self.en_voice if lang == "en" else self.cn_voice
-            t = threading.Thread(target=self._speak_thread, args=(text, rate, voice, current_id), daemon=True)
-            t.start()
+            service = get_tts_service()
+            service.cancel(CN_FOLLOW_CHANNEL)
+            service.submit(text, voice, rate,
+                           on_ready=lambda path: self._play_speech(path, current_id))
     
     def _speak_praise_direct(self, text, rate):
-        t = threading.Thread(target=self._speak_thread_direct, args=(text, rate), daemon=True)
-        t.start()
+        get_tts_service().submit(text, self.cn_voice, rate,
+                                 on_ready=self._play_speech_direct, channel="praise")
     
-    def _speak_thread_direct(self, text, rate):
-        audio_file = None
+    def _play_speech_direct(self, audio_file):
         try:
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.cn_voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
             while pygame.mixer.music.get_busy():
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
     
-    def _speak_thread(self, text, rate, voice, speech_id):
-        audio_file = None
+    def _play_speech(self, audio_file, speech_id):
         try:
             if speech_id != self.speech_id:
                 return
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
-            if speech_id != self.speech_id:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
-                return
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
@@ -368,11 +356,6 @@ class KidsEnglishApp:
                     pygame.mixer.music.stop()
                     break
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
     
@@ -383,16 +366,23 @@ class KidsEnglishApp:
             pygame.mixer.music.stop()
         except:
             pass
+        # 英文和中文同时生成，按顺序播放
+        service = get_tts_service()
+        # 两句各占一个通道：下一次朗读会取代它们，stop/cancel 也能取消
+        en_future = service.submit(en_text, self.en_voice, "-10%", channel=DEFAULT_CHANNEL)
+        cn_future = service.submit(cn_text, self.cn_voice, "+0%", channel=CN_FOLLOW_CHANNEL)
         def speak_both():
+            en_file = en_future.result()
             if current_id != self.speech_id:
                 return
-            self._speak_thread(en_text, "-10%", self.en_voice, current_id)
+            if en_file:
+                self._play_speech(en_file, current_id)
             if current_id != self.speech_id:
                 return
             time.sleep(0.3)
-            if current_id != self.speech_id:
-                return
-            self._speak_thread(cn_text, "+0%", self.cn_voice, current_id)
+            cn_file = cn_future.result()
+            if cn_file and current_id == self.speech_id:
+                self._play_speech(cn_file, current_id)
         t = threading.Thread(target=speak_both, daemon=True)
         t.start()
     
@@ -858,19 +848,19 @@ class KidsEnglishApp:
         
         if q_type == "animal":
             self.listen_target = random.choice(self.animals)
-            others = random.sample([a for a in self.animals if a != self.listen_target], 3)
+            others = sample_distinct(self.animals, 3, exclude=(self.listen_target,))
             self.listen_options = [self.listen_target] + others
             self.listen_word = self.listen_target["en"]
             display_key = "emoji"
         elif q_type == "color":
             self.listen_target = random.choice(self.colors_data)
-            others = random.sample([c for c in self.colors_data if c != self.listen_target], 3)
+            others = sample_distinct(self.colors_data, 3, exclude=(self.listen_target,))
             self.listen_options = [self.listen_target] + others
             self.listen_word = self.listen_target["en"]
             display_key = "emoji"
         else:
             self.listen_target = random.choice(self.letters)
-            others = random.sample([l for l in self.letters if l != self.listen_target], 3)
+            others = sample_distinct(self.letters, 3, exclude=(self.listen_target,))
             self.listen_options = [{"letter": l[0], "emoji": l[2]} for l in [self.listen_target] + others]
             self.listen_target = {"letter": self.listen_target[0], "emoji": self.listen_target[2]}
             self.listen_word = self.listen_target["letter"]
@@ -1021,12 +1011,12 @@ class KidsEnglishApp:
         
         if q_type == "animal":
             self.en_whack_target = random.choice(self.animals)
-            others = [a for a in self.animals if a["en"] != self.en_whack_target["en"]]
-            others = random.sample(others, min(3, len(others)))
+            others = sample_distinct(self.animals, 3, exclude=(self.en_whack_target["en"],),
+                                     key=lambda a: a["en"])
         else:
             self.en_whack_target = random.choice(self.colors_data)
-            others = [c for c in self.colors_data if c["en"] != self.en_whack_target["en"]]
-            others = random.sample(others, min(3, len(others)))
+            others = sample_distinct(self.colors_data, 3, exclude=(self.en_whack_target["en"],),
+                                     key=lambda c: c["en"])
         
         self.en_whack_word = self.en_whack_target["en"]
         
@@ -1155,6 +1145,7 @@ class KidsEnglishApp:
             self.window.after(3000, self.en_whack_new_round)
     
     def run(self):
+        self.window.after_idle(startup_profiler.first_frame)
         self.window.mainloop()
 
 
@@ -8,14 +8,16 @@
 优化：UI配置模块，为平板适配做准备
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_game_v3")
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import random
 import threading
-import asyncio
 import os
 import tempfile
-import uuid
 import time
 import atexit
 import json
@@ -32,13 +34,18 @@ except ImportError:
     IS_MOBILE = False
     PLATFORM = "windows"
 
-try:
-    import edge_tts
-    import pygame
-    pygame.mixer.init()
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+with startup_profiler.phase("audio_init"):
+    try:
+        import edge_tts
+        import pygame
+        pygame.mixer.init()
+        TTS_AVAILABLE = True
+    except ImportError:
+        TTS_AVAILABLE = False
+
+from tts_service import get_tts_service
+from core.sampling import sample_distinct
+from rolling_stats import RollingStats, LevelPool
 
 try:
     from pypinyin import pinyin, Style
@@ -57,6 +64,17 @@ except ImportError:
     LEARNING_DATA_AVAILABLE = False
     get_learning_data = lambda: None
 
+try:
+    from config_manager import config_manager
+    CONFIG_MANAGER_AVAILABLE = True
+except ImportError:
+    CONFIG_MANAGER_AVAILABLE = False
+
+try:
+    from progress_store import sqlite_enabled, get_progress_store
+except ImportError:
+    sqlite_enabled = lambda: False
+
 try:
     from word_database import get_characters_by_level, CHAR_EMOJI_MAP, STROKE_DATA, get_stroke_data
     WORD_DB_AVAILABLE = True
@@ -194,6 +212,14 @@ def get_char_sentence(char):
     return backup.get(char, f"乐乐学会了{words[0]}。")
 
 
+# 每个字最近的表现修正掌握度（最近至少答过几次才算数）
+RECENT_MIN_ANSWERS = 3
+# 最近正确率低于这个百分比：最多算"学习中"，出题时多出现
+RECENT_STRUGGLE_ACCURACY = 50
+# 平均答题用时超过这个秒数：还没到"掌握"
+SLOW_ANSWER_SECONDS = 8.0
+
+
 class KidsLiteracyGame:
     def __init__(self):
         self.window = tk.Tk()
@@ -228,6 +254,11 @@ class KidsLiteracyGame:
         # 掌握度等级: 0=生疏(红), 1=学习中(橙), 2=熟悉(黄), 3=掌握(绿)
         self.char_mastery = {}  # {字: {"level": 0-3, "correct": 0, "wrong": 0, "last_seen": ""}}
         self.load_mastery_data()
+        # 每个字最近的表现（滚动窗口 + 衰减正确率/用时）
+        self.char_stats = RollingStats(window=10)
+        # 按掌握度分组的字库（字库列表变了才重建）
+        self._word_pool = None
+        self._question_started = None
         
         # 汪汪队角色列表（用于随机显示）
         self.paw_characters = [
@@ -352,6 +383,9 @@ class KidsLiteracyGame:
                 except:
                     pass
             self.pending_timers.clear()
+            for unsubscribe in getattr(self, 'config_unsubscribers', []):
+                unsubscribe()
+            self.config_unsubscribers = []
             if hasattr(self, 'rest_reminder') and self.rest_reminder:
                 self.rest_reminder.stop()
             try:
@@ -367,6 +401,9 @@ class KidsLiteracyGame:
     def load_mastery_data(self):
         """加载汉字掌握度数据"""
         try:
+            if sqlite_enabled():
+                self.char_mastery = get_progress_store().load_char_mastery()
+                return
             if UI_CONFIG_AVAILABLE:
                 mastery_file = get_data_path("char_mastery.json")
             else:
@@ -381,6 +418,9 @@ class KidsLiteracyGame:
     def save_mastery_data(self):
         """保存汉字掌握度数据"""
         try:
+            if sqlite_enabled():
+                get_progress_store().save_char_mastery(self.char_mastery)
+                return
             if UI_CONFIG_AVAILABLE:
                 mastery_file = get_data_path("char_mastery.json")
             else:
@@ -390,7 +430,7 @@ class KidsLiteracyGame:
         except Exception as e:
             print(f"保存掌握度数据失败: {e}")
     
-    def update_char_mastery(self, char, is_correct):
+    def update_char_mastery(self, char, is_correct, response_time=None):
         """更新汉字掌握度
         
         掌握度计算规则：
@@ -415,6 +455,7 @@ class KidsLiteracyGame:
         
         data = self.char_mastery[char]
         data["last_seen"] = today
+        self.char_stats.record(char, is_correct, response_time)
         
         if is_correct:
             data["correct"] += 1
@@ -426,18 +467,36 @@ class KidsLiteracyGame:
         # 计算掌握度等级
         score = data["score"]
         if score >= 9:
-            data["level"] = 3  # 掌握
+            level = 3  # 掌握
         elif score >= 6:
-            data["level"] = 2  # 熟悉
+            level = 2  # 熟悉
         elif score >= 3:
-            data["level"] = 1  # 学习中
+            level = 1  # 学习中
         else:
-            data["level"] = 0  # 生疏
+            level = 0  # 生疏
+        data["level"] = self._adjust_level_by_recent(level, self.char_stats.get(char))
+        if self._word_pool is not None:
+            self._word_pool.set_level(char, data["level"])
         
         # 定期保存
         if (data["correct"] + data["wrong"]) % 5 == 0:
             self.save_mastery_data()
     
+    def _adjust_level_by_recent(self, level, recent):
+        """按这个字最近的表现修正掌握度（抽题权重跟着掌握度走）
+
+        - 最近几次老答错：累计分再高也最多算"学习中"，多出几次
+        - 答对了但总是想很久：还不算"掌握"
+        """
+        if recent is None or recent.recent_count() < RECENT_MIN_ANSWERS:
+            return level
+        if recent.recent_accuracy() < RECENT_STRUGGLE_ACCURACY:
+            return min(level, 1)
+        slow = recent.response_time.value
+        if level == 3 and slow is not None and slow > SLOW_ANSWER_SECONDS:
+            return 2
+        return level
+    
     def get_mastery_stats(self):
         """获取掌握度统计"""
         total = len(self.words)
@@ -712,9 +771,21 @@ class KidsLiteracyGame:
         
         # 加载设置
         self.load_sound_settings()
+
+        # 音效和语音设置改了由配置管理器推送过来，不用重新读文件
+        self.config_unsubscribers = []
+        if CONFIG_MANAGER_AVAILABLE:
+            self.config_unsubscribers.append(
+                config_manager.subscribe("sound", self._on_sound_settings_changed))
+            self.config_unsubscribers.append(
+                config_manager.subscribe("voice", self._on_voice_settings_changed))
     
     def load_sound_settings(self):
         """加载音效设置"""
+        if CONFIG_MANAGER_AVAILABLE:
+            self.sound_enabled = config_manager.get("sound", "sound_enabled", True)
+            self.music_enabled = config_manager.get("sound", "music_enabled", False)
+            return
         try:
             if UI_CONFIG_AVAILABLE:
                 settings_file = get_data_path("sound_settings.json")
@@ -729,7 +800,13 @@ class KidsLiteracyGame:
             pass
     
     def save_sound_settings(self):
-        """保存音效设置"""
+        """保存音效设置（经配置管理器合并保存，并通知订阅者）"""
+        if CONFIG_MANAGER_AVAILABLE:
+            config_manager.update("sound", {
+                "sound_enabled": self.sound_enabled,
+                "music_enabled": self.music_enabled
+            })
+            return
         try:
             if UI_CONFIG_AVAILABLE:
                 settings_file = get_data_path("sound_settings.json")
@@ -743,6 +820,27 @@ class KidsLiteracyGame:
         except:
             pass
     
+    def _on_sound_settings_changed(self, config_name, changes, snapshot):
+        """别处改了音效设置：更新开关，背景音乐跟着开关"""
+        self.sound_enabled = snapshot.get("sound_enabled", True)
+        music_enabled = snapshot.get("music_enabled", False)
+        if music_enabled != self.music_enabled:
+            self.music_enabled = music_enabled
+            if music_enabled:
+                self.start_background_music()
+            else:
+                self.stop_background_music()
+    
+    def _on_voice_settings_changed(self, config_name, changes, snapshot):
+        """语音风格改了：换朗读语音和表扬/鼓励语"""
+        try:
+            from voice_config_shared import get_voice, get_praises, get_encourages
+        except ImportError:
+            return
+        self.voice = get_voice()
+        self.praises = get_praises()
+        self.encourages = get_encourages()
+    
     def play_sound(self, sound_name):
         """播放音效"""
         if not self.sound_enabled:
@@ -840,6 +938,13 @@ class KidsLiteracyGame:
     # =====================================================
     # 自适应难度系统
     # =====================================================
+    def _get_word_pool(self):
+        """按掌握度分组的字库（换字库、增删字后重建）"""
+        if self._word_pool is None or self._word_pool.is_stale(self.words):
+            self._word_pool = LevelPool(self.words, key=lambda w: w[0],
+                                        level_of=self.get_char_mastery_level)
+        return self._word_pool
+    
     def get_adaptive_word(self, exclude_chars=None):
         """智能选择下一个要学习的汉字
         
@@ -855,42 +960,15 @@ class KidsLiteracyGame:
         if exclude_chars is None:
             exclude_chars = []
         
-        # 按掌握度分组
-        groups = {0: [], 1: [], 2: [], 3: []}
-        
-        for w in self.words:
-            char = w[0]
-            if char in exclude_chars:
-                continue
-            level = self.get_char_mastery_level(char)
-            groups[level].append(w)
-        
-        # 权重选择
+        # 权重选择：按掌握度分组的字库，先按"权重 x 组大小"选组，再组内均匀选
         weights = {0: 50, 1: 30, 2: 15, 3: 5}
+        word = self._get_word_pool().sample(weights, exclude=exclude_chars)
+        if word is not None:
+            return word
         
-        # 构建加权列表
-        weighted_pool = []
-        for level, words in groups.items():
-            if words:
-                weight = weights[level]
-                weighted_pool.extend([(w, weight) for w in words])
-        
-        if not weighted_pool:
-            # 如果所有字都被排除了，从全部字库随机选
-            available = [w for w in self.words if w[0] not in exclude_chars]
-            return random.choice(available) if available else random.choice(self.words)
-        
-        # 加权随机选择
-        total_weight = sum(w[1] for w in weighted_pool)
-        r = random.uniform(0, total_weight)
-        
-        cumulative = 0
-        for word, weight in weighted_pool:
-            cumulative += weight
-            if r <= cumulative:
-                return word
-        
-        return weighted_pool[-1][0]
+        # 如果所有字都被排除了，从全部字库随机选
+        available = [w for w in self.words if w[0] not in exclude_chars]
+        return random.choice(available) if available else random.choice(self.words)
     
     def get_adaptive_options(self, target_word, num_options=4):
         """智能生成选项，确保难度适中
@@ -901,50 +979,20 @@ class KidsLiteracyGame:
         """
         target_char = target_word[0]
         target_level = self.get_char_mastery_level(target_char)
+        pool = self._get_word_pool()
+        # 出选项就是出题，从这里开始计答题用时
+        self._question_started = time.monotonic()
         
-        # 获取其他字
-        other_words = [w for w in self.words if w[0] != target_char]
-        
-        if len(other_words) < num_options - 1:
-            # 字库太小，直接随机
-            options = [target_word] + random.sample(other_words, min(len(other_words), num_options - 1))
-            random.shuffle(options)
-            return options
-        
-        # 按掌握度分组
-        same_level = []
-        near_level = []
-        other_level = []
-        
-        for w in other_words:
-            level = self.get_char_mastery_level(w[0])
-            if level == target_level:
-                same_level.append(w)
-            elif abs(level - target_level) == 1:
-                near_level.append(w)
-            else:
-                other_level.append(w)
-        
-        # 优先选择同级别或相近级别的字作为干扰项
-        distractors = []
+        # 优先选择同级别或相近级别的字作为干扰项（组内不放回均匀抽）
+        exclude = (target_char,)
         needed = num_options - 1
-        
-        # 先从同级别选
-        if same_level:
-            take = min(len(same_level), needed)
-            distractors.extend(random.sample(same_level, take))
-            needed -= take
-        
-        # 再从相近级别选
-        if needed > 0 and near_level:
-            take = min(len(near_level), needed)
-            distractors.extend(random.sample(near_level, take))
-            needed -= take
-        
-        # 最后从其他级别选
-        if needed > 0 and other_level:
-            take = min(len(other_level), needed)
-            distractors.extend(random.sample(other_level, take))
+        distractors = pool.sample_levels([target_level], needed, exclude)
+        if len(distractors) < needed:
+            near = [target_level - 1, target_level + 1]
+            distractors += pool.sample_levels(near, needed - len(distractors), exclude)
+        if len(distractors) < needed:
+            far = [lv for lv in range(4) if abs(lv - target_level) > 1]
+            distractors += pool.sample_levels(far, needed - len(distractors), exclude)
         
         options = [target_word] + distractors
         random.shuffle(options)
@@ -1065,6 +1113,12 @@ class KidsLiteracyGame:
         """记录答题结果"""
         points = 10 if is_correct else 0
         
+        # 答题用时（从出选项开始算，没有计时的玩法为 None）
+        response_time = None
+        if self._question_started is not None:
+            response_time = time.monotonic() - self._question_started
+            self._question_started = None
+        
         # 更新汉字掌握度
         if question_data:
             # 从question_data中提取汉字
@@ -1076,10 +1130,10 @@ class KidsLiteracyGame:
                 # 格式如 "看图选字:🌙" 或 "听音选字:月"
                 char = question_data.get("answer", "")
             if char and len(char) == 1:
-                self.update_char_mastery(char, is_correct)
+                self.update_char_mastery(char, is_correct, response_time)
         
         if LEARNING_DATA_AVAILABLE:
-            result = record_answer("literacy", points, is_correct, question_data)
+            result = record_answer("literacy", points, is_correct, question_data, response_time)
             
             # 答对时将内容加入复习列表
             if is_correct and question_data:
@@ -1249,50 +1303,27 @@ class KidsLiteracyGame:
                 pygame.mixer.music.stop()
             except:
                 pass
-            t = threading.Thread(target=self._speak_thread, args=(text, rate, current_id), daemon=True)
-            t.start()
+            get_tts_service().submit(text, self.voice, rate,
+                                     on_ready=lambda path: self._play_speech(path, current_id))
     
     def _speak_praise_direct(self, text, rate):
-        t = threading.Thread(target=self._speak_thread_direct, args=(text, rate), daemon=True)
-        t.start()
+        get_tts_service().submit(text, self.voice, rate,
+                                 on_ready=self._play_speech_direct, channel="praise")
     
-    def _speak_thread_direct(self, text, rate):
-        audio_file = None
+    def _play_speech_direct(self, audio_file):
         try:
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
             while pygame.mixer.music.get_busy():
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
     
-    def _speak_thread(self, text, rate, speech_id):
-        audio_file = None
+    def _play_speech(self, audio_file, speech_id):
         try:
             if speech_id != self.speech_id:
                 return
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
-            if speech_id != self.speech_id:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
-                return
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
@@ -1301,11 +1332,6 @@ class KidsLiteracyGame:
                     pygame.mixer.music.stop()
                     break
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
     
@@ -1345,6 +1371,8 @@ class KidsLiteracyGame:
         self.praise_playing = False
 
     def create_main_menu(self):
+        if TTS_AVAILABLE:
+            get_tts_service().cancel_prefetch()
         for widget in self.window.winfo_children():
             widget.destroy()
         self.window.configure(bg="#FFF8E1")
@@ -1592,6 +1620,10 @@ class KidsLiteracyGame:
                 pass
         self.pending_timers.clear()
         
+        # 离开当前游戏，取消预取
+        if TTS_AVAILABLE:
+            get_tts_service().cancel_prefetch()
+        
         for widget in self.window.winfo_children():
             widget.destroy()
         self.window.configure(bg=bg_color)
@@ -1751,6 +1783,7 @@ class KidsLiteracyGame:
     def start_audio(self):
         self.clear_game_area("#FFE4E1")
         self.audio_score = 0
+        self.audio_upcoming = []
         
         # 标题带狗狗装饰
         if THEME_AVAILABLE:
@@ -1785,8 +1818,14 @@ class KidsLiteracyGame:
         self.new_audio_question()
     
     def new_audio_question(self):
-        # 使用自适应难度选择目标字
-        self.audio_target = self.get_adaptive_word()
+        # 使用自适应难度选择目标字（提前选好下一题，并预取它的题目语音）
+        if self.audio_upcoming:
+            self.audio_target = self.audio_upcoming.pop(0)
+        else:
+            self.audio_target = self.get_adaptive_word()
+        self.audio_upcoming.append(self.get_adaptive_word())
+        if TTS_AVAILABLE:
+            get_tts_service().prefetch([f"请选择，{w[0]}" for w in self.audio_upcoming], self.voice, "-10%")
         
         # 使用智能选项生成
         self.audio_options = self.get_adaptive_options(self.audio_target, 4)
@@ -2125,9 +2164,8 @@ class KidsLiteracyGame:
         self.whack_correct_pos = random.choice(positions)
         
         # 选择干扰汉字
-        other_words = [w for w in self.words if w[0] != self.whack_target_char]
-        num_distractors = min(len(other_words), num_moles - 1)
-        distractors = random.sample(other_words, num_distractors) if num_distractors > 0 else []
+        distractors = sample_distinct(self.words, num_moles - 1,
+                                      exclude=(self.whack_target_char,), key=lambda w: w[0])
         
         # 放置地鼠
         distractor_idx = 0
@@ -3081,7 +3119,7 @@ class KidsLiteracyGame:
             self.speak(f"请选择，{q[0]}", "-10%")
         
         # 选项
-        others = random.sample([w for w in self.words if w != q], min(3, len(self.words) - 1))
+        others = sample_distinct(self.words, 3, exclude=(q,))
         options = [q] + others
         random.shuffle(options)
         correct_idx = options.index(q)
@@ -3177,6 +3215,7 @@ class KidsLiteracyGame:
         self.speak(f"答题完成！乐乐答对了{self.parent_correct}题，得了{self.parent_score}分！{comment}", "+0%")
     
     def run(self):
+        self.window.after_idle(startup_profiler.first_frame)
         self.window.mainloop()
 
 
@@ -6,15 +6,17 @@
 改进：退出确认、临时文件清理、休息提醒、数据保存优化、打包支持
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_learning_main")
+
 import tkinter as tk
 from tkinter import messagebox, ttk
 import subprocess
 import sys
 import os
 import threading
-import asyncio
 import tempfile
-import uuid
 import time
 import json
 import random
@@ -22,13 +24,16 @@ import datetime
 import atexit
 
 # edge-tts 语音
-try:
-    import edge_tts
-    import pygame
-    pygame.mixer.init()
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+with startup_profiler.phase("audio_init"):
+    try:
+        import edge_tts
+        import pygame
+        pygame.mixer.init()
+        TTS_AVAILABLE = True
+    except ImportError:
+        TTS_AVAILABLE = False
+
+from tts_service import get_tts_service
 
 # 导入UI配置模块
 try:
@@ -48,6 +53,12 @@ try:
 except ImportError:
     LEARNING_DATA_AVAILABLE = False
 
+# 导入共享语音配置（经配置管理器保存，各模块马上收到新风格）
+try:
+    from voice_config_shared import save_voice_config as _save_shared_voice_config
+except ImportError:
+    _save_shared_voice_config = None
+
 # 导入基础模块
 try:
     from learning_base import temp_file_manager, RestReminder
@@ -207,6 +218,9 @@ def load_voice_config():
 
 def save_voice_config(config):
     """保存语音配置"""
+    if _save_shared_voice_config is not None:
+        _save_shared_voice_config(config)
+        return
     try:
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
@@ -256,30 +270,13 @@ class KidsLearningMain:
                 pygame.mixer.music.stop()
             except:
                 pass
-            t = threading.Thread(target=self._speak_thread, args=(text, rate, current_id), daemon=True)
-            t.start()
+            get_tts_service().submit(text, self.voice, rate,
+                                     on_ready=lambda path: self._play_speech(path, current_id))
     
-    def _speak_thread(self, text, rate, speech_id):
-        audio_file = None
+    def _play_speech(self, audio_file, speech_id):
         try:
             if speech_id != self.speech_id:
                 return
-            
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            
-            asyncio.run(generate())
-            
-            if speech_id != self.speech_id:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
-                return
-            
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
@@ -288,19 +285,8 @@ class KidsLearningMain:
                     pygame.mixer.music.stop()
                     break
                 pygame.time.Clock().tick(10)
-            
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
-            if audio_file:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
 
     def create_main_menu(self):
         for widget in self.window.winfo_children():
@@ -1248,6 +1234,7 @@ class KidsLearningMain:
         self.review_items = items.copy()
         self.review_index = 0
         self.review_correct = 0
+        self.review_results = []  # 本次会话的答题结果，结束时一次写入
         
         self.review_win = tk.Toplevel(self.window)
         self.review_win.title("🧠 复习中...")
@@ -1259,6 +1246,7 @@ class KidsLearningMain:
         x = (self.review_win.winfo_screenwidth() - 600) // 2
         y = (self.review_win.winfo_screenheight() - 500) // 2
         self.review_win.geometry(f"+{x}+{y}")
+        self.review_win.protocol("WM_DELETE_WINDOW", self.close_review_session)
         
         self.show_review_question()
     
@@ -1322,8 +1310,8 @@ class KidsLearningMain:
     
     def review_answer(self, item, is_correct):
         """处理复习答案"""
-        # 更新复习记录
-        self.learning_data.update_review_item(item["category"], item["item"], is_correct)
+        # 记录复习结果（会话结束时批量更新）
+        self.review_results.append((item["category"], item["item"], is_correct))
         
         if is_correct:
             self.review_correct += 1
@@ -1334,8 +1322,21 @@ class KidsLearningMain:
         self.review_index += 1
         self.review_win.after(1500, self.show_review_question)
     
+    def flush_review_results(self):
+        """把本次会话的复习结果一次写入学习数据"""
+        results, self.review_results = self.review_results, []
+        if results:
+            self.learning_data.update_review_items(results)
+    
+    def close_review_session(self):
+        """中途关闭复习窗口时也保存已答的结果"""
+        self.flush_review_results()
+        self.review_win.destroy()
+    
     def finish_review_session(self):
         """完成复习会话"""
+        self.flush_review_results()
+        
         for widget in self.review_win.winfo_children():
             widget.destroy()
         
@@ -2064,6 +2065,8 @@ class KidsLearningMain:
             self.speak("今天有新的挑战任务，快来完成吧！")
     
     def run(self):
+        # 进入主循环后第一次空闲时窗口已画好，记为首帧
+        self.window.after_idle(startup_profiler.first_frame)
         self.window.mainloop()
 
 
@@ -7,6 +7,10 @@
 v2.0 更新：继承 BaseGameModule，减少代码重复
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_math")
+
 import tkinter as tk
 from tkinter import messagebox
 import random
@@ -17,6 +21,7 @@ from base_module import (
     BaseGameModule, logger, TTS_AVAILABLE,
     UI_CONFIG_AVAILABLE, IS_MOBILE
 )
+from core.sampling import sample_distinct
 
 # 导入UI配置模块
 try:
@@ -884,7 +889,7 @@ class KidsMathApp(BaseGameModule):
     
     def new_shape_question(self):
         self.shape_target = random.choice(self.shapes)
-        others = random.sample([s for s in self.shapes if s != self.shape_target], 3)
+        others = sample_distinct(self.shapes, 3, exclude=(self.shape_target,))
         self.shape_options = [self.shape_target] + others
         random.shuffle(self.shape_options)
         self.shape_correct_idx = self.shape_options.index(self.shape_target)
@@ -1088,8 +1093,7 @@ class KidsMathApp(BaseGameModule):
         positions = random.sample(range(9), num_moles)
         correct_pos = random.choice(positions)
         
-        other_nums = [n for n in range(1, 11) if n != self.whack_target]
-        distractors = random.sample(other_nums, num_moles - 1)
+        distractors = sample_distinct(range(1, 11), num_moles - 1, exclude=(self.whack_target,))
         
         distractor_idx = 0
         for pos in positions:
@@ -6,6 +6,10 @@
 v2.0 更新：继承 BaseGameModule，减少代码重复
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_pinyin")
+
 import tkinter as tk
 from tkinter import messagebox
 import random
@@ -15,6 +19,7 @@ from base_module import (
     BaseGameModule, logger, TTS_AVAILABLE,
     UI_CONFIG_AVAILABLE, IS_MOBILE
 )
+from core.sampling import sample_distinct
 
 # 导入语音配置
 try:
@@ -424,7 +429,7 @@ class KidsPinyinApp(BaseGameModule):
     def new_listen_question(self):
         all_pinyin = self.vowels + self.consonants
         self.listen_target = random.choice(all_pinyin)
-        others = random.sample([p for p in all_pinyin if p != self.listen_target], 3)
+        others = sample_distinct(all_pinyin, 3, exclude=(self.listen_target,))
         self.listen_options = [self.listen_target] + others
         random.shuffle(self.listen_options)
         self.listen_correct_idx = self.listen_options.index(self.listen_target)
@@ -501,7 +506,7 @@ class KidsPinyinApp(BaseGameModule):
     def new_picture_question(self):
         all_pinyin = self.vowels + self.consonants
         self.pic_target = random.choice(all_pinyin)
-        others = random.sample([p for p in all_pinyin if p != self.pic_target], 3)
+        others = sample_distinct(all_pinyin, 3, exclude=(self.pic_target,))
         self.pic_options = [self.pic_target] + others
         random.shuffle(self.pic_options)
         self.pic_correct_idx = self.pic_options.index(self.pic_target)
@@ -702,7 +707,7 @@ class KidsPinyinApp(BaseGameModule):
         
         all_pinyin = self.consonants + self.vowels
         self.py_whack_target = random.choice(all_pinyin)
-        others = random.sample([p for p in all_pinyin if p != self.py_whack_target], 3)
+        others = sample_distinct(all_pinyin, 3, exclude=(self.py_whack_target,))
         self.py_whack_options = [self.py_whack_target] + others
         self.py_whack_target_pinyin = self.py_whack_target[0]
         self.py_whack_target_label.config(text=self.py_whack_target_pinyin)
@@ -5,27 +5,33 @@
 包含：找不同、记忆翻牌、图形规律、分类游戏、迷宫寻路、拼图游戏
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_thinking")
+
 import tkinter as tk
 from tkinter import messagebox
 import random
 import threading
-import asyncio
 import os
 import tempfile
-import uuid
 import time
 import atexit
 
 import math
 
 # edge-tts 语音
-try:
-    import edge_tts
-    import pygame
-    pygame.mixer.init()
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+with startup_profiler.phase("audio_init"):
+    try:
+        import edge_tts
+        import pygame
+        pygame.mixer.init()
+        TTS_AVAILABLE = True
+    except ImportError:
+        TTS_AVAILABLE = False
+
+from tts_service import get_tts_service
+from core.sampling import sample_distinct
 
 # 导入UI配置模块
 try:
@@ -273,55 +279,27 @@ class KidsThinkingApp:
                 pygame.mixer.music.stop()
             except:
                 pass
-            t = threading.Thread(target=self._speak_thread, args=(text, rate, current_id), daemon=True)
-            t.start()
+            get_tts_service().submit(text, self.voice, rate,
+                                     on_ready=lambda path: self._play_speech(path, current_id))
     
     def _speak_praise_direct(self, text, rate):
-        t = threading.Thread(target=self._speak_thread_direct, args=(text, rate), daemon=True)
-        t.start()
+        get_tts_service().submit(text, self.voice, rate,
+                                 on_ready=self._play_speech_direct, channel="praise")
     
-    def _speak_thread_direct(self, text, rate):
-        audio_file = None
+    def _play_speech_direct(self, audio_file):
         try:
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
             while pygame.mixer.music.get_busy():
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
-            if audio_file:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
     
-    def _speak_thread(self, text, rate, speech_id):
-        audio_file = None
+    def _play_speech(self, audio_file, speech_id):
         try:
             if speech_id != self.speech_id:
                 return
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
-            if speech_id != self.speech_id:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
-                return
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
@@ -330,18 +308,8 @@ class KidsThinkingApp:
                     pygame.mixer.music.stop()
                     break
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
-            if audio_file:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
     
     def _scan_audio_folder(self, folder_name):
         folder_path = os.path.join(self.audio_dir, folder_name)
@@ -838,8 +806,7 @@ class KidsThinkingApp:
         
         # 生成选项
         all_shapes = list(self.shape_colors.keys())
-        others = [s for s in all_shapes if s != self.pattern_answer]
-        self.pattern_options = [self.pattern_answer] + random.sample(others, 2)
+        self.pattern_options = [self.pattern_answer] + sample_distinct(all_shapes, 2, exclude=(self.pattern_answer,))
         random.shuffle(self.pattern_options)
         self.pattern_correct_idx = self.pattern_options.index(self.pattern_answer)
         
@@ -1088,7 +1055,7 @@ class KidsThinkingApp:
     def new_matching_question(self):
         all_emojis = ["🍎", "🍌", "🍊", "🍇", "🐱", "🐶", "⭐", "🌙", "🎈", "🎁"]
         self.match_answer = random.choice(all_emojis)
-        others = random.sample([e for e in all_emojis if e != self.match_answer], 3)
+        others = sample_distinct(all_emojis, 3, exclude=(self.match_answer,))
         
         self.match_options = [self.match_answer] + others
         random.shuffle(self.match_options)
@@ -1122,6 +1089,7 @@ class KidsThinkingApp:
         self.window.after(5500, self.new_matching_question)
     
     def run(self):
+        self.window.after_idle(startup_profiler.first_frame)
         self.window.mainloop()
 
 
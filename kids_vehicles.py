@@ -5,24 +5,34 @@
 使用Canvas绘制彩色卡通图形
 """
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("kids_vehicles")
+
 import tkinter as tk
 from tkinter import messagebox
 import random
 import threading
-import asyncio
 import os
 import tempfile
-import uuid
 import time
 import math
 
-try:
-    import edge_tts
-    import pygame
-    pygame.mixer.init()
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
+with startup_profiler.phase("audio_init"):
+    try:
+        import edge_tts
+        import pygame
+        pygame.mixer.init()
+        TTS_AVAILABLE = True
+    except ImportError:
+        TTS_AVAILABLE = False
+
+from tts_service import get_tts_service
+from canvas_scene import CanvasScene
+from sprite_cache import cached
+from game_loop import FixedStepLoop, toggle_overlay
+from core.collision import EntityGroup
+from core.sampling import sample_distinct
 
 # 导入UI配置模块
 try:
@@ -170,6 +180,10 @@ class KidsVehiclesApp:
         self.praise_playing = False
         self.game_running = False
         self.current_pup = None  # 当前游戏的狗狗
+        self.game_loop = None  # 当前小游戏的固定步长循环
+        
+        # F3 显示/隐藏帧率
+        self.window.bind("<F3>", toggle_overlay)
         
         self.create_main_menu()
 
@@ -191,50 +205,27 @@ class KidsVehiclesApp:
                 pygame.mixer.music.stop()
             except:
                 pass
-            t = threading.Thread(target=self._speak_thread, args=(text, rate, current_id), daemon=True)
-            t.start()
+            get_tts_service().submit(text, self.voice, rate,
+                                     on_ready=lambda path: self._play_speech(path, current_id))
     
     def _speak_praise_direct(self, text, rate):
-        t = threading.Thread(target=self._speak_thread_direct, args=(text, rate), daemon=True)
-        t.start()
+        get_tts_service().submit(text, self.voice, rate,
+                                 on_ready=self._play_speech_direct, channel="praise")
     
-    def _speak_thread_direct(self, text, rate):
-        audio_file = None
+    def _play_speech_direct(self, audio_file):
         try:
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
             while pygame.mixer.music.get_busy():
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
     
-    def _speak_thread(self, text, rate, speech_id):
-        audio_file = None
+    def _play_speech(self, audio_file, speech_id):
         try:
             if speech_id != self.speech_id:
                 return
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            async def generate():
-                communicate = edge_tts.Communicate(text, self.voice, rate=rate)
-                await communicate.save(audio_file)
-            asyncio.run(generate())
-            if speech_id != self.speech_id:
-                try:
-                    os.remove(audio_file)
-                except:
-                    pass
-                return
             pygame.mixer.music.stop()
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
@@ -243,11 +234,6 @@ class KidsVehiclesApp:
                     pygame.mixer.music.stop()
                     break
                 pygame.time.Clock().tick(10)
-            time.sleep(0.1)
-            try:
-                os.remove(audio_file)
-            except:
-                pass
         except Exception as e:
             print(f"语音错误: {e}")
     
@@ -434,15 +420,12 @@ class KidsVehiclesApp:
         canvas.create_rectangle(x+8*s, y-35*s, x+12*s, y-32*s, fill="#333333", tags=tag)
         
         # === 机械臂 ===
-        arm_rad = math.radians(arm_angle)
+        arm_end_x, arm_end_y, bucket_x, bucket_y = self._excavator_arm(x, y, s, arm_angle)
         
         # 大臂基座
         canvas.create_oval(x+10*s, y-25*s, x+25*s, y-10*s, fill="#FFB800", outline="#CC9500", width=2, tags=tag)
         
         # 大臂
-        arm_len = 70 * s
-        arm_end_x = x + 17*s + arm_len * math.cos(arm_rad)
-        arm_end_y = y - 17*s - arm_len * math.sin(arm_rad)
         # 大臂主体（梯形截面效果）
         canvas.create_polygon(
             x+12*s, y-22*s, x+22*s, y-22*s,
@@ -455,10 +438,6 @@ class KidsVehiclesApp:
         
         # 小臂
         small_arm_angle = arm_angle - 40
-        small_arm_rad = math.radians(small_arm_angle)
-        small_arm_len = 50 * s
-        bucket_x = arm_end_x + small_arm_len * math.cos(small_arm_rad)
-        bucket_y = arm_end_y - small_arm_len * math.sin(small_arm_rad)
         canvas.create_polygon(
             arm_end_x-4*s, arm_end_y, arm_end_x+4*s, arm_end_y,
             bucket_x+3*s, bucket_y, bucket_x-3*s, bucket_y,
@@ -488,6 +467,24 @@ class KidsVehiclesApp:
             )
         
         return bucket_x, bucket_y + 35*s  # 返回铲斗位置
+    
+    @staticmethod
+    def _excavator_arm(x, y, s, arm_angle):
+        """挖掘机大臂末端和铲斗的位置"""
+        arm_rad = math.radians(arm_angle)
+        arm_len = 70 * s
+        arm_end_x = x + 17*s + arm_len * math.cos(arm_rad)
+        arm_end_y = y - 17*s - arm_len * math.sin(arm_rad)
+        small_arm_rad = math.radians(arm_angle - 40)
+        small_arm_len = 50 * s
+        bucket_x = arm_end_x + small_arm_len * math.cos(small_arm_rad)
+        bucket_y = arm_end_y - small_arm_len * math.sin(small_arm_rad)
+        return arm_end_x, arm_end_y, bucket_x, bucket_y
+    
+    def excavator_bucket_pos(self, x, y, scale=1.0, arm_angle=30):
+        """铲斗位置（和 draw_excavator 的返回值一样，不用画）"""
+        _, _, bucket_x, bucket_y = self._excavator_arm(x, y, scale, arm_angle)
+        return bucket_x, bucket_y + 35*scale
 
     def draw_race_car(self, canvas, x, y, scale=1.0, color="#FF0000"):
         """绘制更真实的赛车 - 车头朝右（用于主菜单预览）"""
@@ -1408,6 +1405,7 @@ class KidsVehiclesApp:
     # =====================================================
     def create_main_menu(self):
         self.game_running = False
+        self.stop_game_loop()
         self.init_achievements()
         self.current_pup = None
         
@@ -1592,6 +1590,7 @@ class KidsVehiclesApp:
 
     def clear_game_area(self, bg_color="#87CEEB"):
         self.game_running = False
+        self.stop_game_loop()
         for widget in self.window.winfo_children():
             widget.destroy()
         self.window.configure(bg=bg_color)
@@ -1625,6 +1624,19 @@ class KidsVehiclesApp:
         
         self.game_frame = tk.Frame(self.window, bg=bg_color)
         self.game_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    
+    def start_game_loop(self, name, scene, update, render, step_ms=50):
+        """启动小游戏循环：update 按固定步长执行，render 每帧画一次"""
+        self.stop_game_loop()
+        self.game_loop = FixedStepLoop(self.window, update, render, step_ms=step_ms,
+                                       scene=scene, name=name,
+                                       active=lambda: self.game_running)
+        self.game_loop.start()
+    
+    def stop_game_loop(self):
+        if self.game_loop:
+            self.game_loop.stop()
+            self.game_loop = None
 
 
     # =====================================================
@@ -1776,8 +1788,8 @@ class KidsVehiclesApp:
                                     font=("微软雅黑", 16, "bold"), fill="#FFD700")
         
         # 画挖掘机
-        bucket_pos = self.draw_excavator(self.exc_canvas, self.exc_x, self.ground_y, 1.0, self.exc_arm_angle)
-        self.bucket_x, self.bucket_y = bucket_pos
+        cached(self.draw_excavator)(self.exc_canvas, self.exc_x, self.ground_y, 1.0, self.exc_arm_angle)
+        self.bucket_x, self.bucket_y = self.excavator_bucket_pos(self.exc_x, self.ground_y, 1.0, self.exc_arm_angle)
     
     def exc_draw(self):
         """更新场景"""
@@ -1887,9 +1899,10 @@ class KidsVehiclesApp:
         self.clear_game_area("#333333")
         self.race_score = 0
         self.race_speed = 3  # 降低初始速度，更适合小朋友
-        self.race_obstacles = []
-        self.race_coins = []
+        self.race_obstacles = EntityGroup()
+        self.race_coins = EntityGroup()
         self.race_distance = 0
+        self.race_message = None
         self.game_running = True
         
         # 获取当前狗狗信息
@@ -1905,6 +1918,7 @@ class KidsVehiclesApp:
         self.race_canvas = tk.Canvas(self.game_frame, bg="#333333", highlightthickness=2)
         self.race_canvas.pack(pady=5, fill=tk.BOTH, expand=True)
         self.window.update()
+        self.race_scene = CanvasScene(self.race_canvas)
         
         # 获取画布尺寸
         self.race_cw = self.race_canvas.winfo_width()
@@ -1926,7 +1940,7 @@ class KidsVehiclesApp:
         self.window.bind("<Right>", self.race_move_right)
         
         self.speak(f"{pup.get('name', '阿奇')}说：赛车比赛开始！躲避障碍物，吃金币加分！")
-        self.race_game_loop()
+        self.start_game_loop("race", self.race_scene, self.race_update, self.race_render)
     
     def race_move_left(self, event):
         if self.game_running and self.race_x > self.race_left + 80:
@@ -1936,16 +1950,9 @@ class KidsVehiclesApp:
         if self.game_running and self.race_x < self.race_right - 80:
             self.race_x += 40
     
-    def race_game_loop(self):
-        if not self.game_running:
-            return
-        
-        self.race_canvas.delete("all")
-        # 动态获取画布尺寸（支持窗口最大化）
-        cw = self.race_canvas.winfo_width()
-        ch = self.race_canvas.winfo_height()
-        if cw < 100:
-            cw, ch = 900, 550
+    def race_update(self):
+        """赛车：每 50ms 一步，移动、生成和碰撞检测"""
+        cw, ch = self.race_scene.size()
         
         # 如果画布尺寸变化，调整赛车位置
         if hasattr(self, 'race_cw') and self.race_cw > 0 and self.race_cw != cw:
@@ -1964,17 +1971,6 @@ class KidsVehiclesApp:
         # 确保赛车在赛道内
         self.race_x = max(self.race_left + 50, min(self.race_x, self.race_right - 50))
         
-        # 画赛道
-        self.race_canvas.create_rectangle(self.race_left, 0, self.race_right, ch, fill="#444444", outline="")
-        # 赛道边线
-        self.race_canvas.create_rectangle(self.race_left, 0, self.race_left+10, ch, fill="#FFFF00", outline="")
-        self.race_canvas.create_rectangle(self.race_right-10, 0, self.race_right, ch, fill="#FFFF00", outline="")
-        # 中线（虚线效果）
-        cx = cw // 2
-        for i in range(0, ch, 60):
-            y = (i + self.race_distance * 3) % ch
-            self.race_canvas.create_rectangle(cx-5, y, cx+5, y+30, fill="white", outline="")
-        
         # 计算车道位置
         lane_width = (self.race_right - self.race_left) // 5
         lanes = [self.race_left + lane_width * (i + 1) for i in range(4)]
@@ -1982,71 +1978,92 @@ class KidsVehiclesApp:
         # 生成障碍物
         if random.random() < 0.015:  # 降低障碍物频率
             ox = random.choice(lanes)
-            self.race_obstacles.append({"x": ox, "y": -50})
+            self.race_obstacles.spawn(x=ox, y=-50)
         
         # 生成金币
         if random.random() < 0.10:  # 增加金币频率，让小朋友更有成就感
             coin_x = random.choice(lanes)
-            self.race_coins.append({"x": coin_x, "y": -30})
+            self.race_coins.spawn(x=coin_x, y=-30)
         
         # 更新障碍物
-        new_obstacles = []
         for obs in self.race_obstacles:
             obs["y"] += self.race_speed + 3
-            if obs["y"] < ch + 50:
-                new_obstacles.append(obs)
-                # 画障碍物（路障）
-                self.race_canvas.create_rectangle(obs["x"]-30, obs["y"]-20, obs["x"]+30, obs["y"]+20, 
-                                                  fill="#FF6600", outline="#CC5500", width=2)
-                self.race_canvas.create_line(obs["x"]-25, obs["y"]-15, obs["x"]+25, obs["y"]+15, fill="white", width=3)
-                self.race_canvas.create_line(obs["x"]-25, obs["y"]+15, obs["x"]+25, obs["y"]-15, fill="white", width=3)
-        self.race_obstacles = new_obstacles
+        self.race_obstacles.retain(lambda obs: obs["y"] < ch + 50)
         
         # 更新金币
-        new_coins = []
         for coin in self.race_coins:
             coin["y"] += self.race_speed + 2
-            if coin["y"] < ch + 50:
-                new_coins.append(coin)
-                # 画金币
-                self.race_canvas.create_oval(coin["x"]-15, coin["y"]-15, coin["x"]+15, coin["y"]+15, 
-                                             fill="#FFD700", outline="#FFA500", width=2)
-                self.race_canvas.create_text(coin["x"], coin["y"], text="$", font=("Arial", 12, "bold"), fill="#8B4513")
-        self.race_coins = new_coins
-        
-        # 画赛车（车头朝上）
-        self.draw_race_car_up(self.race_canvas, self.race_x, self.race_y, 1.0, "#FF0000")
+        self.race_coins.retain(lambda coin: coin["y"] < ch + 50)
         
         # 碰撞检测 - 障碍物
-        for obs in self.race_obstacles:
-            if abs(obs["x"] - self.race_x) < 35 and abs(obs["y"] - self.race_y) < 30:  # 更宽松的碰撞检测
-                self.game_running = False
-                self.race_canvas.create_text(cx, ch//2, text="💥 撞车了！", 
-                                             font=("微软雅黑", 40, "bold"), fill="#FF0000")
-                # 使用汪汪队风格的结束
-                pup = self.PAW_PATROL_GAMES.get("chase", {})
-                self.speak(f"阿奇说：没关系！你跑了{self.race_distance}米，得了{self.race_score}分！下次更小心！")
-                self.window.after(3000, self.create_main_menu)
-                return
+        if self.race_obstacles.hits(self.race_x, self.race_y, 35, 30):  # 更宽松的碰撞检测
+            self.game_running = False
+            self.race_message = "💥 撞车了！"
+            # 使用汪汪队风格的结束
+            self.speak(f"阿奇说：没关系！你跑了{self.race_distance}米，得了{self.race_score}分！下次更小心！")
+            self.window.after(3000, self.create_main_menu)
+            return
         
         # 碰撞检测 - 金币
-        for coin in self.race_coins[:]:
-            if abs(coin["x"] - self.race_x) < 40 and abs(coin["y"] - self.race_y) < 40:
-                self.race_coins.remove(coin)
-                self.race_score += 10
-                self.score += 10
-                self.score_label.config(text=f"⭐ 得分: {self.race_score}")
+        coins = self.race_coins.hits(self.race_x, self.race_y, 40, 40)
+        if coins:
+            self.race_coins.remove(coins)
+            self.race_score += 10 * len(coins)
+            self.score += 10 * len(coins)
+            self.score_label.config(text=f"⭐ 得分: {self.race_score}")
         
         # 距离和速度
         self.race_distance += 1
         if self.race_distance % 400 == 0:  # 速度增长更慢
             self.race_speed = min(self.race_speed + 1, 8)  # 最高速度降低
+    
+    def race_render(self):
+        """赛车：画出当前状态"""
+        scene = self.race_scene
+        ch = self.race_ch
+        cx = self.race_cw // 2
         
-        # 显示距离
-        self.race_canvas.create_text(cx, 30, text=f"距离: {self.race_distance}m  速度: {self.race_speed}", 
-                                     font=("微软雅黑", 14), fill="white")
+        # 画赛道（只在窗口大小变化时重画）
+        scene.layer("track", self._draw_race_track, self.race_left, self.race_right, ch)
+        # 中线（虚线效果）：整条虚线一起往下平移
+        scene.sprite("dashes", self._draw_race_dashes, cx, (self.race_distance * 3) % 60, ch, z=1)
+        
+        for obs in self.race_obstacles:
+            scene.sprite(("obs", id(obs)), self._draw_race_obstacle, obs["x"], obs["y"], z=2)
+        for coin in self.race_coins:
+            scene.sprite(("coin", id(coin)), self._draw_race_coin, coin["x"], coin["y"], z=2)
         
-        self.window.after(50, self.race_game_loop)
+        # 画赛车（车头朝上）
+        scene.sprite("car", cached(self.draw_race_car_up), self.race_x, self.race_y, 1.0, "#FF0000", z=3)
+        
+        # 显示距离
+        scene.item("hud", "text", (cx, 30), z=9, text=f"距离: {self.race_distance}m  速度: {self.race_speed}",
+                   font=("微软雅黑", 14), fill="white")
+        if self.race_message:
+            scene.item("message", "text", (cx, ch//2), z=10, text=self.race_message,
+                       font=("微软雅黑", 40, "bold"), fill="#FF0000")
+    
+    def _draw_race_track(self, canvas, left, right, ch):
+        """赛道和两侧黄线"""
+        canvas.create_rectangle(left, 0, right, ch, fill="#444444", outline="")
+        canvas.create_rectangle(left, 0, left+10, ch, fill="#FFFF00", outline="")
+        canvas.create_rectangle(right-10, 0, right, ch, fill="#FFFF00", outline="")
+    
+    def _draw_race_dashes(self, canvas, cx, y, ch):
+        """赛道中线，多画一段，平移时上方不会露空"""
+        for i in range(-60, ch, 60):
+            canvas.create_rectangle(cx-5, y+i, cx+5, y+i+30, fill="white", outline="")
+    
+    def _draw_race_obstacle(self, canvas, x, y):
+        """路障"""
+        canvas.create_rectangle(x-30, y-20, x+30, y+20, fill="#FF6600", outline="#CC5500", width=2)
+        canvas.create_line(x-25, y-15, x+25, y+15, fill="white", width=3)
+        canvas.create_line(x-25, y+15, x+25, y-15, fill="white", width=3)
+    
+    def _draw_race_coin(self, canvas, x, y):
+        """金币"""
+        canvas.create_oval(x-15, y-15, x+15, y+15, fill="#FFD700", outline="#FFA500", width=2)
+        canvas.create_text(x, y, text="$", font=("Arial", 12, "bold"), fill="#8B4513")
 
 
     # =====================================================
@@ -2055,10 +2072,11 @@ class KidsVehiclesApp:
     def start_airplane_game(self):
         self.clear_game_area("#87CEEB")
         self.plane_score = 0
-        self.plane_clouds = []
-        self.plane_stars = []
-        self.plane_birds = []
+        self.plane_clouds = EntityGroup()
+        self.plane_stars = EntityGroup()
+        self.plane_birds = EntityGroup()
         self.plane_distance = 0
+        self.plane_message = None
         self.game_running = True
         
         # 获取当前狗狗信息
@@ -2074,6 +2092,7 @@ class KidsVehiclesApp:
         self.plane_canvas = tk.Canvas(self.game_frame, bg="#87CEEB", highlightthickness=2)
         self.plane_canvas.pack(pady=5, fill=tk.BOTH, expand=True)
         self.window.update()
+        self.plane_scene = CanvasScene(self.plane_canvas)
         
         # 获取画布尺寸
         self.plane_cw = self.plane_canvas.winfo_width()
@@ -2091,7 +2110,7 @@ class KidsVehiclesApp:
         self.window.bind("<Down>", self.plane_move_down)
         
         self.speak(f"{pup.get('name', '天天')}说：飞机起飞！收集星星，小心小鸟！")
-        self.plane_game_loop()
+        self.start_game_loop("plane", self.plane_scene, self.plane_update, self.plane_render)
     
     def plane_move_up(self, event):
         if self.game_running and self.plane_y > 80:
@@ -2101,16 +2120,9 @@ class KidsVehiclesApp:
         if self.game_running and self.plane_y < self.plane_ch - 80:
             self.plane_y += 40
     
-    def plane_game_loop(self):
-        if not self.game_running:
-            return
-        
-        self.plane_canvas.delete("all")
-        # 动态获取画布尺寸（支持窗口最大化）
-        cw = self.plane_canvas.winfo_width()
-        ch = self.plane_canvas.winfo_height()
-        if cw < 100:
-            cw, ch = 900, 550
+    def plane_update(self):
+        """飞机：每 50ms 一步，移动、生成和碰撞检测"""
+        cw, ch = self.plane_scene.size()
         
         # 如果画布尺寸变化，调整飞机位置
         if hasattr(self, 'plane_cw') and self.plane_cw > 0 and self.plane_ch > 0:
@@ -2123,110 +2135,115 @@ class KidsVehiclesApp:
         self.plane_x = max(80, min(self.plane_x, cw - 80))
         self.plane_y = max(80, min(self.plane_y, ch - 80))
         
-        # 天空渐变背景（优化：使用条带而非逐行）
-        for i in range(0, ch, 10):
-            r = max(50, 135 - i // 10)
-            g = max(100, 206 - i // 15)
-            b = 235
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            self.plane_canvas.create_rectangle(0, i, cw, i+10, fill=color, outline="")
-        
-        # 太阳
-        sun_x = int(cw * 0.87)
-        self.plane_canvas.create_oval(sun_x, 30, sun_x+80, 110, fill="#FFD700", outline="#FFA500", width=3)
-        
         # 生成云朵
         if random.random() < 0.02:
             cy = random.randint(50, ch - 50)
-            self.plane_clouds.append({"x": cw + 50, "y": cy})
+            self.plane_clouds.spawn(x=cw + 50, y=cy)
         
         # 生成星星
         if random.random() < 0.08:  # 增加星星频率
             sy = random.randint(80, ch - 80)
-            self.plane_stars.append({"x": cw + 50, "y": sy})
+            self.plane_stars.spawn(x=cw + 50, y=sy)
         
         # 生成小鸟（障碍物）
         if random.random() < 0.012:  # 降低小鸟频率
             by = random.randint(100, ch - 100)
-            self.plane_birds.append({"x": cw + 50, "y": by})
+            self.plane_birds.spawn(x=cw + 50, y=by)
         
-        # 更新云朵
-        new_clouds = []
+        # 更新云朵、星星和小鸟（小鸟飞得慢一点）
         for cloud in self.plane_clouds:
             cloud["x"] -= 3
-            if cloud["x"] > -100:
-                new_clouds.append(cloud)
-                # 画云朵
-                cx, cy = cloud["x"], cloud["y"]
-                for dx, dy in [(-30, 0), (0, -15), (30, 0), (0, 15), (-15, -8), (15, -8)]:
-                    self.plane_canvas.create_oval(cx+dx-25, cy+dy-18, cx+dx+25, cy+dy+18, fill="white", outline="")
-        self.plane_clouds = new_clouds
-        
-        # 更新星星
-        new_stars = []
+        self.plane_clouds.retain(lambda c: c["x"] > -100)
         for star in self.plane_stars:
             star["x"] -= 5
-            if star["x"] > -30:
-                new_stars.append(star)
-                # 画星星
-                sx, sy = star["x"], star["y"]
-                self.plane_canvas.create_polygon(
-                    sx, sy-20, sx+6, sy-6, sx+20, sy-6, sx+10, sy+4,
-                    sx+14, sy+20, sx, sy+10, sx-14, sy+20, sx-10, sy+4,
-                    sx-20, sy-6, sx-6, sy-6,
-                    fill="#FFD700", outline="#FFA500", width=1
-                )
-        self.plane_stars = new_stars
-        
-        # 更新小鸟
-        new_birds = []
+        self.plane_stars.retain(lambda s: s["x"] > -30)
         for bird in self.plane_birds:
-            bird["x"] -= 4  # 小鸟飞得慢一点
-            if bird["x"] > -50:
-                new_birds.append(bird)
-                # 画小鸟
-                bx, by = bird["x"], bird["y"]
-                # 身体
-                self.plane_canvas.create_oval(bx-15, by-10, bx+15, by+10, fill="#8B4513", outline="#654321")
-                # 翅膀
-                wing_y = by - 15 + (5 if self.plane_distance % 10 < 5 else -5)
-                self.plane_canvas.create_polygon(bx-5, by, bx-25, wing_y, bx+5, by, fill="#A0522D", outline="")
-                # 嘴
-                self.plane_canvas.create_polygon(bx+15, by, bx+25, by-3, bx+25, by+3, fill="#FFA500", outline="")
-                # 眼睛
-                self.plane_canvas.create_oval(bx+5, by-5, bx+10, by, fill="white", outline="")
-                self.plane_canvas.create_oval(bx+6, by-4, bx+9, by-1, fill="black", outline="")
-        self.plane_birds = new_birds
-        
-        # 画飞机
-        self.draw_airplane(self.plane_canvas, self.plane_x, self.plane_y, 0.8, "#4169E1")
+            bird["x"] -= 4
+        self.plane_birds.retain(lambda b: b["x"] > -50)
         
         # 碰撞检测 - 星星
-        for star in self.plane_stars[:]:
-            if abs(star["x"] - self.plane_x) < 50 and abs(star["y"] - self.plane_y) < 40:
-                self.plane_stars.remove(star)
-                self.plane_score += 15
-                self.score += 15
-                self.score_label.config(text=f"⭐ 得分: {self.plane_score}")
+        stars = self.plane_stars.hits(self.plane_x, self.plane_y, 50, 40)
+        if stars:
+            self.plane_stars.remove(stars)
+            self.plane_score += 15 * len(stars)
+            self.score += 15 * len(stars)
+            self.score_label.config(text=f"⭐ 得分: {self.plane_score}")
         
         # 碰撞检测 - 小鸟
-        for bird in self.plane_birds:
-            if abs(bird["x"] - self.plane_x) < 45 and abs(bird["y"] - self.plane_y) < 25:  # 更宽松
-                self.game_running = False
-                self.plane_canvas.create_text(cw//2, ch//2, text="💥 撞到小鸟了！", 
-                                              font=("微软雅黑", 36, "bold"), fill="#FF0000")
-                # 使用汪汪队风格的结束
-                self.speak(f"天天说：没关系！你飞了{self.plane_distance}米，收集了{self.plane_score//15}颗星星！下次飞得更高！")
-                self.window.after(3000, self.create_main_menu)
-                return
+        if self.plane_birds.hits(self.plane_x, self.plane_y, 45, 25):  # 更宽松
+            self.game_running = False
+            self.plane_message = "💥 撞到小鸟了！"
+            # 使用汪汪队风格的结束
+            self.speak(f"天天说：没关系！你飞了{self.plane_distance}米，收集了{self.plane_score//15}颗星星！下次飞得更高！")
+            self.window.after(3000, self.create_main_menu)
+            return
         
         self.plane_distance += 2
+    
+    def plane_render(self):
+        """飞机：画出当前状态"""
+        scene = self.plane_scene
+        cw, ch = self.plane_cw, self.plane_ch
         
-        # 显示距离
-        self.plane_canvas.create_text(cw//2, 30, text=f"飞行距离: {self.plane_distance}m", 
-                                      font=("微软雅黑", 14, "bold"), fill="#1E3A8A")
+        # 天空渐变背景和太阳（只在窗口大小变化时重画）
+        scene.layer("sky", self._draw_plane_sky, cw, ch)
+        
+        for cloud in self.plane_clouds:
+            scene.sprite(("cloud", id(cloud)), self._draw_plane_cloud, cloud["x"], cloud["y"], z=1)
+        for star in self.plane_stars:
+            scene.sprite(("star", id(star)), self._draw_plane_star, star["x"], star["y"], z=2)
+        # 小鸟翅膀上下扇动时才重画
+        wing_up = self.plane_distance % 10 < 5
+        for bird in self.plane_birds:
+            scene.sprite(("bird", id(bird)), self._draw_plane_bird, bird["x"], bird["y"], wing_up, z=2)
         
-        self.window.after(50, self.plane_game_loop)
+        # 画飞机
+        scene.sprite("plane", cached(self.draw_airplane), self.plane_x, self.plane_y, 0.8, "#4169E1", z=3)
+        
+        # 显示距离
+        scene.item("hud", "text", (cw//2, 30), z=9, text=f"飞行距离: {self.plane_distance}m",
+                   font=("微软雅黑", 14, "bold"), fill="#1E3A8A")
+        if self.plane_message:
+            scene.item("message", "text", (cw//2, ch//2), z=10, text=self.plane_message,
+                       font=("微软雅黑", 36, "bold"), fill="#FF0000")
+    
+    def _draw_plane_sky(self, canvas, cw, ch):
+        """天空渐变（条带）和太阳"""
+        for i in range(0, ch, 10):
+            r = max(50, 135 - i // 10)
+            g = max(100, 206 - i // 15)
+            b = 235
+            color = f"#{r:02x}{g:02x}{b:02x}"
+            canvas.create_rectangle(0, i, cw, i+10, fill=color, outline="")
+        sun_x = int(cw * 0.87)
+        canvas.create_oval(sun_x, 30, sun_x+80, 110, fill="#FFD700", outline="#FFA500", width=3)
+    
+    def _draw_plane_cloud(self, canvas, cx, cy):
+        """云朵"""
+        for dx, dy in [(-30, 0), (0, -15), (30, 0), (0, 15), (-15, -8), (15, -8)]:
+            canvas.create_oval(cx+dx-25, cy+dy-18, cx+dx+25, cy+dy+18, fill="white", outline="")
+    
+    def _draw_plane_star(self, canvas, sx, sy):
+        """星星"""
+        canvas.create_polygon(
+            sx, sy-20, sx+6, sy-6, sx+20, sy-6, sx+10, sy+4,
+            sx+14, sy+20, sx, sy+10, sx-14, sy+20, sx-10, sy+4,
+            sx-20, sy-6, sx-6, sy-6,
+            fill="#FFD700", outline="#FFA500", width=1
+        )
+    
+    def _draw_plane_bird(self, canvas, bx, by, wing_up):
+        """小鸟"""
+        # 身体
+        canvas.create_oval(bx-15, by-10, bx+15, by+10, fill="#8B4513", outline="#654321")
+        # 翅膀
+        wing_y = by - 15 + (5 if wing_up else -5)
+        canvas.create_polygon(bx-5, by, bx-25, wing_y, bx+5, by, fill="#A0522D", outline="")
+        # 嘴
+        canvas.create_polygon(bx+15, by, bx+25, by-3, bx+25, by+3, fill="#FFA500", outline="")
+        # 眼睛
+        canvas.create_oval(bx+5, by-5, bx+10, by, fill="white", outline="")
+        canvas.create_oval(bx+6, by-4, bx+9, by-1, fill="black", outline="")
 
     # =====================================================
     # 游戏4: 消防车救火
@@ -2235,8 +2252,10 @@ class KidsVehiclesApp:
         self.clear_game_area("#2F4F4F")
         self.fire_score = 0
         self.fire_buildings = []
-        self.fire_water = []
+        self.fire_water = EntityGroup()
         self.fires_saved = 0
+        self.fire_tick = 0
+        self.fire_message = None
         self.game_running = True
         
         # 获取当前狗狗信息
@@ -2256,6 +2275,7 @@ class KidsVehiclesApp:
         self.fire_canvas = tk.Canvas(self.game_frame, bg="#1a1a2e", highlightthickness=2)
         self.fire_canvas.pack(pady=5, fill=tk.BOTH, expand=True)
         self.window.update()
+        self.fire_scene = CanvasScene(self.fire_canvas)
         
         # 获取画布尺寸
         self.fire_cw = self.fire_canvas.winfo_width()
@@ -2275,7 +2295,7 @@ class KidsVehiclesApp:
         # 初始化建筑
         self.fire_init_buildings()
         self.speak(f"{pup.get('name', '毛毛')}说：消防车出动！快去灭火救人！")
-        self.fire_game_loop()
+        self.start_game_loop("fire", self.fire_scene, self.fire_update, self.fire_render, step_ms=60)
     
     def fire_init_buildings(self):
         self.fire_buildings = []
@@ -2302,18 +2322,11 @@ class KidsVehiclesApp:
             return
         # 添加水柱
         ground_y = int(self.fire_ch * 0.87)
-        self.fire_water.append({"x": self.fire_truck_x + 30, "y": ground_y - 20, "active": True})
+        self.fire_water.spawn(x=self.fire_truck_x + 30, y=ground_y - 20)
     
-    def fire_game_loop(self):
-        if not self.game_running:
-            return
-        
-        self.fire_canvas.delete("all")
-        # 动态获取画布尺寸（支持窗口最大化）
-        cw = self.fire_canvas.winfo_width()
-        ch = self.fire_canvas.winfo_height()
-        if cw < 100:
-            cw, ch = 900, 550
+    def fire_update(self):
+        """消防车：每 60ms 一步，水柱移动和灭火"""
+        cw, ch = self.fire_scene.size()
         
         # 如果画布尺寸变化，调整消防车位置
         if hasattr(self, 'fire_cw') and self.fire_cw > 0:
@@ -2330,97 +2343,107 @@ class KidsVehiclesApp:
         for i, b in enumerate(self.fire_buildings):
             b["x"] = spacing + i * spacing
         
-        # 夜空背景
-        self.fire_canvas.create_rectangle(0, 0, cw, ch, fill="#1a1a2e", outline="")
-        
-        # 星星
-        for _ in range(20):
-            sx = random.randint(0, cw)
-            sy = random.randint(0, int(ch * 0.36))
-            self.fire_canvas.create_oval(sx-1, sy-1, sx+1, sy+1, fill="white", outline="")
+        # 更新水柱
+        for w in self.fire_water:
+            w["y"] -= 15
+        self.fire_water.retain(lambda w: w["y"] > 50)
         
-        # 月亮
-        moon_x = int(cw * 0.89)
-        self.fire_canvas.create_oval(moon_x, 30, moon_x+60, 90, fill="#FFFACD", outline="#FFE4B5", width=2)
+        # 检测水柱是否击中着火建筑：楼左右 50 像素以内、升到楼顶往下 50 像素以上
+        for b in self.fire_buildings:
+            if not b["on_fire"] or b["saved"]:
+                continue
+            zone_bottom = ground_y - b["height"] + 50
+            hits = self.fire_water.hits(b["x"], (50 + zone_bottom) / 2, 50, (zone_bottom - 50) / 2)
+            if not hits:
+                continue
+            b["fire_level"] -= 12 * len(hits)  # 水更有效
+            if b["fire_level"] <= 0:
+                b["on_fire"] = False
+                b["saved"] = True
+                self.fires_saved += 1
+                self.fire_score += 50
+                self.score += 50
+                self.score_label.config(text=f"⭐ 得分: {self.fire_score}")
+                self.fire_progress.config(text=f"已救: {self.fires_saved}/5 栋楼")
+                self.speak_praise()
+                
+                if self.fires_saved >= 5:
+                    self.game_running = False
+                    self.fire_message = "🎉 全部救完了！"
+                    self.speak(f"太棒了！乐乐救了所有的楼！得了{self.fire_score}分！")
+                    self.window.after(5500, self.create_main_menu)
+                    return
+    
+    def fire_render(self):
+        """消防车：画出当前状态"""
+        scene = self.fire_scene
+        cw, ch = self.fire_cw, self.fire_ch
+        ground_y = int(ch * 0.87)
         
-        # 地面
-        self.fire_canvas.create_rectangle(0, ground_y, cw, ch, fill="#333333", outline="")
-        self.fire_canvas.create_rectangle(0, ground_y-5, cw, ground_y, fill="#555555", outline="")
+        # 夜空、月亮和地面（只在窗口大小变化时重画）
+        scene.layer("night", self._draw_fire_night, cw, ch, ground_y)
         
-        # 画建筑和火焰
-        for b in self.fire_buildings:
-            bx, height, color = b["x"], b["height"], b["color"]
-            by = ground_y - height
-            
-            # 建筑主体
-            self.fire_canvas.create_rectangle(bx-40, by, bx+40, ground_y, fill=color, outline="#333", width=2)
-            
-            # 窗户
-            for wy in range(by + 30, ground_y - 15, 50):
-                for wx in [bx-20, bx+10]:
-                    window_color = "#FFFF00" if b["on_fire"] else "#87CEEB"
-                    self.fire_canvas.create_rectangle(wx, wy, wx+15, wy+25, fill=window_color, outline="#333")
-            
-            # 火焰
+        # 画建筑和火焰：建筑只在着火/已救状态变化时重画，火焰每帧跳动
+        self.fire_tick += 1
+        for i, b in enumerate(self.fire_buildings):
+            bx, height = b["x"], b["height"]
+            scene.sprite(("building", i), self._draw_fire_building, bx, ground_y,
+                         height, b["color"], b["on_fire"], b["saved"], z=1)
             if b["on_fire"] and b["fire_level"] > 0:
-                fire_size = b["fire_level"] / 100
-                for _ in range(int(5 * fire_size)):
-                    fx = bx + random.randint(-30, 30)
-                    fy = by + random.randint(-20, 30)
-                    fsize = random.randint(10, 25) * fire_size
-                    colors = ["#FF4500", "#FF6600", "#FFCC00", "#FF0000"]
-                    self.fire_canvas.create_oval(fx-fsize, fy-fsize, fx+fsize, fy+fsize, 
-                                                 fill=random.choice(colors), outline="")
-            
-            # 已救标记
-            if b["saved"]:
-                self.fire_canvas.create_text(bx, by-20, text="✅ 已救", 
-                                             font=("微软雅黑", 12, "bold"), fill="#32CD32")
+                scene.sprite(("flames", i), self._draw_fire_flames, bx, ground_y - height,
+                             b["fire_level"], key=self.fire_tick, z=2)
         
-        # 更新水柱
-        new_water = []
         for w in self.fire_water:
-            if w["active"]:
-                w["y"] -= 15
-                if w["y"] > 50:
-                    new_water.append(w)
-                    # 画水柱
-                    self.fire_canvas.create_oval(w["x"]-8, w["y"]-15, w["x"]+8, w["y"]+15, 
-                                                 fill="#00BFFF", outline="#1E90FF", width=2)
-                    
-                    # 检测是否击中着火建筑
-                    for b in self.fire_buildings:
-                        if b["on_fire"] and not b["saved"]:
-                            if abs(w["x"] - b["x"]) < 50 and w["y"] < ground_y - b["height"] + 50:
-                                b["fire_level"] -= 12  # 水更有效
-                                if b["fire_level"] <= 0:
-                                    b["on_fire"] = False
-                                    b["saved"] = True
-                                    self.fires_saved += 1
-                                    self.fire_score += 50
-                                    self.score += 50
-                                    self.score_label.config(text=f"⭐ 得分: {self.fire_score}")
-                                    self.fire_progress.config(text=f"已救: {self.fires_saved}/5 栋楼")
-                                    self.speak_praise()
-                                    
-                                    if self.fires_saved >= 5:
-                                        self.game_running = False
-                                        self.fire_canvas.create_text(cw//2, ch//2, text="🎉 全部救完了！", 
-                                                                     font=("微软雅黑", 36, "bold"), fill="#32CD32")
-                                        self.speak(f"太棒了！乐乐救了所有的楼！得了{self.fire_score}分！")
-                                        self.window.after(5500, self.create_main_menu)
-                                        return
-        self.fire_water = new_water
-        
-        # 画消防车
-        truck_y = ground_y - 35
-        self.draw_fire_truck(self.fire_canvas, self.fire_truck_x, truck_y, 0.9)
-        
-        # 画水管
-        self.fire_canvas.create_line(self.fire_truck_x-30, truck_y-20, self.fire_truck_x+30, truck_y-40, 
-                                     fill="#C0C0C0", width=5)
-        
-        self.window.after(60, self.fire_game_loop)
+            scene.sprite(("water", id(w)), self._draw_fire_water, w["x"], w["y"], z=2)
+        
+        # 画消防车和水管
+        scene.sprite("truck", self._draw_fire_truck_with_hose, self.fire_truck_x, ground_y - 35, z=3)
+        if self.fire_message:
+            scene.item("message", "text", (cw//2, ch//2), z=10, text=self.fire_message,
+                       font=("微软雅黑", 36, "bold"), fill="#32CD32")
+    
+    def _draw_fire_night(self, canvas, cw, ch, ground_y):
+        """夜空、星星、月亮和地面"""
+        canvas.create_rectangle(0, 0, cw, ch, fill="#1a1a2e", outline="")
+        for _ in range(20):
+            sx = random.randint(0, cw)
+            sy = random.randint(0, int(ch * 0.36))
+            canvas.create_oval(sx-1, sy-1, sx+1, sy+1, fill="white", outline="")
+        moon_x = int(cw * 0.89)
+        canvas.create_oval(moon_x, 30, moon_x+60, 90, fill="#FFFACD", outline="#FFE4B5", width=2)
+        canvas.create_rectangle(0, ground_y, cw, ch, fill="#333333", outline="")
+        canvas.create_rectangle(0, ground_y-5, cw, ground_y, fill="#555555", outline="")
+    
+    def _draw_fire_building(self, canvas, bx, ground_y, height, color, on_fire, saved):
+        """建筑、窗户和已救标记"""
+        by = ground_y - height
+        canvas.create_rectangle(bx-40, by, bx+40, ground_y, fill=color, outline="#333", width=2)
+        window_color = "#FFFF00" if on_fire else "#87CEEB"
+        for wy in range(by + 30, ground_y - 15, 50):
+            for wx in [bx-20, bx+10]:
+                canvas.create_rectangle(wx, wy, wx+15, wy+25, fill=window_color, outline="#333")
+        if saved:
+            canvas.create_text(bx, by-20, text="✅ 已救", font=("微软雅黑", 12, "bold"), fill="#32CD32")
+    
+    def _draw_fire_flames(self, canvas, bx, by, fire_level):
+        """楼顶的火焰（随机跳动）"""
+        fire_size = fire_level / 100
+        colors = ["#FF4500", "#FF6600", "#FFCC00", "#FF0000"]
+        for _ in range(int(5 * fire_size)):
+            fx = bx + random.randint(-30, 30)
+            fy = by + random.randint(-20, 30)
+            fsize = random.randint(10, 25) * fire_size
+            canvas.create_oval(fx-fsize, fy-fsize, fx+fsize, fy+fsize,
+                               fill=random.choice(colors), outline="")
+    
+    def _draw_fire_water(self, canvas, x, y):
+        """水柱"""
+        canvas.create_oval(x-8, y-15, x+8, y+15, fill="#00BFFF", outline="#1E90FF", width=2)
+    
+    def _draw_fire_truck_with_hose(self, canvas, x, truck_y):
+        """消防车和水管"""
+        cached(self.draw_fire_truck)(canvas, x, truck_y, 0.9)
+        canvas.create_line(x-30, truck_y-20, x+30, truck_y-40, fill="#C0C0C0", width=5)
 
 
     # =====================================================
@@ -2434,6 +2457,7 @@ class KidsVehiclesApp:
         self.rocket_fuel = 100
         self.rocket_stars = []
         self.rocket_altitude = 0
+        self.rocket_message = None
         self.game_running = True
         
         # 获取当前狗狗信息
@@ -2453,6 +2477,7 @@ class KidsVehiclesApp:
         self.rocket_canvas = tk.Canvas(self.game_frame, bg="#0a0a23", highlightthickness=2)
         self.rocket_canvas.pack(pady=5, fill=tk.BOTH, expand=True)
         self.window.update()
+        self.rocket_scene = CanvasScene(self.rocket_canvas)
         
         # 获取画布尺寸
         self.rocket_cw = self.rocket_canvas.winfo_width()
@@ -2470,8 +2495,8 @@ class KidsVehiclesApp:
         self.window.bind("<Left>", self.rocket_move_left)
         self.window.bind("<Right>", self.rocket_move_right)
         
-        self.rocket_meteors = []
-        self.rocket_fuels = []
+        self.rocket_meteors = EntityGroup()
+        self.rocket_fuels = EntityGroup()
         
         self.speak(f"{pup.get('name', '灰灰')}说：火箭准备发射！按空格键点火！")
         self.rocket_countdown_loop()
@@ -2493,35 +2518,22 @@ class KidsVehiclesApp:
         if not self.game_running:
             return
         
-        self.rocket_canvas.delete("all")
+        scene = self.rocket_scene
+        scene.begin_frame()
         # 动态获取画布尺寸（支持窗口最大化）
-        cw = self.rocket_canvas.winfo_width()
-        ch = self.rocket_canvas.winfo_height()
-        if cw < 100:
-            cw, ch = 900, 550
+        cw, ch = scene.size()
         self.rocket_cw, self.rocket_ch = cw, ch
         
-        # 星空背景
-        for _ in range(50):
-            sx = random.randint(0, cw)
-            sy = random.randint(0, ch)
-            size = random.randint(1, 3)
-            self.rocket_canvas.create_oval(sx-size, sy-size, sx+size, sy+size, fill="white", outline="")
-        
         if not self.rocket_launched:
-            # 发射台
-            pad_y = int(ch * 0.95)
-            self.rocket_canvas.create_rectangle(cw//2-100, pad_y-30, cw//2+100, pad_y, fill="#555555", outline="#333333", width=2)
-            self.rocket_canvas.create_polygon(cw//2-50, pad_y-30, cw//2, pad_y-70, cw//2+50, pad_y-30, fill="#777777", outline="#555555")
-            
-            # 火箭
-            self.draw_rocket(self.rocket_canvas, cw//2, pad_y-130, 1.2, False)
+            # 星空、发射台和火箭（只在窗口大小变化时重画）
+            scene.layer("pad", self._draw_rocket_pad, cw, ch)
             
             # 倒计时
-            self.rocket_canvas.create_text(cw//2, ch*0.36, text=f"倒计时: {self.rocket_countdown}", 
-                                           font=("微软雅黑", 48, "bold"), fill="#FFD700")
-            self.rocket_canvas.create_text(cw//2, ch*0.5, text="按 空格键 发射！", 
-                                           font=("微软雅黑", 20), fill="#AAA")
+            scene.item("countdown", "text", (cw//2, ch*0.36), z=9, text=f"倒计时: {self.rocket_countdown}",
+                       font=("微软雅黑", 48, "bold"), fill="#FFD700")
+            scene.item("hint", "text", (cw//2, ch*0.5), z=9, text="按 空格键 发射！",
+                       font=("微软雅黑", 20), fill="#AAA")
+            scene.end_frame()
             
             self.rocket_countdown -= 1
             if self.rocket_countdown < 0:
@@ -2529,18 +2541,12 @@ class KidsVehiclesApp:
             
             self.window.after(1000, self.rocket_countdown_loop)
         else:
-            self.rocket_fly_loop()
+            scene.end_frame()
+            self.start_game_loop("rocket", self.rocket_scene, self.rocket_update, self.rocket_render)
     
-    def rocket_fly_loop(self):
-        if not self.game_running:
-            return
-        
-        self.rocket_canvas.delete("all")
-        # 动态获取画布尺寸（支持窗口最大化）
-        cw = self.rocket_canvas.winfo_width()
-        ch = self.rocket_canvas.winfo_height()
-        if cw < 100:
-            cw, ch = 900, 550
+    def rocket_update(self):
+        """火箭：每 50ms 一步，移动、燃料和碰撞检测"""
+        cw, ch = self.rocket_scene.size()
         
         # 如果画布尺寸变化，调整火箭位置
         if hasattr(self, 'rocket_cw') and self.rocket_cw > 0:
@@ -2552,81 +2558,40 @@ class KidsVehiclesApp:
         # 确保火箭在有效范围内
         self.rocket_x = max(100, min(self.rocket_x, cw - 100))
         
-        # 太空背景（随高度变化）
-        bg_color = max(10, 35 - self.rocket_altitude // 500)
-        self.rocket_canvas.create_rectangle(0, 0, cw, ch, fill=f"#0a0a{bg_color:02x}", outline="")
-        
-        # 星星
-        for _ in range(80):
-            sx = random.randint(0, cw)
-            sy = random.randint(0, ch)
-            size = random.randint(1, 3)
-            brightness = random.randint(200, 255)
-            self.rocket_canvas.create_oval(sx-size, sy-size, sx+size, sy+size, 
-                                           fill=f"#{brightness:02x}{brightness:02x}{brightness:02x}", outline="")
-        
         # 生成陨石
         if random.random() < 0.015:  # 降低陨石频率
             mx = random.randint(100, cw - 100)
-            self.rocket_meteors.append({"x": mx, "y": -30})
+            self.rocket_meteors.spawn(x=mx, y=-30)
         
         # 生成燃料
         if random.random() < 0.05:  # 增加燃料频率
             fx = random.randint(150, cw - 150)
-            self.rocket_fuels.append({"x": fx, "y": -30})
+            self.rocket_fuels.spawn(x=fx, y=-30)
         
-        # 更新陨石
-        new_meteors = []
+        # 更新陨石（下落更慢）和燃料
         for m in self.rocket_meteors:
-            m["y"] += 5  # 陨石下落更慢
-            if m["y"] < ch + 50:
-                new_meteors.append(m)
-                # 画陨石
-                mx, my = m["x"], m["y"]
-                self.rocket_canvas.create_oval(mx-20, my-20, mx+20, my+20, fill="#8B4513", outline="#654321", width=2)
-                # 陨石坑
-                for _ in range(3):
-                    cx = mx + random.randint(-12, 12)
-                    cy = my + random.randint(-12, 12)
-                    self.rocket_canvas.create_oval(cx-5, cy-5, cx+5, cy+5, fill="#654321", outline="")
-                # 火焰尾巴
-                self.rocket_canvas.create_polygon(mx, my-20, mx-10, my-40, mx+10, my-40, 
-                                                  fill="#FF4500", outline="")
-        self.rocket_meteors = new_meteors
-        
-        # 更新燃料
-        new_fuels = []
+            m["y"] += 5
+        self.rocket_meteors.retain(lambda m: m["y"] < ch + 50)
         for f in self.rocket_fuels:
             f["y"] += 5
-            if f["y"] < ch + 50:
-                new_fuels.append(f)
-                # 画燃料罐
-                fx, fy = f["x"], f["y"]
-                self.rocket_canvas.create_rectangle(fx-12, fy-18, fx+12, fy+18, fill="#32CD32", outline="#228B22", width=2)
-                self.rocket_canvas.create_text(fx, fy, text="F", font=("Arial", 14, "bold"), fill="white")
-        self.rocket_fuels = new_fuels
-        
-        # 画火箭
-        self.draw_rocket(self.rocket_canvas, self.rocket_x, rocket_draw_y, 1.0, True)
+        self.rocket_fuels.retain(lambda f: f["y"] < ch + 50)
         
         # 碰撞检测 - 陨石
-        for m in self.rocket_meteors:
-            if abs(m["x"] - self.rocket_x) < 30 and abs(m["y"] - rocket_draw_y) < 35:  # 更宽松
-                self.game_running = False
-                self.rocket_canvas.create_text(cw//2, ch//2, text="💥 撞到陨石了！", 
-                                               font=("微软雅黑", 36, "bold"), fill="#FF0000")
-                self.speak(f"哎呀撞到陨石了！火箭飞了{self.rocket_altitude}米，得了{self.rocket_score}分！")
-                self.window.after(3000, self.create_main_menu)
-                return
+        if self.rocket_meteors.hits(self.rocket_x, rocket_draw_y, 30, 35):  # 更宽松
+            self.game_running = False
+            self.rocket_message = ("💥 撞到陨石了！", "#FF0000")
+            self.speak(f"哎呀撞到陨石了！火箭飞了{self.rocket_altitude}米，得了{self.rocket_score}分！")
+            self.window.after(3000, self.create_main_menu)
+            return
         
         # 碰撞检测 - 燃料
-        for f in self.rocket_fuels[:]:
-            if abs(f["x"] - self.rocket_x) < 35 and abs(f["y"] - rocket_draw_y) < 50:
-                self.rocket_fuels.remove(f)
-                self.rocket_fuel = min(100, self.rocket_fuel + 20)
-                self.rocket_score += 20
-                self.score += 20
-                self.score_label.config(text=f"⭐ 得分: {self.rocket_score}")
+        fuels = self.rocket_fuels.hits(self.rocket_x, rocket_draw_y, 35, 50)
+        if fuels:
+            self.rocket_fuels.remove(fuels)
+            self.rocket_fuel = min(100, self.rocket_fuel + 20 * len(fuels))
+            self.rocket_score += 20 * len(fuels)
+            self.score += 20 * len(fuels)
+            self.score_label.config(text=f"⭐ 得分: {self.rocket_score}")
         
         # 消耗燃料
         self.rocket_fuel -= 0.15  # 燃料消耗更慢
@@ -2634,26 +2599,86 @@ class KidsVehiclesApp:
         
         if self.rocket_fuel <= 0:
             self.game_running = False
-            self.rocket_canvas.create_text(cw//2, ch//2, text="⛽ 燃料耗尽！", 
-                                           font=("微软雅黑", 36, "bold"), fill="#FFD700")
+            self.rocket_message = ("⛽ 燃料耗尽！", "#FFD700")
             self.speak(f"燃料用完了！火箭飞了{self.rocket_altitude}米，得了{self.rocket_score}分！")
             self.window.after(3000, self.create_main_menu)
-            return
+    
+    def rocket_render(self):
+        """火箭：画出当前状态"""
+        scene = self.rocket_scene
+        cw, ch = self.rocket_cw, self.rocket_ch
+        rocket_draw_y = int(ch * 0.73)
+        
+        # 太空背景（随高度变化，颜色变了才改）
+        bg_color = max(10, 35 - self.rocket_altitude // 500)
+        scene.item("space", "rectangle", (0, 0, cw, ch), z=0, fill=f"#0a0a{bg_color:02x}", outline="")
+        
+        # 星星（只在窗口大小变化时重画）
+        scene.layer("stars", self._draw_rocket_stars, cw, ch, 80, z=1)
+        
+        for m in self.rocket_meteors:
+            scene.sprite(("meteor", id(m)), self._draw_rocket_meteor, m["x"], m["y"], z=2)
+        for f in self.rocket_fuels:
+            scene.sprite(("fuel", id(f)), self._draw_rocket_fuel, f["x"], f["y"], z=2)
+        
+        # 画火箭（尾焰每两步闪一次）
+        flicker = self.rocket_altitude // 20 % 2
+        scene.sprite("rocket", cached(self.draw_rocket), self.rocket_x, rocket_draw_y, 1.0, True,
+                     variant=flicker, key=flicker, z=3)
         
         # 显示状态
-        self.rocket_canvas.create_text(100, 30, text=f"高度: {self.rocket_altitude}m", 
-                                       font=("微软雅黑", 14), fill="white", anchor="w")
+        scene.item("altitude", "text", (100, 30), z=9, text=f"高度: {self.rocket_altitude}m",
+                   font=("微软雅黑", 14), fill="white", anchor="w")
         
-        # 燃料条
+        # 燃料条（只改长度和颜色）
+        fuel = max(0, self.rocket_fuel)
         fuel_bar_x = cw - 150
-        self.rocket_canvas.create_rectangle(fuel_bar_x, 20, fuel_bar_x+150, 40, fill="#333333", outline="#555555")
-        fuel_width = int(150 * self.rocket_fuel / 100)
-        fuel_color = "#32CD32" if self.rocket_fuel > 30 else "#FF6600" if self.rocket_fuel > 10 else "#FF0000"
-        self.rocket_canvas.create_rectangle(fuel_bar_x, 20, fuel_bar_x+fuel_width, 40, fill=fuel_color, outline="")
-        self.rocket_canvas.create_text(fuel_bar_x+75, 30, text=f"燃料: {int(self.rocket_fuel)}%", 
-                                       font=("微软雅黑", 10), fill="white")
-        
-        self.window.after(50, self.rocket_fly_loop)
+        scene.item("fuel_bg", "rectangle", (fuel_bar_x, 20, fuel_bar_x+150, 40), z=9,
+                   fill="#333333", outline="#555555")
+        fuel_width = int(150 * fuel / 100)
+        fuel_color = "#32CD32" if fuel > 30 else "#FF6600" if fuel > 10 else "#FF0000"
+        scene.item("fuel_bar", "rectangle", (fuel_bar_x, 20, fuel_bar_x+fuel_width, 40), z=9,
+                   fill=fuel_color, outline="")
+        scene.item("fuel_text", "text", (fuel_bar_x+75, 30), z=9, text=f"燃料: {int(fuel)}%",
+                   font=("微软雅黑", 10), fill="white")
+        if self.rocket_message:
+            text, color = self.rocket_message
+            scene.item("message", "text", (cw//2, ch//2), z=10, text=text,
+                       font=("微软雅黑", 36, "bold"), fill=color)
+    
+    def _draw_rocket_stars(self, canvas, cw, ch, count):
+        """星空"""
+        for _ in range(count):
+            sx = random.randint(0, cw)
+            sy = random.randint(0, ch)
+            size = random.randint(1, 3)
+            brightness = random.randint(200, 255)
+            canvas.create_oval(sx-size, sy-size, sx+size, sy+size,
+                               fill=f"#{brightness:02x}{brightness:02x}{brightness:02x}", outline="")
+    
+    def _draw_rocket_pad(self, canvas, cw, ch):
+        """倒计时画面：星空、发射台和火箭"""
+        self._draw_rocket_stars(canvas, cw, ch, 50)
+        pad_y = int(ch * 0.95)
+        canvas.create_rectangle(cw//2-100, pad_y-30, cw//2+100, pad_y, fill="#555555", outline="#333333", width=2)
+        canvas.create_polygon(cw//2-50, pad_y-30, cw//2, pad_y-70, cw//2+50, pad_y-30, fill="#777777", outline="#555555")
+        self.draw_rocket(canvas, cw//2, pad_y-130, 1.2, False)
+    
+    def _draw_rocket_meteor(self, canvas, mx, my):
+        """陨石"""
+        canvas.create_oval(mx-20, my-20, mx+20, my+20, fill="#8B4513", outline="#654321", width=2)
+        # 陨石坑
+        for _ in range(3):
+            cx = mx + random.randint(-12, 12)
+            cy = my + random.randint(-12, 12)
+            canvas.create_oval(cx-5, cy-5, cx+5, cy+5, fill="#654321", outline="")
+        # 火焰尾巴
+        canvas.create_polygon(mx, my-20, mx-10, my-40, mx+10, my-40, fill="#FF4500", outline="")
+    
+    def _draw_rocket_fuel(self, canvas, fx, fy):
+        """燃料罐"""
+        canvas.create_rectangle(fx-12, fy-18, fx+12, fy+18, fill="#32CD32", outline="#228B22", width=2)
+        canvas.create_text(fx, fy, text="F", font=("Arial", 14, "bold"), fill="white")
 
     # =====================================================
     # 游戏6: 火车运货
@@ -2684,6 +2709,7 @@ class KidsVehiclesApp:
         self.train_canvas = tk.Canvas(self.game_frame, bg="#87CEEB", highlightthickness=2)
         self.train_canvas.pack(pady=5, fill=tk.BOTH, expand=True)
         self.window.update()
+        self.train_scene = CanvasScene(self.train_canvas)
         
         # 获取画布尺寸
         self.train_cw = self.train_canvas.winfo_width()
@@ -2703,7 +2729,7 @@ class KidsVehiclesApp:
         # 初始化车站
         self.train_init_stations()
         self.speak(f"{pup.get('name', '路马')}说：火车准备出发！去车站装货送货！")
-        self.train_game_loop()
+        self.start_game_loop("train", self.train_scene, self.train_update, self.train_render)
     
     def train_init_stations(self):
         self.train_stations = []
@@ -2734,7 +2760,7 @@ class KidsVehiclesApp:
             available = self.train_stations
         
         from_station = random.choice(available)
-        to_station = random.choice([s for s in self.train_stations if s != from_station])
+        to_station = sample_distinct(self.train_stations, 1, exclude=(from_station,))[0]
         
         from_station["has_cargo"] = True
         to_station["wants_cargo"] = from_station["cargo"]
@@ -2781,16 +2807,9 @@ class KidsVehiclesApp:
                     self.train_assign_delivery()
                 break
     
-    def train_game_loop(self):
-        if not self.game_running:
-            return
-        
-        self.train_canvas.delete("all")
-        # 动态获取画布尺寸（支持窗口最大化）
-        cw = self.train_canvas.winfo_width()
-        ch = self.train_canvas.winfo_height()
-        if cw < 100:
-            cw, ch = 900, 550
+    def train_update(self):
+        """火车：跟随窗口大小调整位置（移动和装卸货由按键处理）"""
+        cw, ch = self.train_scene.size()
         
         # 如果画布尺寸变化，调整火车位置（保持相对比例）
         if hasattr(self, 'train_cw') and self.train_cw > 0:
@@ -2798,8 +2817,6 @@ class KidsVehiclesApp:
             self.train_x = int(cw * ratio)
         
         self.train_cw, self.train_ch = cw, ch
-        ground_y = int(ch * 0.64)
-        track_y = int(ch * 0.76)
         
         # 确保火车在有效范围内
         self.train_x = max(80, min(self.train_x, cw - 80))
@@ -2808,7 +2825,38 @@ class KidsVehiclesApp:
         spacing = cw // 5
         for i, station in enumerate(self.train_stations):
             station["x"] = spacing + i * spacing
+    
+    def train_render(self):
+        """火车：画出当前状态"""
+        scene = self.train_scene
+        cw, ch = self.train_cw, self.train_ch
+        ground_y = int(ch * 0.64)
+        track_y = int(ch * 0.76)
+        
+        # 天空、草地和铁轨（只在窗口大小变化时重画）
+        scene.layer("scenery", self._draw_train_scenery, cw, ch, ground_y, track_y)
+        
+        # 画车站（装货/卸货后才重画）
+        for i, station in enumerate(self.train_stations):
+            scene.sprite(("station", i), self._draw_train_station, station["x"], track_y,
+                         station["name"], station["color"], station["cargo"],
+                         station["has_cargo"], station["wants_cargo"], z=1)
         
+        # 画火车
+        train_draw_y = track_y - 25
+        scene.sprite("train", cached(self.draw_train), self.train_x, train_draw_y, 0.8, "#228B22", z=2)
+        
+        # 画车厢（如果有货物）
+        if self.train_current_cargo:
+            scene.sprite("wagon", self._draw_train_wagon, self.train_x - 90, train_draw_y,
+                         self.train_current_cargo, z=2)
+        
+        # 任务提示
+        task_text = f"任务: 从 {self.train_task['from']['name']} 运送货物到 {self.train_task['to']['name']}"
+        scene.sprite("task", self._draw_train_task, cw//2, ch - 50, task_text, self.train_task['cargo'], z=9)
+    
+    def _draw_train_scenery(self, canvas, cw, ch, ground_y, track_y):
+        """天空、太阳、云朵、草地和铁轨"""
         # 天空
         sky_height = int(ch * 0.55)
         for i in range(sky_height):
@@ -2816,81 +2864,67 @@ class KidsVehiclesApp:
             g = min(255, 206 + i // 8)
             b = 235
             color = f"#{r:02x}{g:02x}{b:02x}"
-            self.train_canvas.create_line(0, i, cw, i, fill=color)
+            canvas.create_line(0, i, cw, i, fill=color)
         
         # 太阳
         sun_x = int(cw * 0.87)
-        self.train_canvas.create_oval(sun_x, 30, sun_x+70, 100, fill="#FFD700", outline="#FFA500", width=3)
+        canvas.create_oval(sun_x, 30, sun_x+70, 100, fill="#FFD700", outline="#FFA500", width=3)
         
         # 云朵
         for cx_ratio in [0.17, 0.44, 0.72]:
             cx = int(cw * cx_ratio)
             cy = random.randint(40, 70)
             for dx, dy in [(-20, 0), (0, -10), (20, 0), (0, 10)]:
-                self.train_canvas.create_oval(cx+dx-25, cy+dy-15, cx+dx+25, cy+dy+15, fill="white", outline="")
+                canvas.create_oval(cx+dx-25, cy+dy-15, cx+dx+25, cy+dy+15, fill="white", outline="")
         
         # 草地
-        self.train_canvas.create_rectangle(0, ground_y, cw, ch, fill="#228B22", outline="")
+        canvas.create_rectangle(0, ground_y, cw, ch, fill="#228B22", outline="")
         
         # 铁轨
-        self.train_canvas.create_rectangle(0, track_y, cw, track_y+10, fill="#8B4513", outline="")
-        self.train_canvas.create_rectangle(0, track_y+25, cw, track_y+35, fill="#8B4513", outline="")
+        canvas.create_rectangle(0, track_y, cw, track_y+10, fill="#8B4513", outline="")
+        canvas.create_rectangle(0, track_y+25, cw, track_y+35, fill="#8B4513", outline="")
         for i in range(0, cw, 40):
-            self.train_canvas.create_rectangle(i, track_y-5, i+25, track_y+40, fill="#654321", outline="#543210")
-        
-        # 画车站
-        for station in self.train_stations:
-            sx = station["x"]
-            color = station["color"]
-            
-            # 站台
-            self.train_canvas.create_rectangle(sx-60, track_y-40, sx+60, track_y, fill="#DDD", outline="#999", width=2)
-            
-            # 站牌
-            self.train_canvas.create_rectangle(sx-35, track_y-130, sx+35, track_y-40, fill=color, outline="#333", width=2)
-            self.train_canvas.create_text(sx, track_y-85, text=station["name"], font=("微软雅黑", 11, "bold"), fill="white")
-            
-            # 货物 - 使用真实水果绘制
-            if station["has_cargo"]:
-                self.draw_fruit(self.train_canvas, station["cargo"], sx, track_y-20, size=50)
-            
-            # 需要的货物（闪烁效果）
-            if station["wants_cargo"]:
-                self.train_canvas.create_rectangle(sx-30, track_y-165, sx+30, track_y-130, fill="#FFD700", outline="#FFA500", width=2)
-                self.train_canvas.create_text(sx, track_y-155, text="需要", font=("微软雅黑", 9), fill="#333")
-                self.draw_fruit(self.train_canvas, station["wants_cargo"], sx, track_y-140, size=25)
-        
-        # 画火车
-        train_draw_y = track_y - 25
-        self.draw_train(self.train_canvas, self.train_x, train_draw_y, 0.8, "#228B22")
-        
-        # 画车厢（如果有货物）
-        if self.train_current_cargo:
-            # 车厢
-            cx = self.train_x - 90
-            # 车厢主体
-            self.train_canvas.create_rectangle(cx-35, train_draw_y-10, cx+35, train_draw_y+30, fill="#8B4513", outline="#654321", width=2)
-            # 车厢顶部
-            self.train_canvas.create_rectangle(cx-38, train_draw_y-15, cx+38, train_draw_y-10, fill="#A0522D", outline="#8B4513", width=1)
-            # 货物 - 使用真实水果绘制
-            self.draw_fruit(self.train_canvas, self.train_current_cargo, cx, train_draw_y+8, size=45)
-            # 轮子
-            self.train_canvas.create_oval(cx-25, train_draw_y+25, cx-8, train_draw_y+42, fill="#222", outline="#111", width=2)
-            self.train_canvas.create_oval(cx+8, train_draw_y+25, cx+25, train_draw_y+42, fill="#222", outline="#111", width=2)
-            # 轮子中心
-            self.train_canvas.create_oval(cx-20, train_draw_y+30, cx-13, train_draw_y+37, fill="#444", outline="")
-            self.train_canvas.create_oval(cx+13, train_draw_y+30, cx+20, train_draw_y+37, fill="#444", outline="")
-        
-        # 任务提示
-        task_text = f"任务: 从 {self.train_task['from']['name']} 运送货物到 {self.train_task['to']['name']}"
-        tip_y = ch - 50
-        # 任务框
-        self.train_canvas.create_rectangle(cw//2-280, tip_y-25, cw//2+280, tip_y+25, fill="#FFF8DC", outline="#DDD", width=2)
-        self.train_canvas.create_text(cw//2, tip_y-8, text=task_text, font=("微软雅黑", 12), fill="#333")
-        # 在任务框中显示要运送的水果
-        self.draw_fruit(self.train_canvas, self.train_task['cargo'], cw//2, tip_y+12, size=30)
-        
-        self.window.after(50, self.train_game_loop)
+            canvas.create_rectangle(i, track_y-5, i+25, track_y+40, fill="#654321", outline="#543210")
+    
+    def _draw_train_station(self, canvas, sx, track_y, name, color, cargo, has_cargo, wants_cargo):
+        """车站、站牌和货物"""
+        # 站台
+        canvas.create_rectangle(sx-60, track_y-40, sx+60, track_y, fill="#DDD", outline="#999", width=2)
+        
+        # 站牌
+        canvas.create_rectangle(sx-35, track_y-130, sx+35, track_y-40, fill=color, outline="#333", width=2)
+        canvas.create_text(sx, track_y-85, text=name, font=("微软雅黑", 11, "bold"), fill="white")
+        
+        # 货物 - 使用真实水果绘制
+        if has_cargo:
+            self.draw_fruit(canvas, cargo, sx, track_y-20, size=50)
+        
+        # 需要的货物
+        if wants_cargo:
+            canvas.create_rectangle(sx-30, track_y-165, sx+30, track_y-130, fill="#FFD700", outline="#FFA500", width=2)
+            canvas.create_text(sx, track_y-155, text="需要", font=("微软雅黑", 9), fill="#333")
+            self.draw_fruit(canvas, wants_cargo, sx, track_y-140, size=25)
+    
+    def _draw_train_wagon(self, canvas, cx, train_draw_y, cargo):
+        """装着货物的车厢"""
+        # 车厢主体
+        canvas.create_rectangle(cx-35, train_draw_y-10, cx+35, train_draw_y+30, fill="#8B4513", outline="#654321", width=2)
+        # 车厢顶部
+        canvas.create_rectangle(cx-38, train_draw_y-15, cx+38, train_draw_y-10, fill="#A0522D", outline="#8B4513", width=1)
+        # 货物 - 使用真实水果绘制
+        self.draw_fruit(canvas, cargo, cx, train_draw_y+8, size=45)
+        # 轮子
+        canvas.create_oval(cx-25, train_draw_y+25, cx-8, train_draw_y+42, fill="#222", outline="#111", width=2)
+        canvas.create_oval(cx+8, train_draw_y+25, cx+25, train_draw_y+42, fill="#222", outline="#111", width=2)
+        # 轮子中心
+        canvas.create_oval(cx-20, train_draw_y+30, cx-13, train_draw_y+37, fill="#444", outline="")
+        canvas.create_oval(cx+13, train_draw_y+30, cx+20, train_draw_y+37, fill="#444", outline="")
+    
+    def _draw_train_task(self, canvas, x, tip_y, task_text, cargo):
+        """底部的任务框"""
+        canvas.create_rectangle(x-280, tip_y-25, x+280, tip_y+25, fill="#FFF8DC", outline="#DDD", width=2)
+        canvas.create_text(x, tip_y-8, text=task_text, font=("微软雅黑", 12), fill="#333")
+        self.draw_fruit(canvas, cargo, x, tip_y+12, size=30)
 
     # =====================================================
     # 游戏7: 交通小达人 - 认识交通工具和交通规则
@@ -2988,7 +3022,7 @@ class KidsVehiclesApp:
         
         # 随机选择目标
         self.quiz_target = random.choice(self.vehicles_data)
-        others = random.sample([v for v in self.vehicles_data if v != self.quiz_target], 3)
+        others = sample_distinct(self.vehicles_data, 3, exclude=(self.quiz_target,))
         self.quiz_options = [self.quiz_target] + others
         random.shuffle(self.quiz_options)
         self.quiz_correct_idx = self.quiz_options.index(self.quiz_target)
@@ -2999,17 +3033,17 @@ class KidsVehiclesApp:
         # 尝试绘制交通工具
         draw_method = self.quiz_target.get("draw")
         if draw_method == "excavator":
-            self.draw_excavator(self.quiz_display, 150, 100, 0.8, 30)
+            cached(self.draw_excavator)(self.quiz_display, 150, 100, 0.8, 30)
         elif draw_method == "race_car":
-            self.draw_race_car(self.quiz_display, 150, 100, 0.9, "#FF0000")
+            cached(self.draw_race_car)(self.quiz_display, 150, 100, 0.9, "#FF0000")
         elif draw_method == "fire_truck":
-            self.draw_fire_truck(self.quiz_display, 150, 100, 0.7)
+            cached(self.draw_fire_truck)(self.quiz_display, 150, 100, 0.7)
         elif draw_method == "airplane":
-            self.draw_airplane(self.quiz_display, 150, 100, 0.7)
+            cached(self.draw_airplane)(self.quiz_display, 150, 100, 0.7)
         elif draw_method == "rocket":
-            self.draw_rocket(self.quiz_display, 150, 120, 0.6)
+            cached(self.draw_rocket)(self.quiz_display, 150, 120, 0.6)
         elif draw_method == "train":
-            self.draw_train(self.quiz_display, 150, 120, 0.7)
+            cached(self.draw_train)(self.quiz_display, 150, 120, 0.7)
         else:
             # 用大emoji显示
             self.quiz_display.create_text(150, 100, text=self.quiz_target["emoji"],
@@ -3091,7 +3125,7 @@ class KidsVehiclesApp:
         # 选择有声音的交通工具
         sound_vehicles = [v for v in self.vehicles_data if v.get("sound")]
         self.quiz_target = random.choice(sound_vehicles)
-        others = random.sample([v for v in sound_vehicles if v != self.quiz_target], 3)
+        others = sample_distinct(sound_vehicles, 3, exclude=(self.quiz_target,))
         self.quiz_options = [self.quiz_target] + others
         random.shuffle(self.quiz_options)
         self.quiz_correct_idx = self.quiz_options.index(self.quiz_target)
@@ -3285,11 +3319,11 @@ class KidsVehiclesApp:
         self.speed_answered = False
         
         # 选择目标
-        all_vehicles = [v for v in self.vehicles_data]
+        all_vehicles = self.vehicles_data
         self.quiz_target = random.choice(all_vehicles)
         
         # 生成9个选项（包含1个正确答案）
-        others = random.sample([v for v in all_vehicles if v != self.quiz_target], 8)
+        others = sample_distinct(all_vehicles, 8, exclude=(self.quiz_target,))
         options = [self.quiz_target] + others
         random.shuffle(options)
         self.speed_options = options
@@ -4250,6 +4284,7 @@ class KidsVehiclesApp:
     # 运行
     # =====================================================
     def run(self):
+        self.window.after_idle(startup_profiler.first_frame)
         self.window.mainloop()
 
 
@@ -44,10 +44,9 @@ class TempFileManager:
         self._cleanup_lock = threading.Lock()
         
         # 注册退出时清理
+        # TTS 语音已改用 tts_cache 持久缓存，不再产生 tts_*.mp3 临时文件，
+        # 因此不需要定期清理线程，退出时顺带清掉旧版本遗留的文件即可
         atexit.register(self.cleanup_all)
-        
-        # 启动定期清理线程
-        self._start_periodic_cleanup()
     
     def register_file(self, filepath):
         """注册一个临时文件"""
@@ -94,16 +93,6 @@ class TempFileManager:
                     pass
         except Exception as e:
             print(f"清理遗留TTS文件失败: {e}")
-    
-    def _start_periodic_cleanup(self):
-        """启动定期清理线程"""
-        def cleanup_thread():
-            while True:
-                time.sleep(300)  # 每5分钟清理一次
-                self._cleanup_orphan_tts_files()
-        
-        t = threading.Thread(target=cleanup_thread, daemon=True)
-        t.start()
 
 
 # 全局临时文件管理器实例
@@ -4,9 +4,13 @@
 统一管理学习进度、错题记录、奖励系统
 优化：使用BatchSaver减少频繁IO
 优化：使用ui_config统一路径管理
+优化：保存时只追加增量日志（data_journal），不再整份重写；
+      改动处用 save(路径) 标出改过的子树，保存时只比较这些子树
+可选：SQLite 存储（progress_store），复习查询走索引
+优化：徽章和每日挑战按依赖的计数器增量检查（achievement_rules）
+优化：难度调整看最近 20 题的滚动窗口（rolling_stats），不再看累计总数
 """
 
-import json
 import os
 import atexit
 from datetime import datetime, date, timedelta
@@ -26,6 +30,15 @@ else:
     DATA_DIR = os.path.dirname(os.path.abspath(__file__))
     PROGRESS_FILE = os.path.join(DATA_DIR, "learning_progress.json")
 
+from data_journal import JsonJournal
+from progress_store import sqlite_enabled, get_progress_store
+from review_scheduler import ReviewScheduler, is_mastered
+from rolling_stats import RollingStats
+from achievement_rules import (
+    RuleEngine, module_key, STARS, STREAK, DAYS_LEARNED, TODAY_QUESTIONS, TODAY_CORRECT,
+    DAILY_TARGET, CHALLENGES, FLAGS, EXPLORED_MODES, CLOCK,
+)
+
 # 尝试导入BatchSaver
 try:
     from learning_base import BatchSaver
@@ -112,33 +125,38 @@ DEFAULT_DATA = {
         "completed": [],             # 已完成的挑战ID
         "streak": 0,                 # 连续完成天数
         "total_completed": 0         # 累计完成挑战数
-    }
+    },
+    # 各模块最近表现（滚动窗口 + 衰减正确率/用时），保存时从 RollingStats 导出
+    "recent_stats": {}
 }
 
-# 徽章定义
+# 所有模块的答题计数器
+MODULE_KEYS = tuple(module_key(m) for m in DEFAULT_DATA["modules"])
+
+# 徽章定义（watch：条件依赖的计数器，只有这些计数器变化时才检查条件）
 BADGES = {
-    "first_star": {"name": "初露锋芒", "desc": "获得第一颗星星", "emoji": "🌟", "condition": lambda d: d["rewards"]["stars"] >= 1},
-    "ten_stars": {"name": "小小明星", "desc": "累计获得10颗星星", "emoji": "⭐", "condition": lambda d: d["rewards"]["stars"] >= 10},
-    "fifty_stars": {"name": "闪耀之星", "desc": "累计获得50颗星星", "emoji": "🌠", "condition": lambda d: d["rewards"]["stars"] >= 50},
-    "hundred_stars": {"name": "超级巨星", "desc": "累计获得100颗星星", "emoji": "💫", "condition": lambda d: d["rewards"]["stars"] >= 100},
-    "first_day": {"name": "学习起步", "desc": "完成第一天学习", "emoji": "📚", "condition": lambda d: d["overall"]["days_learned"] >= 1},
-    "seven_days": {"name": "坚持一周", "desc": "累计学习7天", "emoji": "📅", "condition": lambda d: d["overall"]["days_learned"] >= 7},
-    "thirty_days": {"name": "学习达人", "desc": "累计学习30天", "emoji": "🏆", "condition": lambda d: d["overall"]["days_learned"] >= 30},
-    "perfect_ten": {"name": "完美十连", "desc": "连续答对10题", "emoji": "🎯", "condition": lambda d: d.get("current_streak", 0) >= 10},
-    "literacy_master": {"name": "识字小能手", "desc": "识字正确率达到90%", "emoji": "📖", "condition": lambda d: _calc_accuracy(d, "literacy") >= 90},
-    "math_master": {"name": "数学小天才", "desc": "数学正确率达到90%", "emoji": "🔢", "condition": lambda d: _calc_accuracy(d, "math") >= 90},
-    "english_master": {"name": "英语小达人", "desc": "英语正确率达到90%", "emoji": "🔤", "condition": lambda d: _calc_accuracy(d, "english") >= 90},
-    "all_rounder": {"name": "全能宝宝", "desc": "所有模块都学习过", "emoji": "🎖️", "condition": lambda d: all(m["correct"] > 0 for m in d["modules"].values())},
-    "daily_goal": {"name": "今日之星", "desc": "完成每日学习目标", "emoji": "🌈", "condition": lambda d: d.get("daily_plan", {}).get("today_questions", 0) >= d.get("daily_plan", {}).get("target_questions", 30)},
-    "early_bird": {"name": "早起鸟儿", "desc": "早上9点前开始学习", "emoji": "🐦", "condition": lambda d: d.get("early_bird_achieved", False)},
-    "night_owl": {"name": "学习小夜猫", "desc": "晚上学习并完成目标", "emoji": "🦉", "condition": lambda d: d.get("night_owl_achieved", False)},
+    "first_star": {"name": "初露锋芒", "desc": "获得第一颗星星", "emoji": "🌟", "watch": (STARS,), "condition": lambda d: d["rewards"]["stars"] >= 1},
+    "ten_stars": {"name": "小小明星", "desc": "累计获得10颗星星", "emoji": "⭐", "watch": (STARS,), "condition": lambda d: d["rewards"]["stars"] >= 10},
+    "fifty_stars": {"name": "闪耀之星", "desc": "累计获得50颗星星", "emoji": "🌠", "watch": (STARS,), "condition": lambda d: d["rewards"]["stars"] >= 50},
+    "hundred_stars": {"name": "超级巨星", "desc": "累计获得100颗星星", "emoji": "💫", "watch": (STARS,), "condition": lambda d: d["rewards"]["stars"] >= 100},
+    "first_day": {"name": "学习起步", "desc": "完成第一天学习", "emoji": "📚", "watch": (DAYS_LEARNED,), "condition": lambda d: d["overall"]["days_learned"] >= 1},
+    "seven_days": {"name": "坚持一周", "desc": "累计学习7天", "emoji": "📅", "watch": (DAYS_LEARNED,), "condition": lambda d: d["overall"]["days_learned"] >= 7},
+    "thirty_days": {"name": "学习达人", "desc": "累计学习30天", "emoji": "🏆", "watch": (DAYS_LEARNED,), "condition": lambda d: d["overall"]["days_learned"] >= 30},
+    "perfect_ten": {"name": "完美十连", "desc": "连续答对10题", "emoji": "🎯", "watch": (STREAK,), "condition": lambda d: d.get("current_streak", 0) >= 10},
+    "literacy_master": {"name": "识字小能手", "desc": "识字正确率达到90%", "emoji": "📖", "watch": (module_key("literacy"),), "condition": lambda d: _calc_accuracy(d, "literacy") >= 90},
+    "math_master": {"name": "数学小天才", "desc": "数学正确率达到90%", "emoji": "🔢", "watch": (module_key("math"),), "condition": lambda d: _calc_accuracy(d, "math") >= 90},
+    "english_master": {"name": "英语小达人", "desc": "英语正确率达到90%", "emoji": "🔤", "watch": (module_key("english"),), "condition": lambda d: _calc_accuracy(d, "english") >= 90},
+    "all_rounder": {"name": "全能宝宝", "desc": "所有模块都学习过", "emoji": "🎖️", "watch": MODULE_KEYS, "condition": lambda d: all(m["correct"] > 0 for m in d["modules"].values())},
+    "daily_goal": {"name": "今日之星", "desc": "完成每日学习目标", "emoji": "🌈", "watch": (TODAY_QUESTIONS, DAILY_TARGET), "condition": lambda d: d.get("daily_plan", {}).get("today_questions", 0) >= d.get("daily_plan", {}).get("target_questions", 30)},
+    "early_bird": {"name": "早起鸟儿", "desc": "早上9点前开始学习", "emoji": "🐦", "watch": (FLAGS,), "condition": lambda d: d.get("early_bird_achieved", False)},
+    "night_owl": {"name": "学习小夜猫", "desc": "晚上学习并完成目标", "emoji": "🦉", "watch": (FLAGS,), "condition": lambda d: d.get("night_owl_achieved", False)},
     # 新增挑战相关徽章
-    "challenge_first": {"name": "挑战新手", "desc": "完成第一个每日挑战", "emoji": "🎪", "condition": lambda d: d.get("daily_challenges", {}).get("total_completed", 0) >= 1},
-    "challenge_week": {"name": "挑战达人", "desc": "连续7天完成挑战", "emoji": "🏅", "condition": lambda d: d.get("daily_challenges", {}).get("streak", 0) >= 7},
-    "challenge_master": {"name": "挑战大师", "desc": "累计完成50个挑战", "emoji": "👑", "condition": lambda d: d.get("daily_challenges", {}).get("total_completed", 0) >= 50},
-    "speed_demon": {"name": "闪电侠", "desc": "5分钟内答对10题", "emoji": "⚡", "condition": lambda d: d.get("speed_achievement", False)},
-    "explorer": {"name": "探索家", "desc": "尝试所有6种游戏模式", "emoji": "🧭", "condition": lambda d: len(d.get("explored_modes", [])) >= 6},
-    "two_hundred_stars": {"name": "星光璀璨", "desc": "累计获得200颗星星", "emoji": "✨", "condition": lambda d: d["rewards"]["stars"] >= 200},
+    "challenge_first": {"name": "挑战新手", "desc": "完成第一个每日挑战", "emoji": "🎪", "watch": (CHALLENGES,), "condition": lambda d: d.get("daily_challenges", {}).get("total_completed", 0) >= 1},
+    "challenge_week": {"name": "挑战达人", "desc": "连续7天完成挑战", "emoji": "🏅", "watch": (CHALLENGES,), "condition": lambda d: d.get("daily_challenges", {}).get("streak", 0) >= 7},
+    "challenge_master": {"name": "挑战大师", "desc": "累计完成50个挑战", "emoji": "👑", "watch": (CHALLENGES,), "condition": lambda d: d.get("daily_challenges", {}).get("total_completed", 0) >= 50},
+    "speed_demon": {"name": "闪电侠", "desc": "5分钟内答对10题", "emoji": "⚡", "watch": (FLAGS,), "condition": lambda d: d.get("speed_achievement", False)},
+    "explorer": {"name": "探索家", "desc": "尝试所有6种游戏模式", "emoji": "🧭", "watch": (EXPLORED_MODES,), "condition": lambda d: len(d.get("explored_modes", [])) >= 6},
+    "two_hundred_stars": {"name": "星光璀璨", "desc": "累计获得200颗星星", "emoji": "✨", "watch": (STARS,), "condition": lambda d: d["rewards"]["stars"] >= 200},
 }
 
 # 每日挑战模板
@@ -157,6 +175,16 @@ DAILY_CHALLENGE_TEMPLATES = [
     {"id": "perfect_5", "name": "完美答题", "desc": "连续答对5题不出错", "target": 5, "type": "perfect", "reward_stars": 3, "emoji": "💯"},
 ]
 
+# 每日挑战按类型依赖的计数器（学习时长随时间变化，每次检查挑战都算一次）
+CHALLENGE_WATCH = {
+    "correct": (TODAY_CORRECT,),
+    "streak": (STREAK,),
+    "module_correct": (TODAY_CORRECT,),
+    "time": (CLOCK,),
+    "review": (),
+    "perfect": (STREAK,),
+}
+
 def _calc_accuracy(data, module):
     """计算模块正确率"""
     m = data["modules"].get(module, {})
@@ -187,11 +215,27 @@ class LearningData:
         if self._initialized:
             return
         self._initialized = True
-        self._data_lock = threading.Lock()  # 数据访问锁
+        # 数据访问锁（可重入：答题时在锁内 save()，BatchSaver 到点会直接调 _do_save）
+        self._data_lock = threading.RLock()
+        self._journal = JsonJournal(PROGRESS_FILE)
+        # 可选的 SQLite 存储：复习项目存在数据库中，不放在 self.data 里
+        self._store = get_progress_store() if sqlite_enabled() else None
+        self._saved_sections = {}
+        self._scheduler = None  # 复习调度器（JSON 存储时使用，懒加载）
         self.data = self._load_data()
+        # 合并进来的默认值还没保存过：第一次保存比较整份数据
+        self._journal.touch_all()
         self.session_start = datetime.now()
         self.current_streak = 0  # 当前连续答对数
         self._dirty = False  # 数据是否已修改
+        # 各模块最近表现（每答一题 O(1) 更新）
+        self._recent = RollingStats.from_dict(self.data.get("recent_stats"))
+        
+        # 徽章/挑战规则：只检查依赖的计数器变化了的规则
+        self._badge_rules = RuleEngine()
+        self._challenge_rules = RuleEngine()
+        self._challenge_rules_date = None
+        self._init_badge_rules()
         
         # 初始化BatchSaver
         if BATCH_SAVER_AVAILABLE:
@@ -203,21 +247,48 @@ class LearningData:
         atexit.register(self.force_save)
     
     def _load_data(self):
-        """加载数据"""
+        """加载数据（快照 + 重放增量日志，或从 SQLite 读取）"""
+        if self._store:
+            return self._load_from_store()
         try:
-            if os.path.exists(PROGRESS_FILE):
-                with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 合并默认值（处理新增字段）
-                    return self._merge_defaults(data)
+            data = self._journal.load()
+            if data is not None:
+                # 合并默认值（处理新增字段）
+                return self._merge_defaults(data)
         except Exception as e:
             print(f"加载数据失败: {e}")
         
         # 返回默认数据
-        data = DEFAULT_DATA.copy()
+        import copy
+        data = copy.deepcopy(DEFAULT_DATA)
         data["user_info"]["created_date"] = date.today().isoformat()
         return data
     
+    def _load_from_store(self):
+        """从 SQLite 读取学习数据（复习项目留在数据库中）"""
+        import copy
+        sections = self._store.load_sections()
+        data = self._merge_defaults(sections)
+        if not sections:
+            data["user_info"]["created_date"] = date.today().isoformat()
+        data.pop("review_items", None)
+        self._saved_sections = copy.deepcopy(sections)
+        return data
+    
+    def _save_to_store(self):
+        """只写入和上次保存相比变化了的顶层字段"""
+        import copy
+        changed = {key: value for key, value in self.data.items()
+                   if self._saved_sections.get(key) != value}
+        removed = [key for key in self._saved_sections if key not in self.data]
+        if not changed and not removed:
+            return
+        self._store.save_sections(changed, removed)
+        for key in removed:
+            del self._saved_sections[key]
+        for key, value in changed.items():
+            self._saved_sections[key] = copy.deepcopy(value)
+    
     def _merge_defaults(self, data):
         """合并默认值，确保所有字段存在"""
         import copy
@@ -236,8 +307,18 @@ class LearningData:
         
         return merge(result, data)
     
-    def save(self):
-        """保存数据（使用BatchSaver优化）"""
+    def save(self, *paths):
+        """保存数据（使用BatchSaver优化）
+
+        Args:
+            paths: 这次改过的数据路径（键的元组，如 ("modules", "math")），
+                   保存时只比较这些子树；不传表示改动位置不确定，比较整份数据
+        """
+        if not self._store:
+            if paths:
+                self._journal.touch(*paths)
+            else:
+                self._journal.touch_all()
         self._dirty = True
         if self._batch_saver:
             self._batch_saver.mark_dirty()
@@ -245,46 +326,21 @@ class LearningData:
             self._do_save()
     
     def _do_save(self):
-        """实际执行保存（带备份机制）"""
+        """实际执行保存：只把改动追加到日志，日志过大时合并成快照"""
         if not self._dirty:
             return
         
         with self._data_lock:
             try:
-                # 先创建备份
-                backup_file = PROGRESS_FILE + ".bak"
-                if os.path.exists(PROGRESS_FILE):
-                    try:
-                        import shutil
-                        shutil.copy2(PROGRESS_FILE, backup_file)
-                    except Exception as e:
-                        print(f"创建备份失败: {e}")
-                
-                # 写入临时文件
-                temp_file = PROGRESS_FILE + ".tmp"
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.data, f, ensure_ascii=False, indent=2)
-                
-                # 验证写入的数据
-                with open(temp_file, 'r', encoding='utf-8') as f:
-                    json.load(f)  # 验证 JSON 格式正确
-                
-                # 替换原文件
-                if os.path.exists(PROGRESS_FILE):
-                    os.remove(PROGRESS_FILE)
-                os.rename(temp_file, PROGRESS_FILE)
-                
+                self.data["recent_stats"] = self._recent.to_dict()
+                if self._store:
+                    self._save_to_store()
+                else:
+                    self._journal.touch(("recent_stats",))
+                    self._journal.record(self.data)
                 self._dirty = False
             except Exception as e:
                 print(f"保存数据失败: {e}")
-                # 尝试从备份恢复
-                if os.path.exists(backup_file):
-                    try:
-                        import shutil
-                        shutil.copy2(backup_file, PROGRESS_FILE)
-                        print("已从备份恢复数据")
-                    except:
-                        pass
     
     def force_save(self):
         """强制立即保存（退出时调用）"""
@@ -299,17 +355,19 @@ class LearningData:
         if self.data["overall"]["last_date"] != today:
             self.data["overall"]["days_learned"] += 1
             self.data["overall"]["last_date"] = today
-            self.save()
+            self.notify_changed(DAYS_LEARNED)
+            self.save(("overall",))
             return True  # 新的一天
         return False
     
-    def add_score(self, module, points, is_correct):
+    def add_score(self, module, points, is_correct, response_time=None):
         """添加分数
         
         Args:
             module: 模块名称 (literacy, pinyin, math, english, thinking, vehicles)
             points: 得分（必须为非负整数）
             is_correct: 是否正确
+            response_time: 答题用时（秒，可选）
         
         Returns:
             list: 新获得的徽章列表
@@ -334,6 +392,8 @@ class LearningData:
                 else:
                     self.data["modules"][module]["wrong"] += 1
                     self.current_streak = 0
+                self._recent.record(module, is_correct, response_time)
+                self.notify_changed(module_key(module), STREAK)
             
             # 更新总体数据
             self.data["overall"]["total_score"] += points
@@ -351,6 +411,7 @@ class LearningData:
             # 检查是否获得星星（每答对3题得1星）
             if is_correct and self.data["overall"]["total_correct"] % 3 == 0:
                 self.data["rewards"]["stars"] += 1
+                self.notify_changed(STARS)
             
             # 检查并更新难度等级（每答5题检查一次）
             if module in self.data["modules"]:
@@ -365,22 +426,32 @@ class LearningData:
             # 检查新徽章
             new_badges = self._check_new_badges()
         
-        self.save()
+        self.save(("modules", module), ("overall",), ("rewards",), ("current_streak",))
         return new_badges
     
+    def _init_badge_rules(self):
+        """把还没获得的徽章加入规则引擎（加入时都待检查一次）"""
+        self._badge_rules.clear()
+        earned = set(self.data["rewards"]["badges"])
+        for badge_id, badge_info in BADGES.items():
+            if badge_id not in earned:
+                self._badge_rules.add(badge_id, badge_info["condition"],
+                                      watch=badge_info.get("watch"), payload=badge_info)
+    
+    def notify_changed(self, *keys):
+        """通知规则引擎这些计数器变了（直接修改 self.data 后调用，如 FLAGS、EXPLORED_MODES）"""
+        self._badge_rules.touch(*keys)
+        self._challenge_rules.touch(*keys)
+    
     def _check_new_badges(self):
-        """检查是否获得新徽章"""
+        """检查是否获得新徽章（只检查依赖的计数器变化过的徽章）"""
         new_badges = []
         self.data["current_streak"] = self.current_streak
         
-        for badge_id, badge_info in BADGES.items():
+        for badge_id, badge_info in self._badge_rules.collect(self.data):
             if badge_id not in self.data["rewards"]["badges"]:
-                try:
-                    if badge_info["condition"](self.data):
-                        self.data["rewards"]["badges"].append(badge_id)
-                        new_badges.append(badge_info)
-                except:
-                    pass
+                self.data["rewards"]["badges"].append(badge_id)
+                new_badges.append(badge_info)
         
         return new_badges
     
@@ -391,7 +462,7 @@ class LearningData:
             for q in self.data["wrong_questions"][module]:
                 if q.get("question") == question_data.get("question"):
                     q["wrong_count"] = q.get("wrong_count", 1) + 1
-                    self.save()
+                    self.save(("wrong_questions", module))
                     return
             
             question_data["wrong_count"] = 1
@@ -402,7 +473,7 @@ class LearningData:
             if len(self.data["wrong_questions"][module]) > 50:
                 self.data["wrong_questions"][module] = self.data["wrong_questions"][module][-50:]
             
-            self.save()
+            self.save(("wrong_questions", module))
     
     def remove_wrong_question(self, module, question):
         """移除错题（答对后）"""
@@ -411,7 +482,7 @@ class LearningData:
                 q for q in self.data["wrong_questions"][module] 
                 if q.get("question") != question
             ]
-            self.save()
+            self.save(("wrong_questions", module))
     
     def get_wrong_questions(self, module):
         """获取错题列表"""
@@ -422,7 +493,7 @@ class LearningData:
         if category in self.data["mastered_items"]:
             if item not in self.data["mastered_items"][category]:
                 self.data["mastered_items"][category].append(item)
-                self.save()
+                self.save(("mastered_items", category))
     
     def get_mastered_items(self, category):
         """获取已掌握的内容"""
@@ -433,30 +504,33 @@ class LearningData:
         return self.data["modules"].get(module, {}).get("level", 1)
     
     def update_level(self, module):
-        """根据正确率自动调整难度"""
+        """根据最近的正确率自动调整难度（滚动窗口，调整后重新计）"""
         if module not in self.data["modules"]:
             return None
         
         m = self.data["modules"][module]
-        total = m["correct"] + m["wrong"]
+        recent = self._recent.get(module)
+        total = recent.recent_count() if recent else 0
         
         if total < 5:  # 至少答5题才调整
             return None
         
-        # 计算最近的正确率（使用总体数据，但考虑最近表现）
-        accuracy = m["correct"] / total * 100
+        # 最近 total 题的正确率
+        accuracy = recent.recent_accuracy()
         current_level = m.get("level", 1)
         
         # 根据正确率调整等级
         # 正确率>=80%且答题>=10题，升级
         if accuracy >= 80 and total >= 10 and current_level < 3:
             m["level"] = current_level + 1
-            self.save()
+            recent.reset_window()
+            self.save(("modules", module))
             return "up"
         # 正确率<50%且答题>=8题，降级
         elif accuracy < 50 and total >= 8 and current_level > 1:
             m["level"] = current_level - 1
-            self.save()
+            recent.reset_window()
+            self.save(("modules", module))
             return "down"
         
         return None
@@ -465,7 +539,7 @@ class LearningData:
         """手动设置难度等级（家长功能）"""
         if module in self.data["modules"]:
             self.data["modules"][module]["level"] = max(1, min(3, level))
-            self.save()
+            self.save(("modules", module))
     
     def get_stats(self, module=None):
         """获取统计数据"""
@@ -473,13 +547,16 @@ class LearningData:
             m = self.data["modules"].get(module, {})
             total = m.get("correct", 0) + m.get("wrong", 0)
             accuracy = int(m.get("correct", 0) / total * 100) if total > 0 else 0
+            recent = self._recent.get(module)
             return {
                 "score": m.get("score", 0),
                 "correct": m.get("correct", 0),
                 "wrong": m.get("wrong", 0),
                 "total": total,
                 "accuracy": accuracy,
-                "level": m.get("level", 1)
+                "level": m.get("level", 1),
+                "recent_accuracy": recent.recent_accuracy() if recent else None,
+                "response_time": recent.response_time.value if recent else None
             }
         else:
             o = self.data["overall"]
@@ -504,6 +581,7 @@ class LearningData:
                 badge = BADGES[badge_id].copy()
                 badge["id"] = badge_id
                 del badge["condition"]
+                badge.pop("watch", None)
                 result.append(badge)
         return result
     
@@ -562,13 +640,14 @@ class LearningData:
             self.data["daily_plan"]["today_minutes"] = 0
             self.data["daily_plan"]["today_date"] = today
             self.data["daily_plan"]["last_rest_reminder"] = ""
-            self.save()
+            self.notify_changed(TODAY_QUESTIONS, TODAY_CORRECT)
+            self.save(("daily_plan",))
     
     def _update_today_minutes(self, minutes):
         """更新今日学习时长"""
         self._reset_daily_plan_if_needed()
         self.data["daily_plan"]["today_minutes"] += minutes
-        self.save()
+        self.save(("daily_plan",))
     
     def add_today_question(self, is_correct):
         """记录今日答题"""
@@ -576,7 +655,10 @@ class LearningData:
         self.data["daily_plan"]["today_questions"] += 1
         if is_correct:
             self.data["daily_plan"]["today_correct"] += 1
-        self.save()
+            self.notify_changed(TODAY_QUESTIONS, TODAY_CORRECT)
+        else:
+            self.notify_changed(TODAY_QUESTIONS)
+        self.save(("daily_plan",))
     
     def get_daily_plan(self):
         """获取每日计划数据"""
@@ -610,6 +692,7 @@ class LearningData:
             self.data["daily_plan"]["target_minutes"] = target_minutes
         if rest_reminder is not None:
             self.data["daily_plan"]["rest_reminder"] = rest_reminder
+        self.notify_changed(DAILY_TARGET)
         self.save()
     
     def should_show_rest_reminder(self):
@@ -646,14 +729,17 @@ class LearningData:
         # 早起鸟儿（9点前）
         if hour < 9 and not self.data.get("early_bird_achieved", False):
             self.data["early_bird_achieved"] = True
-            self.save()
+            self.notify_changed(FLAGS)
+            self.save(("early_bird_achieved",))
         
         # 学习小夜猫（晚上8点后且完成目标）
-        if hour >= 20:
-            plan = self.get_daily_plan()
-            if plan["goal_completed"] and not self.data.get("night_owl_achieved", False):
+        if hour >= 20 and not self.data.get("night_owl_achieved", False):
+            self._reset_daily_plan_if_needed()
+            plan = self.data["daily_plan"]
+            if plan["today_questions"] >= plan["target_questions"]:
                 self.data["night_owl_achieved"] = True
-                self.save()
+                self.notify_changed(FLAGS)
+                self.save(("night_owl_achieved",))
     
     # =====================================================
     # 艾宾浩斯智能复习系统
@@ -662,6 +748,16 @@ class LearningData:
     # 艾宾浩斯复习间隔（天数）：1, 2, 4, 7, 15, 30
     REVIEW_INTERVALS = [1, 2, 4, 7, 15, 30]
     
+    def _get_scheduler(self):
+        """复习调度器（第一次使用时按现有复习项目建立，复习项目字典是共享的）"""
+        if self._scheduler is None:
+            scheduler = ReviewScheduler()
+            for items in self.data.get("review_items", {}).values():
+                for r in items:
+                    scheduler.add(r)
+            self._scheduler = scheduler
+        return self._scheduler
+    
     def add_review_item(self, category, item, display_name=None):
         """添加需要复习的内容
         
@@ -670,6 +766,10 @@ class LearningData:
             item: 内容标识
             display_name: 显示名称（可选）
         """
+        if self._store:
+            self._store.add_review(self._new_review_item(category, item, display_name))
+            return
+        
         if "review_items" not in self.data:
             self.data["review_items"] = {"literacy": [], "pinyin": [], "english": [], "math": []}
         
@@ -677,14 +777,21 @@ class LearningData:
             self.data["review_items"][category] = []
         
         # 检查是否已存在
-        for r in self.data["review_items"][category]:
-            if r["item"] == item:
-                return  # 已存在，不重复添加
+        scheduler = self._get_scheduler()
+        if (category, item) in scheduler:
+            return  # 已存在，不重复添加
         
+        review_data = self._new_review_item(category, item, display_name)
+        self.data["review_items"][category].append(review_data)
+        scheduler.add(review_data)
+        self.save(("review_items", category))
+    
+    def _new_review_item(self, category, item, display_name=None):
+        """新的复习项目记录"""
         today = date.today().isoformat()
         next_review = (date.today() + timedelta(days=1)).isoformat()  # 第一次复习在1天后
         
-        review_data = {
+        return {
             "item": item,
             "display_name": display_name or item,
             "category": category,
@@ -694,9 +801,6 @@ class LearningData:
             "ease_factor": 2.5,  # 初始难度系数
             "correct_streak": 0  # 连续答对次数
         }
-        
-        self.data["review_items"][category].append(review_data)
-        self.save()
     
     def update_review_item(self, category, item, is_correct):
         """更新复习项目状态
@@ -709,39 +813,70 @@ class LearningData:
         Returns:
             下次复习日期
         """
-        if "review_items" not in self.data:
-            return None
+        return self.update_review_items([(category, item, is_correct)])[0]
+    
+    def update_review_items(self, results):
+        """批量更新复习结果（一次复习会话结束时调用，只保存一次）
         
-        if category not in self.data["review_items"]:
-            return None
+        Args:
+            results: [(类别, 内容标识, 是否答对), ...]
         
-        for r in self.data["review_items"][category]:
-            if r["item"] == item:
-                r["review_count"] += 1
-                
-                if is_correct:
-                    r["correct_streak"] += 1
-                    # 答对：增加难度系数，延长复习间隔
-                    r["ease_factor"] = min(3.0, r["ease_factor"] + 0.1)
-                    
-                    # 根据复习次数确定下次间隔
-                    idx = min(r["review_count"], len(self.REVIEW_INTERVALS) - 1)
-                    base_interval = self.REVIEW_INTERVALS[idx]
-                    # 根据难度系数调整间隔
-                    interval = int(base_interval * r["ease_factor"] / 2.5)
-                else:
-                    r["correct_streak"] = 0
-                    # 答错：降低难度系数，缩短复习间隔
-                    r["ease_factor"] = max(1.3, r["ease_factor"] - 0.2)
-                    interval = 1  # 答错后第二天再复习
-                
-                r["next_review"] = (date.today() + timedelta(days=interval)).isoformat()
-                r["last_review"] = date.today().isoformat()
-                
-                self.save()
-                return r["next_review"]
+        Returns:
+            每一项的下次复习日期列表（找不到的为 None）
+        """
+        if self._store:
+            updated = []
+            dates = []
+            for category, item, is_correct in results:
+                r = self._store.get_review(category, item)
+                if r is not None:
+                    self._apply_review_result(r, is_correct)
+                    updated.append(r)
+                dates.append(r["next_review"] if r else None)
+            self._store.update_reviews(updated)
+            return dates
+        
+        scheduler = self._get_scheduler()
+        dates = []
+        changed = set()
+        for category, item, is_correct in results:
+            r = scheduler.get(category, item)
+            if r is None:
+                dates.append(None)
+                continue
+            changed.add(("review_items", category))
+            old_next_review = r["next_review"]
+            was_mastered = is_mastered(r)
+            self._apply_review_result(r, is_correct)
+            scheduler.reschedule(r, old_next_review, was_mastered)
+            dates.append(r["next_review"])
+        
+        if changed:
+            self.save(*changed)
+        return dates
+    
+    def _apply_review_result(self, r, is_correct):
+        """按答题结果更新复习记录（艾宾浩斯间隔 + 难度系数）"""
+        r["review_count"] += 1
         
-        return None
+        if is_correct:
+            r["correct_streak"] += 1
+            # 答对：增加难度系数，延长复习间隔
+            r["ease_factor"] = min(3.0, r["ease_factor"] + 0.1)
+            
+            # 根据复习次数确定下次间隔
+            idx = min(r["review_count"], len(self.REVIEW_INTERVALS) - 1)
+            base_interval = self.REVIEW_INTERVALS[idx]
+            # 根据难度系数调整间隔
+            interval = int(base_interval * r["ease_factor"] / 2.5)
+        else:
+            r["correct_streak"] = 0
+            # 答错：降低难度系数，缩短复习间隔
+            r["ease_factor"] = max(1.3, r["ease_factor"] - 0.2)
+            interval = 1  # 答错后第二天再复习
+        
+        r["next_review"] = (date.today() + timedelta(days=interval)).isoformat()
+        r["last_review"] = date.today().isoformat()
     
     def get_due_reviews(self, category=None):
         """获取今天需要复习的内容
@@ -750,58 +885,35 @@ class LearningData:
             category: 指定类别，None表示所有类别
         
         Returns:
-            需要复习的项目列表
+            需要复习的项目列表（逾期最久的在前）
         """
+        if self._store:
+            return self._store.due_reviews(date.today().isoformat(), category)
+        
         if "review_items" not in self.data:
             return []
         
-        today = date.today().isoformat()
-        due_items = []
-        
-        categories = [category] if category else self.data["review_items"].keys()
-        
-        for cat in categories:
-            if cat not in self.data["review_items"]:
-                continue
-            for r in self.data["review_items"][cat]:
-                if r["next_review"] <= today:
-                    due_items.append(r)
-        
-        # 按优先级排序：先复习逾期最久的
-        due_items.sort(key=lambda x: x["next_review"])
-        
-        return due_items
+        return self._get_scheduler().due_items(category)
     
     def get_review_stats(self):
         """获取复习统计数据"""
-        if "review_items" not in self.data:
+        if self._store:
+            by_category = self._store.review_stats(date.today().isoformat())
+        elif "review_items" in self.data:
+            counts = self._get_scheduler().stats()
+            by_category = {
+                cat: counts.get(cat, {"total": 0, "due": 0, "mastered": 0})
+                for cat in self.data["review_items"]
+            }
+        else:
             return {"total": 0, "due_today": 0, "mastered": 0, "by_category": {}}
         
-        today = date.today().isoformat()
-        stats = {
-            "total": 0,
-            "due_today": 0,
-            "mastered": 0,  # 复习次数>=5且连续答对>=3
-            "by_category": {}
+        return {
+            "total": sum(c["total"] for c in by_category.values()),
+            "due_today": sum(c["due"] for c in by_category.values()),
+            "mastered": sum(c["mastered"] for c in by_category.values()),  # 复习次数>=5且连续答对>=3
+            "by_category": by_category
         }
-        
-        for category, items in self.data["review_items"].items():
-            cat_stats = {"total": len(items), "due": 0, "mastered": 0}
-            
-            for r in items:
-                stats["total"] += 1
-                
-                if r["next_review"] <= today:
-                    stats["due_today"] += 1
-                    cat_stats["due"] += 1
-                
-                if r["review_count"] >= 5 and r.get("correct_streak", 0) >= 3:
-                    stats["mastered"] += 1
-                    cat_stats["mastered"] += 1
-            
-            stats["by_category"][category] = cat_stats
-        
-        return stats
     
     def get_review_calendar(self, days=7):
         """获取未来几天的复习日历
@@ -812,25 +924,25 @@ class LearningData:
         Returns:
             {日期: 复习数量} 的字典
         """
-        if "review_items" not in self.data:
-            return {}
-        
-        calendar = {}
         today = date.today()
+        if self._store:
+            days_list = [(today + timedelta(days=i)).isoformat() for i in range(days)]
+            if not days_list:
+                return {}
+            counts = self._store.review_calendar(days_list[0], days_list[-1])
+            return {day: counts.get(day, 0) for day in days_list}
         
-        for i in range(days):
-            day = (today + timedelta(days=i)).isoformat()
-            calendar[day] = 0
-        
-        for category, items in self.data["review_items"].items():
-            for r in items:
-                if r["next_review"] in calendar:
-                    calendar[r["next_review"]] += 1
+        if "review_items" not in self.data:
+            return {}
         
-        return calendar
+        return self._get_scheduler().forecast(today.isoformat(), days)
     
     def remove_mastered_item(self, category, item):
         """移除已完全掌握的内容（可选）"""
+        if self._store:
+            self._store.remove_review(category, item)
+            return
+        
         if "review_items" not in self.data:
             return
         
@@ -838,7 +950,8 @@ class LearningData:
             self.data["review_items"][category] = [
                 r for r in self.data["review_items"][category] if r["item"] != item
             ]
-            self.save()
+            self._get_scheduler().remove(category, item)
+            self.save(("review_items", category))
     
     # =====================================================
     # 家长控制面板相关方法
@@ -985,6 +1098,10 @@ class LearningData:
                 self.data["wrong_questions"][module] = []
             if module in self.data.get("review_items", {}):
                 self.data["review_items"][module] = []
+                self._get_scheduler().clear(module)
+            if self._store:
+                self._store.clear_reviews(module)
+            self._recent.reset(module)
         else:
             # 重置所有（保留用户信息和家长设置）
             user_info = self.data.get("user_info", {})
@@ -993,6 +1110,13 @@ class LearningData:
             self.data = self._merge_defaults({})
             self.data["user_info"] = user_info
             self.data["parent_settings"] = parent_settings
+            self._scheduler = None
+            self._recent.reset()
+            if self._store:
+                self.data.pop("review_items", None)
+                self._store.clear_reviews()
+            self._init_badge_rules()
+            self._challenge_rules_date = None
         
         self.save()
     
@@ -1040,8 +1164,10 @@ class LearningData:
         self.data["daily_challenges"]["date"] = today
         self.data["daily_challenges"]["challenges"] = selected
         self.data["daily_challenges"]["completed"] = []
+        self._challenge_rules_date = None
+        self.notify_changed(CHALLENGES)
         
-        self.save()
+        self.save(("daily_challenges",))
         return selected
     
     def get_daily_challenges(self):
@@ -1108,29 +1234,47 @@ class LearningData:
         if self.data["daily_challenges"]["date"] != today:
             return []
         
+        self._sync_challenge_rules(today)
+        # 学习时长随时间增长，每次检查都算变化
+        self._challenge_rules.touch(CLOCK)
+        
         newly_completed = []
-        challenges = self.data["daily_challenges"]["challenges"]
         completed = self.data["daily_challenges"]["completed"]
         
-        for c in challenges:
-            if c["id"] in completed:
+        for challenge_id, c in self._challenge_rules.collect(self.data):
+            if challenge_id in completed:
                 continue
+            completed.append(challenge_id)
+            self.data["daily_challenges"]["total_completed"] += 1
+            
+            # 奖励星星
+            self.data["rewards"]["stars"] += c.get("reward_stars", 1)
             
-            progress = self._get_challenge_progress(c)
-            if progress >= c["target"]:
-                completed.append(c["id"])
-                self.data["daily_challenges"]["total_completed"] += 1
-                
-                # 奖励星星
-                self.data["rewards"]["stars"] += c.get("reward_stars", 1)
-                
-                newly_completed.append(c)
+            newly_completed.append(c)
         
         if newly_completed:
-            self.save()
+            self.notify_changed(STARS, CHALLENGES)
+            self.save(("daily_challenges",), ("rewards",))
         
         return newly_completed
     
+    def _sync_challenge_rules(self, today):
+        """今日挑战换了（新的一天/重置）时，重新把未完成的挑战加入规则引擎"""
+        if self._challenge_rules_date == today:
+            return
+        self._challenge_rules.clear()
+        completed = self.data["daily_challenges"]["completed"]
+        for c in self.data["daily_challenges"]["challenges"]:
+            if c["id"] in completed:
+                continue
+            watch = CHALLENGE_WATCH.get(c.get("type"))
+            if watch == ():
+                continue  # 进度不随答题变化（复习挑战）
+            self._challenge_rules.add(
+                c["id"], lambda d, c=c: self._get_challenge_progress(c) >= c["target"],
+                watch=watch, payload=c)
+        self._challenge_rules_date = today
+    
     def get_challenge_stats(self):
         """获取挑战统计"""
         self._init_daily_challenges()
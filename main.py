@@ -12,6 +12,10 @@ sys.path.insert(0, app_dir)
 sys.path.insert(0, os.path.join(app_dir, 'ui_kivy'))
 sys.path.insert(0, os.path.join(app_dir, 'core'))
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("main")
+
 # 设置环境变量
 os.environ['KIVY_NO_FILELOG'] = '1'
 os.environ['KIVY_NO_CONSOLELOG'] = '0'  # 保留控制台日志用于调试
@@ -31,7 +35,8 @@ try:
     # 先初始化字体配置
     print("[main] 初始化字体配置...")
     try:
-        from ui_kivy import font_config
+        with startup_profiler.phase("font_config"):
+            from ui_kivy import font_config
         print("[main] 字体配置完成")
     except Exception as e:
         print(f"[main] 字体配置失败: {e}")
@@ -6,6 +6,8 @@
 import zipfile
 import os
 
+from audio_pack import build_pack
+
 def pack_project():
     """打包项目文件"""
     zip_name = 'lele_chinese.zip'
@@ -16,6 +18,7 @@ def pack_project():
         'ui_kivy/chinese_app.py',
         'ui_kivy/font_config.py',
         'ui_kivy/audio_kivy.py',
+        'ui_kivy/lazy_screens.py',
         'ui_kivy/__init__.py',
         
         # 核心模块
@@ -26,6 +29,12 @@ def pack_project():
         
         # 语音配置
         'voice_config_shared.py',
+        'tts_cache.py',
+        'tts_service.py',
+        'audio_index.py',
+        'sound_pool.py',
+        'audio_pack.py',
+        'startup_profiler.py',
         
         # 编译配置
         'buildozer_chinese.spec',
@@ -47,6 +56,12 @@ def pack_project():
             else:
                 print(f'警告: 文件不存在 {file_path}')
         
+        # 预生成音频：打成一个资源包再加入
+        if os.path.isdir('audio/generated'):
+            pack_path, count = build_pack('audio/generated')
+            zf.write(pack_path, 'audio/generated.pack')
+            print(f'已添加: audio/generated.pack ({count}个音频)')
+        
         # 重命名buildozer配置
         if os.path.exists('buildozer_chinese.spec'):
             zf.write('buildozer_chinese.spec', 'buildozer.spec')
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 学习进度存储 v1.0（可选）
+复习项目越来越多以后，JSON 里逐个扫描太慢，这里改用 SQLite：
+- review_items 表：(category, next_review) 和 (category, item) 上建索引，
+  到期查询、单项更新、统计和日历都交给数据库
+- char_mastery 表：汉字掌握度（原 char_mastery.json）
+- sections 表：其余学习数据按顶层字段各存一行 JSON，只写改动的字段
+- 第一次启用时自动从 learning_progress.json 和 char_mastery.json 迁移，
+  原文件保留不动
+
+启用方式（满足其一）：
+    设置环境变量 LELE_STORAGE=sqlite
+    数据目录中已有 learning_progress.db（迁移后一直使用）
+
+使用方法：
+    from progress_store import sqlite_enabled, get_progress_store
+
+    if sqlite_enabled():
+        store = get_progress_store()
+        due = store.due_reviews("2026-01-01")
+"""
+
+import os
+import json
+import threading
+
+try:
+    import sqlite3
+    SQLITE_AVAILABLE = True
+except ImportError:
+    SQLITE_AVAILABLE = False
+
+# 尝试导入UI配置模块
+try:
+    from ui_config import get_data_path
+    UI_CONFIG_AVAILABLE = True
+except ImportError:
+    UI_CONFIG_AVAILABLE = False
+
+from data_journal import JsonJournal
+
+# 数据文件路径
+if UI_CONFIG_AVAILABLE:
+    DB_FILE = get_data_path("learning_progress.db")
+    PROGRESS_FILE = get_data_path("learning_progress.json")
+    MASTERY_FILE = get_data_path("char_mastery.json")
+else:
+    _DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+    DB_FILE = os.path.join(_DATA_DIR, "learning_progress.db")
+    PROGRESS_FILE = os.path.join(_DATA_DIR, "learning_progress.json")
+    MASTERY_FILE = os.path.join(_DATA_DIR, "char_mastery.json")
+
+STORAGE_ENV = "LELE_STORAGE"
+
+# 复习项目字段（和 JSON 中的字典一致）
+REVIEW_FIELDS = ("item", "display_name", "category", "learn_date", "review_count",
+                 "next_review", "ease_factor", "correct_streak", "last_review")
+
+MASTERY_FIELDS = ("level", "score", "correct", "wrong", "last_seen", "first_seen")
+
+# 已迁移标记（存在 sections 表中）
+MIGRATED_KEY = "_migrated"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS review_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL,
+    item TEXT NOT NULL,
+    display_name TEXT,
+    learn_date TEXT,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    next_review TEXT NOT NULL,
+    ease_factor REAL NOT NULL DEFAULT 2.5,
+    correct_streak INTEGER NOT NULL DEFAULT 0,
+    last_review TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_review_item ON review_items (category, item);
+CREATE INDEX IF NOT EXISTS idx_review_due ON review_items (category, next_review);
+CREATE INDEX IF NOT EXISTS idx_review_next ON review_items (next_review);
+CREATE TABLE IF NOT EXISTS char_mastery (
+    char TEXT PRIMARY KEY,
+    level INTEGER NOT NULL DEFAULT 0,
+    score INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    wrong INTEGER NOT NULL DEFAULT 0,
+    last_seen TEXT,
+    first_seen TEXT
+);
+"""
+
+
+def sqlite_enabled(db_path=None):
+    """是否使用 SQLite 存储"""
+    if not SQLITE_AVAILABLE:
+        return False
+    if os.environ.get(STORAGE_ENV, "").lower() == "sqlite":
+        return True
+    return os.path.exists(db_path or DB_FILE)
+
+
+def _review_row(r):
+    """复习项目字典 -> 数据库参数"""
+    return {field: r.get(field) for field in REVIEW_FIELDS}
+
+
+def _review_dict(row):
+    """数据库行 -> 复习项目字典（没有 last_review 的不带这个键，和 JSON 一致）"""
+    r = dict(zip(REVIEW_FIELDS, row))
+    if r["last_review"] is None:
+        del r["last_review"]
+    return r
+
+
+class SqliteProgressStore:
+    """SQLite 学习进度存储（线程安全）"""
+
+    _REVIEW_COLUMNS = ", ".join(REVIEW_FIELDS)
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or DB_FILE
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ---------- 迁移 ----------
+
+    def is_migrated(self):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM sections WHERE key = ?",
+                                     (MIGRATED_KEY,)).fetchone()
+        return row is not None
+
+    def migrate_from_json(self, progress_file=None, mastery_file=None):
+        """从 JSON 文件导入（只做一次），返回导入的复习项目数"""
+        if self.is_migrated():
+            return 0
+        progress_file = progress_file or PROGRESS_FILE
+        mastery_file = mastery_file or MASTERY_FILE
+
+        data = JsonJournal(progress_file).load() or {}
+        mastery = {}
+        if os.path.exists(mastery_file):
+            try:
+                with open(mastery_file, 'r', encoding='utf-8') as f:
+                    mastery = json.load(f)
+            except Exception as e:
+                print(f"[progress_store] 读取掌握度数据失败: {e}")
+
+        review_items = data.pop("review_items", {}) or {}
+        count = 0
+        with self._lock, self._conn:
+            for category, items in review_items.items():
+                for r in items:
+                    row = _review_row(r)
+                    row["category"] = category
+                    self._insert_review(row)
+                    count += 1
+            self._write_sections(data)
+            self._write_mastery(mastery)
+            self._conn.execute("INSERT OR REPLACE INTO sections (key, value) VALUES (?, ?)",
+                               (MIGRATED_KEY, json.dumps({"from": os.path.basename(progress_file)})))
+        print(f"[progress_store] 已从 JSON 迁移: {count} 个复习项目, {len(mastery)} 个汉字掌握度")
+        return count
+
+    # ---------- 其他学习数据（按顶层字段存） ----------
+
+    def load_sections(self):
+        """读出所有顶层字段"""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM sections WHERE key != ?",
+                                      (MIGRATED_KEY,)).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def save_sections(self, changed, removed=()):
+        """写入改动的顶层字段，删除去掉的字段"""
+        with self._lock, self._conn:
+            self._write_sections(changed)
+            self._conn.executemany("DELETE FROM sections WHERE key = ?",
+                                   [(key,) for key in removed])
+
+    def _write_sections(self, sections):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO sections (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in sections.items()])
+
+    # ---------- 复习项目 ----------
+
+    def _insert_review(self, row):
+        cur = self._conn.execute(
+            f"INSERT OR IGNORE INTO review_items ({self._REVIEW_COLUMNS}) "
+            f"VALUES ({', '.join(':' + f for f in REVIEW_FIELDS)})", row)
+        return cur.rowcount > 0
+
+    def add_review(self, review):
+        """添加复习项目，已存在返回 False"""
+        with self._lock, self._conn:
+            return self._insert_review(_review_row(review))
+
+    def get_review(self, category, item):
+        """按 (类别, 内容) 取一个复习项目"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._REVIEW_COLUMNS} FROM review_items WHERE category = ? AND item = ?",
+                (category, item)).fetchone()
+        return _review_dict(row) if row else None
+
+    def update_reviews(self, reviews):
+        """批量写回复习项目（一个事务）"""
+        sets = ", ".join(f"{f} = :{f}" for f in REVIEW_FIELDS if f not in ("category", "item"))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"UPDATE review_items SET {sets} WHERE category = :category AND item = :item",
+                [_review_row(r) for r in reviews])
+
+    def remove_review(self, category, item):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM review_items WHERE category = ? AND item = ?",
+                               (category, item))
+
+    def clear_reviews(self, category=None):
+        """清空某个类别（或全部）复习项目"""
+        with self._lock, self._conn:
+            if category is None:
+                self._conn.execute("DELETE FROM review_items")
+            else:
+                self._conn.execute("DELETE FROM review_items WHERE category = ?", (category,))
+
+    def due_reviews(self, today, category=None):
+        """到期的复习项目，逾期最久的在前"""
+        sql = f"SELECT {self._REVIEW_COLUMNS} FROM review_items WHERE next_review <= ?"
+        params = [today]
+        if category is not None:
+            sql += " AND category = ?"
+            params.append(category)
+        sql += " ORDER BY next_review, id"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_review_dict(row) for row in rows]
+
+    def review_stats(self, today):
+        """各类别的总数 / 到期数 / 已掌握数"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*), "
+                "SUM(next_review <= ?), "
+                "SUM(review_count >= 5 AND correct_streak >= 3) "
+                "FROM review_items GROUP BY category", (today,)).fetchall()
+        return {category: {"total": total, "due": due or 0, "mastered": mastered or 0}
+                for category, total, due, mastered in rows}
+
+    def review_calendar(self, first_day, last_day):
+        """[first_day, last_day] 之间每天的复习数量"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT next_review, COUNT(*) FROM review_items "
+                "WHERE next_review BETWEEN ? AND ? GROUP BY next_review",
+                (first_day, last_day)).fetchall()
+        return dict(rows)
+
+    # ---------- 汉字掌握度 ----------
+
+    def load_char_mastery(self):
+        """读出全部汉字掌握度 {字: {...}}"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT char, {', '.join(MASTERY_FIELDS)} FROM char_mastery").fetchall()
+        return {row[0]: dict(zip(MASTERY_FIELDS, row[1:])) for row in rows}
+
+    def save_char_mastery(self, mastery, chars=None):
+        """写入汉字掌握度（chars 指定只写这些字）"""
+        if chars is not None:
+            mastery = {c: mastery[c] for c in chars if c in mastery}
+        with self._lock, self._conn:
+            self._write_mastery(mastery)
+
+    def _write_mastery(self, mastery):
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO char_mastery (char, {', '.join(MASTERY_FIELDS)}) "
+            f"VALUES (?, {', '.join('?' for _ in MASTERY_FIELDS)})",
+            [(char,) + tuple(m.get(f) for f in MASTERY_FIELDS) for char, m in mastery.items()])
+
+
+# 全局存储实例（懒加载）
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_progress_store():
+    """获取全局 SQLite 存储（第一次调用时从 JSON 迁移）"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = SqliteProgressStore()
+                store.migrate_from_json()
+                _store = store
+    return _store
+
+
+__all__ = [
+    'SqliteProgressStore',
+    'get_progress_store',
+    'sqlite_enabled',
+    'SQLITE_AVAILABLE',
+    'DB_FILE',
+]
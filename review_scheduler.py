@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+艾宾浩斯复习调度器 v1.0
+按下次复习日期分桶（每天一个桶）管理复习项目：
+- pop_due：取出逾期最久的一项，O(log 天数)；每个类别另有自己的日期桶，
+  按类别取时不用扫别的类别
+- due_count：今天到期的数量，O(1)（跨天时只补算新到期的桶）
+- forecast：未来几天每天的复习数量，只看这几天的桶
+- 单项查找按 (类别, 内容) 直接命中，不再逐个扫描
+
+复习项目仍然是 learning_data 中的那些字典，调度器只保存引用，
+修改 next_review 后调用 reschedule 即可。
+
+使用方法：
+    scheduler = ReviewScheduler(today="2026-01-01")
+    scheduler.add(review)                  # review["category"], review["item"], review["next_review"]
+    scheduler.due_count()                  # 今天到期数
+    review = scheduler.pop_due()           # 取出一项（复习后 reschedule / 放弃时 restore）
+    scheduler.forecast("2026-01-01", 7)    # {日期: 数量}
+"""
+
+import bisect
+from collections import Counter
+from datetime import date, timedelta
+
+
+def review_key(review):
+    """复习项目的唯一键"""
+    return (review["category"], review["item"])
+
+
+def is_mastered(review):
+    """复习次数>=5且连续答对>=3 视为已掌握（和 get_review_stats 一致）"""
+    return review.get("review_count", 0) >= 5 and review.get("correct_streak", 0) >= 3
+
+
+class ReviewScheduler:
+    """按天分桶的复习日历
+
+    Args:
+        today: 今天的日期字符串（默认 date.today()，测试时可以指定）
+    """
+
+    def __init__(self, today=None):
+        self._fixed_today = today
+        self._today = today or date.today().isoformat()
+        self._items = {}          # 键 -> 复习项目
+        self._buckets = {}        # 日期 -> {键: 复习项目}（保持加入顺序）
+        self._days = []           # 有项目的日期，升序
+        self._cat_buckets = {}    # 类别 -> {日期: {键: 复习项目}}
+        self._cat_days = {}       # 类别 -> 有该类项目的日期，升序
+        self._checked_out = {}    # 已 pop 出去、还没复习完的项目
+        self._totals = Counter()  # 类别 -> 总数
+        self._due = Counter()     # 类别 -> 今天到期数
+        self._mastered = Counter()
+
+    # ---------- 日期 ----------
+
+    def _sync_today(self):
+        """跨天时把新到期的桶计入 due"""
+        today = self._fixed_today or date.today().isoformat()
+        if today == self._today:
+            return
+        old, self._today = self._today, today
+        if today > old:
+            lo = bisect.bisect_right(self._days, old)
+            hi = bisect.bisect_right(self._days, today)
+            sign = 1
+        else:
+            lo = bisect.bisect_right(self._days, today)
+            hi = bisect.bisect_right(self._days, old)
+            sign = -1
+        days = self._days
+        for i in range(lo, hi):
+            for category, _ in self._buckets[days[i]]:
+                self._due[category] += sign
+
+    def set_today(self, today):
+        """指定今天（测试用）"""
+        self._fixed_today = today
+        self._sync_today()
+
+    # ---------- 维护 ----------
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, category, item):
+        """按 (类别, 内容) 查找复习项目"""
+        return self._items.get((category, item))
+
+    def add(self, review):
+        """加入复习项目，已存在返回 False"""
+        key = review_key(review)
+        if key in self._items:
+            return False
+        self._sync_today()
+        self._items[key] = review
+        self._totals[key[0]] += 1
+        if is_mastered(review):
+            self._mastered[key[0]] += 1
+        self._insert(key, review)
+        return True
+
+    def remove(self, category, item):
+        """移除复习项目"""
+        key = (category, item)
+        review = self._items.pop(key, None)
+        if review is None:
+            return None
+        self._sync_today()
+        self._totals[category] -= 1
+        if is_mastered(review):
+            self._mastered[category] -= 1
+        if self._checked_out.pop(key, None) is None:
+            self._detach(key, review["next_review"])
+        return review
+
+    def clear(self, category=None):
+        """清空某个类别（或全部）"""
+        for key in [k for k in self._items if category is None or k[0] == category]:
+            self.remove(*key)
+
+    def reschedule(self, review, old_next_review=None, was_mastered=None):
+        """复习项目的 next_review 等字段改了之后调用
+
+        Args:
+            old_next_review: 修改前的日期（pop 出去的项目不需要）
+            was_mastered: 修改前是否已掌握
+        """
+        key = review_key(review)
+        if key not in self._items:
+            return self.add(review)
+        self._sync_today()
+        if was_mastered is not None and was_mastered != is_mastered(review):
+            self._mastered[key[0]] += 1 if not was_mastered else -1
+        if self._checked_out.pop(key, None) is None and old_next_review is not None:
+            self._detach(key, old_next_review)
+        self._insert(key, review)
+        return True
+
+    def restore(self, review=None):
+        """把 pop 出去但没有复习的项目放回（不传参数时全部放回）"""
+        reviews = [review] if review is not None else list(self._checked_out.values())
+        for r in reviews:
+            key = review_key(r)
+            if self._checked_out.pop(key, None) is not None:
+                self._insert(key, r)
+
+    def _insert(self, key, review):
+        day = review["next_review"]
+        category = key[0]
+        _bucket_add(self._buckets, self._days, day, key, review)
+        _bucket_add(self._cat_buckets.setdefault(category, {}),
+                    self._cat_days.setdefault(category, []), day, key, review)
+        if day <= self._today:
+            self._due[category] += 1
+
+    def _detach(self, key, day):
+        if not _bucket_remove(self._buckets, self._days, day, key):
+            return
+        category = key[0]
+        _bucket_remove(self._cat_buckets[category], self._cat_days[category], day, key)
+        if day <= self._today:
+            self._due[category] -= 1
+
+    # ---------- 查询 ----------
+
+    def due_count(self, category=None):
+        """今天到期的数量"""
+        self._sync_today()
+        if category is None:
+            return sum(self._due.values())
+        return self._due[category]
+
+    def pop_due(self, category=None):
+        """取出逾期最久的一项（没有返回 None）
+
+        取出的项目复习后用 reschedule 放回，不复习用 restore 放回。
+        """
+        self._sync_today()
+        buckets, days = self._day_index(category)
+        # 空桶随时删掉，最早的日期就是逾期最久的一项所在的桶
+        if not days or days[0] > self._today:
+            return None
+        day = days[0]
+        key, review = next(iter(buckets[day].items()))
+        self._detach(key, day)
+        self._checked_out[key] = review
+        return review
+
+    def due_items(self, category=None):
+        """今天到期的全部项目，逾期最久的在前（不取出）"""
+        self._sync_today()
+        buckets, days = self._day_index(category)
+        end = bisect.bisect_right(days, self._today)
+        result = []
+        for i in range(end):
+            result.extend(buckets[days[i]].values())
+        return result
+
+    def _day_index(self, category):
+        """全部项目或某个类别的 (日期桶, 升序日期)"""
+        if category is None:
+            return self._buckets, self._days
+        return self._cat_buckets.get(category, {}), self._cat_days.get(category, [])
+
+    def forecast(self, first_day, days):
+        """从 first_day 开始 days 天，每天的复习数量 {日期: 数量}"""
+        start = date.fromisoformat(first_day)
+        result = {}
+        for i in range(days):
+            day = (start + timedelta(days=i)).isoformat()
+            result[day] = len(self._buckets.get(day, ()))
+        return result
+
+    def stats(self):
+        """各类别 {"total", "due", "mastered"}"""
+        self._sync_today()
+        return {category: {"total": total, "due": self._due[category],
+                           "mastered": self._mastered[category]}
+                for category, total in self._totals.items()}
+
+
+def _bucket_add(buckets, days, day, key, review):
+    bucket = buckets.get(day)
+    if bucket is None:
+        bucket = buckets[day] = {}
+        bisect.insort(days, day)
+    bucket[key] = review
+
+
+def _bucket_remove(buckets, days, day, key):
+    """从日期桶里删掉，桶空了连日期一起删；不在桶里返回 False"""
+    bucket = buckets.get(day)
+    if bucket is None or key not in bucket:
+        return False
+    del bucket[key]
+    if not bucket:
+        del buckets[day]
+        del days[bisect.bisect_left(days, day)]
+    return True
+
+
+__all__ = ['ReviewScheduler', 'review_key', 'is_mastered']
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+滚动窗口学习统计 v1.0
+原来难度调整看的是累计的对错总数，学了几百题以后最近表现再好再差都拉不动正确率；
+识字游戏每出一题都要把整个字库按掌握度分组、展开成加权列表再累加查找。
+这里提供每答一题 O(1) 更新的统计和 O(1) 抽题：
+- RingBuffer：固定长度的环形缓冲，追加 O(1)，窗口内的和随时可用
+- Ewma：指数衰减平均（正确率、答题用时）
+- ItemStats / RollingStats：每个模块、每个字各一份最近表现
+- LevelPool：按掌握度分组的题库，字换组 O(1)，按组权重抽题 O(1)（别名表用 core.sampling 的）
+
+使用方法：
+    stats = RollingStats(window=20)
+    stats.record("math", True, response_time=3.2)
+    s = stats.get("math")
+    s.recent_accuracy(), s.accuracy.value, s.response_time.value
+
+    pool = LevelPool(words, key=lambda w: w[0], level_of=get_level)
+    pool.set_level("日", 2)                            # 掌握度变了
+    word = pool.sample({0: 50, 1: 30, 2: 15, 3: 5}, exclude=["日"])
+"""
+
+import random
+
+from core.sampling import AliasSampler
+
+
+# 默认窗口长度（最近多少题）
+DEFAULT_WINDOW = 20
+
+# 默认衰减系数（越大越看重最近几题）
+DEFAULT_ALPHA = 0.2
+
+
+class RingBuffer:
+    """固定长度的环形缓冲，记录窗口内的和"""
+
+    __slots__ = ("size", "_items", "_pos", "count", "total")
+
+    def __init__(self, size, values=()):
+        if size <= 0:
+            raise ValueError("size 必须大于 0")
+        self.size = size
+        self._items = [0] * size
+        self._pos = 0
+        self.count = 0
+        self.total = 0
+        for value in values:
+            self.push(value)
+
+    def push(self, value):
+        if self.count == self.size:
+            self.total -= self._items[self._pos]
+        else:
+            self.count += 1
+        self._items[self._pos] = value
+        self.total += value
+        self._pos = (self._pos + 1) % self.size
+
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def values(self):
+        """窗口内的值，旧的在前"""
+        start = (self._pos - self.count) % self.size
+        return [self._items[(start + i) % self.size] for i in range(self.count)]
+
+    def clear(self):
+        self._items = [0] * self.size
+        self._pos = 0
+        self.count = 0
+        self.total = 0
+
+    def __len__(self):
+        return self.count
+
+
+class Ewma:
+    """指数衰减平均：value += alpha * (x - value)，第一个值直接作为初值"""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, alpha=DEFAULT_ALPHA, value=None):
+        self.alpha = alpha
+        self.value = value
+
+    def update(self, x):
+        if self.value is None:
+            self.value = float(x)
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class ItemStats:
+    """一个模块（或一个字）的最近表现"""
+
+    __slots__ = ("window", "accuracy", "response_time", "seen")
+
+    def __init__(self, window=DEFAULT_WINDOW, alpha=DEFAULT_ALPHA):
+        self.window = RingBuffer(window)     # 最近几题对(1)/错(0)
+        self.accuracy = Ewma(alpha)          # 衰减正确率（0~1）
+        self.response_time = Ewma(alpha)     # 衰减答题用时（秒）
+        self.seen = 0                        # 累计答题数
+
+    def record(self, is_correct, response_time=None):
+        hit = 1 if is_correct else 0
+        self.window.push(hit)
+        self.accuracy.update(hit)
+        if response_time is not None and response_time >= 0:
+            self.response_time.update(response_time)
+        self.seen += 1
+
+    def recent_accuracy(self):
+        """窗口内正确率（百分比整数），还没答过题时为 None"""
+        if not self.window.count:
+            return None
+        return int(self.window.total / self.window.count * 100)
+
+    def recent_count(self):
+        return self.window.count
+
+    def reset_window(self):
+        """清空窗口（例如换了难度，之前的表现不再代表当前难度）"""
+        self.window.clear()
+
+    def to_dict(self):
+        return {"recent": self.window.values(), "acc": self.accuracy.value,
+                "rt": self.response_time.value, "seen": self.seen}
+
+    @classmethod
+    def from_dict(cls, d, window=DEFAULT_WINDOW, alpha=DEFAULT_ALPHA):
+        stats = cls(window, alpha)
+        for hit in d.get("recent", [])[-window:]:
+            stats.window.push(1 if hit else 0)
+        stats.accuracy.value = d.get("acc")
+        stats.response_time.value = d.get("rt")
+        stats.seen = d.get("seen", 0)
+        return stats
+
+
+class RollingStats:
+    """按键（模块名、汉字……）分别记录最近表现"""
+
+    def __init__(self, window=DEFAULT_WINDOW, alpha=DEFAULT_ALPHA):
+        self.window = window
+        self.alpha = alpha
+        self._items = {}
+
+    def record(self, key, is_correct, response_time=None):
+        stats = self._items.get(key)
+        if stats is None:
+            stats = self._items[key] = ItemStats(self.window, self.alpha)
+        stats.record(is_correct, response_time)
+        return stats
+
+    def get(self, key):
+        return self._items.get(key)
+
+    def reset(self, key=None):
+        if key is None:
+            self._items.clear()
+        else:
+            self._items.pop(key, None)
+
+    def to_dict(self):
+        return {key: stats.to_dict() for key, stats in self._items.items()}
+
+    @classmethod
+    def from_dict(cls, d, window=DEFAULT_WINDOW, alpha=DEFAULT_ALPHA):
+        rolling = cls(window, alpha)
+        for key, item in (d or {}).items():
+            try:
+                rolling._items[key] = ItemStats.from_dict(item, window, alpha)
+            except (AttributeError, TypeError, ValueError):
+                continue
+        return rolling
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
+# =====================================================
+# 加权抽样
+# =====================================================
+
+class LevelPool:
+    """按掌握度分组的题库
+
+    每组是一个列表，字换组时和组内最后一个交换后弹出（O(1)）。
+    抽题先按"组权重 x 组大小"用别名表选组，再在组内均匀选一个，
+    和把每个字按组权重展开成加权列表再抽的分布完全一样。
+
+    Args:
+        items: 题目列表（同一个字出现多次时各算一份）
+        key: 题目 -> 键（如汉字）
+        level_of: 键 -> 等级（0 ~ levels-1）
+        levels: 等级数
+    """
+
+    def __init__(self, items, key, level_of, levels=4):
+        self.items = items
+        self._count = len(items)
+        self._key = key
+        self._levels = levels
+        self._buckets = [[] for _ in range(levels)]
+        self._where = []                 # 题目下标 -> 组内位置
+        self._level = []                 # 题目下标 -> 等级
+        self._indices = {}               # 键 -> [题目下标]
+        self._alias = None
+        self._alias_weights = None
+        for index, item in enumerate(items):
+            k = key(item)
+            level = self._clamp(level_of(k))
+            self._indices.setdefault(k, []).append(index)
+            self._level.append(level)
+            self._where.append(len(self._buckets[level]))
+            self._buckets[level].append(index)
+
+    def _clamp(self, level):
+        return max(0, min(self._levels - 1, int(level)))
+
+    def level(self, k):
+        indices = self._indices.get(k)
+        return self._level[indices[0]] if indices else None
+
+    def set_level(self, k, level):
+        """键 k 的等级变了；不在题库里的键忽略"""
+        level = self._clamp(level)
+        for index in self._indices.get(k, ()):
+            old = self._level[index]
+            if old == level:
+                continue
+            bucket = self._buckets[old]
+            pos = self._where[index]
+            last = bucket.pop()
+            if last != index:
+                bucket[pos] = last
+                self._where[last] = pos
+            self._where[index] = len(self._buckets[level])
+            self._buckets[level].append(index)
+            self._level[index] = level
+            self._alias = None
+
+    def size(self, level):
+        return len(self._buckets[level])
+
+    def _level_sampler(self, weights):
+        key = tuple(weights.get(level, 0) for level in range(self._levels))
+        if self._alias is None or self._alias_weights != key:
+            self._alias = AliasSampler([w * len(b) for w, b in zip(key, self._buckets)])
+            self._alias_weights = key
+        return self._alias
+
+    def sample(self, weights, exclude=(), rng=random, tries=8):
+        """按等级权重抽一个题目；exclude 中的键不抽。抽不到时返回 None"""
+        sampler = self._level_sampler(weights)
+        for _ in range(tries):
+            level = sampler.sample(rng)
+            if level is None:
+                break
+            bucket = self._buckets[level]
+            item = self.items[bucket[int(rng.random() * len(bucket)) % len(bucket)]]
+            if self._key(item) not in exclude:
+                return item
+        # 排除的字占了大半（很少见）：退回逐个筛选
+        pool = [(self.items[i], weights.get(level, 0))
+                for level, bucket in enumerate(self._buckets) for i in bucket
+                if self._key(self.items[i]) not in exclude and weights.get(level, 0) > 0]
+        if not pool:
+            return None
+        picked = AliasSampler([w for _, w in pool]).sample(rng)
+        return pool[picked][0]
+
+    def sample_levels(self, levels, k, exclude=(), rng=random):
+        """从若干等级的组里不放回地均匀抽 k 个（不含 exclude 中的键）"""
+        buckets = [self._buckets[level] for level in levels if 0 <= level < self._levels]
+        total = sum(len(b) for b in buckets)
+        extra = sum(len(self._indices.get(k_, ())) for k_ in exclude)
+        picked = []
+        for n in rng.sample(range(total), min(total, k + extra)):
+            for bucket in buckets:
+                if n < len(bucket):
+                    item = self.items[bucket[n]]
+                    break
+                n -= len(bucket)
+            if self._key(item) in exclude:
+                continue
+            picked.append(item)
+            if len(picked) == k:
+                break
+        return picked
+
+    def is_stale(self, items):
+        """题库列表换了（或在原地增删过）时需要重建"""
+        return items is not self.items or len(items) != self._count
+
+    def __len__(self):
+        return self._count
+
+
+__all__ = [
+    'RingBuffer',
+    'Ewma',
+    'ItemStats',
+    'RollingStats',
+    'AliasSampler',
+    'LevelPool',
+    'DEFAULT_WINDOW',
+    'DEFAULT_ALPHA',
+]
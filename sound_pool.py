@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+反馈音效池 v1.0
+表扬/鼓励这类短音频反复播放，每次都重新解码太慢：
+- 每个文件只解码一次，之后复用同一个 Sound 对象
+- 可以在启动时预加载（每组只预加载前几个，Kivy 每帧一个），也可以第一次播放时再加载
+- 解码后的音效按最近使用保留，超过上限时释放最久没用的
+- 允许几个音效同时播放，超过上限时停掉最早的
+- Tk（pygame）和 Kivy（SoundLoader）使用同一套接口
+
+使用方法：
+    from sound_pool import SoundPool, PygameSoundBackend
+
+    pool = SoundPool(PygameSoundBackend(), max_voices=3)
+    pool.register("praise", ["praise_00.mp3", "praise_01.mp3"])
+    pool.preload()                 # 可选，不调用则第一次播放时加载
+    pool.preload_next("praise")    # 只加载一个（界面线程里每帧调用）
+    pool.play_random("praise")     # 没有可用文件时返回 False
+"""
+
+import random
+import threading
+from collections import OrderedDict, deque
+
+try:
+    import pygame
+    PYGAME_AVAILABLE = True
+except ImportError:
+    PYGAME_AVAILABLE = False
+
+# 默认同时播放的音效数
+DEFAULT_MAX_VOICES = 3
+
+# 默认最多保留的已解码音效数
+DEFAULT_MAX_SOUNDS = 24
+
+# 每组预加载的文件数（其余第一次播放时再加载）
+PRELOAD_PER_GROUP = 4
+
+
+# ============================================================
+# 播放后端
+# ============================================================
+class PygameSoundBackend:
+    """pygame.mixer.Sound 后端（Tk 桌面程序）
+
+    Sound 在独立的声道上播放，不影响 mixer.music 上的朗读。
+    """
+
+    def load(self, filepath):
+        if not PYGAME_AVAILABLE or not pygame.mixer.get_init():
+            return None
+        return pygame.mixer.Sound(filepath)
+
+    def play(self, sound):
+        sound.play()
+
+    def stop(self, sound):
+        sound.stop()
+
+    def is_playing(self, sound):
+        return sound.get_num_channels() > 0
+
+
+class KivySoundBackend:
+    """kivy SoundLoader 后端（需要在主线程中使用）"""
+
+    def __init__(self):
+        from kivy.core.audio import SoundLoader
+        self._loader = SoundLoader
+
+    def load(self, filepath):
+        return self._loader.load(filepath)
+
+    def play(self, sound):
+        if sound.state == 'play':
+            sound.stop()
+        sound.seek(0)
+        sound.play()
+
+    def stop(self, sound):
+        sound.stop()
+
+    def is_playing(self, sound):
+        return sound.state == 'play'
+
+    def unload(self, sound):
+        sound.unload()
+
+
+# ============================================================
+# 音效池
+# ============================================================
+class SoundPool:
+    """反馈音效池
+
+    Args:
+        backend: 播放后端（PygameSoundBackend / KivySoundBackend）
+        max_voices: 最多同时播放的音效数
+        max_sounds: 最多保留的已解码音效数（最久没用的先释放）
+        resolve: 登记的名字 -> 可播放的路径（例如从资源包解出），
+                 加载时才调用；不传表示登记的就是路径
+    """
+
+    def __init__(self, backend, max_voices=DEFAULT_MAX_VOICES,
+                 max_sounds=DEFAULT_MAX_SOUNDS, resolve=None):
+        self.backend = backend
+        self.max_voices = max_voices
+        self.max_sounds = max_sounds
+        self.resolve = resolve
+        self._groups = {}        # 分组名 -> [文件路径]
+        self._sounds = OrderedDict()  # 文件路径 -> Sound（加载失败为 None），最近用的在后
+        self._active = deque()   # 最近开始播放的 Sound
+        self._lock = threading.Lock()
+
+    def register(self, group, filepaths):
+        """登记一组音频文件（不加载）"""
+        with self._lock:
+            self._groups[group] = list(filepaths)
+
+    def has(self, group):
+        """分组中是否有文件"""
+        return bool(self._groups.get(group))
+
+    def preload(self, group=None, limit=None):
+        """预先解码一组（或全部）音频，每组最多 limit 个，返回成功加载的数量"""
+        groups = [group] if group else list(self._groups)
+        loaded = 0
+        for name in groups:
+            for filepath in self._groups.get(name, ())[:limit]:
+                if self._get(filepath) is not None:
+                    loaded += 1
+        return loaded
+
+    def preload_next(self, group, limit=PRELOAD_PER_GROUP):
+        """解码分组前 limit 个文件中还没加载的一个
+
+        界面线程里每帧调用一次，不会一次解码一整组卡住界面。
+        加载了一个返回 True，都已加载过返回 False。
+        """
+        for filepath in self._groups.get(group, ())[:limit]:
+            if filepath not in self._sounds:
+                self._get(filepath)
+                return True
+        return False
+
+    def _get(self, filepath):
+        """取出已加载的 Sound，没有就加载一次"""
+        with self._lock:
+            if filepath in self._sounds:
+                self._sounds.move_to_end(filepath)
+                return self._sounds[filepath]
+        try:
+            path = self.resolve(filepath) if self.resolve else filepath
+            sound = self.backend.load(path) if path else None
+        except Exception as e:
+            print(f"[sound_pool] 加载失败: {filepath}: {e}")
+            sound = None
+        with self._lock:
+            self._sounds[filepath] = sound
+            self._evict()
+        return sound
+
+    def _evict(self):
+        """超过上限时释放最久没用、又没在播放的音效（持有 _lock 时调用）"""
+        excess = len(self._sounds) - self.max_sounds
+        if excess <= 0:
+            return
+        unload = getattr(self.backend, "unload", None)
+        for filepath in list(self._sounds):
+            if excess <= 0:
+                break
+            sound = self._sounds[filepath]
+            if sound is not None and any(s is sound for s in self._active):
+                continue
+            del self._sounds[filepath]
+            excess -= 1
+            if sound is not None and unload is not None:
+                try:
+                    unload(sound)
+                except Exception:
+                    pass
+
+    def play(self, filepath):
+        """播放一个文件，成功返回 True"""
+        sound = self._get(filepath)
+        if sound is None:
+            return False
+        with self._lock:
+            # 去掉已经播完的，超过上限时停掉最早的
+            self._active = deque(s for s in self._active
+                                 if s is not sound and self.backend.is_playing(s))
+            while len(self._active) >= self.max_voices:
+                self.backend.stop(self._active.popleft())
+            self._active.append(sound)
+        self.backend.play(sound)
+        return True
+
+    def play_random(self, group):
+        """随机播放分组中的一个文件，没有可用文件时返回 False"""
+        filepaths = self._groups.get(group)
+        if not filepaths:
+            return False
+        return self.play(random.choice(filepaths))
+
+    def stop_all(self):
+        """停止所有正在播放的音效"""
+        with self._lock:
+            active, self._active = list(self._active), deque()
+        for sound in active:
+            try:
+                self.backend.stop(sound)
+            except Exception:
+                pass
+
+    def loaded_count(self):
+        """已解码的文件数"""
+        return sum(1 for sound in self._sounds.values() if sound is not None)
+
+
+__all__ = [
+    'SoundPool',
+    'PygameSoundBackend',
+    'KivySoundBackend',
+    'DEFAULT_MAX_VOICES',
+    'DEFAULT_MAX_SOUNDS',
+    'PRELOAD_PER_GROUP',
+]
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+"""
+Tk 精灵图缓存 v1.0
+汪汪队狗狗（ThemeDrawings.draw_puppy_xxx）每只都要一百多个 canvas 图元，
+小游戏里的挖掘机、消防车、火箭也是几十个图元，菜单和游戏帧里反复画同样的东西。
+这里把同一个绘图调用（同一个函数、同样的参数）只光栅化一次：
+- 先用 RecordingCanvas 记下绘图函数的 create_xxx 调用（在原点画）
+- 用 Pillow 把椭圆、矩形、多边形、线、弧画成一张透明图片（2 倍超采样抗锯齿），
+  smooth=True 的曲线按 Tk 的二次 B 样条展开
+- 之后每次画只是一个 create_image；文字等 Pillow 画不好的图元照常用 Tk 画，
+  前后顺序不变（图片被文字分成几段）
+- 缓存键由函数名和参数决定（不含位置），按图片字节数 LRU 淘汰
+
+没有安装 Pillow 时直接调用原来的绘图函数，效果和以前一样。
+
+使用方法：
+    from sprite_cache import cached
+
+    class ThemeDrawings:
+        @staticmethod
+        @cached
+        def draw_puppy_chase(canvas, x, y, scale=1.0):
+            ...
+
+    cached(self.draw_rocket)(canvas, x, y, 1.0, True, variant=flicker)
+    print(get_sprite_cache().stats())
+"""
+import functools
+import inspect
+import math
+import types
+import weakref
+from collections import OrderedDict
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    print("提示: 未安装 Pillow（pip install pillow），狗狗和车辆绘图不缓存，动画可能卡顿")
+
+# 缓存上限：32MB（RGBA 每像素 4 字节）
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# 超采样倍数（画大一倍再缩小，边缘平滑）
+SUPERSAMPLE = 2
+
+# 画布上登记的图片达到这个数时，清掉已经被删除的图形对应的图片
+SHOWN_PRUNE_MIN = 64
+
+# Pillow 能画的图元和选项；其余的照常交给 Tk
+RASTER_KINDS = {"oval", "rectangle", "polygon", "line", "arc"}
+RASTER_OPTIONS = {"fill", "outline", "width", "smooth", "splinesteps", "tags",
+                  "start", "extent", "style", "joinstyle", "capstyle"}
+
+
+def _flatten(coords):
+    flat = []
+    for c in coords:
+        if isinstance(c, (list, tuple)):
+            flat.extend(_flatten(c))
+        else:
+            flat.append(float(c))
+    return flat
+
+
+class RecordingCanvas:
+    """假 Canvas：只记录 create_xxx 调用 (kind, coords, options)"""
+
+    def __init__(self):
+        self.ops = []
+
+    def __getattr__(self, name):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+        kind = name[7:]
+
+        def create(*coords, **options):
+            self.ops.append((kind, _flatten(coords), options))
+            return len(self.ops)
+        return create
+
+
+def rasterizable(op):
+    kind, coords, options = op
+    return kind in RASTER_KINDS and len(coords) >= 4 and set(options) <= RASTER_OPTIONS
+
+
+def split_runs(ops):
+    """把图元分成连续的段：[(True, 可光栅化的图元列表), (False, [Tk 图元]), ...]"""
+    runs = []
+    for op in ops:
+        flag = rasterizable(op)
+        if runs and runs[-1][0] == flag:
+            runs[-1][1].append(op)
+        else:
+            runs.append((flag, [op]))
+    return runs
+
+
+def smooth_points(coords, closed, steps=12):
+    """Tk 的 smooth=True：以各顶点为控制点、相邻中点为端点的二次贝塞尔曲线"""
+    pts = list(zip(coords[0::2], coords[1::2]))
+    if closed and len(pts) > 1 and pts[0] == pts[-1]:
+        pts = pts[:-1]
+    n = len(pts)
+    if n < 3:
+        return list(coords)
+
+    def mid(a, b):
+        return ((a[0] + b[0]) / 2, (a[1] + b[1]) / 2)
+
+    def curve(a, c, b, include_start):
+        out = []
+        for i in range(0 if include_start else 1, steps + 1):
+            t = i / steps
+            u = 1 - t
+            out.extend([u * u * a[0] + 2 * u * t * c[0] + t * t * b[0],
+                        u * u * a[1] + 2 * u * t * c[1] + t * t * b[1]])
+        return out
+
+    result = []
+    if closed:
+        for i in range(n):
+            result += curve(mid(pts[i - 1], pts[i]), pts[i], mid(pts[i], pts[(i + 1) % n]), i == 0)
+    else:
+        for i in range(1, n - 1):
+            a = pts[0] if i == 1 else mid(pts[i - 1], pts[i])
+            b = pts[-1] if i == n - 2 else mid(pts[i], pts[i + 1])
+            result += curve(a, pts[i], b, i == 1)
+    return result
+
+
+def _bbox(ops):
+    """所有图元的范围（加上线宽）"""
+    x0 = y0 = math.inf
+    x1 = y1 = -math.inf
+    for kind, coords, options in ops:
+        pad = float(options.get("width", 1) or 1) / 2 + 1
+        xs, ys = coords[0::2], coords[1::2]
+        x0, x1 = min(x0, min(xs) - pad), max(x1, max(xs) + pad)
+        y0, y1 = min(y0, min(ys) - pad), max(y1, max(ys) + pad)
+    return math.floor(x0), math.floor(y0), math.ceil(x1), math.ceil(y1)
+
+
+class SpriteCache:
+    """绘图调用 -> 光栅化后的图片段，按字节数 LRU 淘汰"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, supersample=SUPERSAMPLE):
+        self.max_bytes = max_bytes
+        self.supersample = supersample
+        self._entries = OrderedDict()   # key -> (段列表, 字节数)
+        self._signatures = {}
+        self._colors = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- 缓存键 ----------
+
+    def key(self, draw, args, kwargs, variant=None):
+        """确定的缓存键：函数全名 + 补全默认值后的参数（不含 canvas 和位置）"""
+        func = getattr(draw, "__func__", draw)
+        name = f"{func.__module__}.{func.__qualname__}"
+        if "<locals>" in name or "<lambda>" in name:
+            # 局部函数同名不同义，只能按对象区分
+            name = (name, id(func))
+        params = self._bind(draw, args, kwargs)
+        return (name, params, variant)
+
+    def _bind(self, draw, args, kwargs):
+        try:
+            # 按函数（不按绑定方法）记签名，不让缓存拉住对象
+            sig_key = (getattr(draw, "__func__", draw), hasattr(draw, "__self__"))
+            signature = self._signatures.get(sig_key)
+            if signature is None:
+                signature = self._signatures[sig_key] = inspect.signature(draw)
+            bound = signature.bind(None, 0, 0, *args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.items())[3:]
+        except (TypeError, ValueError):
+            values = list(enumerate(args)) + sorted(kwargs.items())
+        return tuple(values)
+
+    # ---------- 绘制 ----------
+
+    def draw(self, canvas, draw, x, y, *args, variant=None, **kwargs):
+        """在 (x, y) 画 draw(canvas, x, y, *args, **kwargs)，同样的调用只光栅化一次
+
+        variant 只参与缓存键（例如火焰闪烁的第几帧），不传给绘图函数。
+        """
+        if not PIL_AVAILABLE:
+            draw(canvas, x, y, *args, **kwargs)
+            return
+        try:
+            key = self.key(draw, args, kwargs, variant)
+            hash(key)
+        except TypeError:
+            draw(canvas, x, y, *args, **kwargs)
+            return
+        segments = self._get(key)
+        if segments is None:
+            segments = self._build(canvas, draw, args, kwargs)
+            if segments is None:
+                # 画的过程中用了 create_xxx 以外的 canvas 方法，只能直接画
+                draw(canvas, x, y, *args, **kwargs)
+                return
+            self._put(key, segments)
+        self._place(canvas, key, segments, x, y)
+
+    def _build(self, canvas, draw, args, kwargs):
+        recorder = RecordingCanvas()
+        try:
+            draw(recorder, 0, 0, *args, **kwargs)
+        except AttributeError:
+            return None
+        segments = []
+        for flag, ops in split_runs(recorder.ops):
+            if flag:
+                segments.append(("image",) + self._rasterize(canvas, ops))
+            else:
+                segments.extend(("tk", op) for op in ops)
+        return segments
+
+    def _rasterize(self, canvas, ops):
+        """把一段图元画成图片，返回 (图片, 左上角 x, 左上角 y, 字节数, 标签)"""
+        x0, y0, x1, y1 = _bbox(ops)
+        ss = self.supersample
+        width, height = max(1, x1 - x0), max(1, y1 - y0)
+        image = Image.new("RGBA", (width * ss, height * ss), (0, 0, 0, 0))
+        pen = ImageDraw.Draw(image)
+        tags = []
+        for kind, coords, options in ops:
+            pts = [(c - (x0 if i % 2 == 0 else y0)) * ss for i, c in enumerate(coords)]
+            self._paint(pen, canvas, kind, pts, options, ss)
+            tags.extend(self._tags(options))
+        image = image.resize((width, height), Image.BOX)
+        return ImageTk.PhotoImage(image), x0, y0, width * height * 4, tuple(dict.fromkeys(tags))
+
+    def _paint(self, pen, canvas, kind, pts, options, ss):
+        color = lambda name: self._color(canvas, name)
+        line_width = max(1, round(float(options.get("width", 1) or 1) * ss))
+        smooth = options.get("smooth") not in (None, False, 0, "", "0", "false")
+        steps = int(options.get("splinesteps", 12))
+        if kind in ("oval", "rectangle", "arc"):
+            box = [min(pts[0], pts[2]), min(pts[1], pts[3]), max(pts[0], pts[2]), max(pts[1], pts[3])]
+            fill = color(options.get("fill", ""))
+            outline = color(options.get("outline", "black"))
+            if kind == "oval":
+                pen.ellipse(box, fill=fill, outline=outline, width=line_width if outline else 0)
+            elif kind == "rectangle":
+                pen.rectangle(box, fill=fill, outline=outline, width=line_width if outline else 0)
+            else:
+                # Tk 角度逆时针、Pillow 顺时针
+                start = float(options.get("start", 0))
+                extent = float(options.get("extent", 90))
+                begin, end = -(start + extent), -start
+                if extent < 0:
+                    begin, end = end, begin
+                style = options.get("style", "pieslice")
+                if style == "arc":
+                    if outline:
+                        pen.arc(box, begin, end, fill=outline, width=line_width)
+                elif style == "chord":
+                    pen.chord(box, begin, end, fill=fill, outline=outline, width=line_width if outline else 0)
+                else:
+                    pen.pieslice(box, begin, end, fill=fill, outline=outline, width=line_width if outline else 0)
+        elif kind == "polygon":
+            if smooth:
+                pts = smooth_points(pts, True, steps)
+            xy = list(zip(pts[0::2], pts[1::2]))
+            fill = color(options.get("fill", "black"))
+            outline = color(options.get("outline", ""))
+            if fill and len(xy) >= 3:
+                pen.polygon(xy, fill=fill)
+            if outline:
+                pen.line(xy + xy[:1], fill=outline, width=line_width, joint="curve")
+        elif kind == "line":
+            if smooth:
+                pts = smooth_points(pts, False, steps)
+            fill = color(options.get("fill", "black"))
+            if fill:
+                pen.line(list(zip(pts[0::2], pts[1::2])), fill=fill, width=line_width, joint="curve")
+
+    def _color(self, canvas, name):
+        if not name:
+            return None
+        rgba = self._colors.get(name)
+        if rgba is None:
+            r, g, b = canvas.winfo_rgb(name)
+            rgba = self._colors[name] = (r >> 8, g >> 8, b >> 8, 255)
+        return rgba
+
+    @staticmethod
+    def _tags(options):
+        tags = options.get("tags", ())
+        if isinstance(tags, str):
+            return tags.split() if tags else []
+        return list(tags)
+
+    def _place(self, canvas, key, segments, x, y):
+        # 画布按图形编号持有它显示的图片（缓存淘汰后图片也不会从画布上消失），
+        # 图形被删掉后下次清理时放掉，淘汰的图片不会一直留在画布上
+        target = getattr(canvas, "_canvas", canvas)
+        try:
+            shown = target._sprite_images
+        except AttributeError:
+            shown = target._sprite_images = {}
+        for segment in segments:
+            if segment[0] == "image":
+                _, image, ox, oy, _, tags = segment
+                item = canvas.create_image(x + ox, y + oy, image=image, anchor="nw", tags=tags)
+                shown[item] = image
+            else:
+                kind, coords, options = segment[1]
+                moved = [c + (x if i % 2 == 0 else y) for i, c in enumerate(coords)]
+                getattr(canvas, "create_" + kind)(*moved, **options)
+        if len(shown) >= getattr(target, "_sprite_prune_at", SHOWN_PRUNE_MIN):
+            self._prune_shown(target, shown)
+
+    @staticmethod
+    def _prune_shown(target, shown):
+        """去掉画布上已经不存在的图形对应的图片（阈值翻倍，均摊下来每次放置 O(1)）"""
+        try:
+            alive = set(target.find_all())
+        except Exception:
+            return
+        for item in [item for item in shown if item not in alive]:
+            del shown[item]
+        target._sprite_prune_at = max(SHOWN_PRUNE_MIN, 2 * len(shown))
+
+    # ---------- LRU ----------
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _put(self, key, segments):
+        nbytes = sum(s[4] for s in segments if s[0] == "image")
+        self._entries[key] = (segments, nbytes)
+        self.bytes += nbytes
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {"items": len(self._entries), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = None
+_wrappers = {}                               # 普通函数 -> 包装
+_method_wrappers = weakref.WeakKeyDictionary()  # 对象 -> {函数: 包装}（对象释放后一起释放）
+
+
+def get_sprite_cache():
+    """获取全局精灵图缓存"""
+    global _cache
+    if _cache is None:
+        _cache = SpriteCache()
+    return _cache
+
+
+def cached(draw):
+    """把 draw(canvas, x, y, ...) 包装成走缓存的版本（可以当装饰器用）
+
+    同一个函数（包括同一个对象的绑定方法）每次得到同一个包装，
+    CanvasScene 可以照常用它判断外观有没有变化。
+    绑定方法的包装只弱引用对象，不会让界面对象（和它的画布）一直活着。
+    """
+    owner = getattr(draw, "__self__", None)
+    func = getattr(draw, "__func__", None)
+    if owner is None or func is None:
+        wrapper = _wrappers.get(draw)
+        if wrapper is None:
+            wrapper = _wrappers[draw] = _make_wrapper(draw, lambda: draw)
+        return wrapper
+    try:
+        methods = _method_wrappers.setdefault(owner, {})
+    except TypeError:
+        # 不能弱引用的对象：每次新建包装
+        return _make_wrapper(draw, lambda: draw)
+    wrapper = methods.get(func)
+    if wrapper is None:
+        ref = weakref.ref(owner)
+        wrapper = methods[func] = _make_wrapper(func, lambda: types.MethodType(func, ref()))
+    return wrapper
+
+
+def _make_wrapper(func, resolve):
+    """resolve() 取出真正的绘图函数（绑定方法按弱引用现取）"""
+    @functools.wraps(func)
+    def wrapper(canvas, x, y, *args, **kwargs):
+        return get_sprite_cache().draw(canvas, resolve(), x, y, *args, **kwargs)
+    if resolve() is func:
+        wrapper.uncached = func
+    else:
+        wrapper.uncached = lambda *args, **kwargs: resolve()(*args, **kwargs)
+    return wrapper
+
+
+__all__ = [
+    'SpriteCache',
+    'RecordingCanvas',
+    'get_sprite_cache',
+    'cached',
+    'smooth_points',
+    'split_runs',
+    'PIL_AVAILABLE',
+]
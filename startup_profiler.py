@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+"""
+启动性能分析 v1.0
+记录程序从启动到第一帧的耗时，找出拖慢冷启动的模块：
+- 每个模块的导入耗时（累计 / 自身，嵌套导入会分开计算）
+- 字体配置、音频初始化等阶段的耗时
+- 第一帧画出来的时间
+- 结束时写出 JSON 报告，并在控制台打印最慢的模块
+
+开启方式（满足其一，平时不开启时几乎没有开销）：
+    设置环境变量 LELE_PROFILE_STARTUP=1
+    启动时加参数 --profile-startup（例如 启动学习乐园.bat --profile-startup）
+
+报告默认写到数据目录的 startup_report_<入口>.json，
+可以用环境变量 LELE_PROFILE_OUTPUT 指定路径。
+
+使用方法（入口文件最上面）：
+    import startup_profiler
+    startup_profiler.install_if_enabled("kids_learning_main")
+
+    with startup_profiler.phase("audio_init"):
+        pygame.mixer.init()
+
+    window.after_idle(startup_profiler.first_frame)   # 第一帧后写报告
+
+命令行（无界面导入一个入口，超出预算时返回 1，测试用）：
+    python startup_profiler.py kids_learning_main --budget 1500
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import argparse
+import platform
+import threading
+from contextlib import contextmanager
+
+# 计时起点：入口文件第一行导入本模块的时间
+PROCESS_START = time.perf_counter()
+
+PROFILE_ENV = "LELE_PROFILE_STARTUP"
+OUTPUT_ENV = "LELE_PROFILE_OUTPUT"
+BUDGET_ENV = "LELE_STARTUP_BUDGET_MS"
+CLI_FLAG = "--profile-startup"
+
+# 报告里列出最慢的多少个模块
+TOP_IMPORTS = 30
+
+# 无界面导入各入口的冷启动预算（毫秒）
+# 桌面版只导入 tkinter，Kivy 版要加载窗口和图形库，所以宽松一些
+DEFAULT_BUDGETS_MS = {
+    "kids_learning_main": 1500,
+    "kids_game_v3": 1500,
+    "kids_pinyin": 1500,
+    "kids_math": 1500,
+    "kids_english": 1500,
+    "kids_thinking": 1500,
+    "kids_vehicles": 1500,
+    "main": 4000,
+    "app_main": 4000,
+    "chinese_app": 4000,
+    "math_app": 4000,
+}
+FALLBACK_BUDGET_MS = 2000
+
+
+def budget_for(entry):
+    """入口的冷启动预算（环境变量 LELE_STARTUP_BUDGET_MS 可统一覆盖）"""
+    override = os.environ.get(BUDGET_ENV)
+    if override:
+        try:
+            return float(override)
+        except ValueError:
+            print(f"[startup] 忽略无效的预算设置: {BUDGET_ENV}={override}")
+    name = entry.rsplit(".", 1)[-1]
+    return DEFAULT_BUDGETS_MS.get(name, FALLBACK_BUDGET_MS)
+
+
+def profiling_requested(argv=None):
+    """环境变量或命令行参数是否要求开启分析"""
+    argv = sys.argv if argv is None else argv
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0") or CLI_FLAG in argv
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+# ============================================================
+# 导入计时
+# ============================================================
+class _TimedLoader:
+    """包一层加载器，记录 exec_module 的耗时，执行完换回原加载器"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        # 不让其他代码看到包装过的加载器
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._begin_import()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end_import(module.__name__)
+
+
+class _ImportTimer:
+    """放在 sys.meta_path 最前面，给找到的模块套上计时加载器"""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+# ============================================================
+# 分析器
+# ============================================================
+class StartupProfiler:
+    """收集一次启动的导入、阶段和首帧耗时
+
+    Args:
+        entry: 入口名（用于报告文件名和预算）
+        start: 计时起点（time.perf_counter()）
+    """
+
+    def __init__(self, entry, start=None):
+        self.entry = entry
+        self.start = PROCESS_START if start is None else start
+        self.imports = {}        # 模块名 -> [自身耗时, 累计耗时]（秒）
+        self.phases = []         # [(阶段名, 开始偏移, 耗时)]
+        self.marks = {}          # 时间点名 -> 距起点的秒数
+        self.report_path = None
+        self._stack = []         # 正在导入的模块: [开始时间, 子模块耗时]
+        self._timer = None
+        self._lock = threading.Lock()
+        self._thread = threading.get_ident()
+
+    # ---------- 导入 ----------
+
+    def install(self):
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall(self):
+        if self._timer is not None:
+            try:
+                sys.meta_path.remove(self._timer)
+            except ValueError:
+                pass
+            self._timer = None
+
+    def _begin_import(self):
+        if threading.get_ident() == self._thread:
+            self._stack.append([time.perf_counter(), 0.0])
+
+    def _end_import(self, name):
+        if threading.get_ident() != self._thread or not self._stack:
+            # 后台线程里的导入不计入启动时间
+            return
+        began, children = self._stack.pop()
+        total = time.perf_counter() - began
+        if self._stack:
+            self._stack[-1][1] += total
+        with self._lock:
+            entry = self.imports.setdefault(name, [0.0, 0.0])
+            entry[0] += total - children
+            entry[1] += total
+
+    # ---------- 阶段和时间点 ----------
+
+    @contextmanager
+    def phase(self, name):
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, began - self.start, time.perf_counter() - began))
+
+    def mark(self, name):
+        self.marks.setdefault(name, time.perf_counter() - self.start)
+        return self.marks[name]
+
+    # ---------- 报告 ----------
+
+    def report(self):
+        """整理成可写入 JSON 的字典"""
+        now = time.perf_counter() - self.start
+        imports = sorted(self.imports.items(), key=lambda kv: kv[1][1], reverse=True)
+        first_frame = self.marks.get("first_frame")
+        budget = budget_for(self.entry)
+        elapsed = first_frame if first_frame is not None else now
+        return {
+            "entry": self.entry,
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "total_ms": _ms(now),
+            "first_frame_ms": _ms(first_frame) if first_frame is not None else None,
+            "import_count": len(self.imports),
+            "import_ms": _ms(sum(own for own, _ in self.imports.values())),
+            "phases": [{"name": name, "start_ms": _ms(began), "ms": _ms(spent)}
+                       for name, began, spent in self.phases],
+            "marks": {name: _ms(t) for name, t in self.marks.items()},
+            "imports": [{"module": name, "self_ms": _ms(own), "total_ms": _ms(total)}
+                        for name, (own, total) in imports[:TOP_IMPORTS]],
+            "budget_ms": budget,
+            "over_budget": elapsed * 1000 > budget,
+        }
+
+    def write_report(self, path=None):
+        """写出 JSON 报告并打印摘要，返回报告字典"""
+        data = self.report()
+        path = path or os.environ.get(OUTPUT_ENV) or _default_report_path(self.entry)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.report_path = path
+        except OSError as e:
+            print(f"[startup] 写入报告失败: {e}")
+        print_summary(data)
+        if self.report_path:
+            print(f"[startup] 报告: {self.report_path}")
+        return data
+
+
+def _default_report_path(entry):
+    # 写报告时才导入 ui_config，不把它算进启动时间
+    filename = f"startup_report_{entry.rsplit('.', 1)[-1]}.json"
+    try:
+        from ui_config import get_data_path
+        return get_data_path(filename)
+    except ImportError:
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+
+
+def print_summary(data, top=10):
+    """在控制台打印报告摘要"""
+    first = data["first_frame_ms"]
+    print(f"[startup] {data['entry']}: 总计 {data['total_ms']:.0f}ms, "
+          f"首帧 {'-' if first is None else f'{first:.0f}ms'}, "
+          f"导入 {data['import_count']} 个模块共 {data['import_ms']:.0f}ms, "
+          f"预算 {data['budget_ms']:.0f}ms{'（超出）' if data['over_budget'] else ''}")
+    for p in data["phases"]:
+        print(f"[startup]   阶段 {p['name']:<16} {p['ms']:>8.1f}ms  (开始于 {p['start_ms']:.0f}ms)")
+    for item in data["imports"][:top]:
+        print(f"[startup]   导入 {item['module']:<32} {item['total_ms']:>8.1f}ms  "
+              f"(自身 {item['self_ms']:.1f}ms)")
+
+
+# ============================================================
+# 全局接口
+# ============================================================
+_profiler = None
+
+
+def get_profiler():
+    """当前的分析器（没有开启时返回 None）"""
+    return _profiler
+
+
+def install_if_enabled(entry, argv=None):
+    """按环境变量 / 命令行参数开启分析，返回分析器或 None
+
+    重复调用（例如 main.py 再导入 chinese_app）时保留第一次的入口。
+    命令行里的 --profile-startup 会被去掉，以免 Kivy 等解析参数时报错。
+    """
+    global _profiler
+    argv = sys.argv if argv is None else argv
+    if CLI_FLAG in argv:
+        argv[:] = [a for a in argv if a != CLI_FLAG]
+        os.environ[PROFILE_ENV] = "1"
+    if _profiler is not None or not profiling_requested(argv):
+        return _profiler
+    _profiler = StartupProfiler(entry)
+    _profiler.install()
+    atexit.register(_write_at_exit)
+    print(f"[startup] 启动分析已开启: {entry}")
+    return _profiler
+
+
+@contextmanager
+def phase(name):
+    """记录一个启动阶段的耗时（未开启时什么都不做）"""
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name):
+            yield
+
+
+def mark(name):
+    """记录一个时间点（未开启时什么都不做）"""
+    if _profiler is not None:
+        return _profiler.mark(name)
+    return None
+
+
+def first_frame(*args):
+    """第一帧画出后调用：记录时间、停止导入计时并写出报告"""
+    if _profiler is None or "first_frame" in _profiler.marks:
+        return
+    _profiler.mark("first_frame")
+    _profiler.uninstall()
+    _profiler.write_report()
+
+
+def _write_at_exit():
+    # 没有等到第一帧就退出时（无界面、启动失败）也留下报告
+    if _profiler is not None and _profiler.report_path is None:
+        _profiler.uninstall()
+        _profiler.write_report()
+
+
+# ============================================================
+# 命令行
+# ============================================================
+def main(argv=None):
+    global _profiler
+    root = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="无界面导入一个入口并报告冷启动耗时")
+    parser.add_argument("entry", help="入口模块，例如 kids_learning_main、main、app_main")
+    parser.add_argument("--budget", type=float, help="预算（毫秒），默认按入口取")
+    parser.add_argument("--output", help="报告路径")
+    args = parser.parse_args(argv)
+
+    # 和 main.py 一样的搜索路径
+    for sub in ("core", "ui_kivy", ""):
+        path = os.path.join(root, sub) if sub else root
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    if args.budget is not None:
+        os.environ[BUDGET_ENV] = str(args.budget)
+
+    # 入口里 import startup_profiler 拿到的是同一个模块，阶段记录才能汇总到一起
+    sys.modules.setdefault("startup_profiler", sys.modules[__name__])
+    _profiler = StartupProfiler(args.entry, start=time.perf_counter())
+    _profiler.report_path = args.output or ""   # 退出时不再写默认报告
+    _profiler.install()
+    try:
+        with _profiler.phase("import " + args.entry):
+            __import__(args.entry)
+    finally:
+        _profiler.uninstall()
+    if args.output:
+        data = _profiler.write_report(args.output)
+    else:
+        data = _profiler.report()
+        print_summary(data)
+    return 1 if data["over_budget"] else 0
+
+
+__all__ = [
+    'StartupProfiler',
+    'install_if_enabled',
+    'get_profiler',
+    'phase',
+    'mark',
+    'first_frame',
+    'budget_for',
+    'profiling_requested',
+    'print_summary',
+    'DEFAULT_BUDGETS_MS',
+    'PROCESS_START',
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+成就规则引擎测试
+- 只检查依赖的计数器变了的规则，满足一次就移除
+- LearningData 答题：徽章和原来整表检查的结果一致
+- 徽章目录变大，每题检查的规则数不变
+"""
+import random
+
+import pytest
+
+import learning_data
+from achievement_rules import RuleEngine, ANY, STARS, DAYS_LEARNED, FLAGS
+from learning_data import LearningData, BADGES
+
+
+def test_only_watchers_are_checked():
+    rules = RuleEngine()
+    calls = []
+
+    def cond(name, ok):
+        return lambda d: calls.append(name) or ok(d)
+
+    rules.add("stars", cond("stars", lambda d: d["stars"] >= 2), watch=(STARS,), payload="⭐")
+    rules.add("days", cond("days", lambda d: d["days"] >= 1), watch=(DAYS_LEARNED,))
+    rules.add("old", cond("old", lambda d: False))
+    data = {"stars": 0, "days": 0}
+    # 新加入的规则都检查一次
+    assert rules.collect(data) == [] and calls == ["stars", "days", "old"]
+
+    calls.clear()
+    rules.touch(STARS)
+    assert rules.collect(data) == [] and calls == ["stars", "old"]   # 没声明依赖的规则总是检查
+
+    calls.clear()
+    data["stars"] = 2
+    rules.touch(STARS)
+    assert rules.collect(data) == [("stars", "⭐")]
+    assert "stars" not in rules and len(rules) == 2
+    calls.clear()
+    rules.touch(STARS)
+    assert rules.collect(data) == [] and calls == ["old"]
+
+    # 没有变化就不检查
+    calls.clear()
+    assert rules.collect(data) == [] and calls == []
+    assert rules._watchers.keys() == {DAYS_LEARNED, ANY}
+    print("✅ 只检查订阅了变化计数器的规则")
+
+
+def test_bad_condition_is_false():
+    rules = RuleEngine()
+    rules.add("boom", lambda d: d["missing"] > 0, watch=(FLAGS,))
+    assert rules.collect({}) == [] and "boom" in rules
+    print("✅ 条件出错当作不满足")
+
+
+@pytest.fixture
+def make_data(tmp_path, monkeypatch):
+    """在临时文件里新建 LearningData（不动真实学习记录）"""
+    monkeypatch.setattr(learning_data, "sqlite_enabled", lambda: False)
+    created = []
+
+    def make():
+        monkeypatch.setattr(learning_data, "PROGRESS_FILE", str(tmp_path / f"progress{len(created)}.json"))
+        monkeypatch.setattr(LearningData, "_instance", None)
+        data = LearningData()
+        data.check_daily_login()
+        random.seed(0)   # 每日挑战是随机抽的，每次抽到一样的
+        data.generate_daily_challenges()
+        created.append(data)
+        return data
+
+    yield make
+    for data in created:
+        data._dirty = False
+
+
+def _missed_badges(data):
+    """原来的整表检查：条件满足却还没发的徽章"""
+    earned = data.data["rewards"]["badges"]
+    return [badge_id for badge_id, info in BADGES.items()
+            if badge_id not in earned and info["condition"](data.data)]
+
+
+def test_same_badges_as_full_scan(make_data):
+    """随机答 400 题，每题之后都没有漏发的徽章"""
+    fresh_data = make_data()
+    rng = random.Random(7)
+    modules = list(learning_data.DEFAULT_DATA["modules"])
+    got = []
+    for _ in range(400):
+        got += [b["name"] for b in fresh_data.add_score(rng.choice(modules), 10, rng.random() < 0.9)]
+        assert _missed_badges(fresh_data) == []
+    assert "初露锋芒" in got and "学习起步" in got and "全能宝宝" in got
+    # 和答题有关的挑战都完成了（学习时长、复习挑战答题完成不了）
+    completed = fresh_data.data["daily_challenges"]["completed"]
+    for c in fresh_data.data["daily_challenges"]["challenges"]:
+        assert (c["id"] in completed) == (c["type"] not in ("time", "review"))
+    print(f"✅ 徽章和整表检查一致: {len(got)} 个")
+
+
+def test_cost_independent_of_catalog(make_data, monkeypatch):
+    """再加 2000 个徽章，答题时检查的规则数不变"""
+    def per_answer(data, answers=30):
+        data.add_score("math", 10, True)   # 先把新加入的规则检查一遍
+        before = data._badge_rules.evaluated
+        for i in range(answers):
+            data.add_score("math", 10, i % 4 != 0)
+        return (data._badge_rules.evaluated - before) / answers
+
+    base = per_answer(make_data())
+    extra = dict(BADGES)
+    for i in range(2000):
+        extra[f"days_{i}"] = {"name": f"坚持{i}天", "desc": "", "emoji": "📅",
+                              "watch": (DAYS_LEARNED,),
+                              "condition": lambda d, n=i + 100: d["overall"]["days_learned"] >= n}
+    monkeypatch.setattr(learning_data, "BADGES", extra)
+    grown = per_answer(make_data())
+    print(f"✅ 每题检查规则数: {len(BADGES)} 个徽章 {base:.1f}, {len(extra)} 个徽章 {grown:.1f}")
+    assert grown == base and grown < len(BADGES)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
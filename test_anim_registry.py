@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+页面动画登记测试（用假的 Clock / Animation / Screen，不需要 Kivy）
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_kivy"))
+
+import anim_registry
+from anim_registry import track_animation, track_clock, registry_for, release, live_counts
+
+
+class FakeEvent:
+    def __init__(self, clock, callback, interval):
+        self.clock = clock
+        self.callback = callback
+        self.interval = interval
+
+    def cancel(self):
+        self.clock.events.discard(self)
+
+
+class FakeClock:
+    def __init__(self):
+        self.events = set()
+        self.once = []
+
+    def schedule_interval(self, callback, interval):
+        event = FakeEvent(self, callback, interval)
+        self.events.add(event)
+        return event
+
+    def schedule_once(self, callback, timeout=0):
+        self.once.append(callback)
+        return FakeEvent(self, callback, timeout)
+
+    def next_frame(self):
+        pending, self.once = self.once, []
+        for callback in pending:
+            callback(0)
+
+
+class FakeAnimation:
+    def __init__(self):
+        self.running = set()
+
+    def start(self, widget):
+        self.running.add(widget)
+
+    def cancel(self, widget):
+        self.running.discard(widget)
+
+
+class FakeWidget:
+    def __init__(self, parent=None):
+        self.parent = parent
+
+
+class FakeManager:
+    def __init__(self):
+        self.current = None
+
+
+class FakeScreen(FakeWidget):
+    def __init__(self, name, manager):
+        super().__init__(parent=manager)
+        self.name = name
+        self.manager = manager
+        self.handlers = {}
+
+    def bind(self, **handlers):
+        self.handlers.update(handlers)
+
+    def unbind(self, **handlers):
+        for key in handlers:
+            self.handlers.pop(key, None)
+
+    def on_leave(self, *args):
+        if "on_leave" in self.handlers:
+            self.handlers["on_leave"]()
+
+    def on_enter(self, *args):
+        if "on_enter" in self.handlers:
+            self.handlers["on_enter"]()
+
+
+def _setup(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(anim_registry, "Clock", clock)
+    monkeypatch.setattr(anim_registry, "_global", anim_registry.AnimationRegistry())
+    monkeypatch.setattr(anim_registry, "_registries", anim_registry.weakref.WeakKeyDictionary())
+    monkeypatch.setattr(anim_registry, "_pending", [])
+    monkeypatch.setattr(anim_registry, "_pending_event", None)
+    return clock
+
+
+def _switch(manager, old, new):
+    manager.current = new.name
+    old.on_leave()
+    new.on_enter()
+
+
+def test_pause_and_resume_with_screen(monkeypatch):
+    """离开页面时动画和定时器都停下，回来时重新开始"""
+    clock = _setup(monkeypatch)
+    manager = FakeManager()
+    home, game = FakeScreen("home", manager), FakeScreen("game", manager)
+    manager.current = "home"
+
+    star = FakeWidget(parent=FakeWidget(parent=home))
+    anim = track_animation(star, FakeAnimation())
+    track_clock(star, lambda dt: None, 0.1)
+    # 登记后马上开始（和原来一样）
+    assert star in anim.running and len(clock.events) == 1
+    clock.next_frame()
+    assert registry_for(home).counts() == {"animations": 1, "clocks": 1}
+
+    _switch(manager, home, game)
+    assert star not in anim.running and not clock.events
+    assert live_counts() == {"animations": 0, "clocks": 0, "screens": 1}
+
+    _switch(manager, game, home)
+    assert star in anim.running and len(clock.events) == 1
+    print("✅ 离开页面暂停，回来继续")
+
+
+def test_no_growth_after_many_switches(monkeypatch):
+    """来回切换很多次，运行中的动画数量不增长"""
+    clock = _setup(monkeypatch)
+    manager = FakeManager()
+    screens = [FakeScreen(f"s{i}", manager) for i in range(4)]
+    manager.current = "s0"
+    for screen in screens:
+        for _ in range(5):
+            track_animation(FakeWidget(parent=screen), FakeAnimation())
+        track_clock(FakeWidget(parent=screen), lambda dt: None, 0.05)
+    clock.next_frame()
+    # 只有当前页面在运行，其余页面在登记时就暂停了
+    assert live_counts() == {"animations": 5, "clocks": 1, "screens": 4}
+
+    current = screens[0]
+    for i in range(200):
+        new = screens[(i + 1) % 4]
+        _switch(manager, current, new)
+        current = new
+        counts = live_counts()
+        assert counts["animations"] == 5 and counts["clocks"] == 1
+    assert len(clock.events) == 1
+    print("✅ 切换 200 次不增长")
+
+
+def test_detached_and_released(monkeypatch):
+    """从页面移除的 widget 和被释放的页面，动画都会被取消"""
+    clock = _setup(monkeypatch)
+    manager = FakeManager()
+    home, game = FakeScreen("home", manager), FakeScreen("game", manager)
+    manager.current = "home"
+    kept, removed = FakeWidget(parent=home), FakeWidget(parent=home)
+    track_animation(kept, FakeAnimation())
+    anim = track_animation(removed, FakeAnimation())
+    clock.next_frame()
+
+    removed.parent = None
+    _switch(manager, home, game)
+    _switch(manager, game, home)
+    assert removed not in anim.running and len(registry_for(home)) == 1
+
+    release(home)
+    assert live_counts() == {"animations": 0, "clocks": 0, "screens": 0}
+    assert "on_enter" not in home.handlers
+    print("✅ 移除的 widget 和释放的页面")
+
+
+def test_widget_outside_screens_keeps_running(monkeypatch):
+    """不在任何页面里的 widget（例如直接加到 Window）一直运行"""
+    clock = _setup(monkeypatch)
+    loose = FakeWidget()
+    anim = track_animation(loose, FakeAnimation())
+    clock.next_frame()
+    assert loose in anim.running
+    assert live_counts() == {"animations": 1, "clocks": 0, "screens": 0}
+    print("✅ 页面外的 widget")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
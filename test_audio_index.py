@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+本地音频索引测试
+- 单字按编码精确匹配
+- 词组、欢迎语只按清单记录的文字整句匹配，没有清单时交给 TTS
+- 清单记录的语音/语速
+"""
+import json
+import os
+
+import pytest
+
+from audio_index import LocalAudioIndex, GENERATED_VOICE, char_to_code
+
+
+def _make_dir(root, manifest=None):
+    audio_dir = root / "generated"
+    audio_dir.mkdir()
+    for name in ("char_%s.mp3" % char_to_code("天"), "word_%s.mp3" % char_to_code("天"),
+                 "welcome.mp3", "praise_00.mp3"):
+        (audio_dir / name).write_bytes(b"mp3")
+    if manifest is not None:
+        (audio_dir / "manifest.json").write_text(
+            json.dumps({"version": 1, "files": manifest}, ensure_ascii=False), encoding="utf-8")
+    return LocalAudioIndex(str(audio_dir))
+
+
+def test_without_manifest_only_single_chars(tmp_path):
+    """没有清单：词组不再按第一个字匹配，带"欢迎"的句子不再播欢迎语"""
+    index = _make_dir(tmp_path)
+    assert index.find_text_name("天") == "char_%s.mp3" % char_to_code("天")
+    assert index.find_text_name("天空") is None
+    assert index.find_text_name("天地") is None and index.find_word("天地") is None
+    assert index.find_text_name("欢迎来到乐乐的识字乐园") is None
+    assert index.find_text_name("欢迎回来") is None
+    assert index.count() == 4
+    print("✅ 没有清单时只匹配单字")
+
+
+def test_manifest_exact_matches(tmp_path):
+    word = "word_%s.mp3" % char_to_code("天")
+    index = _make_dir(tmp_path, {
+        word: {"text": "天空", "voice": GENERATED_VOICE, "rate": "+0%"},
+        "welcome.mp3": {"text": "欢迎来到乐乐的识字乐园"},
+        "praise_00.mp3": {"text": "太棒了！", "voice": "zh-CN-YunxiNeural", "rate": "+10%"},
+        "gone.mp3": {"text": "不存在的文件"},
+    })
+    assert index.find_text_name("天空") == word and index.find_word("天空").endswith(word)
+    assert index.find_text_name("天上") is None
+    assert index.find_text_name("欢迎来到乐乐的识字乐园") == "welcome.mp3"
+    assert index.find_text_name("欢迎回来") is None
+    assert index.find_text_name("不存在的文件") is None
+    # 词组查找只返回词组文件
+    assert index.find_word("太棒了！") is None and index.find_text_name("太棒了！") == "praise_00.mp3"
+    print("✅ 清单整句匹配")
+
+
+def test_same_voice(tmp_path):
+    index = _make_dir(tmp_path, {
+        "praise_00.mp3": {"text": "太棒了！", "voice": "zh-CN-YunxiNeural", "rate": "+10%"},
+    })
+    char = index.find_text_name("天")
+    # 清单里没有记录：按生成脚本默认语音和语速
+    assert index.same_voice(char, GENERATED_VOICE, "+0%")
+    assert not index.same_voice(char, GENERATED_VOICE, "-10%")
+    assert not index.same_voice(char, "zh-CN-YunxiNeural", "+0%")
+    assert index.same_voice("praise_00.mp3", "zh-CN-YunxiNeural", "+10%")
+    assert not index.same_voice("praise_00.mp3", GENERATED_VOICE, "+0%")
+    print("✅ 语音和语速对得上才用本地音频")
+
+
+def test_shipped_words_and_welcome():
+    """随程序发布的 audio/generated 带清单：真实的词组和欢迎语能找到本地音频"""
+    audio_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "audio", "generated")
+    index = LocalAudioIndex(audio_dir)
+    assert index.find_text_name("天空") == "word_%s.mp3" % char_to_code("天")
+    assert index.find_word("月亮").endswith("word_%s.mp3" % char_to_code("月"))
+    assert index.find_text_name("欢迎来到乐乐的识字乐园") == "welcome.mp3"
+    assert index.find_text_name("天地") is None
+    assert index.same_voice(index.find_text_name("天空"), GENERATED_VOICE, "+0%")
+    print("✅ 发布的词组和欢迎语走本地音频")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
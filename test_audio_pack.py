@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+音频资源包测试
+打包一个临时目录，再通过资源包和音频索引读回来
+"""
+import os
+import json
+import shutil
+
+import pytest
+
+import audio_pack
+from audio_pack import AudioPack, PackError, build_pack
+from audio_index import LocalAudioIndex
+
+
+def _make_audio_dir(root):
+    audio_dir = os.path.join(str(root), "generated")
+    os.makedirs(audio_dir)
+    files = {
+        "char_4e00.mp3": b"yi" * 100,
+        "word_5929.mp3": b"tiandi",
+        "praise_00.mp3": b"praise",
+        "notes.txt": b"not packed",
+    }
+    for name, data in files.items():
+        with open(os.path.join(audio_dir, name), "wb") as f:
+            f.write(data)
+    manifest = {"version": 1, "files": {"word_5929.mp3": {"text": "天地"}}}
+    with open(os.path.join(audio_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return audio_dir, files
+
+
+def test_pack_roundtrip(tmp_path):
+    """打包后按文件名读出的内容不变"""
+    audio_dir, files = _make_audio_dir(tmp_path)
+    pack_path, count = build_pack(audio_dir)
+    assert pack_path == audio_dir + ".pack" and count == 4
+
+    pack = AudioPack(pack_path, extract_dir=str(tmp_path / "extract"))
+    assert "notes.txt" not in pack
+    assert bytes(pack.view("char_4e00.mp3")) == files["char_4e00.mp3"]
+    with pack.open("word_5929.mp3") as f:
+        assert f.read(3) == b"tia" and f.read() == b"ndi"
+    path = pack.extract("praise_00.mp3")
+    with open(path, "rb") as f:
+        assert f.read() == b"praise"
+    assert pack.view("missing.mp3") is None
+    pack.close()
+    print("✅ 资源包读写")
+
+
+def test_index_reads_pack_without_directory(tmp_path, monkeypatch):
+    """只有资源包、没有散文件时索引照样能找到"""
+    audio_dir, _ = _make_audio_dir(tmp_path)
+    build_pack(audio_dir)
+    shutil.rmtree(audio_dir)
+    monkeypatch.setattr(audio_pack, "EXTRACT_DIR", str(tmp_path / "extract"))
+
+    index = LocalAudioIndex(audio_dir)
+    assert index.count() == 3
+    assert index.find_text("天地").endswith("word_5929.mp3")
+    assert index.find_text("天空") is None
+    source = index.source(index.find_text_name("一"))
+    assert source.read() == b"yi" * 100
+    print("✅ 索引读取资源包")
+
+
+def test_bad_pack_rejected(tmp_path):
+    """不是资源包的文件报 PackError"""
+    path = str(tmp_path / "bad.pack")
+    with open(path, "wb") as f:
+        f.write(b"not a pack at all")
+    with pytest.raises(PackError):
+        AudioPack(path)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
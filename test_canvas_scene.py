@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Canvas 保留模式场景测试（用假画布，不需要显示器）
+"""
+from canvas_scene import CanvasScene
+
+
+class FakeCanvas:
+    """记录图形和操作次数的假 Canvas（只实现场景用到的方法）"""
+
+    def __init__(self, width=900, height=550):
+        self.width, self.height = width, height
+        self.items = {}       # id -> {"kind", "coords", "tags", "options"}
+        self.order = []       # 显示顺序，后面的在上面
+        self.ops = []
+        self._next = 0
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def _create(self, kind, *coords, tags=(), **options):
+        self._next += 1
+        if isinstance(tags, str):
+            tags = (tags,)
+        self.items[self._next] = {"kind": kind, "coords": list(coords),
+                                  "tags": set(tags), "options": options}
+        self.order.append(self._next)
+        self.ops.append("create")
+        return self._next
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return lambda *a, **kw: self._create(name[7:], *a, **kw)
+        raise AttributeError(name)
+
+    def _find(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [i for i in self.order if tag_or_id in self.items[i]["tags"]]
+
+    def move(self, tag, dx, dy):
+        self.ops.append("move")
+        for i in self._find(tag):
+            c = self.items[i]["coords"]
+            self.items[i]["coords"] = [v + (dx if k % 2 == 0 else dy) for k, v in enumerate(c)]
+
+    def coords(self, item, *coords):
+        self.ops.append("coords")
+        self.items[item]["coords"] = list(coords)
+
+    def itemconfigure(self, item, **options):
+        self.ops.append("config")
+        self.items[item]["options"].update(options)
+
+    def delete(self, tag):
+        self.ops.append("delete")
+        for i in self._find(tag):
+            del self.items[i]
+            self.order.remove(i)
+
+    def addtag_withtag(self, new_tag, tag):
+        for i in self._find(tag):
+            self.items[i]["tags"].add(new_tag)
+
+    def tag_lower(self, tag, below):
+        moving = self._find(tag)
+        rest = [i for i in self.order if i not in moving]
+        pos = rest.index(self._find(below)[0])
+        self.order = rest[:pos] + moving + rest[pos:]
+
+
+def _draw_box(canvas, x, y, color="red"):
+    canvas.create_rectangle(x - 5, y - 5, x + 5, y + 5, fill=color)
+    canvas.create_text(x, y, text="#", tags="label")
+
+
+def _draw_track(canvas, cw, ch):
+    for i in range(0, ch, 10):
+        canvas.create_line(0, i, cw, i)
+
+
+def test_static_layer_and_moving_sprite():
+    """静态背景只画一次，之后每帧只有移动操作"""
+    canvas = FakeCanvas()
+    scene = CanvasScene(canvas)
+    for frame in range(5):
+        scene.begin_frame()
+        cw, ch = scene.size()
+        scene.layer("track", _draw_track, cw, ch)
+        scene.sprite("car", _draw_box, 100 + frame * 10, 200, z=2)
+        scene.item("hud", "text", (cw // 2, 30), z=9, text=f"距离: {frame}m")
+        scene.end_frame()
+        if frame == 0:
+            assert len(canvas.items) == 55 + 2 + 1
+            canvas.ops.clear()
+    # 后面四帧：每帧一次 move + 一次文字修改
+    assert canvas.ops == ["move", "config"] * 4
+    box = [i for i in canvas.items.values() if i["kind"] == "rectangle"][0]
+    assert box["coords"] == [135, 195, 145, 205]
+    # 自带的标签保留
+    assert any("label" in i["tags"] for i in canvas.items.values())
+
+
+def test_resize_and_redraw():
+    """窗口大小或外观参数变化时重画"""
+    canvas = FakeCanvas()
+    scene = CanvasScene(canvas)
+    scene.begin_frame()
+    scene.layer("track", _draw_track, *scene.size())
+    scene.sprite("car", _draw_box, 10, 10, color="red")
+    scene.end_frame()
+
+    canvas.height = 600
+    canvas.ops.clear()
+    scene.begin_frame()
+    scene.layer("track", _draw_track, *scene.size())
+    scene.sprite("car", _draw_box, 10, 10, color="blue")
+    scene.end_frame()
+    assert canvas.ops.count("delete") == 2
+    assert len([i for i in canvas.items.values() if i["kind"] == "line"]) == 60
+    assert scene.stats["created"] == 2
+
+
+def test_sweep_and_z_order():
+    """没有再画的图形被删除，新图形插到更高 z 的下面"""
+    canvas = FakeCanvas()
+    scene = CanvasScene(canvas)
+    scene.begin_frame()
+    scene.sprite("car", _draw_box, 50, 50, z=3)
+    scene.item("hud", "text", (0, 0), z=9, text="hi")
+    scene.sprite(("coin", 1), _draw_box, 10, 10, z=2)
+    scene.end_frame()
+    kinds = [canvas.items[i]["kind"] for i in canvas.order]
+    # 金币（z=2）在赛车（z=3）下面
+    coin_ids = canvas._find(scene._sprites[("coin", 1)].tag)
+    car_ids = canvas._find(scene._sprites["car"].tag)
+    assert canvas.order.index(coin_ids[-1]) < canvas.order.index(car_ids[0])
+    assert kinds[-1] == "text"
+
+    scene.begin_frame()
+    scene.sprite("car", _draw_box, 50, 60, z=3)
+    scene.item("hud", "text", (0, 0), z=9, text="hi")
+    scene.end_frame()
+    assert ("coin", 1) not in scene and len(scene) == 2
+    assert len(canvas.items) == 3
+
+
+if __name__ == "__main__":
+    test_static_layer_and_moving_sprite()
+    print("✅ 静态背景 + 移动")
+    test_resize_and_redraw()
+    print("✅ 缩放重画")
+    test_sweep_and_z_order()
+    print("✅ 自动删除和层次")
+    print("\n🎉 所有测试通过!")
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+配置管理器测试
+- 读配置不复制、快照只读
+- 第一次 set 没加载过的配置不死锁
+- 多次 set 合并保存
+- 订阅配置变化
+- 多线程同时读写
+- 写入失败后自动重试
+- 主题设置经配置管理器保存
+"""
+import json
+import threading
+from types import MappingProxyType
+
+import pytest
+
+import config_manager as cm
+from config_manager import ConfigManager, ALL_CONFIGS
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """临时目录里的新配置管理器（不动真实配置文件）"""
+    monkeypatch.setattr(cm, "UI_CONFIG_AVAILABLE", False)
+    monkeypatch.setattr(ConfigManager, "_instance", None)
+    monkeypatch.setattr(ConfigManager, "SAVE_INTERVAL", 0.05)
+    m = ConfigManager()
+    m._config_dir = str(tmp_path)
+    yield m
+    m.save_all()
+
+
+def _read(tmp_path, name):
+    return json.loads((tmp_path / name).read_text(encoding="utf-8"))
+
+
+def test_reads_share_one_snapshot(manager, tmp_path):
+    (tmp_path / "sound_settings.json").write_text('{"volume": 0.3}', encoding="utf-8")
+    snap = manager.snapshot("sound")
+    assert manager.snapshot("sound") is snap
+    assert manager.get("sound", "volume") == 0.3 and manager.get("sound", "sound_enabled") is True
+    with pytest.raises(TypeError):
+        snap["volume"] = 1.0
+    # load() 给的是副本
+    copy = manager.load("sound")
+    copy["volume"] = 1.0
+    assert manager.get("sound", "volume") == 0.3
+    # 改了以后换新快照，旧快照不变
+    manager.set("sound", "volume", 0.6)
+    assert snap["volume"] == 0.3 and manager.get("sound", "volume") == 0.6
+    print("✅ 读配置不复制，快照只读")
+
+
+def test_first_set_does_not_deadlock(manager):
+    """原来 set() 持锁时调用 load()，第一次设置没加载过的配置会卡死"""
+    t = threading.Thread(target=manager.set, args=("theme", "current_theme", "frozen"), daemon=True)
+    t.start()
+    t.join(2)
+    assert not t.is_alive()
+    assert manager.get("theme", "current_theme") == "frozen"
+    print("✅ 第一次 set 不死锁")
+
+
+def test_sets_are_batched(manager, tmp_path, monkeypatch):
+    writes = []
+    original = manager._save_to_file
+
+    def counting(filepath, config, backup=True):
+        writes.append(backup)
+        return original(filepath, config, backup)
+
+    monkeypatch.setattr(manager, "_save_to_file", counting)
+    (tmp_path / "sound_settings.json").write_text('{"volume": 0.1}', encoding="utf-8")
+    for i in range(200):
+        manager.set("sound", "volume", i / 200)
+    assert len(writes) < 10
+    manager.save_all()
+    assert _read(tmp_path, "sound_settings.json")["volume"] == 199 / 200
+    assert not manager.has_pending_save()
+    # 备份只在第一次写的时候做
+    assert writes.count(True) == 1 and _read(tmp_path, "sound_settings.json.bak") == {"volume": 0.1}
+
+    # 值没变不算修改
+    manager.set("sound", "volume", 199 / 200)
+    assert not manager.has_pending_save("sound")
+    print(f"✅ 200 次 set 写了 {len(writes)} 次文件")
+
+
+def test_subscribe(manager, tmp_path):
+    seen = []
+    unsubscribe = manager.subscribe("voice", lambda name, changes, snap: seen.append((name, changes, snap["style"])))
+    everything = []
+    manager.subscribe(ALL_CONFIGS, lambda name, changes, snap: everything.append(name))
+
+    manager.set("voice", "style", "温柔姐姐")
+    manager.set("voice", "style", "温柔姐姐")          # 没变化不通知
+    manager.update("sound", {"volume": 0.2, "music_enabled": True})
+    assert seen == [("voice", {"style": "温柔姐姐"}, "温柔姐姐")]
+    assert everything == ["voice", "sound"]
+
+    # 回调里再改配置不会死锁；回调出错不影响别的监听者
+    def chain(name, changes, snap):
+        if snap["volume"] < 0.5:
+            manager.set("sound", "volume", 0.5)
+    manager.subscribe("sound", lambda *a: 1 / 0)
+    manager.subscribe("sound", chain)
+    manager.set("sound", "volume", 0.1)
+    assert manager.get("sound", "volume") == 0.5
+
+    # 别处改了文件，reload 推送变化
+    manager.save_all()
+    (tmp_path / "voice_config.json").write_text('{"style": "活泼哥哥"}', encoding="utf-8")
+    manager.reload("voice")
+    assert seen[-1] == ("voice", {"style": "活泼哥哥"}, "活泼哥哥")
+
+    unsubscribe()
+    manager.save("voice", {"style": "可爱童声"})
+    assert len(seen) == 2 and _read(tmp_path, "voice_config.json") == {"style": "可爱童声"}
+    print("✅ 订阅配置变化")
+
+
+def test_concurrent_get_and_set(manager, tmp_path):
+    """8 个线程同时读写：读到的快照总是一致的，最后保存的是最新值"""
+    errors = []
+    stop = threading.Event()
+
+    def writer(n):
+        try:
+            for i in range(500):
+                manager.update("sound", {f"w{n}": i, f"w{n}_copy": i})
+                manager.set(f"extra{n % 2}", "last", i)
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        try:
+            while not stop.is_set():
+                snap = manager.snapshot("sound")
+                for n in range(4):
+                    assert snap.get(f"w{n}") == snap.get(f"w{n}_copy")
+                manager.get("sound", "volume")
+                manager.get("extra0", "last")
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join(30)
+    stop.set()
+    for t in readers:
+        t.join(5)
+    assert not errors and not any(t.is_alive() for t in readers + writers)
+
+    manager.save_all()
+    saved = _read(tmp_path, "sound_settings.json")
+    assert all(saved[f"w{n}"] == 499 for n in range(4))
+    assert saved == dict(manager.snapshot("sound"))
+    assert _read(tmp_path, "extra0.json") == {"last": 499}
+    print("✅ 多线程读写一致")
+
+
+def test_voice_cache_follows_manager(tmp_path, monkeypatch):
+    """通过配置管理器改语音风格，语音缓存马上换，不用等下次检查文件"""
+    import voice_config_shared as vcs
+    monkeypatch.setattr(vcs, "CONFIG_FILE", str(tmp_path / "voice_config.json"))
+    monkeypatch.setattr(vcs, "_config_cache", None)
+    assert vcs.get_current_style()[0] == vcs.DEFAULT_STYLE
+    vcs._on_voice_config_changed("voice", {"style": "温柔姐姐"}, MappingProxyType({"style": "温柔姐姐"}))
+    assert vcs.get_voice() == vcs.VOICE_STYLES["温柔姐姐"]["voice"]
+    print("✅ 语音缓存跟着配置管理器走")
+
+
+def test_theme_settings_go_through_manager(manager, tmp_path, monkeypatch):
+    """主题设置经配置管理器读写，订阅者收到变化"""
+    import theme_config
+    monkeypatch.setattr(theme_config, "config_manager", manager)
+    seen = []
+    manager.subscribe("theme", lambda name, changes, snap: seen.append(dict(changes)))
+    assert theme_config.load_settings() == {"current_theme": "paw_patrol"}
+    theme_config.save_settings({"current_theme": "frozen"})
+    assert seen == [{"current_theme": "frozen"}]
+    manager.save_all()
+    assert _read(tmp_path, "theme_settings.json") == {"current_theme": "frozen"}
+    print("✅ 主题设置经配置管理器")
+
+
+def test_failed_write_is_retried(manager, tmp_path):
+    """写文件失败时配置留在待保存里，之后自动重试，不用等下一次 set"""
+    import time
+    target = tmp_path / "missing"
+    manager._config_dir = str(target)    # 目录不存在，写入失败
+    manager.set("sound", "volume", 0.7)
+    time.sleep(0.2)
+    assert manager.has_pending_save("sound")
+    assert not target.exists()
+
+    target.mkdir()                        # 恢复可写，不再调用 set
+    deadline = time.time() + 2
+    while manager.has_pending_save("sound") and time.time() < deadline:
+        time.sleep(0.02)
+    assert not manager.has_pending_save("sound")
+    assert _read(target, "sound_settings.json")["volume"] == 0.7
+    print("✅ 写入失败后自动重试")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
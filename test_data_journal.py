@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+学习数据增量日志测试
+"""
+import os
+import json
+import tempfile
+
+import pytest
+
+import data_journal
+import learning_data
+from data_journal import JsonJournal, diff, diff_paths, apply_ops
+from learning_data import LearningData
+
+
+def _new_journal(**kwargs):
+    path = os.path.join(tempfile.mkdtemp(), "learning_progress.json")
+    return JsonJournal(path, **kwargs)
+
+
+def test_diff_is_small():
+    """只记录变化的字段，列表追加记为 append"""
+    old = {"overall": {"total_score": 10, "total_correct": 3},
+           "notifications": [{"msg": "a"}], "gone": 1}
+    new = {"overall": {"total_score": 15, "total_correct": 3},
+           "notifications": [{"msg": "a"}, {"msg": "b"}], "added": {"x": 1}}
+    ops = diff(old, new)
+    assert {"op": "set", "path": ["overall", "total_score"], "value": 15} in ops
+    assert {"op": "append", "path": ["notifications"], "values": [{"msg": "b"}]} in ops
+    assert {"op": "del", "path": ["gone"]} in ops
+    assert len(ops) == 4
+    assert apply_ops(json.loads(json.dumps(old)), ops) == new
+    print("✅ 增量计算")
+
+
+def test_replay_and_torn_write():
+    """重启后重放日志；最后一行没写完时丢弃"""
+    journal = _new_journal()
+    assert journal.load() is None
+
+    data = {"overall": {"total_score": 0}, "history": []}
+    for i in range(1, 6):
+        data["overall"]["total_score"] = i
+        data["history"].append(i)
+        assert journal.record(data) == 2
+    assert journal.record(data) == 0
+
+    # 模拟写到一半断电
+    with open(journal.journal_path, "ab") as f:
+        f.write(b'{"seq": 6, "ops": [{"op": "se')
+
+    loaded = JsonJournal(journal.snapshot_path).load()
+    assert loaded == data
+    # 残缺的行已被截掉，继续追加不会和它粘在一起
+    again = JsonJournal(journal.snapshot_path)
+    again.load()
+    data["overall"]["total_score"] = 99
+    again.record(data)
+    assert JsonJournal(journal.snapshot_path).load()["overall"]["total_score"] == 99
+    print("✅ 日志重放")
+
+
+def test_compaction():
+    """日志过大时合并成快照，之后旧记录不会重复应用"""
+    journal = _new_journal(compact_bytes=300)
+    journal.load()
+    data = {"items": []}
+    for i in range(20):
+        data["items"].append({"n": i})
+        journal.record(data)
+    assert os.path.exists(journal.snapshot_path)
+    assert journal._journal_size < 300
+
+    with open(journal.snapshot_path, "r", encoding="utf-8") as f:
+        assert json.load(f)["_journal_seq"] > 0
+    assert JsonJournal(journal.snapshot_path).load() == data
+
+    # 合并后、清空日志前崩溃：日志里残留的记录已在快照中
+    journal.compact(data)
+    with open(journal.journal_path, "ab") as f:
+        f.write(json.dumps({"seq": 1, "ops": [{"op": "append", "path": ["items"],
+                                               "values": [{"n": 0}]}]}).encode() + b"\n")
+    assert JsonJournal(journal.snapshot_path).load() == data
+    print("✅ 快照合并")
+
+
+def test_reads_old_snapshot_format():
+    """以前保存的 learning_progress.json（没有日志）照常读取"""
+    journal = _new_journal()
+    with open(journal.snapshot_path, "w", encoding="utf-8") as f:
+        json.dump({"overall": {"total_score": 42}}, f)
+    assert journal.load() == {"overall": {"total_score": 42}}
+
+
+
+def _count_diffs(monkeypatch):
+    """记录 diff 比较过的路径"""
+    seen = []
+    original = data_journal.diff
+
+    def counting(old, new, path=()):
+        seen.append(path)
+        return original(old, new, path)
+
+    monkeypatch.setattr(data_journal, "diff", counting)
+    return seen
+
+
+def test_touched_paths_only(monkeypatch):
+    """标记了路径只比较这些子树；没标记时比较整份数据"""
+    journal = _new_journal()
+    journal.load()
+    data = {"overall": {"total_score": 0}, "history": list(range(1000)), "plan": {"n": 0}}
+    journal.record(data)
+
+    seen = _count_diffs(monkeypatch)
+    data["overall"]["total_score"] = 5
+    data["plan"]["n"] = 1
+    data["history"].pop(0)                      # 没标记：这次不写
+    journal.touch(("overall",), ("overall", "total_score"), ("plan", "n"), ("gone",))
+    assert journal.record(data) == 2
+    assert ("history",) not in seen and () not in seen
+
+    # 标记的路径被删掉/新增
+    del data["plan"]
+    data["added"] = {"x": 1}
+    journal.touch(("plan", "n"), ("plan",), ("added",))
+    assert journal.record(data) == 2
+
+    # 没有标记：整份比较，前面漏掉的列表改动也写进去
+    seen.clear()
+    assert journal.record(data) == 1 and () in seen
+    assert JsonJournal(journal.snapshot_path).load() == data
+    assert diff_paths({"a": {"b": 1}}, {"a": {"b": 2}}, [("a",), ("a", "b")]) == \
+        [{"op": "set", "path": ["a", "b"], "value": 2}]
+    print("✅ 只比较标记的子树")
+
+
+def test_touched_kept_when_write_fails(monkeypatch):
+    journal = _new_journal()
+    journal.load()
+    data = {"a": 1, "b": 1}
+    journal.record(data)
+    data["a"] = 2
+    journal.touch(("a",))
+    monkeypatch.setattr(journal, "journal_path", os.path.join(journal.snapshot_path, "no", "dir"))
+    with pytest.raises(OSError):
+        journal.record(data)
+    monkeypatch.undo()
+    assert journal.record(data) == 1
+    assert JsonJournal(journal.snapshot_path).load() == data
+    print("✅ 写入失败保留标记")
+
+
+def test_learning_data_marks_changes(tmp_path, monkeypatch):
+    """答题、删错题只比较改过的子树，重放结果和内存里的数据一致"""
+    monkeypatch.setattr(learning_data, "PROGRESS_FILE", str(tmp_path / "progress.json"))
+    monkeypatch.setattr(learning_data, "sqlite_enabled", lambda: False)
+    monkeypatch.setattr(LearningData, "_instance", None)
+    ld = LearningData()
+    for i in range(5):
+        ld.add_wrong_question("math", {"question": f"{i}+1"})
+    ld.add_score("math", 10, True, 2.0)
+    ld._do_save()
+
+    seen = _count_diffs(monkeypatch)
+    ld.add_score("literacy", 10, False, 3.0)
+    ld.remove_wrong_question("math", "0+1")
+    ld._do_save()
+    assert () not in seen
+    assert ("mastered_items",) not in seen and ("wrong_questions", "literacy") not in seen
+    assert ("wrong_questions", "math") in seen and ("modules", "literacy") in seen
+    assert JsonJournal(learning_data.PROGRESS_FILE).load() == json.loads(json.dumps(ld.data))
+
+    # 没有标记的修改照样保存（整份比较）
+    ld.update_parent_settings(daily_time_limit=45)
+    ld._do_save()
+    assert () in seen
+    saved = JsonJournal(learning_data.PROGRESS_FILE).load()
+    assert saved == json.loads(json.dumps(ld.data))
+    ld._dirty = False
+    print("✅ LearningData 只比较改过的部分")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
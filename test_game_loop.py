@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+固定步长游戏循环测试（用假时钟和假窗口，不需要显示器）
+"""
+import game_loop
+from game_loop import FixedStepLoop, FrameStats
+from canvas_scene import CanvasScene
+from test_canvas_scene import FakeCanvas
+
+
+class FakeWindow:
+    """记录 after() 调用的假窗口"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func):
+        self.pending.append((ms, func))
+        return len(self.pending)
+
+    def after_cancel(self, after_id):
+        self.pending.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(window, clock, ticks, extra_ms=0, work_ms=0):
+    """执行 ticks 次调度；extra_ms 模拟 after 来晚了，work_ms 模拟每帧绘制耗时"""
+    for _ in range(ticks):
+        if not window.pending:
+            return
+        ms, func = window.pending.pop()
+        clock.now += (ms + extra_ms) / 1000
+        func()
+        clock.now += work_ms / 1000
+
+
+def _make_loop(monkeypatch, **kwargs):
+    clock = FakeClock()
+    monkeypatch.setattr(game_loop.time, "perf_counter", clock)
+    window = FakeWindow()
+    calls = {"update": 0, "render": 0}
+
+    def update():
+        calls["update"] += 1
+
+    def render():
+        calls["render"] += 1
+
+    loop = FixedStepLoop(window, update, render, **kwargs)
+    return loop, window, clock, calls
+
+
+def test_frame_stats_ring_buffer():
+    """环形缓冲区只保留最近 capacity 帧，按时间顺序返回"""
+    stats = FrameStats(capacity=4)
+    for i in range(6):
+        stats.record(50 + i, 1, 2, 1 if i < 5 else 3)
+    assert len(stats) == 4 and stats.count == 6
+    assert stats.values("interval") == [52, 53, 54, 55]
+    assert stats.mean("render") == 2
+    assert stats.percentile("interval", 100) == 55
+    assert stats.skipped == 2
+    assert round(stats.fps(), 1) == round(1000 / 53.5, 1)
+    assert stats.summary()["frames"] == 6
+
+
+def test_fixed_steps_on_time(monkeypatch):
+    """按时调度时每帧一次更新一次绘制"""
+    loop, window, clock, calls = _make_loop(monkeypatch, step_ms=50)
+    loop.start()
+    _run(window, clock, 20)
+    assert calls == {"update": 21, "render": 21}
+    assert loop.stats.skipped == 0 and loop.stats.dropped_steps == 0
+    assert round(loop.stats.fps()) == 20
+
+
+def test_slow_frames_catch_up(monkeypatch):
+    """绘制慢时补上更新：游戏速度按真实时间走，只是少画几帧"""
+    loop, window, clock, calls = _make_loop(monkeypatch, step_ms=50)
+    loop.start()
+    start = clock.now
+    _run(window, clock, 30, work_ms=100)
+    elapsed_ms = (clock.now - start) * 1000
+    # 每个 50ms 都有一次更新，但绘制次数少得多
+    assert abs(calls["update"] - elapsed_ms / 50) <= 2
+    assert calls["render"] == 31
+    assert loop.stats.skipped == calls["update"] - calls["render"]
+
+
+def test_long_stall_drops_steps(monkeypatch):
+    """卡住很久（例如拖动窗口）时最多补 max_steps 步，剩下的丢掉"""
+    loop, window, clock, calls = _make_loop(monkeypatch, step_ms=50, max_steps=5)
+    loop.start()
+    _run(window, clock, 1, extra_ms=1000)
+    assert calls["update"] == 1 + 5
+    assert loop.stats.dropped_steps == 16
+    # 之后恢复正常节奏
+    _run(window, clock, 5)
+    assert calls["update"] == 11 and calls["render"] == 7
+
+
+def test_stops_when_inactive(monkeypatch):
+    """active() 返回 False 后画完最后一帧就停"""
+    clock = FakeClock()
+    monkeypatch.setattr(game_loop.time, "perf_counter", clock)
+    window = FakeWindow()
+    state = {"running": True, "steps": 0, "rendered": []}
+
+    def update():
+        state["steps"] += 1
+        if state["steps"] == 3:
+            state["running"] = False
+
+    loop = FixedStepLoop(window, update, lambda: state["rendered"].append(state["steps"]),
+                         active=lambda: state["running"])
+    loop.start()
+    _run(window, clock, 10)
+    assert state["rendered"] == [1, 2, 3]
+    assert not loop.running and not window.pending
+
+
+def test_scene_frame_and_overlay(monkeypatch):
+    """给了 scene 时自动 begin/end_frame，打开 F3 后显示帧率"""
+    canvas = FakeCanvas()
+    scene = CanvasScene(canvas)
+    pos = {"x": 0}
+
+    def update():
+        pos["x"] += 5
+
+    loop, window, clock, _ = _make_loop(monkeypatch, step_ms=50)
+    loop.update = update
+    loop.scene = scene
+    loop.render = lambda: scene.sprite("dot", lambda c, x, y: c.create_oval(x, y, x + 4, y + 4),
+                                       pos["x"], 10)
+    monkeypatch.setattr(game_loop, "_overlay_enabled", False)
+    loop.start()
+    assert "_fps_overlay" not in scene
+    assert game_loop.toggle_overlay() is True
+    _run(window, clock, 3)
+    assert "_fps_overlay" in scene and "dot" in scene
+    game_loop.toggle_overlay()
+    _run(window, clock, 1)
+    # 关掉后角标在下一帧被删除
+    assert "_fps_overlay" not in scene and len(scene) == 1
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+语音预生成脚本测试
+使用本地假的生成函数，不需要网络
+"""
+import os
+import asyncio
+import tempfile
+
+import generate_audio_v2 as gen
+
+
+async def fake_synthesizer(text, voice, rate, filepath):
+    """假的 TTS：把输入写进文件"""
+    await asyncio.sleep(0)
+    with open(filepath, "wb") as f:
+        f.write(f"{voice}|{rate}|{text}".encode("utf-8"))
+
+
+def _run(plan, output_dir, voice=gen.VOICE):
+    manifest = gen.load_manifest(output_dir)
+    diff = gen.diff_plan(plan, manifest, output_dir, voice=voice)
+    tasks = [(name, text) for name, text, _ in diff["new"] + diff["changed"]]
+    failed = asyncio.run(gen.generate_all(tasks, output_dir, manifest,
+                                          synthesizer=fake_synthesizer, voice=voice, jobs=3))
+    return diff, failed
+
+
+def test_incremental_generation():
+    """只重新生成输入变化了的文件"""
+    print("=" * 50)
+    print("测试增量生成")
+    print("=" * 50)
+
+    output_dir = tempfile.mkdtemp()
+    plan = [("char_4e00.mp3", "一"), ("char_4e8c.mp3", "二"), ("welcome.mp3", "欢迎")]
+
+    diff, failed = _run(plan, output_dir)
+    print(f"第一次: 新增 {len(diff['new'])}")
+    assert len(diff["new"]) == 3 and not failed
+    assert set(gen.load_manifest(output_dir)) == {name for name, _ in plan}
+
+    # 再跑一次，什么都不用做
+    diff, _ = _run(plan, output_dir)
+    print(f"第二次: 不变 {len(diff['unchanged'])}")
+    assert len(diff["unchanged"]) == 3 and not diff["new"] and not diff["changed"]
+
+    # 改文字只重新生成这一个
+    plan[2] = ("welcome.mp3", "欢迎来到乐园")
+    diff, _ = _run(plan, output_dir)
+    assert [name for name, _, _ in diff["changed"]] == ["welcome.mp3"]
+    with open(os.path.join(output_dir, "welcome.mp3"), "rb") as f:
+        assert f.read().decode("utf-8").endswith("欢迎来到乐园")
+
+    # 换语音全部重新生成
+    diff, _ = _run(plan, output_dir, voice="zh-CN-YunxiNeural")
+    assert len(diff["changed"]) == 3
+
+    # 从列表中去掉的文件显示为已移除
+    diff = gen.diff_plan(plan[:2], gen.load_manifest(output_dir), output_dir,
+                         voice="zh-CN-YunxiNeural")
+    assert [name for name, _, _ in diff["removed"]] == ["welcome.mp3"]
+
+    print("\n✅ 增量生成测试通过!")
+
+
+def test_dry_run_changes_nothing():
+    """--dry-run 不生成也不写清单"""
+    output_dir = tempfile.mkdtemp()
+    assert gen.main(["--dry-run", "--output", output_dir]) == 0
+    assert os.listdir(output_dir) == []
+
+
+if __name__ == "__main__":
+    test_incremental_generation()
+    test_dry_run_changes_nothing()
+    print("\n" + "=" * 50)
+    print("🎉 所有测试通过!")
+    print("=" * 50)
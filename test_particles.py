@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+粒子池测试（只测模拟部分，不需要 Kivy）
+"""
+import gc
+import os
+import sys
+import weakref
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_kivy"))
+
+from particles import ParticlePool, SHAPES
+
+
+def _run(pool, seconds, fps=60):
+    finished = []
+    for _ in range(int(seconds * fps)):
+        finished += pool.step(1 / fps)
+    return finished
+
+
+def test_particle_motion():
+    """和原来的 Animation 一样：按 out_quad 移到终点，同时淡出"""
+    pool = ParticlePool(capacity=4)
+    p = pool.spawn("star", 100, 100, 200, 300, size=20, color=(1, 1, 0), duration=1.0, spin=360)
+    assert (p.x, p.y, p.opacity) == (100, 100, 1.0)
+    pool.step(0.5)
+    # out_quad(0.5) = 0.75
+    assert abs(p.x - 175) < 1e-6 and abs(p.y - 250) < 1e-6
+    assert abs(p.angle - 270) < 1e-6 and abs(p.opacity - 0.5) < 1e-6
+    assert pool.step(0.5) == [p] and not p.alive and len(pool) == 0
+    print("✅ 粒子运动")
+
+
+def test_delay_and_fades():
+    """延迟出现、淡入、停留、淡出（爪印轨迹）"""
+    pool = ParticlePool(capacity=4)
+    p = pool.spawn("paw", 10, 10, 10, 10, size=30, color=(0.5, 0.4, 0.4), alpha=0.7,
+                   duration=1.8, delay=0.3, fade_in=0.3, fade_out=0.5)
+    assert p.opacity == 0
+    pool.step(0.45)
+    assert abs(p.opacity - 0.35) < 1e-6
+    pool.step(0.6)
+    assert abs(p.opacity - 0.7) < 1e-6
+    pool.step(0.95)
+    assert p.alive and abs(p.opacity - 0.7 * 0.2) < 1e-6
+    assert pool.step(0.11) == [p]
+    print("✅ 延迟和淡入淡出")
+
+
+def test_pool_reuse_and_cap():
+    """槽位反复使用；超过上限时回收最老的粒子，不会无限增长"""
+    pool = ParticlePool(capacity=20)
+    slots = {id(p) for p in pool.particles}
+    # 模拟连续快速答对：每 0.1 秒一次 15 个纸屑
+    for burst in range(30):
+        for i in range(15):
+            pool.spawn("circle", 0, 0, i, i, size=12, color=(1, 0, 0), duration=1.2)
+        _run(pool, 0.1)
+        assert len(pool) <= 20
+    assert {id(p) for p in pool.particles} == slots
+    assert pool.spawned == 450 and pool.recycled > 0
+    # 最老的先被回收，剩下的都是最近生成的
+    assert all(p.age < 0.5 for p in pool.live)
+    _run(pool, 2)
+    assert len(pool) == 0 and len(pool._free) == 20
+    print("✅ 对象池和上限")
+
+
+def test_shapes_are_triangles():
+    """所有形状都是三角形列表，主体在半径约 1 的范围内"""
+    for name, (body, detail, detail_color) in SHAPES.items():
+        assert len(body) % 3 == 0 and len(detail) % 3 == 0, name
+        assert max(max(abs(x), abs(y)) for x, y in body) <= 1.05, name
+        assert (detail_color is None) == (not detail), name
+    print("✅ 形状")
+
+
+def test_emitter_does_not_pin_parent():
+    """发射器记在父控件身上，父控件不用了能被回收（需要 Kivy）"""
+    pytest.importorskip("kivy")
+    from kivy.uix.widget import Widget
+    from particles import get_emitter
+
+    parent = Widget()
+    emitter = get_emitter(parent)
+    assert get_emitter(parent) is emitter and emitter.parent is parent
+    ref = weakref.ref(parent)
+    del parent, emitter
+    gc.collect()
+    assert ref() is None
+    print("✅ 父控件可以被回收")
+
+
+if __name__ == "__main__":
+    test_particle_motion()
+    test_delay_and_fades()
+    test_pool_reuse_and_cap()
+    test_shapes_are_triangles()
+    print("\n🎉 所有测试通过!")
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 学习进度存储测试
+"""
+import os
+import json
+import tempfile
+
+from progress_store import SqliteProgressStore
+
+
+def _review(category, item, next_review, review_count=0, correct_streak=0):
+    return {"item": item, "display_name": item, "category": category,
+            "learn_date": "2026-01-01", "review_count": review_count,
+            "next_review": next_review, "ease_factor": 2.5, "correct_streak": correct_streak}
+
+
+def _make_json_files(folder):
+    progress = {
+        "overall": {"total_score": 12},
+        "review_items": {
+            "literacy": [_review("literacy", "天", "2026-01-03"),
+                         _review("literacy", "地", "2026-01-01", 6, 3)],
+            "math": [_review("math", "1+1", "2026-01-05")],
+        },
+    }
+    mastery = {"可": {"level": 0, "score": 1, "correct": 1, "wrong": 0,
+                     "last_seen": "2026-01-23", "first_seen": "2026-01-23"}}
+    progress_file = os.path.join(folder, "learning_progress.json")
+    mastery_file = os.path.join(folder, "char_mastery.json")
+    with open(progress_file, "w", encoding="utf-8") as f:
+        json.dump(progress, f, ensure_ascii=False)
+    with open(mastery_file, "w", encoding="utf-8") as f:
+        json.dump(mastery, f, ensure_ascii=False)
+    return progress_file, mastery_file, mastery
+
+
+def test_migration_from_json():
+    """从 learning_progress.json 和 char_mastery.json 迁移，只做一次"""
+    folder = tempfile.mkdtemp()
+    progress_file, mastery_file, mastery = _make_json_files(folder)
+    store = SqliteProgressStore(os.path.join(folder, "learning_progress.db"))
+
+    assert store.migrate_from_json(progress_file, mastery_file) == 3
+    assert store.migrate_from_json(progress_file, mastery_file) == 0
+    assert store.load_sections() == {"overall": {"total_score": 12}}
+    assert store.load_char_mastery() == mastery
+    assert store.get_review("literacy", "天")["next_review"] == "2026-01-03"
+    store.close()
+    print("✅ JSON 迁移")
+
+
+def test_review_queries():
+    """到期查询、统计、日历和单项更新"""
+    folder = tempfile.mkdtemp()
+    store = SqliteProgressStore(os.path.join(folder, "learning_progress.db"))
+    store.add_review(_review("literacy", "天", "2026-01-03"))
+    store.add_review(_review("literacy", "地", "2026-01-01", 6, 3))
+    store.add_review(_review("math", "1+1", "2026-01-05"))
+    assert not store.add_review(_review("literacy", "天", "2026-02-01"))
+
+    due = store.due_reviews("2026-01-03")
+    assert [r["item"] for r in due] == ["地", "天"]
+    assert [r["item"] for r in store.due_reviews("2026-01-03", "math")] == []
+
+    stats = store.review_stats("2026-01-03")
+    assert stats["literacy"] == {"total": 2, "due": 2, "mastered": 1}
+    assert stats["math"] == {"total": 1, "due": 0, "mastered": 0}
+
+    assert store.review_calendar("2026-01-01", "2026-01-04") == {"2026-01-01": 1, "2026-01-03": 1}
+
+    r = store.get_review("math", "1+1")
+    r["next_review"] = "2026-01-02"
+    r["last_review"] = "2026-01-01"
+    store.update_reviews([r])
+    assert store.get_review("math", "1+1") == r
+
+    store.remove_review("literacy", "天")
+    store.clear_reviews("math")
+    assert [r["item"] for r in store.due_reviews("2026-12-31")] == ["地"]
+    store.close()
+    print("✅ 复习查询")
+
+
+if __name__ == "__main__":
+    test_migration_from_json()
+    test_review_queries()
+    print("\n🎉 所有测试通过!")
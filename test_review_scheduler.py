@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+复习调度器测试
+"""
+from review_scheduler import ReviewScheduler
+
+
+def _review(category, item, next_review, review_count=0, correct_streak=0):
+    return {"item": item, "category": category, "next_review": next_review,
+            "review_count": review_count, "correct_streak": correct_streak}
+
+
+def _make_scheduler():
+    s = ReviewScheduler(today="2026-01-03")
+    s.add(_review("literacy", "天", "2026-01-03"))
+    s.add(_review("literacy", "地", "2026-01-01", 6, 3))
+    s.add(_review("math", "1+1", "2026-01-02"))
+    s.add(_review("pinyin", "a", "2026-01-05"))
+    return s
+
+
+def test_due_and_pop():
+    """到期数量和逾期最久优先"""
+    s = _make_scheduler()
+    assert not s.add(_review("literacy", "天", "2026-02-01"))
+    assert s.due_count() == 3
+    assert s.due_count("literacy") == 2
+    assert [r["item"] for r in s.due_items()] == ["地", "1+1", "天"]
+
+    r = s.pop_due()
+    assert r["item"] == "地" and s.due_count() == 2
+    # 复习完改期
+    r["next_review"] = "2026-01-10"
+    s.reschedule(r)
+    assert s.due_count() == 2
+
+    # 取出后放弃，放回原处
+    r = s.pop_due("math")
+    assert r["item"] == "1+1" and s.due_count("math") == 0
+    s.restore()
+    assert s.due_count("math") == 1
+    print("✅ 到期与取出")
+
+
+def test_day_change_and_forecast():
+    """跨天后新到期的自动计入；日历只看对应的桶"""
+    s = _make_scheduler()
+    assert s.forecast("2026-01-03", 3) == {"2026-01-03": 1, "2026-01-04": 0, "2026-01-05": 1}
+    s.set_today("2026-01-05")
+    assert s.due_count() == 4 and s.due_count("pinyin") == 1
+    s.set_today("2026-01-02")
+    assert s.due_count() == 2
+
+
+def test_reschedule_and_stats():
+    """改期、掌握数和移除"""
+    s = _make_scheduler()
+    r = s.get("math", "1+1")
+    old = r["next_review"]
+    r.update(next_review="2026-01-20", review_count=5, correct_streak=3)
+    s.reschedule(r, old, was_mastered=False)
+    stats = s.stats()
+    assert stats["math"] == {"total": 1, "due": 0, "mastered": 1}
+    assert stats["literacy"] == {"total": 2, "due": 2, "mastered": 1}
+
+    s.remove("literacy", "地")
+    s.clear("pinyin")
+    assert len(s) == 2 and s.due_count() == 1
+    assert s.forecast("2026-01-05", 1) == {"2026-01-05": 0}
+
+
+
+def test_pop_by_category_skips_other_categories():
+    """按类别取只看这个类别的桶：别的类别逾期再多也不用扫"""
+    s = ReviewScheduler(today="2026-03-01")
+    for i in range(2000):
+        s.add(_review("literacy", f"字{i}", "2026-01-%02d" % (i % 28 + 1)))
+    s.add(_review("math", "2+2", "2026-02-27"))
+    s.add(_review("math", "1+1", "2026-02-20"))
+    s.add(_review("math", "3+3", "2026-03-05"))
+
+    # 按类别遍历时碰到别的类别的桶就会报错
+    for day in list(s._buckets):
+        s._buckets[day] = {k: v for k, v in s._buckets[day].items() if k[0] != "literacy"} or None
+    assert [r["item"] for r in s.due_items("math")] == ["1+1", "2+2"]
+    assert s.pop_due("math")["item"] == "1+1"
+    assert s.pop_due("math")["item"] == "2+2"
+    assert s.pop_due("math") is None and s.pop_due("english") is None
+    assert s.due_count("math") == 0 and s.due_count("literacy") == 2000
+    print("✅ 按类别取出")
+
+
+if __name__ == "__main__":
+    test_due_and_pop()
+    test_day_change_and_forecast()
+    test_reschedule_and_stats()
+    test_pop_by_category_skips_other_categories()
+    print("\n🎉 所有测试通过!")
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+滚动窗口统计和 O(1) 抽题测试
+"""
+import random
+from collections import Counter
+
+import pytest
+
+import learning_data
+from learning_data import LearningData
+from rolling_stats import RingBuffer, Ewma, RollingStats, LevelPool
+
+
+def test_ring_buffer():
+    buf = RingBuffer(3)
+    for v in (1, 0, 1, 1, 0):
+        buf.push(v)
+    assert buf.values() == [1, 1, 0] and buf.total == 2 and len(buf) == 3
+    assert abs(buf.mean() - 2 / 3) < 1e-9
+    buf.clear()
+    assert buf.values() == [] and buf.mean() is None
+    print("✅ 环形缓冲")
+
+
+def test_item_stats_roundtrip():
+    """窗口、衰减正确率、用时，导出再导入不变"""
+    stats = RollingStats(window=4, alpha=0.5)
+    for ok, rt in [(True, 2.0), (False, 4.0), (True, None), (True, 2.0), (True, 1.0)]:
+        stats.record("math", ok, rt)
+    s = stats.get("math")
+    assert s.recent_accuracy() == 75 and s.recent_count() == 4 and s.seen == 5
+    assert abs(s.accuracy.value - 0.9375) < 1e-9
+    assert abs(s.response_time.value - 1.75) < 1e-9
+    again = RollingStats.from_dict(stats.to_dict(), window=4, alpha=0.5).get("math")
+    assert again.to_dict() == s.to_dict()
+    assert Ewma(0.5).update(3) == 3.0
+    print("✅ 每题统计")
+
+
+def _words(n):
+    return [(chr(0x4E00 + i), "", "") for i in range(n)]
+
+
+def test_level_pool_matches_weighted_pool():
+    """分组抽样和原来"每个字按掌握度权重展开"的分布一样"""
+    rng = random.Random(2)
+    words = _words(40)
+    levels = {w[0]: i % 4 for i, w in enumerate(words)}
+    levels.update({w[0]: 0 for w in words[:10]})
+    pool = LevelPool(words, key=lambda w: w[0], level_of=lambda c: levels[c])
+    weights = {0: 50, 1: 30, 2: 15, 3: 5}
+    # 掌握度变了：换组
+    for w in words[20:25]:
+        levels[w[0]] = 3
+        pool.set_level(w[0], 3)
+    assert [pool.size(lv) for lv in range(4)] == [Counter(levels.values())[lv] for lv in range(4)]
+
+    total = sum(weights[levels[w[0]]] for w in words[1:])
+    counts = Counter(pool.sample(weights, exclude=[words[0][0]], rng=rng)[0] for _ in range(100000))
+    assert words[0][0] not in counts
+    for w in words[1:]:
+        expected = weights[levels[w[0]]] / total
+        assert abs(counts[w[0]] / 100000 - expected) < 0.01
+    print("✅ 分组抽样分布")
+
+
+def test_sample_levels_without_replacement():
+    words = _words(30)
+    pool = LevelPool(words, key=lambda w: w[0], level_of=lambda c: ord(c) % 3)
+    target = words[0][0]
+    for _ in range(200):
+        picked = pool.sample_levels([0, 2], 3, exclude=(target,))
+        chars = [w[0] for w in picked]
+        assert len(set(chars)) == 3 and target not in chars
+        assert all(ord(c) % 3 in (0, 2) for c in chars)
+    # 组里不够时有多少给多少
+    assert len(pool.sample_levels([3], 3)) == 0
+    assert pool.is_stale(list(words)) and not pool.is_stale(words)
+    print("✅ 不放回抽干扰项")
+
+
+@pytest.fixture
+def fresh_data(tmp_path, monkeypatch):
+    """临时文件里的新 LearningData（不动真实学习记录）"""
+    monkeypatch.setattr(learning_data, "PROGRESS_FILE", str(tmp_path / "progress.json"))
+    monkeypatch.setattr(learning_data, "sqlite_enabled", lambda: False)
+    monkeypatch.setattr(LearningData, "_instance", None)
+    data = LearningData()
+    yield data
+    data._dirty = False
+
+
+def test_level_follows_recent_answers(fresh_data):
+    """答错了 100 题以后连着答对，难度也能升上去（原来累计正确率升不动）"""
+    for _ in range(100):
+        fresh_data.add_score("math", 0, False)
+    assert fresh_data.get_level("math") == 1
+    for _ in range(20):
+        fresh_data.add_score("math", 10, True, response_time=2.5)
+    assert fresh_data.get_level("math") == 2
+    stats = fresh_data.get_stats("math")
+    assert stats["accuracy"] < 20 and stats["response_time"] == 2.5
+    # 升级后窗口重新计：再答对 5 题不会马上再升
+    for _ in range(5):
+        fresh_data.add_score("math", 10, True)
+    assert fresh_data.get_level("math") == 2
+    # 保存时导出最近表现
+    fresh_data._dirty = True
+    fresh_data._do_save()
+    assert fresh_data.data["recent_stats"]["math"]["recent"] == [1] * 5
+    print("✅ 难度跟着最近表现走")
+
+
+def test_char_stats_drive_mastery_and_pool():
+    """识字游戏：字最近老答错就降回"学习中"，抽题分组跟着变；答得慢不算掌握"""
+    kids_game_v3 = pytest.importorskip("kids_game_v3")
+    game = object.__new__(kids_game_v3.KidsLiteracyGame)
+    game.char_mastery = {"日": {"level": 3, "score": 12, "correct": 12, "wrong": 0,
+                                "last_seen": "", "first_seen": ""}}
+    game.char_stats = RollingStats(window=10)
+    game.save_mastery_data = lambda: None
+    words = [("日", "ri"), ("月", "yue")]
+    game.words = words
+    game._word_pool = LevelPool(words, key=lambda w: w[0], level_of=game.get_char_mastery_level)
+    assert game._word_pool.level("日") == 3
+
+    for _ in range(3):
+        game.update_char_mastery("日", False, 2.0)
+    # 累计分还有 9（掌握），最近 3 次全错
+    assert game.char_mastery["日"]["score"] == 9
+    assert game.get_char_mastery_level("日") == 1 and game._word_pool.level("日") == 1
+
+    game.char_mastery["月"] = dict(game.char_mastery["日"], score=12, level=3)
+    for _ in range(3):
+        game.update_char_mastery("月", True, 15.0)
+    assert game.get_char_mastery_level("月") == 2
+    game.char_stats.reset("月")
+    for _ in range(3):
+        game.update_char_mastery("月", True, 2.0)
+    assert game.get_char_mastery_level("月") == 3
+    print("✅ 每个字的最近表现影响掌握度和抽题")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+反馈音效池测试
+使用假的播放后端，不需要声卡
+"""
+from sound_pool import SoundPool
+
+
+class FakeSound:
+    def __init__(self, path):
+        self.path = path
+        self.playing = False
+
+
+class FakeBackend:
+    """记录加载次数的假后端"""
+
+    def __init__(self):
+        self.loads = []
+        self.unloaded = []
+
+    def load(self, filepath):
+        self.loads.append(filepath)
+        return None if filepath.endswith("bad.mp3") else FakeSound(filepath)
+
+    def play(self, sound):
+        sound.playing = True
+
+    def stop(self, sound):
+        sound.playing = False
+
+    def is_playing(self, sound):
+        return sound.playing
+
+    def unload(self, sound):
+        self.unloaded.append(sound.path)
+
+
+def test_each_clip_decoded_once():
+    """同一个文件只加载一次"""
+    backend = FakeBackend()
+    pool = SoundPool(backend)
+    pool.register("praise", ["a.mp3", "b.mp3"])
+    for _ in range(20):
+        assert pool.play_random("praise")
+    assert sorted(backend.loads) == ["a.mp3", "b.mp3"]
+    assert pool.preload() == 2 and len(backend.loads) == 2
+    print("✅ 每个文件只解码一次")
+
+
+def test_overlap_cap():
+    """同时播放数超过上限时停掉最早的"""
+    backend = FakeBackend()
+    pool = SoundPool(backend, max_voices=2)
+    pool.register("praise", ["a.mp3", "b.mp3", "c.mp3"])
+    for name in ["a.mp3", "b.mp3", "c.mp3"]:
+        pool.play(name)
+    playing = sorted(s.path for s in pool._sounds.values() if s.playing)
+    assert playing == ["b.mp3", "c.mp3"]
+
+    pool.stop_all()
+    assert not any(s.playing for s in pool._sounds.values())
+    print("✅ 同时播放上限")
+
+
+def test_missing_and_broken_files():
+    """没有文件或加载失败时返回 False，交给调用方回退"""
+    pool = SoundPool(FakeBackend())
+    assert not pool.play_random("encourage")
+    pool.register("encourage", ["bad.mp3"])
+    assert not pool.play_random("encourage")
+    assert pool.loaded_count() == 0
+
+
+def test_preload_one_clip_at_a_time():
+    """逐个预加载，每组只加载前几个，名字加载时才转换成路径"""
+    backend = FakeBackend()
+    pool = SoundPool(backend, resolve=lambda name: "pack/" + name)
+    pool.register("praise", [f"p{i}.mp3" for i in range(10)])
+    steps = 0
+    while pool.preload_next("praise", limit=3):
+        steps += 1
+        assert len(backend.loads) == steps
+    assert steps == 3
+    assert backend.loads == ["pack/p0.mp3", "pack/p1.mp3", "pack/p2.mp3"]
+    assert pool.preload("praise", limit=3) == 3 and len(backend.loads) == 3
+    print("✅ 逐个预加载")
+
+
+def test_lru_cap():
+    """超过上限时释放最久没用的，正在播放的保留"""
+    backend = FakeBackend()
+    pool = SoundPool(backend, max_voices=1, max_sounds=2)
+    pool.register("praise", ["a.mp3", "b.mp3", "c.mp3", "d.mp3"])
+    pool.play("a.mp3")
+    pool.preload_next("praise", limit=4)  # b
+    pool.preload_next("praise", limit=4)  # c：a 在播放，释放 b
+    assert list(pool._sounds) == ["a.mp3", "c.mp3"]
+    assert backend.unloaded == ["b.mp3"]
+
+    pool.play("c.mp3")                    # a 被停掉，c 变成最近用的
+    pool.play("d.mp3")                    # 释放 a
+    assert list(pool._sounds) == ["c.mp3", "d.mp3"]
+    assert backend.unloaded == ["b.mp3", "a.mp3"]
+    assert pool.loaded_count() == 2
+    print("✅ 已解码音效数量上限")
+
+
+if __name__ == "__main__":
+    test_each_clip_decoded_once()
+    test_overlap_cap()
+    test_missing_and_broken_files()
+    test_preload_one_clip_at_a_time()
+    test_lru_cap()
+    print("\n🎉 所有测试通过!")
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Tk 精灵图缓存测试（用假的光栅化和假画布，不需要 Pillow 和显示器）
+"""
+import gc
+import weakref
+
+import sprite_cache
+from sprite_cache import SpriteCache, RecordingCanvas, cached, smooth_points, split_runs
+from theme_drawings import ThemeDrawings
+
+
+class FakeCanvas:
+    """记录 create_xxx 调用的假画布"""
+
+    def __init__(self):
+        self.created = []
+        self.deleted = 0      # 编号不超过它的图形已删除
+
+    def find_all(self):
+        return tuple(range(self.deleted + 1, len(self.created) + 1))
+
+    def delete(self, what):
+        assert what == "all"
+        self.deleted = len(self.created)
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return lambda *a, **kw: self.created.append((name[7:], a, kw)) or len(self.created)
+        raise AttributeError(name)
+
+
+class CountingCache(SpriteCache):
+    """不用 Pillow：光栅化只记次数，返回一个假图片"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.rasterized = 0
+
+    def _rasterize(self, canvas, ops):
+        self.rasterized += 1
+        x0, y0, x1, y1 = sprite_cache._bbox(ops)
+        return f"img{self.rasterized}", x0, y0, (x1 - x0) * (y1 - y0) * 4, ()
+
+
+def _pup(canvas, x, y, scale=1.0):
+    canvas.create_oval(x - 10 * scale, y - 10 * scale, x + 10 * scale, y + 10 * scale, fill="#8B7355")
+    canvas.create_polygon(x, y, x + 5, y - 5, x + 10, y, fill="#6B5344", smooth=True)
+    canvas.create_text(x, y + 20, text="汪")
+    canvas.create_line(x - 5, y + 30, x + 5, y + 30, fill="black", width=2)
+
+
+def test_recording_and_runs():
+    """记录图元，文字把图片分成两段，前后顺序不变"""
+    rec = RecordingCanvas()
+    _pup(rec, 0, 0)
+    assert [op[0] for op in rec.ops] == ["oval", "polygon", "text", "line"]
+    assert rec.ops[0][1] == [-10.0, -10.0, 10.0, 10.0]
+    runs = split_runs(rec.ops)
+    assert [(flag, len(ops)) for flag, ops in runs] == [(True, 2), (False, 1), (True, 1)]
+    print("✅ 记录和分段")
+
+
+def test_smooth_points():
+    """和 Tk 一样：开放曲线经过两端点，闭合曲线经过各边中点"""
+    line = smooth_points([0, 0, 10, 10, 20, 0], closed=False, steps=4)
+    assert line[:2] == [0, 0] and line[-2:] == [20, 0]
+    poly = smooth_points([0, 0, 10, 0, 10, 10, 0, 10], closed=True, steps=4)
+    xy = list(zip(poly[0::2], poly[1::2]))
+    for mid in [(5, 0), (10, 5), (5, 10), (0, 5)]:
+        assert any(abs(x - mid[0]) < 1e-9 and abs(y - mid[1]) < 1e-9 for x, y in xy)
+    assert smooth_points([0, 0, 5, 5], closed=False) == [0, 0, 5, 5]
+    print("✅ 平滑曲线")
+
+
+def test_deterministic_keys():
+    """缓存键只看函数和参数：默认值补全，位置不算，局部函数按对象区分"""
+    cache = SpriteCache()
+    assert cache.key(_pup, (), {}) == cache.key(_pup, (1.0,), {}) == cache.key(_pup, (), {"scale": 1.0})
+    assert cache.key(_pup, (0.5,), {}) != cache.key(_pup, (1.0,), {})
+    assert cache.key(_pup, (), {}, variant=1) != cache.key(_pup, (), {}, variant=0)
+    assert cache.key(_pup, (), {})[0] == "test_sprite_cache._pup"
+    a = lambda canvas, x, y: None
+    b = lambda canvas, x, y: None
+    assert cache.key(a, (), {}) != cache.key(b, (), {})
+    print("✅ 确定的缓存键")
+
+
+def test_draw_once_then_place(monkeypatch):
+    """同样的狗狗画 50 次只光栅化一次；每次只有 2 张图片 + 1 个文字"""
+    monkeypatch.setattr(sprite_cache, "PIL_AVAILABLE", True)
+    cache = CountingCache()
+    canvas = FakeCanvas()
+    for i in range(50):
+        cache.draw(canvas, _pup, 100 + i, 200, 1.0)
+    assert cache.rasterized == 2 and cache.stats()["hits"] == 49
+    assert len(canvas.created) == 150
+    last = canvas.created[-3:]
+    assert [kind for kind, _, _ in last] == ["image", "text", "image"]
+    # 图片按左上角放在绘图原点的偏移处
+    kind, coords, options = last[0]
+    assert coords == (149 - 12, 200 - 12) and options["anchor"] == "nw"
+    assert last[1][1] == (149.0, 220.0) and last[1][2]["text"] == "汪"
+    # 画布持有显示中的图片
+    assert set(canvas._sprite_images.values()) == {"img1", "img2"}
+    print("✅ 只光栅化一次")
+
+
+def test_canvas_releases_deleted_images(monkeypatch):
+    """画布清空后，淘汰掉的图片不再被画布拉住"""
+    monkeypatch.setattr(sprite_cache, "PIL_AVAILABLE", True)
+    cache = CountingCache(max_bytes=1)
+    canvas = FakeCanvas()
+    for frame in range(200):
+        canvas.delete("all")
+        cache.draw(canvas, _pup, 0, 0, 1.0 + frame / 100)
+    shown = canvas._sprite_images
+    assert len(shown) < sprite_cache.SHOWN_PRUNE_MIN
+    print(f"✅ 画布只留 {len(shown)} 张图片")
+
+
+def test_memory_cap(monkeypatch):
+    """超过字节上限时淘汰最久没用的"""
+    monkeypatch.setattr(sprite_cache, "PIL_AVAILABLE", True)
+    cache = CountingCache(max_bytes=100000)
+    canvas = FakeCanvas()
+    for scale in (1, 2, 3, 4, 5, 6):
+        cache.draw(canvas, _pup, 0, 0, scale)
+    assert cache.bytes <= 100000 and cache.evictions > 0
+    rasterized = cache.rasterized
+    cache.draw(canvas, _pup, 0, 0, 6)
+    assert cache.rasterized == rasterized
+    cache.draw(canvas, _pup, 0, 0, 1)
+    assert cache.rasterized > rasterized
+    print("✅ 内存上限")
+
+
+def test_without_pillow_draws_directly(monkeypatch):
+    """没有 Pillow 时和原来一样直接画"""
+    monkeypatch.setattr(sprite_cache, "PIL_AVAILABLE", False)
+    canvas = FakeCanvas()
+    cached(_pup)(canvas, 0, 0)
+    assert [kind for kind, _, _ in canvas.created] == ["oval", "polygon", "text", "line"]
+    assert cached(_pup) is cached(_pup)
+    print("✅ 没有 Pillow")
+
+
+def test_method_wrapper_does_not_keep_owner(monkeypatch):
+    """cached(self.draw_xxx) 每次是同一个包装，但不让界面对象一直活着"""
+    monkeypatch.setattr(sprite_cache, "PIL_AVAILABLE", True)
+    monkeypatch.setattr(sprite_cache, "_cache", CountingCache())
+
+    class App:
+        def draw_car(self, canvas, x, y, scale=1.0):
+            _pup(canvas, x, y, scale)
+
+    app = App()
+    assert cached(app.draw_car) is cached(app.draw_car)
+    assert cached(App().draw_car) is not cached(app.draw_car)
+    canvas = FakeCanvas()
+    cached(app.draw_car)(canvas, 0, 0)
+    cached(app.draw_car).uncached(canvas, 0, 0)
+    assert len(canvas.created) == 3 + 4
+    ref = weakref.ref(app)
+    del app
+    gc.collect()
+    assert ref() is None
+    print("✅ 绑定方法的包装不拉住对象")
+
+
+def test_puppies_collapse_to_few_items(monkeypatch):
+    """汪汪队狗狗：几十上百个图元 -> 几个图片/文字"""
+    monkeypatch.setattr(sprite_cache, "PIL_AVAILABLE", True)
+    cache = CountingCache()
+    monkeypatch.setattr(sprite_cache, "_cache", cache)
+    for name in ("chase", "marshall", "skye", "rubble", "rocky", "zuma"):
+        draw = getattr(ThemeDrawings, f"draw_puppy_{name}")
+        rec = RecordingCanvas()
+        draw.uncached(rec, 100, 100, 0.6)
+        canvas = FakeCanvas()
+        draw(canvas, 100, 100, 0.6)
+        draw(canvas, 300, 100, 0.6)
+        per_draw = len(canvas.created) // 2
+        print(f"  {name}: {len(rec.ops)} 个图元 -> {per_draw} 个")
+        assert len(rec.ops) >= 50 and per_draw <= 5
+    print("✅ 狗狗图元合并")
+
+
+if __name__ == "__main__":
+    import sys
+    import pytest
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
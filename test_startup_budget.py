@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+冷启动预算测试
+每个入口在新进程里无界面导入一次，超出 startup_profiler.DEFAULT_BUDGETS_MS 就失败。
+预算可以用环境变量 LELE_STARTUP_BUDGET_MS 统一放宽（慢的机器上）。
+"""
+import os
+import sys
+import json
+import tempfile
+import importlib.util
+import subprocess
+
+import pytest
+
+import startup_profiler
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 桌面版入口（各 .bat 启动的程序）
+TK_ENTRIES = ["kids_learning_main", "kids_game_v3", "kids_pinyin", "kids_math",
+              "kids_english", "kids_thinking", "kids_vehicles"]
+# Kivy 版入口，需要安装 kivy
+KIVY_ENTRIES = ["main", "app_main", "chinese_app"]
+
+
+def _cold_import(entry):
+    """新进程中导入入口，返回报告"""
+    fd, report = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_FILELOG="1")
+        env.pop(startup_profiler.PROFILE_ENV, None)
+        proc = subprocess.run(
+            [sys.executable, os.path.join(ROOT, "startup_profiler.py"), entry, "--output", report],
+            cwd=ROOT, env=env, capture_output=True, text=True, encoding="utf-8",
+            errors="replace", timeout=120)
+        assert os.path.getsize(report) > 0, f"{entry} 导入失败:\n{proc.stdout}\n{proc.stderr}"
+        with open(report, encoding="utf-8") as f:
+            data = json.load(f)
+        data["returncode"] = proc.returncode
+        return data
+    finally:
+        os.remove(report)
+
+
+def _check(entry):
+    data = _cold_import(entry)
+    assert data["entry"] == entry and data["import_count"] > 0
+    assert not data["over_budget"], \
+        f"{entry} 冷启动 {data['total_ms']:.0f}ms 超出预算 {data['budget_ms']:.0f}ms，" \
+        f"最慢的模块: {[i['module'] for i in data['imports'][:5]]}"
+    assert data["returncode"] == 0
+    print(f"✅ {entry}: {data['total_ms']:.0f}ms / 预算 {data['budget_ms']:.0f}ms")
+
+
+def test_tk_entries_within_budget():
+    """桌面版入口"""
+    for entry in TK_ENTRIES:
+        _check(entry)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("kivy") is None, reason="未安装 kivy")
+def test_kivy_entries_within_budget():
+    """Kivy 版入口（没有安装 kivy 时跳过）"""
+    for entry in KIVY_ENTRIES:
+        _check(entry)
+
+
+def test_profiler_records_phases():
+    """分析器记录导入、阶段和首帧"""
+    sys.modules.pop("colorsys", None)
+    profiler = startup_profiler.StartupProfiler("demo")
+    profiler.install()
+    try:
+        with profiler.phase("font_config"):
+            import colorsys  # noqa: F401  一个小模块，只为触发计时
+    finally:
+        profiler.uninstall()
+    profiler.mark("first_frame")
+    data = profiler.report()
+    assert "colorsys" in [i["module"] for i in data["imports"]]
+    assert [p["name"] for p in data["phases"]] == ["font_config"]
+    assert data["first_frame_ms"] is not None
+    # 卸下后模块看到的是原来的加载器
+    assert type(sys.modules["colorsys"].__loader__).__name__ != "_TimedLoader"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q", "-s", "-rs"]))
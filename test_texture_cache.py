@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+离屏纹理缓存测试（只测缓存和分档逻辑，不需要 Kivy）
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_kivy"))
+
+from texture_cache import TextureCache, size_bucket, cache_enabled, SIZE_STEP, MARGIN
+
+
+def test_size_bucket():
+    """同一档位内的尺寸变化用同一张纹理，纹理总是盖得住控件加边距"""
+    assert size_bucket(200) == size_bucket(205)
+    assert size_bucket(200) != size_bucket(260)
+    for side in (1, 30, 45, 199, 200, 333.3, 800):
+        px = size_bucket(side)
+        assert px % SIZE_STEP == 0 and px >= side * MARGIN
+        assert px - side * MARGIN < SIZE_STEP
+    print("✅ 尺寸分档")
+
+
+def test_lru_by_bytes():
+    """超过字节上限时淘汰最久没用的"""
+    cache = TextureCache(max_bytes=100)
+    made = []
+
+    def make(name):
+        made.append(name)
+        return name
+
+    cache.get_or_create("a", 40, lambda: make("a"))
+    cache.get_or_create("b", 40, lambda: make("b"))
+    # 用一下 a，b 就成了最久没用的
+    assert cache.get_or_create("a", 40, lambda: make("a")) == "a"
+    cache.get_or_create("c", 40, lambda: make("c"))
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.bytes == 80 and cache.evictions == 1
+    assert made == ["a", "b", "c"]
+    assert cache.stats()["hits"] == 1
+    print("✅ LRU 按字节淘汰")
+
+
+def test_oversized_item_is_kept():
+    """单个纹理超过上限也保留（刚画好的那张总要能显示）"""
+    cache = TextureCache(max_bytes=10)
+    cache.put("a", "a", 5)
+    cache.put("big", "big", 50)
+    assert len(cache) == 1 and "big" in cache and cache.bytes == 50
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0
+    print("✅ 超大纹理")
+
+
+def test_unchanged_pictures_hit_cache():
+    """看图识字：来回切换同样的汉字，只有第一次离屏绘制"""
+    cache = TextureCache()
+    renders = []
+    for _ in range(20):
+        for char in "日月水火山":
+            for side in (300, 301, 310):       # 布局抖动几像素
+                px = size_bucket(side)
+                cache.get_or_create(("picture", char, px), px * px * 4,
+                                    lambda: renders.append(char) or char)
+    assert renders == list("日月水火山")
+    print("✅ 不变的图片只画一次")
+
+
+def test_env_switch(monkeypatch):
+    monkeypatch.delenv("LELE_TEXTURE_CACHE", raising=False)
+    assert cache_enabled()
+    monkeypatch.setenv("LELE_TEXTURE_CACHE", "0")
+    assert not cache_enabled()
+    print("✅ 环境变量开关")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
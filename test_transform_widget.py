@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+变换装饰控件测试
+- 星星轮廓和原来的画法一致（不需要 Kivy）
+- 100 颗旋转的星星：原来每帧重建 canvas vs 现在只改 Rotate（需要 Kivy）
+"""
+import math
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_kivy"))
+
+from transform_widget import star_points, KIVY_AVAILABLE
+
+STARS = 100
+FRAMES = 120
+
+
+def _old_star_points(cx, cy, r):
+    """原来 StarWidget.draw 里的算法（绝对坐标）"""
+    points = []
+    for i in range(5):
+        angle = math.radians(90 + i * 72)
+        points.extend([cx + r * math.cos(angle), cy + r * math.sin(angle)])
+        angle = math.radians(90 + i * 72 + 36)
+        points.extend([cx + r * 0.4 * math.cos(angle), cy + r * 0.4 * math.sin(angle)])
+    return points
+
+
+def test_star_points_match_old_drawing():
+    """以中心为原点的轮廓平移回去，和原来的绝对坐标一样"""
+    cx, cy, r = 137.5, 62.0, 10.0
+    local = star_points(r)
+    old = _old_star_points(cx, cy, r)
+    assert len(local) == len(old) == 20
+    moved = [v + (cx if k % 2 == 0 else cy) for k, v in enumerate(local)]
+    assert all(abs(a - b) < 1e-9 for a, b in zip(moved, old))
+    # 第一个尖角朝上
+    assert abs(local[0]) < 1e-9 and abs(local[1] - r) < 1e-9
+    print("✅ 星星轮廓")
+
+
+def _spin(stars):
+    start = time.process_time()
+    for frame in range(FRAMES):
+        for star in stars:
+            star.rotation = (frame * 3) % 360
+    return time.process_time() - start
+
+
+@pytest.mark.skipif(not KIVY_AVAILABLE, reason="需要 Kivy")
+def test_rotating_stars_benchmark():
+    """100 颗星星转 120 帧：只改 Rotate 比每帧重建 canvas 省 CPU"""
+    from kivy.uix.widget import Widget
+    from kivy.properties import NumericProperty
+    from kivy.graphics import Color, Line, Triangle, Rotate, PushMatrix, PopMatrix
+    from decorations import StarWidget
+
+    class OldStarWidget(Widget):
+        """原来的 StarWidget：rotation 一变就清空 canvas 重建"""
+        rotation = NumericProperty(0)
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.star_color = (1, 0.8, 0)
+            self.bind(size=self.draw, pos=self.draw, rotation=self.draw)
+
+        def draw(self, *args):
+            self.canvas.clear()
+            cx, cy = self.center_x, self.center_y
+            r = min(self.width, self.height) * 0.4
+            with self.canvas:
+                PushMatrix()
+                Rotate(angle=self.rotation, origin=(cx, cy))
+                Color(*self.star_color)
+                points = _old_star_points(cx, cy, r)
+                for i in range(5):
+                    idx = i * 4
+                    Triangle(points=[cx, cy, points[idx], points[idx+1],
+                                     points[(idx+2) % 20], points[(idx+3) % 20]])
+                Line(points=points, width=2, close=True)
+                PopMatrix()
+
+    old_stars = [OldStarWidget(size=(25, 25), pos=(i * 9, i * 5)) for i in range(STARS)]
+    new_stars = [StarWidget(size=(25, 25), pos=(i * 9, i * 5)) for i in range(STARS)]
+    for star in new_stars:
+        star.draw()
+    body = list(new_stars[0]._body.children)
+
+    old_time = _spin(old_stars)
+    new_time = _spin(new_stars)
+    print(f"✅ {STARS} 颗星星 x {FRAMES} 帧: 重建 {old_time*1000:.0f}ms, 只改 Rotate {new_time*1000:.0f}ms")
+    # 图形没有重建，只是角度变了
+    assert list(new_stars[0]._body.children) == body
+    assert new_stars[0]._rotate.angle == new_stars[0].rotation
+    assert new_time < old_time
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+TTS 磁盘缓存测试
+不生成真正的语音，直接往缓存里放假文件
+"""
+import os
+
+import pytest
+
+from tts_cache import TTSCache, make_key, DEFAULT_MAX_BYTES
+
+
+def _put(cache, text, size, voice="v"):
+    """模拟一次生成：写临时文件再 commit"""
+    key = make_key(text, voice)
+    temp = cache.new_temp_path(key)
+    with open(temp, "wb") as f:
+        f.write(b"x" * size)
+    return cache.commit(key, temp)
+
+
+def _set_mtime(cache, text, t, voice="v"):
+    path = cache.path_for(make_key(text, voice))
+    os.utime(path, (t, t))
+
+
+def test_key_is_deterministic():
+    """同样的文字/语音/语速/语言总是同一个键，任何一项不同键就不同"""
+    key = make_key("再试试", "zh-CN-YunxiNeural", "+0%", "cn")
+    assert key == make_key("再试试", "zh-CN-YunxiNeural", "+0%", "cn")
+    assert key == make_key("再试试", "zh-CN-YunxiNeural")      # 默认语速和语言
+    others = {make_key("再试试!", "zh-CN-YunxiNeural"),
+              make_key("再试试", "zh-CN-XiaoyiNeural"),
+              make_key("再试试", "zh-CN-YunxiNeural", "+10%"),
+              make_key("再试试", "zh-CN-YunxiNeural", "+0%", "en")}
+    assert len(others) == 4 and key not in others
+    # 分隔符不会让不同的组合撞在一起
+    assert make_key("a", "bc") != make_key("ab", "c")
+    assert len(key) == 40 and all(c in "0123456789abcdef" for c in key)
+    print("✅ 缓存键确定")
+
+
+def test_get_commit_and_restart(tmp_path):
+    cache = TTSCache(str(tmp_path), max_bytes=1000)
+    assert cache.get("天", "v") is None and not cache.contains("天", "v")
+    path = _put(cache, "天", 100)
+    assert cache.get("天", "v") == path and cache.contains("天", "v")
+    # 空文件不进缓存
+    assert _put(cache, "空", 0) is None and not cache.contains("空", "v")
+    # 重启后照样命中，上次留下的临时文件被清掉
+    with open(cache.new_temp_path("deadbeef"), "wb") as f:
+        f.write(b"half")
+    again = TTSCache(str(tmp_path), max_bytes=1000)
+    assert again.get("天", "v") == path
+    assert not any(".tmp" in name for name in os.listdir(tmp_path))
+    # 文件被外部删掉：当作没缓存
+    os.remove(path)
+    assert again.get("天", "v") is None and again.stats()["entries"] == 0
+    print("✅ 命中、重启、外部删除")
+
+
+def test_lru_eviction_by_mtime(tmp_path):
+    """超过上限时淘汰最久没用的；重启后按 mtime 恢复使用顺序"""
+    cache = TTSCache(str(tmp_path), max_bytes=300)
+    for text in ("一", "二", "三"):
+        _put(cache, text, 100)
+    cache.get("一", "v")                 # 一 变成最近使用
+    _put(cache, "四", 100)               # 超出：淘汰 二
+    assert not cache.contains("二", "v")
+    assert all(cache.contains(t, "v") for t in ("一", "三", "四"))
+    assert cache.stats()["bytes"] == 300
+
+    # 重启：按文件 mtime 排序，最旧的先淘汰
+    _set_mtime(cache, "一", 1000)
+    _set_mtime(cache, "三", 3000)
+    _set_mtime(cache, "四", 2000)
+    again = TTSCache(str(tmp_path), max_bytes=300)
+    _put(again, "五", 100)
+    assert not again.contains("一", "v")
+    _put(again, "六", 100)
+    assert not again.contains("四", "v") and again.contains("三", "v")
+    assert not os.path.exists(again.path_for(make_key("一", "v")))
+    print("✅ 按 mtime 的 LRU 淘汰")
+
+
+def test_size_cap(tmp_path):
+    """默认上限 50MB；总大小始终不超过上限（单个超大文件至少保留最新的一个）"""
+    assert DEFAULT_MAX_BYTES == 50 * 1024 * 1024
+    assert TTSCache(str(tmp_path / "default")).max_bytes == DEFAULT_MAX_BYTES
+
+    cache = TTSCache(str(tmp_path / "small"), max_bytes=1024)
+    for i in range(50):
+        _put(cache, f"句子{i}", 90 + i)
+        assert cache.stats()["bytes"] <= 1024
+    on_disk = sum(os.path.getsize(os.path.join(cache.cache_dir, n)) for n in os.listdir(cache.cache_dir))
+    assert on_disk == cache.stats()["bytes"]
+    assert cache.contains("句子49", "v")
+
+    _put(cache, "很长的一段", 5000)
+    assert cache.stats()["entries"] == 1 and cache.contains("很长的一段", "v")
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "bytes": 0, "max_bytes": 1024}
+    assert os.listdir(cache.cache_dir) == []
+    print("✅ 缓存大小上限")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
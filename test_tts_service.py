@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+TTS 后台服务测试
+用假的生成函数代替 edge-tts（写入文字本身），不需要联网
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tts_cache import TTSCache
+from tts_service import TTSService
+
+
+class StubSynth:
+    """假的生成函数：记录调用；gate 没打开时一直等（模拟生成很慢）"""
+
+    def __init__(self):
+        self.calls = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    async def __call__(self, text, voice, rate, filepath):
+        self.calls.append(text)
+        while not self.gate.is_set():
+            await asyncio.sleep(0.005)
+        with open(filepath, "wb") as f:
+            f.write(text.encode("utf-8"))
+
+
+def _wait(cond, timeout=5):
+    end = time.time() + timeout
+    while time.time() < end:
+        if cond():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def _text(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    services = []
+
+    def make(workers=2, max_pending=16):
+        synth = StubSynth()
+        service = TTSService(cache=TTSCache(str(tmp_path / f"cache{len(services)}")),
+                             synthesizer=synth, max_pending=max_pending, workers=workers)
+        services.append(service)
+        return service, synth
+
+    yield make
+    for service in services:
+        service.shutdown()
+
+
+def test_submit_and_cache(make_service):
+    """一个常驻事件循环线程；生成结果进缓存，同一句话不再生成"""
+    service, synth = make_service()
+    ready = []
+    path = service.submit("天", "v", on_ready=ready.append).result(5)
+    assert _text(path) == "天" and _wait(lambda: ready == [path])
+    thread = service._thread
+    assert thread.is_alive() and thread.name == "tts-service"
+
+    assert service.submit("天", "v").result(5) == path
+    assert service.synthesize("天", "v") == path
+    assert synth.calls == ["天"] and service._thread is thread
+    print("✅ 生成、回调、缓存命中")
+
+
+def test_channel_keeps_latest(make_service):
+    """同一通道连续提交：只有最后一个生成完，前面的结果为 None 且不回调"""
+    service, synth = make_service()
+    synth.gate.clear()
+    ready = []
+    futures = [service.submit(t, "v", on_ready=ready.append) for t in ("一", "二", "三")]
+    other = service.submit("别的通道", "v", channel="praise")
+    assert _wait(lambda: futures[0].done() and futures[1].done())
+    synth.gate.set()
+    assert futures[0].result(5) is None and futures[1].result(5) is None
+    assert _text(futures[2].result(5)) == "三" and _text(other.result(5)) == "别的通道"
+    assert _wait(lambda: len(ready) == 1) and _text(ready[0]) == "三"
+    assert not service.cache.contains("一", "v") and not service.cache.contains("二", "v")
+    print("✅ 同一通道只保留最新请求")
+
+
+def test_cancel(make_service):
+    service, synth = make_service()
+    synth.gate.clear()
+    speech = service.submit("正在读", "v")
+    praise = service.submit("表扬", "v", channel="praise")
+    assert _wait(lambda: "正在读" in synth.calls and "表扬" in synth.calls)
+    service.cancel()
+    assert speech.result(5) is None
+    synth.gate.set()
+    assert _text(praise.result(5)) == "表扬"
+    assert not service.cache.contains("正在读", "v")
+    print("✅ 取消通道")
+
+
+def test_speech_before_prefetch_and_cancel_prefetch(make_service):
+    """预取优先级低：排队时朗读先处理；cancel_prefetch 取消还没完成的预取"""
+    service, synth = make_service(workers=1)
+    synth.gate.clear()
+    blocker = service.submit("占住", "v", channel="blocker")
+    assert _wait(lambda: synth.calls == ["占住"])
+    assert service.prefetch(["下一题", "再下一题"], "v") == 2
+    spoken = service.submit("现在读", "v")
+    time.sleep(0.05)
+    synth.gate.set()
+    assert spoken.result(5) and blocker.result(5)
+    assert _wait(lambda: len(synth.calls) == 4)
+    assert synth.calls[1] == "现在读"
+
+    # 已缓存的不再预取；取消后没完成的预取不进缓存
+    assert service.prefetch(["下一题", "再下一题"], "v") == 0
+    synth.gate.clear()
+    assert service.prefetch(["甲", "乙", "丙"], "v") == 3
+    assert _wait(lambda: "甲" in synth.calls)
+    service.cancel_prefetch()
+    synth.gate.set()
+    time.sleep(0.1)
+    assert not any(service.cache.contains(t, "v") for t in ("甲", "乙", "丙"))
+    assert "乙" not in synth.calls and "丙" not in synth.calls
+    print("✅ 预取优先级和取消")
+
+
+def test_shared_inflight_render(make_service):
+    """同一句话正在预取时朗读它：复用那次生成，只生成一次"""
+    service, synth = make_service()
+    synth.gate.clear()
+    service.prefetch(["天空"], "v")
+    assert _wait(lambda: synth.calls == ["天空"])
+    ready = []
+    future = service.submit("天空", "v", on_ready=ready.append)
+    time.sleep(0.05)
+    # 取消预取也不影响正在等这句话的朗读
+    service.cancel_prefetch()
+    time.sleep(0.05)
+    synth.gate.set()
+    assert _text(future.result(5)) == "天空"
+    assert _wait(lambda: len(ready) == 1)
+    assert synth.calls == ["天空"]
+    print("✅ 同一句话只生成一次")
+
+
+def test_pending_limit(make_service):
+    """队列满了先丢预取，再丢最早提交的朗读"""
+    service, synth = make_service(workers=1, max_pending=3)
+    synth.gate.clear()
+    service.submit("占住", "v", channel="blocker")
+    assert _wait(lambda: synth.calls == ["占住"])
+    service.prefetch(["预取"], "v")
+    futures = [service.submit(f"第{i}句", "v", channel=None) for i in range(4)]
+    assert _wait(lambda: sum(f.done() for f in futures) == 1)
+    assert futures[0].result(1) is None
+    synth.gate.set()
+    assert all(futures[i].result(5) for i in range(1, 4))
+    assert "预取" not in synth.calls
+    print("✅ 队列上限")
+
+
+def test_shutdown_resolves_pending(make_service):
+    """shutdown 时排队和生成中的请求都得到 None，等结果的调用方不会卡住"""
+    service, synth = make_service(workers=1)
+    synth.gate.clear()
+    running = service.submit("正在读", "v")
+    assert _wait(lambda: synth.calls == ["正在读"])
+    queued = service.submit("排队", "v", channel="praise")
+    loose = service.submit("独立", "v", channel=None)
+    thread = service._thread
+    service.shutdown()
+    assert running.result(2) is None and queued.result(2) is None and loose.result(2) is None
+    assert _wait(lambda: not thread.is_alive())
+    print("✅ shutdown 后 future 都有结果")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+语音配置缓存测试
+- 连续取语音不读文件
+- 文件在别处被改：过了检查间隔才重新读；通知后立即生效
+- 保存后缓存立即更新，经配置管理器通知订阅者
+"""
+import json
+import time
+
+import pytest
+
+import config_manager as cm
+import voice_config_shared as vcs
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """临时配置文件和配置管理器（不动真实语音设置）"""
+    path = tmp_path / "voice_config.json"
+    path.write_text(json.dumps({"style": "温柔姐姐"}, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(vcs, "CONFIG_FILE", str(path))
+    monkeypatch.setattr(vcs, "_config_cache", None)
+    monkeypatch.setattr(cm, "UI_CONFIG_AVAILABLE", False)
+    monkeypatch.setattr(cm.ConfigManager, "_instance", None)
+    manager = cm.ConfigManager()
+    manager._config_dir = str(tmp_path)
+    manager.subscribe("voice", vcs._on_voice_config_changed)
+    monkeypatch.setattr(vcs, "_config_manager", manager)
+    return path
+
+
+def _count_reads(monkeypatch):
+    reads = []
+    original = vcs._read_config_file
+
+    def counting():
+        reads.append(1)
+        return original()
+
+    monkeypatch.setattr(vcs, "_read_config_file", counting)
+    return reads
+
+
+def test_repeated_calls_do_not_read_file(config_file, monkeypatch):
+    reads = _count_reads(monkeypatch)
+    for _ in range(1000):
+        assert vcs.get_voice() == vcs.VOICE_STYLES["温柔姐姐"]["voice"]
+        vcs.get_praises()
+        vcs.get_encourages()
+    assert len(reads) == 1
+    # 返回的配置是副本
+    vcs.load_voice_config()["style"] = "汪汪队风格"
+    assert vcs.get_current_style()[0] == "温柔姐姐"
+    print("✅ 3000 次取配置只读 1 次文件")
+
+
+def test_external_edit_after_interval(config_file, monkeypatch):
+    monkeypatch.setattr(vcs, "CONFIG_CHECK_INTERVAL", 0.05)
+    reads = _count_reads(monkeypatch)
+    assert vcs.get_current_style()[0] == "温柔姐姐"
+    config_file.write_text(json.dumps({"style": "活泼哥哥"}, ensure_ascii=False), encoding="utf-8")
+    # 间隔内还是旧的
+    assert vcs.get_current_style()[0] == "温柔姐姐"
+    time.sleep(0.06)
+    assert vcs.get_current_style()[0] == "活泼哥哥"
+    # 文件没变：过了间隔只看修改时间，不重新读
+    time.sleep(0.06)
+    vcs.get_current_style()
+    assert len(reads) == 2
+    print("✅ 过了检查间隔发现文件改了")
+
+
+def test_notify_and_save(config_file):
+    vcs.get_voice()
+    config_file.write_text(json.dumps({"style": "活泼哥哥"}, ensure_ascii=False), encoding="utf-8")
+    vcs.notify_voice_config_changed()
+    assert vcs.get_current_style()[0] == "活泼哥哥"
+
+    assert vcs.save_voice_config({"style": "汪汪队风格"})
+    assert vcs.get_current_style()[0] == "汪汪队风格"
+    assert json.loads(config_file.read_text(encoding="utf-8")) == {"style": "汪汪队风格"}
+
+    # 保存经配置管理器：订阅语音配置的模块马上收到
+    seen = []
+    vcs._config_manager.subscribe("voice", lambda name, changes, snap: seen.append(dict(changes)))
+    assert vcs.save_voice_config({"style": "温柔姐姐"})
+    assert seen == [{"style": "温柔姐姐"}] and vcs.get_current_style()[0] == "温柔姐姐"
+    print("✅ 通知和保存后立即生效")
+
+
+def test_missing_or_bad_file(config_file):
+    config_file.write_text("{坏的", encoding="utf-8")
+    assert vcs.get_current_style()[0] == vcs.DEFAULT_STYLE
+    config_file.unlink()
+    vcs.notify_voice_config_changed()
+    assert vcs.load_voice_config() == {"style": vcs.DEFAULT_STYLE}
+    # 不认识的风格用默认
+    vcs.save_voice_config({"style": "不存在"})
+    assert vcs.get_current_style()[0] == vcs.DEFAULT_STYLE
+    print("✅ 文件缺失/损坏用默认风格")
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-s"]))
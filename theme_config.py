@@ -9,6 +9,13 @@ import random
 
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "theme_settings.json")
 
+# 主题设置经配置管理器读写，改了推送给订阅 "theme" 的模块
+try:
+    from config_manager import config_manager
+    CONFIG_MANAGER_AVAILABLE = True
+except ImportError:
+    CONFIG_MANAGER_AVAILABLE = False
+
 # 汪汪队主题配置
 THEME = {
     "name": "汪汪队",
@@ -66,6 +73,8 @@ THEME = {
 
 def load_settings():
     """加载设置"""
+    if CONFIG_MANAGER_AVAILABLE:
+        return config_manager.load("theme")
     try:
         if os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
@@ -77,6 +86,9 @@ def load_settings():
 
 def save_settings(settings):
     """保存设置"""
+    if CONFIG_MANAGER_AVAILABLE:
+        config_manager.update("theme", settings)
+        return
     try:
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(settings, f, ensure_ascii=False, indent=2)
@@ -2,15 +2,19 @@
 """
 主题绘图模块 v3.0 - 超精细卡通角色
 增加毛发质感、阴影高光、更多细节
+狗狗每只一百多个图元，经 sprite_cache 光栅化成图片后重复使用
 """
 
 import math
 
+from sprite_cache import cached
+
 
 class ThemeDrawings:
     """主题绘图类 - 超精细版"""
     
     @staticmethod
+    @cached
     def draw_puppy_chase(canvas, x, y, scale=1.0):
         """阿奇 - 德国牧羊犬警犬 - 超精细版本
         特点：竖立的大耳朵、棕褐色毛发、蓝色警察装备
@@ -181,6 +185,7 @@ class ThemeDrawings:
             canvas.create_oval(x+dx-s*0.25, y+dy-s*0.25, x+dx+s*0.25, y+dy+s*0.25, fill="#1565C0", outline="")
 
     @staticmethod
+    @cached
     def draw_puppy_marshall(canvas, x, y, scale=1.0):
         """毛毛 - 斑点狗消防犬 - 超精细版本
         特点：白色身体黑色斑点、下垂的黑耳朵、红色消防装备
@@ -313,6 +318,7 @@ class ThemeDrawings:
         canvas.create_oval(x+14*s, y-2*s, x+22*s, y+6*s, fill="#FFCDD2", outline="")
     
     @staticmethod
+    @cached
     def draw_puppy_skye(canvas, x, y, scale=1.0):
         """天天 - 可卡犬飞行员 - 超精细版本
         特点：奶油色长卷毛、大眼睛睫毛、粉色飞行装备
@@ -460,6 +466,7 @@ class ThemeDrawings:
         canvas.create_oval(x+12*s, y-2*s, x+20*s, y+6*s, fill="#FFCDD2", outline="")
     
     @staticmethod
+    @cached
     def draw_puppy_rubble(canvas, x, y, scale=1.0):
         """小砾 - 英国斗牛犬工程师 - 超精细版本
         特点：矮胖身材、宽脸皱纹、黄色工程装备
@@ -572,6 +579,7 @@ class ThemeDrawings:
         canvas.create_oval(x+18*s, y-2*s, x+26*s, y+6*s, fill="#FFCDD2", outline="")
     
     @staticmethod
+    @cached
     def draw_puppy_rocky(canvas, x, y, scale=1.0):
         """灰灰(Rocky) - 混种犬环保员 - 超精细版本
         特点：灰色毛发、半竖立耳朵、绿色环保装备
@@ -683,6 +691,7 @@ class ThemeDrawings:
         canvas.create_oval(x+12*s, y-2*s, x+20*s, y+6*s, fill="#FFCDD2", outline="")
     
     @staticmethod
+    @cached
     def draw_puppy_zuma(canvas, x, y, scale=1.0):
         """路马(Zuma) - 拉布拉多水上救援犬，巧克力棕色，超精细版"""
         s = scale
@@ -806,6 +815,7 @@ class ThemeDrawings:
         canvas.create_text(x, y+10*s, text="⚓", font=("Segoe UI Emoji", int(6*s)), fill="#E65100")
     
     @staticmethod
+    @cached
     def draw_puppy_everest(canvas, x, y, scale=1.0):
         """珠珠(Everest) - 哈士奇雪山救援犬，紫色主题，超精细版"""
         s = scale
@@ -936,6 +946,7 @@ class ThemeDrawings:
         canvas.create_text(x, y+10*s, text="❄", font=("Segoe UI Emoji", int(6*s)), fill="#00838F")
     
     @staticmethod
+    @cached
     def draw_puppy_tracker(canvas, x, y, scale=1.0):
         """阿克(Tracker) - 吉娃娃丛林救援犬，棕色，超精细版"""
         s = scale * 0.95
@@ -1072,6 +1083,7 @@ class ThemeDrawings:
         canvas.create_text(x, y+12*s, text="🐾", font=("Segoe UI Emoji", int(5*s)), fill="#1B5E20")
     
     @staticmethod
+    @cached
     def draw_puppy_rex(canvas, x, y, scale=1.0):
         """小克(Rex) - 恐龙救援犬，棕白色伯恩山犬，超精细版"""
         s = scale
@@ -1221,6 +1233,7 @@ class ThemeDrawings:
         canvas.create_text(x, y+11*s, text="🦖", font=("Segoe UI Emoji", int(6*s)), fill="#33691E")
     
     @staticmethod
+    @cached
     def draw_puppy_liberty(canvas, x, y, scale=1.0):
         """乐乐(Liberty) - 腊肠犬城市救援犬，紫色主题，超精细版"""
         s = scale
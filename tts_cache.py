@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+TTS 语音缓存模块 v1.0
+所有音频后端共用的磁盘缓存：
+- 按 (文字, 语音, 语速, 语言) 内容寻址
+- 按总大小做 LRU 淘汰
+- 重启后继续有效，不再每次生成/删除 tts_<uuid>.mp3
+
+使用方法：
+    from tts_cache import get_tts_cache
+
+    path = get_tts_cache().get("再试试", "zh-CN-YunxiNeural")
+    if path:
+        pygame.mixer.music.load(path)
+
+生成语音请使用 tts_service（常驻事件循环，生成结果自动写入本缓存）
+"""
+
+import os
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+
+# 尝试导入UI配置模块
+try:
+    from ui_config import get_data_path
+    UI_CONFIG_AVAILABLE = True
+except ImportError:
+    UI_CONFIG_AVAILABLE = False
+
+try:
+    import edge_tts
+    EDGE_TTS_AVAILABLE = True
+except ImportError:
+    edge_tts = None
+    EDGE_TTS_AVAILABLE = False
+
+# 缓存目录
+if UI_CONFIG_AVAILABLE:
+    CACHE_DIR = get_data_path("tts_cache")
+else:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tts_cache")
+
+# 默认缓存上限 50MB（一句短语音约 10~30KB）
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+CACHE_EXT = ".mp3"
+
+
+def make_key(text, voice, rate="+0%", lang="cn"):
+    """计算缓存键（内容哈希）"""
+    raw = "\x1f".join([text, voice or "", rate or "+0%", lang or "cn"])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+async def edge_tts_save(text, voice, rate, filepath):
+    """用 edge-tts 生成语音到指定文件"""
+    communicate = edge_tts.Communicate(text, voice, rate=rate)
+    await communicate.save(filepath)
+
+
+class TTSCache:
+    """磁盘 TTS 缓存 - 内容寻址 + LRU 淘汰
+
+    访问顺序用文件的 mtime 记录，启动时扫描目录重建，
+    因此不需要额外的索引文件，进程被杀也不会丢失一致性。
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> size，按最近使用排序
+        self._total = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """扫描缓存目录，按 mtime 重建 LRU 顺序"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            found = []
+            for name in os.listdir(self.cache_dir):
+                filepath = os.path.join(self.cache_dir, name)
+                if not name.endswith(CACHE_EXT):
+                    # 上次异常退出留下的半成品
+                    if ".tmp" in name:
+                        self._safe_delete(filepath)
+                    continue
+                try:
+                    st = os.stat(filepath)
+                except OSError:
+                    continue
+                found.append((st.st_mtime, name[:-len(CACHE_EXT)], st.st_size))
+            found.sort()
+            for _, key, size in found:
+                self._entries[key] = size
+                self._total += size
+        except Exception as e:
+            print(f"[tts_cache] 加载缓存目录失败: {e}")
+
+    def path_for(self, key):
+        """缓存键对应的文件路径"""
+        return os.path.join(self.cache_dir, key + CACHE_EXT)
+
+    def get(self, text, voice, rate="+0%", lang="cn"):
+        """查找缓存，命中返回文件路径，否则返回 None"""
+        key = make_key(text, voice, rate, lang)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        filepath = self.path_for(key)
+        try:
+            os.utime(filepath, None)
+        except OSError:
+            # 文件被外部删除
+            with self._lock:
+                size = self._entries.pop(key, 0)
+                self._total -= size
+            return None
+        return filepath
+
+    def new_temp_path(self, key):
+        """生成时使用的临时文件路径（完成后用 commit 放入缓存）"""
+        return os.path.join(self.cache_dir, f"{key}.tmp-{uuid.uuid4().hex[:8]}")
+
+    def commit(self, key, temp_path):
+        """把生成好的临时文件原子地移入缓存，返回缓存路径"""
+        filepath = self.path_for(key)
+        try:
+            size = os.path.getsize(temp_path)
+        except OSError:
+            return None
+        if size <= 0:
+            self._safe_delete(temp_path)
+            return None
+        os.replace(temp_path, filepath)
+        with self._lock:
+            self._total -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total += size
+            self._evict()
+        return filepath
+
+    def contains(self, text, voice, rate="+0%", lang="cn"):
+        """是否已缓存（不更新 LRU 顺序）"""
+        with self._lock:
+            return make_key(text, voice, rate, lang) in self._entries
+
+    def _evict(self):
+        """超出上限时淘汰最久未使用的条目（调用方持有锁）"""
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total -= size
+            self._safe_delete(self.path_for(key))
+
+    def _safe_delete(self, filepath):
+        try:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+        except OSError:
+            # 文件可能正在播放（Windows），留到下次启动再处理
+            pass
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._total = 0
+        for key in keys:
+            self._safe_delete(self.path_for(key))
+
+    def stats(self):
+        """缓存统计"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# 全局缓存实例（懒加载）
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache():
+    """获取全局 TTS 缓存实例"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TTSCache()
+    return _cache
+
+
+__all__ = [
+    'TTSCache',
+    'get_tts_cache',
+    'make_key',
+    'edge_tts_save',
+    'CACHE_DIR',
+    'DEFAULT_MAX_BYTES',
+    'EDGE_TTS_AVAILABLE',
+]
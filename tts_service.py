@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+TTS 后台服务 v1.0
+整个进程共用一个常驻事件循环来生成语音：
+- 不再每次 speak 都新建线程 + asyncio.run()
+- 有界请求队列，同一通道只保留最新的请求（和 speech_id 的语义一致）
+- stop / 新请求会取消正在进行的生成
+- 生成结果写入 tts_cache，重复的话直接命中
+- prefetch 预先生成接下来要朗读的题目，speak 时直接命中缓存
+
+使用方法：
+    from tts_service import get_tts_service
+
+    service = get_tts_service()
+    service.submit("再试试", voice, on_ready=play_file)   # 异步，生成后回调
+    service.cancel()                                      # 取消当前通道
+    service.prefetch(["请选择，天", "请选择，地"], voice)    # 预生成下几题
+    service.cancel_prefetch()                             # 离开页面时取消
+"""
+
+import os
+import heapq
+import asyncio
+import threading
+import concurrent.futures
+
+from tts_cache import get_tts_cache, make_key, edge_tts_save, EDGE_TTS_AVAILABLE
+
+# 默认通道：普通朗读
+DEFAULT_CHANNEL = "speech"
+
+# 默认预取分组
+DEFAULT_PREFETCH_GROUP = "prefetch"
+
+# 优先级：数字越小越先处理，预取不能挡住正在等待的朗读
+PRIORITY_SPEECH = 0
+PRIORITY_PREFETCH = 1
+
+
+class _Request:
+    """一次语音生成请求"""
+    __slots__ = ('text', 'voice', 'rate', 'lang', 'channel', 'on_ready', 'future', 'key',
+                 'group', 'priority')
+
+    def __init__(self, text, voice, rate, lang, channel, on_ready,
+                 group=None, priority=PRIORITY_SPEECH):
+        self.text = text
+        self.voice = voice
+        self.rate = rate
+        self.lang = lang
+        self.channel = channel
+        self.on_ready = on_ready
+        self.future = concurrent.futures.Future()
+        self.key = make_key(text, voice, rate, lang)
+        self.group = group
+        self.priority = priority
+
+
+class TTSService:
+    """常驻后台的 TTS 服务
+
+    Args:
+        cache: TTSCache 实例，默认使用全局缓存
+        synthesizer: 生成函数 async (text, voice, rate, filepath)，默认 edge-tts
+        max_pending: 队列上限，超出时丢弃最早的请求
+        workers: 并发生成数
+    """
+
+    def __init__(self, cache=None, synthesizer=None, max_pending=16, workers=2):
+        self.cache = cache or get_tts_cache()
+        self.synthesizer = synthesizer or edge_tts_save
+        self.max_pending = max_pending
+        self.workers = workers
+
+        self._loop = None
+        self._thread = None
+        self._heap = []       # (优先级, 序号, 请求)
+        self._wakeup = None
+        self._start_lock = threading.Lock()
+        self._seq = 0
+        self._latest = {}     # channel -> 最新的请求
+        self._running = {}    # 请求 -> 处理任务
+        self._rendering = {}  # 缓存键 -> 生成任务（同一句话只生成一次）
+
+    @property
+    def available(self):
+        """是否可以生成语音"""
+        return EDGE_TTS_AVAILABLE or self.synthesizer is not edge_tts_save
+
+    # ---------- 事件循环 ----------
+
+    def _ensure_started(self):
+        if self._loop is not None:
+            return
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            ready = threading.Event()
+            loop = asyncio.new_event_loop()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                self._wakeup = asyncio.Event()
+                for _ in range(self.workers):
+                    loop.create_task(self._worker())
+                ready.set()
+                loop.run_forever()
+                # shutdown 之后：取消剩下的任务再关闭事件循环
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                loop.close()
+
+            self._thread = threading.Thread(target=run, name="tts-service", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+
+    def shutdown(self):
+        """停止事件循环（一般不需要调用，进程退出时自动结束）"""
+        with self._start_lock:
+            loop = self._loop
+            self._loop = None
+        if loop is not None:
+            # self._loop 已清空，cancel_all() 不会再派发；直接在原事件循环里取消，
+            # 让还在排队/生成中的请求都得到 None，等 future.result() 的调用方不会卡住
+            loop.call_soon_threadsafe(self._cancel_all)
+            loop.call_soon_threadsafe(loop.stop)
+
+    # ---------- 对外接口（任意线程可调用） ----------
+
+    def submit(self, text, voice, rate="+0%", lang="cn", on_ready=None, channel=DEFAULT_CHANNEL):
+        """提交一次语音生成
+
+        Args:
+            on_ready: 生成完成后的回调 on_ready(filepath)，在后台线程池中执行，
+                      可以阻塞（例如等待 pygame 播放结束）
+            channel: 同一通道只保留最新请求；None 表示独立请求，不参与合并
+
+        Returns:
+            concurrent.futures.Future，结果为缓存文件路径；被取代或取消时为 None
+        """
+        req = _Request(text, voice, rate, lang, channel, on_ready)
+        self._ensure_started()
+        self._loop.call_soon_threadsafe(self._enqueue, req)
+        return req.future
+
+    def synthesize(self, text, voice, rate="+0%", lang="cn", timeout=None):
+        """同步生成（阻塞直到完成），返回缓存文件路径"""
+        filepath = self.cache.get(text, voice, rate, lang)
+        if filepath:
+            return filepath
+        try:
+            return self.submit(text, voice, rate, lang, channel=None).result(timeout)
+        except concurrent.futures.TimeoutError:
+            return None
+
+    def prefetch(self, texts, voice, rate="+0%", lang="cn", group=DEFAULT_PREFETCH_GROUP):
+        """预先生成一批语音放入缓存（低优先级，不回调）
+
+        已缓存的直接跳过。同一分组再次 prefetch 会先取消上一批还没完成的。
+
+        Returns:
+            实际提交生成的条数
+        """
+        pending = [t for t in dict.fromkeys(texts)
+                   if t and not self.cache.contains(t, voice, rate, lang)]
+        self._ensure_started()
+        reqs = [_Request(t, voice, rate, lang, None, None, group, PRIORITY_PREFETCH)
+                for t in pending]
+        self._loop.call_soon_threadsafe(self._enqueue_group, group, reqs)
+        return len(reqs)
+
+    def cancel_prefetch(self, group=DEFAULT_PREFETCH_GROUP):
+        """取消某个分组中尚未完成的预取（离开页面时调用）"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel_group, group)
+
+    def cancel(self, channel=DEFAULT_CHANNEL):
+        """取消某个通道上等待中和正在生成的请求"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel, channel)
+
+    def cancel_all(self):
+        """取消所有通道"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._cancel_all)
+
+    # ---------- 以下在事件循环线程中执行 ----------
+
+    def _enqueue(self, req):
+        if req.channel is not None:
+            old = self._latest.get(req.channel)
+            if old is not None:
+                self._finish(old, None)
+            self._latest[req.channel] = req
+            for running, task in list(self._running.items()):
+                # 正在生成同一句话就让它继续，新请求会复用结果
+                if running.channel == req.channel and running.key != req.key:
+                    task.cancel()
+        self._put(req)
+
+    def _put(self, req):
+        if len(self._heap) >= self.max_pending:
+            # 先清掉已被取代的请求，仍然满时丢弃优先级最低、最早提交的
+            self._heap = [item for item in self._heap if not item[2].future.done()]
+            while len(self._heap) >= self.max_pending:
+                # 优先级最低的里面最早提交的
+                victim = max(self._heap, key=lambda item: (item[0], -item[1]))
+                self._finish(victim[2], None)
+                self._heap.remove(victim)
+            heapq.heapify(self._heap)
+        self._seq += 1
+        heapq.heappush(self._heap, (req.priority, self._seq, req))
+        self._wakeup.set()
+
+    def _enqueue_group(self, group, reqs):
+        self._cancel_group(group)
+        for req in reqs:
+            self._put(req)
+
+    def _cancel(self, channel):
+        req = self._latest.pop(channel, None)
+        if req is not None:
+            self._finish(req, None)
+        for running, task in list(self._running.items()):
+            if running.channel == channel:
+                task.cancel()
+
+    def _cancel_group(self, group):
+        for _, _, req in self._heap:
+            if req.group == group:
+                self._finish(req, None)
+        for running, task in list(self._running.items()):
+            if running.group == group:
+                task.cancel()
+
+    def _cancel_all(self):
+        for channel in list(self._latest):
+            self._cancel(channel)
+        for _, _, req in self._heap:
+            self._finish(req, None)
+        for running, task in list(self._running.items()):
+            self._finish(running, None)
+            task.cancel()
+
+    def _finish(self, req, filepath):
+        if not req.future.done():
+            req.future.set_result(filepath)
+        if req.channel is not None and self._latest.get(req.channel) is req:
+            del self._latest[req.channel]
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            _, _, req = heapq.heappop(self._heap)
+            if req.future.done():
+                # 已被更新的请求取代或已取消
+                continue
+
+            task = loop.create_task(self._render(req))
+            self._running[req] = task
+            await asyncio.wait({task})
+            del self._running[req]
+
+            if task.cancelled():
+                self._finish(req, None)
+                continue
+            if task.exception() is not None:
+                print(f"[tts_service] 生成失败: {req.text}: {task.exception()}")
+                self._finish(req, None)
+                continue
+
+            filepath = task.result()
+            if req.future.done():
+                continue
+            self._finish(req, filepath)
+            if filepath and req.on_ready:
+                loop.run_in_executor(None, self._call_ready, req.on_ready, filepath)
+
+    @staticmethod
+    def _call_ready(on_ready, filepath):
+        try:
+            on_ready(filepath)
+        except Exception as e:
+            print(f"[tts_service] 回调错误: {e}")
+
+    async def _render(self, req):
+        """命中缓存直接返回，否则生成并写入缓存
+
+        同一句话正在生成（例如已被预取）时复用那次生成，不重复请求。
+        """
+        filepath = self.cache.get(req.text, req.voice, req.rate, req.lang)
+        if filepath:
+            return filepath
+        if not self.available:
+            return None
+        shared = self._rendering.get(req.key)
+        if shared is None:
+            shared = asyncio.get_running_loop().create_task(self._synthesize(req))
+            self._rendering[req.key] = shared
+            shared.add_done_callback(lambda t, key=req.key: self._forget_render(key, t))
+        try:
+            return await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            # 没有其他请求在等这句话时才真正取消生成
+            if not any(r.key == req.key and r is not req and not r.future.done()
+                       for r in self._running):
+                shared.cancel()
+            raise
+
+    def _forget_render(self, key, task):
+        if self._rendering.get(key) is task:
+            del self._rendering[key]
+
+    async def _synthesize(self, req):
+        temp_path = self.cache.new_temp_path(req.key)
+        try:
+            await self.synthesizer(req.text, req.voice, req.rate, temp_path)
+            return self.cache.commit(req.key, temp_path)
+        finally:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+
+# 全局服务实例（懒加载）
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_tts_service():
+    """获取全局 TTS 服务实例"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = TTSService()
+    return _service
+
+
+__all__ = ['TTSService', 'get_tts_service', 'DEFAULT_CHANNEL', 'DEFAULT_PREFETCH_GROUP']
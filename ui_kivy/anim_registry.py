@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+页面动画登记 v1.0
+装饰图形的循环动画（漂浮、旋转、闪烁……）和 Clock.schedule_interval 定时器
+以前启动后就再也不停，离开页面后仍在后台跑，来回切换几次页面 CPU 就越来越高。
+这里按页面（Screen）登记：
+- track_animation(widget, anim) / track_clock(widget, callback, interval)
+  登记后立即开始，下一帧找到 widget 所在的 Screen，归到这个页面名下
+- 页面 on_leave 时暂停该页面的全部动画和定时器，on_enter 时重新开始
+- 已经从页面上移除的 widget，它的动画在下次暂停/恢复时取消并丢弃
+- 页面被释放（LazyScreenManager.evict_unused）时 release(screen) 全部取消
+- live_counts() 返回当前正在运行的动画和定时器数量，用来排查泄漏
+
+不在任何 Screen 里的 widget 归到全局登记，一直运行（和原来一样）。
+
+使用方法：
+    anim = Animation(y=100, duration=2) + Animation(y=0, duration=2)
+    anim.repeat = True
+    track_animation(widget, anim)
+    track_clock(widget, update_wing, 0.025)
+    print(live_counts())    # {"animations": 12, "clocks": 3, "screens": 4}
+"""
+import weakref
+
+try:
+    from kivy.clock import Clock
+    KIVY_AVAILABLE = True
+except ImportError:
+    Clock = None
+    KIVY_AVAILABLE = False
+
+
+def _find_screen(widget):
+    """沿 parent 往上找 widget 所在的 Screen（有 manager 和 on_leave 的就是）"""
+    node = widget
+    while node is not None:
+        if hasattr(node, "manager") and hasattr(node, "on_leave"):
+            return node
+        parent = node.parent
+        if parent is node:
+            break
+        node = parent
+    return None
+
+
+def _is_inside(widget, screen):
+    node = widget
+    while node is not None:
+        if node is screen:
+            return True
+        node = node.parent
+    return False
+
+
+class AnimationRegistry:
+    """一个页面上的循环动画和定时器"""
+
+    def __init__(self, screen=None):
+        self._screen = weakref.ref(screen) if screen is not None else None
+        self._animations = []   # [widget, anim, running]
+        self._clocks = []       # [widget, callback, interval, event]
+        self.active = True
+
+    @property
+    def screen(self):
+        return self._screen() if self._screen is not None else None
+
+    # ---------- 登记 ----------
+
+    def add_animation(self, widget, anim, running=False):
+        entry = [widget, anim, running]
+        self._animations.append(entry)
+        if self.active and not running:
+            anim.start(widget)
+            entry[2] = True
+        elif not self.active and running:
+            anim.cancel(widget)
+            entry[2] = False
+        return anim
+
+    def add_clock(self, widget, callback, interval, event=None):
+        entry = [widget, callback, interval, event]
+        self._clocks.append(entry)
+        if self.active and event is None:
+            entry[3] = Clock.schedule_interval(callback, interval)
+        elif not self.active and event is not None:
+            event.cancel()
+            entry[3] = None
+        return entry[3]
+
+    def _take(self, widget):
+        """取出某个 widget 的登记（移到别的页面时用）"""
+        animations = [e for e in self._animations if e[0] is widget]
+        clocks = [e for e in self._clocks if e[0] is widget]
+        self._animations = [e for e in self._animations if e[0] is not widget]
+        self._clocks = [e for e in self._clocks if e[0] is not widget]
+        return animations, clocks
+
+    # ---------- 页面切换 ----------
+
+    def resume(self, *args):
+        """进入页面：重新开始全部动画和定时器"""
+        self.active = True
+        self._drop_detached()
+        for entry in self._animations:
+            if not entry[2]:
+                entry[1].start(entry[0])
+                entry[2] = True
+        for entry in self._clocks:
+            if entry[3] is None:
+                entry[3] = Clock.schedule_interval(entry[1], entry[2])
+
+    def pause(self, *args):
+        """离开页面：停止全部动画和定时器（登记保留，回来时再开始）"""
+        self.active = False
+        self._drop_detached()
+        self._stop_all()
+
+    def clear(self):
+        """取消并忘掉全部登记"""
+        self._stop_all()
+        self._animations = []
+        self._clocks = []
+
+    def _stop_all(self):
+        for entry in self._animations:
+            if entry[2]:
+                entry[1].cancel(entry[0])
+                entry[2] = False
+        for entry in self._clocks:
+            if entry[3] is not None:
+                entry[3].cancel()
+                entry[3] = None
+
+    def _drop_detached(self):
+        """已经从页面上移除的 widget：取消它的动画并丢弃登记"""
+        screen = self.screen
+        if screen is None:
+            return
+        kept = []
+        for entry in self._animations:
+            if _is_inside(entry[0], screen):
+                kept.append(entry)
+            elif entry[2]:
+                entry[1].cancel(entry[0])
+        self._animations = kept
+        kept = []
+        for entry in self._clocks:
+            if _is_inside(entry[0], screen):
+                kept.append(entry)
+            elif entry[3] is not None:
+                entry[3].cancel()
+        self._clocks = kept
+
+    # ---------- 诊断 ----------
+
+    def counts(self):
+        return {
+            "animations": sum(1 for e in self._animations if e[2]),
+            "clocks": sum(1 for e in self._clocks if e[3] is not None),
+        }
+
+    def __len__(self):
+        return len(self._animations) + len(self._clocks)
+
+
+# 全局登记：还没找到页面、或者不在任何页面里的 widget
+_global = AnimationRegistry()
+# 页面 -> 登记
+_registries = weakref.WeakKeyDictionary()
+# 等下一帧确定所属页面的 widget
+_pending = []
+_pending_event = None
+
+
+def registry_for(screen):
+    """页面的登记（第一次调用时绑定页面的 on_enter / on_leave）"""
+    registry = _registries.get(screen)
+    if registry is None:
+        registry = AnimationRegistry(screen)
+        _registries[screen] = registry
+        screen.bind(on_enter=registry.resume, on_leave=registry.pause)
+        manager = screen.manager
+        if manager is not None and manager.current != screen.name:
+            registry.active = False
+    return registry
+
+
+def _resolve(*args):
+    """把全局登记里的 widget 归到它所在的页面"""
+    global _pending_event
+    _pending_event = None
+    widgets, _pending[:] = list(_pending), []
+    for widget in widgets:
+        screen = _find_screen(widget)
+        if screen is None:
+            continue
+        animations, clocks = _global._take(widget)
+        registry = registry_for(screen)
+        for _, anim, running in animations:
+            registry.add_animation(widget, anim, running)
+        for _, callback, interval, event in clocks:
+            registry.add_clock(widget, callback, interval, event)
+
+
+def _defer(widget):
+    global _pending_event
+    if any(w is widget for w in _pending):
+        return
+    _pending.append(widget)
+    if _pending_event is None:
+        _pending_event = Clock.schedule_once(_resolve, 0)
+
+
+def track_animation(widget, anim):
+    """开始一个循环动画，并登记到 widget 所在的页面"""
+    _global.add_animation(widget, anim)
+    _defer(widget)
+    return anim
+
+
+def track_clock(widget, callback, interval):
+    """开始一个定时器（Clock.schedule_interval），并登记到 widget 所在的页面"""
+    event = _global.add_clock(widget, callback, interval)
+    _defer(widget)
+    return event
+
+
+def release(screen):
+    """页面被删除时取消它的全部动画和定时器"""
+    registry = _registries.pop(screen, None)
+    if registry is not None:
+        registry.clear()
+        try:
+            screen.unbind(on_enter=registry.resume, on_leave=registry.pause)
+        except Exception:
+            pass
+
+
+def live_counts():
+    """当前正在运行的动画和定时器数量（全部页面 + 全局）"""
+    animations = clocks = 0
+    for registry in [_global] + list(_registries.values()):
+        counts = registry.counts()
+        animations += counts["animations"]
+        clocks += counts["clocks"]
+    return {"animations": animations, "clocks": clocks, "screens": len(_registries)}
+
+
+__all__ = [
+    'AnimationRegistry',
+    'track_animation',
+    'track_clock',
+    'registry_for',
+    'release',
+    'live_counts',
+]
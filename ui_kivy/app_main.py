@@ -5,9 +5,19 @@
 """
 import sys
 import os
+import time
+
+# 启动计时起点（用于测量首帧时间）
+APP_START = time.perf_counter()
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import font_config
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("app_main")
+
+with startup_profiler.phase("font_config"):
+    import font_config
 
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
@@ -19,17 +29,53 @@ from kivy.graphics import Color, Rectangle
 from kivy.core.window import Window
 from kivy.utils import get_color_from_hex
 
-# 导入所有模块
-from math_module import (MathMenuScreen, NumberCardsScreen, AdditionScreen, 
-                         CompareScreen, CountGameScreen, ShapesGameScreen, WhackGameScreen)
-from pinyin_module import (PinyinMenuScreen, VowelsLearnScreen, ConsonantsLearnScreen, 
-                          PinyinQuizScreen, PinyinPictureScreen, PinyinMatchScreen, PinyinWhackScreen)
-from english_module import (EnglishMenuScreen, LettersLearnScreen, ColorsLearnScreen, 
-                           NumbersLearnScreen, EnglishQuizScreen)
-from chinese_module import ChineseMenuScreen, ChineseLearnScreen, ChineseQuizScreen
-from thinking_module import ThinkingMenuScreen, FindDifferentScreen, FindPatternScreen
-from vehicles_module import (VehiclesMenuScreen, VehiclesLearnScreen, TrafficLightScreen,
-                            PawPatrolScreen, VehiclesQuizScreen)
+from lazy_screens import LazyScreenManager, measure_first_frame, eager_screens_enabled
+
+# 各学习模块的页面：(页面名, 模块, 类名)
+# 模块在第一次进入对应页面时才导入，冷启动只需要加载主菜单
+LAZY_SCREENS = [
+    # 数学乐园
+    ('math_menu', 'math_module', 'MathMenuScreen'),
+    ('number_cards', 'math_module', 'NumberCardsScreen'),
+    ('addition', 'math_module', 'AdditionScreen'),
+    ('compare', 'math_module', 'CompareScreen'),
+    ('count_game', 'math_module', 'CountGameScreen'),
+    ('shapes_game', 'math_module', 'ShapesGameScreen'),
+    ('whack_game', 'math_module', 'WhackGameScreen'),
+    
+    # 拼音乐园
+    ('pinyin_menu', 'pinyin_module', 'PinyinMenuScreen'),
+    ('vowels_learn', 'pinyin_module', 'VowelsLearnScreen'),
+    ('consonants_learn', 'pinyin_module', 'ConsonantsLearnScreen'),
+    ('pinyin_quiz', 'pinyin_module', 'PinyinQuizScreen'),
+    ('pinyin_picture', 'pinyin_module', 'PinyinPictureScreen'),
+    ('pinyin_match', 'pinyin_module', 'PinyinMatchScreen'),
+    ('pinyin_whack', 'pinyin_module', 'PinyinWhackScreen'),
+    
+    # 英语乐园
+    ('english_menu', 'english_module', 'EnglishMenuScreen'),
+    ('letters_learn', 'english_module', 'LettersLearnScreen'),
+    ('colors_learn', 'english_module', 'ColorsLearnScreen'),
+    ('numbers_learn', 'english_module', 'NumbersLearnScreen'),
+    ('english_quiz', 'english_module', 'EnglishQuizScreen'),
+    
+    # 识字乐园
+    ('chinese_menu', 'chinese_module', 'ChineseMenuScreen'),
+    ('chinese_learn', 'chinese_module', 'ChineseLearnScreen'),
+    ('chinese_quiz', 'chinese_module', 'ChineseQuizScreen'),
+    
+    # 思维乐园
+    ('thinking_menu', 'thinking_module', 'ThinkingMenuScreen'),
+    ('find_different', 'thinking_module', 'FindDifferentScreen'),
+    ('find_pattern', 'thinking_module', 'FindPatternScreen'),
+    
+    # 交通乐园
+    ('vehicles_menu', 'vehicles_module', 'VehiclesMenuScreen'),
+    ('vehicles_learn', 'vehicles_module', 'VehiclesLearnScreen'),
+    ('traffic_light', 'vehicles_module', 'TrafficLightScreen'),
+    ('paw_patrol', 'vehicles_module', 'PawPatrolScreen'),
+    ('vehicles_quiz', 'vehicles_module', 'VehiclesQuizScreen'),
+]
 
 Window.size = (900, 700)
 
@@ -108,53 +154,18 @@ class LearningApp(App):
     
     def build(self):
         self.title = '乐乐的学习乐园 - Kivy版'
-        sm = ScreenManager(transition=FadeTransition())
+        sm = LazyScreenManager(transition=FadeTransition())
         
         # 主菜单
         sm.add_widget(MainMenuScreen(name='main'))
         
-        # 数学乐园
-        sm.add_widget(MathMenuScreen(name='math_menu'))
-        sm.add_widget(NumberCardsScreen(name='number_cards'))
-        sm.add_widget(AdditionScreen(name='addition'))
-        sm.add_widget(CompareScreen(name='compare'))
-        sm.add_widget(CountGameScreen(name='count_game'))
-        sm.add_widget(ShapesGameScreen(name='shapes_game'))
-        sm.add_widget(WhackGameScreen(name='whack_game'))
-        
-        # 拼音乐园
-        sm.add_widget(PinyinMenuScreen(name='pinyin_menu'))
-        sm.add_widget(VowelsLearnScreen(name='vowels_learn'))
-        sm.add_widget(ConsonantsLearnScreen(name='consonants_learn'))
-        sm.add_widget(PinyinQuizScreen(name='pinyin_quiz'))
-        sm.add_widget(PinyinPictureScreen(name='pinyin_picture'))
-        sm.add_widget(PinyinMatchScreen(name='pinyin_match'))
-        sm.add_widget(PinyinWhackScreen(name='pinyin_whack'))
-        
-        # 英语乐园
-        sm.add_widget(EnglishMenuScreen(name='english_menu'))
-        sm.add_widget(LettersLearnScreen(name='letters_learn'))
-        sm.add_widget(ColorsLearnScreen(name='colors_learn'))
-        sm.add_widget(NumbersLearnScreen(name='numbers_learn'))
-        sm.add_widget(EnglishQuizScreen(name='english_quiz'))
-        
-        # 识字乐园
-        sm.add_widget(ChineseMenuScreen(name='chinese_menu'))
-        sm.add_widget(ChineseLearnScreen(name='chinese_learn'))
-        sm.add_widget(ChineseQuizScreen(name='chinese_quiz'))
-        
-        # 思维乐园
-        sm.add_widget(ThinkingMenuScreen(name='thinking_menu'))
-        sm.add_widget(FindDifferentScreen(name='find_different'))
-        sm.add_widget(FindPatternScreen(name='find_pattern'))
-        
-        # 交通乐园
-        sm.add_widget(VehiclesMenuScreen(name='vehicles_menu'))
-        sm.add_widget(VehiclesLearnScreen(name='vehicles_learn'))
-        sm.add_widget(TrafficLightScreen(name='traffic_light'))
-        sm.add_widget(PawPatrolScreen(name='paw_patrol'))
-        sm.add_widget(VehiclesQuizScreen(name='vehicles_quiz'))
+        # 其余页面按需创建
+        for name, module_name, class_name in LAZY_SCREENS:
+            sm.register_class(name, module_name, class_name)
+        if eager_screens_enabled():
+            sm.build_all()
         
+        measure_first_frame(self, "LearningApp", APP_START)
         return sm
 
 
@@ -8,7 +8,6 @@ import os
 import sys
 import threading
 import random
-import tempfile
 import uuid
 
 # 禁用代理
@@ -21,6 +20,7 @@ os.environ['no_proxy'] = '*'
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.audio_interface import AudioInterface
+from audio_pack import pack_path_for
 
 # ============================================================
 # 本地音频文件路径
@@ -62,6 +62,9 @@ def get_audio_dir():
     for path in possible_paths:
         try:
             abs_path = os.path.abspath(path)
+            if os.path.isfile(pack_path_for(abs_path)):
+                print(f"[audio] 找到音频资源包: {pack_path_for(abs_path)}")
+                return abs_path
             if os.path.exists(abs_path):
                 # 检查目录是否有mp3文件
                 files = os.listdir(abs_path)
@@ -151,6 +154,10 @@ try:
 except ImportError:
     pass
 
+from tts_service import get_tts_service
+from audio_index import get_audio_index, char_to_code
+from sound_pool import SoundPool, KivySoundBackend, PRELOAD_PER_GROUP
+
 
 # ============================================================
 # 本地音频文件查找
@@ -163,12 +170,19 @@ def _init_audio_dir():
         print(f"[audio] 音频目录: {AUDIO_DIR}")
     return AUDIO_DIR
 
-def char_to_code(char):
-    """将汉字转换为Unicode编码字符串（十六进制）"""
-    return format(ord(char), 'x')
+def _get_index():
+    """获取本地音频索引（第一次调用时扫描音频目录）"""
+    index = get_audio_index()
+    if index.audio_dir is None:
+        index.invalidate(_init_audio_dir())
+    return index
+
+def refresh_local_audio():
+    """音频文件有更新时调用，下次查找会重新扫描目录"""
+    get_audio_index().invalidate(_init_audio_dir())
 
 def find_local_audio(text):
-    """查找本地预生成的音频文件
+    """查找本地预生成的音频文件（内存索引，不访问文件系统）
     
     Args:
         text: 要播放的文字
@@ -176,42 +190,7 @@ def find_local_audio(text):
     Returns:
         音频文件路径，如果不存在返回None
     """
-    audio_dir = _init_audio_dir()
-    if not os.path.exists(audio_dir):
-        print(f"[audio] 音频目录不存在: {audio_dir}")
-        return None
-    
-    # 欢迎语
-    if '欢迎' in text or '乐园' in text:
-        filepath = os.path.join(audio_dir, "welcome.mp3")
-        if os.path.exists(filepath):
-            print(f"[audio] 找到欢迎语音频!")
-            return filepath
-    
-    # 单个汉字 - 使用Unicode编码作为文件名
-    if len(text) == 1:
-        code = char_to_code(text)
-        filepath = os.path.join(audio_dir, f"char_{code}.mp3")
-        if os.path.exists(filepath):
-            print(f"[audio] 找到汉字音频: {text} -> char_{code}.mp3")
-            return filepath
-    
-    # 拼音 - 需要根据汉字查找对应的拼音音频
-    # 拼音文件名也是用汉字的Unicode编码
-    # 这里text可能是拼音字符串，需要特殊处理
-    # 暂时跳过拼音的本地查找，使用TTS
-    
-    # 词组 - 只匹配2-4个字的短词组，避免长句子误匹配
-    if 2 <= len(text) <= 4:
-        first_char = text[0]
-        code = char_to_code(first_char)
-        filepath = os.path.join(audio_dir, f"word_{code}.mp3")
-        if os.path.exists(filepath):
-            print(f"[audio] 找到词组音频: {text} -> word_{code}.mp3")
-            return filepath
-    
-    print(f"[audio] 未找到本地音频: {text}")
-    return None
+    return _get_index().find_text(text)
 
 def find_pinyin_audio(char):
     """查找汉字对应的拼音音频文件
@@ -222,66 +201,23 @@ def find_pinyin_audio(char):
     Returns:
         音频文件路径，如果不存在返回None
     """
-    audio_dir = _init_audio_dir()
-    if not os.path.exists(audio_dir):
-        return None
-    
-    if len(char) == 1:
-        code = char_to_code(char)
-        filepath = os.path.join(audio_dir, f"pinyin_{code}.mp3")
-        if os.path.exists(filepath):
-            print(f"[audio] 找到拼音音频: {char} -> pinyin_{code}.mp3")
-            return filepath
-    
-    return None
+    return _get_index().find_pinyin(char)
 
 def find_praise_audio():
     """随机获取一个表扬语音频文件"""
-    audio_dir = _init_audio_dir()
-    if not os.path.exists(audio_dir):
-        return None
-    
-    idx = random.randint(0, NUM_PRAISES - 1)
-    filepath = os.path.join(audio_dir, f"praise_{idx:02d}.mp3")
-    if os.path.exists(filepath):
-        return filepath
-    return None
+    return _get_index().random_clip('praise')
 
 def find_encourage_audio():
     """随机获取一个鼓励语音频文件"""
-    audio_dir = _init_audio_dir()
-    if not os.path.exists(audio_dir):
-        return None
-    
-    idx = random.randint(0, NUM_ENCOURAGES - 1)
-    filepath = os.path.join(audio_dir, f"encourage_{idx:02d}.mp3")
-    if os.path.exists(filepath):
-        return filepath
-    return None
+    return _get_index().random_clip('encourage')
 
 def find_short_praise_audio():
     """随机获取一个简短表扬语音频文件"""
-    audio_dir = _init_audio_dir()
-    if not os.path.exists(audio_dir):
-        return None
-    
-    idx = random.randint(0, NUM_SHORT_PRAISES - 1)
-    filepath = os.path.join(audio_dir, f"short_praise_{idx:02d}.mp3")
-    if os.path.exists(filepath):
-        return filepath
-    return None
+    return _get_index().random_clip('short_praise')
 
 def find_short_encourage_audio():
     """随机获取一个简短鼓励语音频文件"""
-    audio_dir = _init_audio_dir()
-    if not os.path.exists(audio_dir):
-        return None
-    
-    idx = random.randint(0, NUM_SHORT_ENCOURAGES - 1)
-    filepath = os.path.join(audio_dir, f"short_encourage_{idx:02d}.mp3")
-    if os.path.exists(filepath):
-        return filepath
-    return None
+    return _get_index().random_clip('short_encourage')
 
 
 # ============================================================
@@ -437,6 +373,10 @@ def get_android_tts():
     return _android_tts
 
 
+# 反馈音效分组（对应 audio/generated 中的 praise_XX.mp3 等）
+FEEDBACK_GROUPS = ('short_praise', 'short_encourage', 'praise', 'encourage')
+
+
 # ============================================================
 # 主音频类
 # ============================================================
@@ -446,21 +386,38 @@ class KivyAudio(AudioInterface):
     def __init__(self):
         self.platform = PLATFORM
         self.tts_ready = False
-        self.temp_dir = None
         self.speech_id = 0
         self.current_sound = None
         self.tts_lock = threading.Lock()
         self._pending_speaks = []
         self._android_tts = None
-        
-        # 创建临时目录
-        try:
-            self.temp_dir = tempfile.mkdtemp()
-        except:
-            self.temp_dir = '/tmp'
+        self.sound_pool = None
         
         # 初始化
         self._init_tts()
+        # 启动后每帧预加载一个反馈音效（每组前几个），第一次表扬就不用等解码
+        self._preload_groups = list(FEEDBACK_GROUPS)
+        Clock.schedule_once(
+            lambda dt: Clock.schedule_interval(self._preload_feedback, 0), 1)
+    
+    def _preload_feedback(self, dt):
+        """每帧解码一个反馈音效，全部完成后返回 False 停止调度"""
+        pool = self._get_sound_pool()
+        while self._preload_groups:
+            if pool.preload_next(self._preload_groups[0], PRELOAD_PER_GROUP):
+                return True
+            self._preload_groups.pop(0)
+        return False
+    
+    def _get_sound_pool(self):
+        """反馈音效池（第一次使用时按本地音频索引登记文件，播放时才解出）"""
+        if self.sound_pool is None:
+            index = _get_index()
+            pool = SoundPool(KivySoundBackend(), resolve=index.path)
+            for group in FEEDBACK_GROUPS:
+                pool.register(group, index.clip_names(group))
+            self.sound_pool = pool
+        return self.sound_pool
     
     def _init_tts(self):
         """初始化TTS"""
@@ -506,12 +463,9 @@ class KivyAudio(AudioInterface):
     
     def speak(self, text: str, rate: str = "+0%"):
         """朗读文字 - 优先使用本地预生成音频"""
-        print(f"[KivyAudio] speak: '{text}', ready={self.tts_ready}, platform={self.platform}")
-        
         # 优先查找本地音频文件
         local_audio = find_local_audio(text)
         if local_audio:
-            print(f"[KivyAudio] 使用本地音频: {local_audio}")
             Clock.schedule_once(lambda dt: self._play_file(local_audio, cleanup=False), 0)
             return
         
@@ -523,16 +477,28 @@ class KivyAudio(AudioInterface):
         
         self._do_speak(text)
     
+    def prefetch(self, texts, rate: str = "+0%", lang: str = "cn"):
+        """预先生成接下来要朗读的文字（已有本地音频的跳过）"""
+        if self.platform == 'android' or not EDGE_TTS_AVAILABLE:
+            return
+        texts = [t for t in texts if t and not find_local_audio(t)]
+        if texts:
+            get_tts_service().prefetch(texts, get_voice(), rate, lang)
+    
+    def cancel_prefetch(self):
+        """取消尚未完成的预取"""
+        if EDGE_TTS_AVAILABLE:
+            get_tts_service().cancel_prefetch()
+    
     def _do_speak(self, text: str):
         """执行语音播放"""
         if self.platform == 'android':
             # Android平台 - 在主线程调用
             Clock.schedule_once(lambda dt: self._speak_android(text), 0)
         elif EDGE_TTS_AVAILABLE:
-            # 桌面平台 - 后台线程
+            # 桌面平台 - 交给常驻TTS服务，旧请求自动被取代
             self.speech_id += 1
-            t = threading.Thread(target=self._speak_edge_tts, args=(text, self.speech_id), daemon=True)
-            t.start()
+            self._speak_edge_tts(text, self.speech_id)
         elif hasattr(self, '_pyttsx3'):
             # pyttsx3后备
             try:
@@ -550,29 +516,12 @@ class KivyAudio(AudioInterface):
             print("[KivyAudio] AndroidTTS实例不存在")
     
     def _speak_edge_tts(self, text: str, speech_id: int):
-        """Edge TTS播放（桌面）"""
-        try:
-            if speech_id != self.speech_id:
-                return
-            
-            import asyncio
-            audio_file = os.path.join(self.temp_dir, f"tts_{uuid.uuid4().hex}.mp3")
-            
-            async def generate():
-                communicate = edge_tts.Communicate(text, get_voice())
-                await communicate.save(audio_file)
-            
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(generate())
-            finally:
-                loop.close()
-            
-            if os.path.exists(audio_file):
-                Clock.schedule_once(lambda dt: self._play_file(audio_file), 0)
-        except Exception as e:
-            print(f"[KivyAudio] Edge TTS错误: {e}")
+        """Edge TTS播放（桌面）- 结果写入共享缓存，重复的话直接播放"""
+        def on_ready(audio_file):
+            if speech_id == self.speech_id:
+                Clock.schedule_once(lambda dt: self._play_file(audio_file, cleanup=False), 0)
+        
+        get_tts_service().submit(text, get_voice(), on_ready=on_ready)
     
     def _play_file(self, filepath: str, cleanup: bool = True):
         """播放音频文件
@@ -603,41 +552,45 @@ class KivyAudio(AudioInterface):
         except:
             pass
     
+    def _play_feedback(self, group, fallback_texts):
+        """从音效池播放预生成的反馈音频（已解码的 Sound 直接复用）
+
+        音效池里没有这组文件、或者真正播放时加载/播放失败，都改用 TTS 朗读
+        fallback_texts 中随机的一句（失败是在 Clock 回调里才知道的，所以回退也在回调里做）。
+        """
+        pool = self._get_sound_pool()
+        if not pool.has(group):
+            self.speak(random.choice(fallback_texts))
+            return
+        
+        def _play(dt):
+            if self.current_sound:
+                self.current_sound.stop()
+            try:
+                started = pool.play_random(group)
+            except Exception as e:
+                print(f"[KivyAudio] 播放反馈音频失败: {e}")
+                started = False
+            if not started:
+                self.speak(random.choice(fallback_texts))
+        
+        Clock.schedule_once(_play, 0)
+    
     def play_praise(self):
         """播放表扬 - 优先使用本地预生成音频"""
-        local_audio = find_praise_audio()
-        if local_audio:
-            print(f"[KivyAudio] 使用本地表扬音频: {local_audio}")
-            Clock.schedule_once(lambda dt: self._play_file(local_audio, cleanup=False), 0)
-        else:
-            self.speak(random.choice(get_praises()))
+        self._play_feedback('praise', get_praises())
     
     def play_encourage(self):
         """播放鼓励 - 优先使用本地预生成音频"""
-        local_audio = find_encourage_audio()
-        if local_audio:
-            print(f"[KivyAudio] 使用本地鼓励音频: {local_audio}")
-            Clock.schedule_once(lambda dt: self._play_file(local_audio, cleanup=False), 0)
-        else:
-            self.speak(random.choice(get_encourages()))
+        self._play_feedback('encourage', get_encourages())
     
     def play_short_praise(self):
         """播放简短表扬（用于打地鼠等快节奏游戏）"""
-        local_audio = find_short_praise_audio()
-        if local_audio:
-            print(f"[KivyAudio] 使用本地简短表扬音频: {local_audio}")
-            Clock.schedule_once(lambda dt: self._play_file(local_audio, cleanup=False), 0)
-        else:
-            self.speak(random.choice(SHORT_PRAISES))
+        self._play_feedback('short_praise', SHORT_PRAISES)
     
     def play_short_encourage(self):
         """播放简短鼓励（用于打地鼠等快节奏游戏）"""
-        local_audio = find_short_encourage_audio()
-        if local_audio:
-            print(f"[KivyAudio] 使用本地简短鼓励音频: {local_audio}")
-            Clock.schedule_once(lambda dt: self._play_file(local_audio, cleanup=False), 0)
-        else:
-            self.speak(random.choice(SHORT_ENCOURAGES))
+        self._play_feedback('short_encourage', SHORT_ENCOURAGES)
     
     def speak_pinyin(self, char: str):
         """播放汉字的拼音 - 优先使用本地预生成音频
@@ -647,7 +600,6 @@ class KivyAudio(AudioInterface):
         """
         local_audio = find_pinyin_audio(char)
         if local_audio:
-            print(f"[KivyAudio] 使用本地拼音音频: {local_audio}")
             Clock.schedule_once(lambda dt: self._play_file(local_audio, cleanup=False), 0)
         else:
             # 没有本地音频，使用TTS（需要从数据中获取拼音文本）
@@ -660,6 +612,8 @@ class KivyAudio(AudioInterface):
     def stop(self):
         """停止播放"""
         self.speech_id += 1
+        if EDGE_TTS_AVAILABLE:
+            get_tts_service().cancel()
         if self._android_tts:
             self._android_tts.stop()
         if self.current_sound:
@@ -667,6 +621,8 @@ class KivyAudio(AudioInterface):
                 self.current_sound.stop()
             except:
                 pass
+        if self.sound_pool:
+            self.sound_pool.stop_all()
     
     def cleanup(self):
         """清理"""
@@ -6,15 +6,24 @@ v1.8.7 - 修复测验延迟时间，等表扬播完再下一题
 """
 import sys
 import os
+import time
+
+# 启动计时起点（用于测量首帧时间）
+APP_START = time.perf_counter()
 
 # 确保能找到模块
 app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, app_dir)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# 启动性能分析（LELE_PROFILE_STARTUP=1 或 --profile-startup 时开启）
+import startup_profiler
+startup_profiler.install_if_enabled("chinese_app")
+
 # 必须在导入kivy之前配置字体
 try:
-    import font_config
+    with startup_profiler.phase("font_config"):
+        import font_config
     print("[chinese_app] 字体配置模块已加载")
 except ImportError as e:
     print(f"[chinese_app] 字体配置导入失败: {e}")
@@ -34,6 +43,8 @@ from kivy.clock import Clock
 from kivy.metrics import dp, sp
 from kivy.core.text import LabelBase
 from kivy.animation import Animation  # 添加动画支持
+from lazy_screens import LazyScreenManager, measure_first_frame, eager_screens_enabled
+from anim_registry import track_clock
 import random
 
 
@@ -290,12 +301,14 @@ def setup_font():
     print("[chinese_app] 警告: 未找到中文字体，使用系统默认")
     return False
 
-setup_font()
+with startup_profiler.phase("setup_font"):
+    setup_font()
 
 # 导入数据模块
 try:
     from core.data_chinese import ChineseData
     from core.game_logic import GameLogic, GameType
+    from core.sampling import sample_distinct
 except ImportError:
     # 如果导入失败，使用内置数据
     print("使用内置数据模块")
@@ -380,6 +393,16 @@ def speak(text):
     if audio:
         audio.speak(text)
 
+def prefetch(texts):
+    """预先生成接下来要朗读的文字"""
+    if audio:
+        audio.prefetch(texts)
+
+def cancel_prefetch():
+    """取消尚未完成的预取"""
+    if audio:
+        audio.cancel_prefetch()
+
 def play_praise():
     """播放表扬"""
     if audio:
@@ -681,12 +704,11 @@ class ChineseMenuScreen(Screen):
         if not hasattr(self, 'debug_label'):
             return
         try:
-            import os
-            from audio_kivy import get_audio_dir, PLATFORM
-            audio_dir = get_audio_dir()
-            if os.path.exists(audio_dir):
-                files = os.listdir(audio_dir)
-                mp3_count = len([f for f in files if f.endswith('.mp3')])
+            from audio_kivy import _get_index, PLATFORM
+            index = _get_index()
+            audio_dir = index.audio_dir
+            mp3_count = index.count()
+            if mp3_count:
                 self.debug_label.text = f'v1.8.7 | 音频:{mp3_count}个 | {PLATFORM}'
             else:
                 self.debug_label.text = f'v1.8.7 | 音频:未找到 | {PLATFORM} | {audio_dir[:30]}...'
@@ -702,8 +724,8 @@ class ChineseMenuScreen(Screen):
                 color = random.choice(colors)
                 self.title_label.color = get_color_from_hex(color)
         
-        # 每2秒变换一次颜色
-        Clock.schedule_interval(change_color, 2)
+        # 每2秒变换一次颜色（离开主页时暂停）
+        track_clock(self, change_color, 2)
 
 
 class ChineseLearnScreen(Screen):
@@ -1192,11 +1214,15 @@ class ChineseDetailScreen(Screen):
 class ChineseQuizScreen(Screen):
     """汉字测验 - 选择题模式 - 天天主题"""
     
+    # 提前准备几题的读音
+    PREFETCH_AHEAD = 3
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.logic = GameLogic()
         self.session = None
         self.current_word = None
+        self.upcoming_words = []
         self.build_ui()
     
     def build_ui(self):
@@ -1302,8 +1328,21 @@ class ChineseQuizScreen(Screen):
         self.score_label.text = '得分: 0'
         self.feedback_label.text = ''
         self.start_btn.text = '重新开始'
+        self.upcoming_words = []
         self.next_question()
     
+    def on_leave(self):
+        """离开页面时取消预取"""
+        cancel_prefetch()
+    
+    def pick_word(self, words):
+        """取出下一题的汉字，并预取之后几题的读音"""
+        while len(self.upcoming_words) <= self.PREFETCH_AHEAD:
+            self.upcoming_words.append(random.choice(words))
+        word = self.upcoming_words.pop(0)
+        prefetch([w[0] for w in self.upcoming_words])
+        return word
+    
     def play_sound(self, instance):
         """点击播放按钮再听一遍"""
         if self.current_word:
@@ -1315,7 +1354,7 @@ class ChineseQuizScreen(Screen):
             return
         
         words = ChineseData.get_words(level=2)
-        self.current_word = random.choice(words)
+        self.current_word = self.pick_word(words)
         char, pinyin, word, emoji = self.current_word
         
         # 听声音选字模式
@@ -1327,8 +1366,7 @@ class ChineseQuizScreen(Screen):
         
         # 生成汉字选项 - 使用更大的按钮
         self.answers_layout.clear_widgets()
-        all_chars = [w[0] for w in words]
-        options = self.logic.get_random_options(char, all_chars, count=4)
+        options = self.logic.get_random_options(char, words, count=4, key=lambda w: w[0])
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
         for i, opt in enumerate(options):
@@ -1963,7 +2001,7 @@ class ChineseWhackScreen(Screen):
         mole_positions = random.sample(range(9), num_moles)
         
         # 确保目标汉字在其中
-        others = random.sample([w for w in words if w[0] != self.target_char], num_moles - 1)
+        others = sample_distinct(words, num_moles - 1, exclude=(self.target_char,), key=lambda w: w[0])
         char_list = [self.target_char] + [w[0] for w in others]
         random.shuffle(char_list)
         
@@ -2201,8 +2239,7 @@ class ChinesePictureScreen(Screen):
         
         # 生成选项
         self.answers_layout.clear_widgets()
-        all_chars = [w[0] for w in words]
-        options = self.logic.get_random_options(char, all_chars, count=4)
+        options = self.logic.get_random_options(char, words, count=4, key=lambda w: w[0])
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
         for i, opt in enumerate(options):
@@ -2519,8 +2556,7 @@ class ChineseChallengeScreen(Screen):
         
         # 生成汉字选项
         self.answers_layout.clear_widgets()
-        all_chars = [w[0] for w in words]
-        options = self.logic.get_random_options(char, all_chars, count=num_options)
+        options = self.logic.get_random_options(char, words, count=num_options, key=lambda w: w[0])
         
         # 根据选项数量调整列数
         if num_options <= 4:
@@ -3686,7 +3722,8 @@ class ChineseLearnApp(App):
         
         # 初始化音频（关键！）
         print("[App] 初始化音频模块...")
-        audio_instance = init_audio()
+        with startup_profiler.phase("audio_init"):
+            audio_instance = init_audio()
         if audio_instance:
             print("[App] 音频模块初始化成功")
         else:
@@ -3695,18 +3732,22 @@ class ChineseLearnApp(App):
         # 延迟播放欢迎语，等待TTS完全初始化（增加延迟时间）
         Clock.schedule_once(lambda dt: self._play_welcome(), 3.0)
         
-        sm = ScreenManager(transition=FadeTransition())
+        # 启动时只创建菜单，其余页面第一次进入时再创建
+        sm = LazyScreenManager(transition=FadeTransition())
         sm.add_widget(ChineseMenuScreen(name='chinese_menu'))
-        sm.add_widget(ChineseLearnScreen(name='chinese_learn'))
-        sm.add_widget(ChineseDetailScreen(name='chinese_detail'))
-        sm.add_widget(ChineseQuizScreen(name='chinese_quiz'))
-        sm.add_widget(ChineseMatchScreen(name='chinese_match'))
-        sm.add_widget(ChineseWhackScreen(name='chinese_whack'))
-        sm.add_widget(ChinesePictureScreen(name='chinese_picture'))
-        sm.add_widget(ChineseChallengeScreen(name='chinese_challenge'))
-        sm.add_widget(ChineseWriteScreen(name='chinese_write'))
-        sm.add_widget(ChineseStoryScreen(name='chinese_story'))
-        
+        sm.register('chinese_learn', lambda: ChineseLearnScreen)
+        sm.register('chinese_detail', lambda: ChineseDetailScreen)
+        sm.register('chinese_quiz', lambda: ChineseQuizScreen)
+        sm.register('chinese_match', lambda: ChineseMatchScreen)
+        sm.register('chinese_whack', lambda: ChineseWhackScreen)
+        sm.register('chinese_picture', lambda: ChinesePictureScreen)
+        sm.register('chinese_challenge', lambda: ChineseChallengeScreen)
+        sm.register('chinese_write', lambda: ChineseWriteScreen)
+        sm.register('chinese_story', lambda: ChineseStoryScreen)
+        if eager_screens_enabled():
+            sm.build_all()
+        
+        measure_first_frame(self, "App", APP_START)
         print("[App] 应用构建完成")
         return sm
     
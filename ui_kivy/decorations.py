@@ -6,7 +6,7 @@ v2.0 - 大幅扩展，更多图案和动画
 """
 from kivy.uix.widget import Widget
 from kivy.uix.floatlayout import FloatLayout
-from kivy.graphics import Color, Ellipse, Line, Rectangle, Triangle, Rotate, PushMatrix, PopMatrix
+from kivy.graphics import Color, Ellipse, Line, Rectangle, Triangle, Rotate, PushMatrix, PopMatrix, Scale, Translate
 from kivy.graphics.instructions import InstructionGroup
 from kivy.metrics import dp
 from kivy.clock import Clock
@@ -15,108 +15,81 @@ from kivy.properties import NumericProperty, ListProperty
 import random
 import math
 
+from particles import get_emitter
+from anim_registry import track_animation, track_clock
+from transform_widget import TransformWidget, star_points
+
 
 # ============================================================
 # 基础装饰图形
 # ============================================================
 
-class StarWidget(Widget):
+class StarWidget(TransformWidget):
     """可爱的星星"""
-    rotation = NumericProperty(0)
     
     def __init__(self, color=(1, 0.8, 0), filled=True, **kwargs):
-        super().__init__(**kwargs)
         self.star_color = color
         self.filled = filled
-        self.bind(size=self.draw, pos=self.draw, rotation=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        super().__init__(**kwargs)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
+    def build(self):
         r = min(self.width, self.height) * 0.4
-        with self.canvas:
-            PushMatrix()
-            Rotate(angle=self.rotation, origin=(cx, cy))
-            Color(*self.star_color)
-            points = []
+        points = star_points(r)
+        self.paint('star_color')
+        if self.filled:
+            # 填充星星用三角形
             for i in range(5):
-                angle = math.radians(90 + i * 72)
-                points.extend([cx + r * math.cos(angle), cy + r * math.sin(angle)])
-                angle = math.radians(90 + i * 72 + 36)
-                points.extend([cx + r * 0.4 * math.cos(angle), cy + r * 0.4 * math.sin(angle)])
-            if self.filled:
-                # 填充星星用三角形
-                for i in range(5):
-                    idx = i * 4
-                    Triangle(points=[cx, cy, points[idx], points[idx+1], points[(idx+2)%20], points[(idx+3)%20]])
-            Line(points=points, width=dp(2), close=True)
-            PopMatrix()
+                idx = i * 4
+                self.add(Triangle(points=[0, 0, points[idx], points[idx+1], points[(idx+2)%20], points[(idx+3)%20]]))
+        self.add(Line(points=points, width=dp(2), close=True))
 
 
-class HeartWidget(Widget):
-    """可爱的爱心"""
-    scale = NumericProperty(1)
+class HeartWidget(TransformWidget):
+    """可爱的爱心（scale 动画只改 Scale 指令）"""
     
     def __init__(self, color=(1, 0.4, 0.4), **kwargs):
-        super().__init__(**kwargs)
         self.heart_color = color
-        self.bind(size=self.draw, pos=self.draw, scale=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        super().__init__(**kwargs)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.25 * self.scale
-        with self.canvas:
-            Color(*self.heart_color)
-            Ellipse(pos=(cx - r * 1.3, cy - r * 0.2), size=(r * 1.4, r * 1.4))
-            Ellipse(pos=(cx - r * 0.1, cy - r * 0.2), size=(r * 1.4, r * 1.4))
-            Triangle(points=[cx - r * 1.4, cy + r * 0.2, cx + r * 1.4, cy + r * 0.2, cx, cy - r * 1.5])
+    def build(self):
+        r = min(self.width, self.height) * 0.25
+        self.paint('heart_color')
+        self.add(Ellipse(pos=(-r * 1.3, -r * 0.2), size=(r * 1.4, r * 1.4)))
+        self.add(Ellipse(pos=(-r * 0.1, -r * 0.2), size=(r * 1.4, r * 1.4)))
+        self.add(Triangle(points=[-r * 1.4, r * 0.2, r * 1.4, r * 0.2, 0, -r * 1.5]))
 
 
-class SunWidget(Widget):
-    """可爱的太阳（带笑脸）"""
-    rotation = NumericProperty(0)
+class SunWidget(TransformWidget):
+    """可爱的太阳（带笑脸，只有光芒旋转）"""
     
     def __init__(self, with_face=True, **kwargs):
-        super().__init__(**kwargs)
         self.with_face = with_face
-        self.bind(size=self.draw, pos=self.draw, rotation=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        super().__init__(**kwargs)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
+    def build(self):
         r = min(self.width, self.height) * 0.25
-        with self.canvas:
-            PushMatrix()
-            Rotate(angle=self.rotation, origin=(cx, cy))
-            # 光芒
-            Color(1, 0.6, 0)
-            for i in range(12):
-                angle = math.radians(i * 30)
-                x1 = cx + r * 1.2 * math.cos(angle)
-                y1 = cy + r * 1.2 * math.sin(angle)
-                x2 = cx + r * 1.7 * math.cos(angle)
-                y2 = cy + r * 1.7 * math.sin(angle)
-                Line(points=[x1, y1, x2, y2], width=dp(3))
-            PopMatrix()
-            # 太阳本体
-            Color(1, 0.85, 0)
-            Ellipse(pos=(cx - r, cy - r), size=(r * 2, r * 2))
-            if self.with_face:
-                # 眼睛
-                Color(0.2, 0.2, 0.2)
-                Ellipse(pos=(cx - r * 0.5, cy + r * 0.1), size=(r * 0.25, r * 0.3))
-                Ellipse(pos=(cx + r * 0.25, cy + r * 0.1), size=(r * 0.25, r * 0.3))
-                # 笑脸
-                Color(1, 0.5, 0)
-                Line(bezier=[cx - r * 0.4, cy - r * 0.2, cx, cy - r * 0.5, cx + r * 0.4, cy - r * 0.2], width=dp(2))
-                # 腮红
-                Color(1, 0.6, 0.6, 0.5)
-                Ellipse(pos=(cx - r * 0.7, cy - r * 0.3), size=(r * 0.3, r * 0.2))
-                Ellipse(pos=(cx + r * 0.4, cy - r * 0.3), size=(r * 0.3, r * 0.2))
+        # 光芒
+        self.add(Color(1, 0.6, 0))
+        for i in range(12):
+            angle = math.radians(i * 30)
+            c, s = math.cos(angle), math.sin(angle)
+            self.add(Line(points=[r * 1.2 * c, r * 1.2 * s, r * 1.7 * c, r * 1.7 * s], width=dp(3)))
+        # 太阳本体
+        fixed = self.add_fixed
+        fixed(Color(1, 0.85, 0))
+        fixed(Ellipse(pos=(-r, -r), size=(r * 2, r * 2)))
+        if self.with_face:
+            # 眼睛
+            fixed(Color(0.2, 0.2, 0.2))
+            fixed(Ellipse(pos=(-r * 0.5, r * 0.1), size=(r * 0.25, r * 0.3)))
+            fixed(Ellipse(pos=(r * 0.25, r * 0.1), size=(r * 0.25, r * 0.3)))
+            # 笑脸
+            fixed(Color(1, 0.5, 0))
+            fixed(Line(bezier=[-r * 0.4, -r * 0.2, 0, -r * 0.5, r * 0.4, -r * 0.2], width=dp(2)))
+            # 腮红
+            fixed(Color(1, 0.6, 0.6, 0.5))
+            fixed(Ellipse(pos=(-r * 0.7, -r * 0.3), size=(r * 0.3, r * 0.2)))
+            fixed(Ellipse(pos=(r * 0.4, -r * 0.3), size=(r * 0.3, r * 0.2)))
 
 
 class MoonWidget(Widget):
@@ -190,41 +163,32 @@ class RainbowWidget(Widget):
 # 植物类装饰
 # ============================================================
 
-class FlowerWidget(Widget):
+class FlowerWidget(TransformWidget):
     """可爱的花朵"""
-    rotation = NumericProperty(0)
     
     def __init__(self, petal_color=(1, 0.5, 0.7), center_color=(1, 0.9, 0), petals=5, **kwargs):
-        super().__init__(**kwargs)
         self.petal_color = petal_color
         self.center_color = center_color
         self.petals = petals
-        self.bind(size=self.draw, pos=self.draw, rotation=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        super().__init__(**kwargs)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
+    def build(self):
         r = min(self.width, self.height) * 0.2
-        with self.canvas:
-            PushMatrix()
-            Rotate(angle=self.rotation, origin=(cx, cy))
-            # 花瓣
-            Color(*self.petal_color)
-            for i in range(self.petals):
-                angle = math.radians(i * (360 / self.petals))
-                px = cx + r * 0.7 * math.cos(angle)
-                py = cy + r * 0.7 * math.sin(angle)
-                Ellipse(pos=(px - r * 0.55, py - r * 0.55), size=(r * 1.1, r * 1.1))
-            # 花心
-            Color(*self.center_color)
-            Ellipse(pos=(cx - r * 0.45, cy - r * 0.45), size=(r * 0.9, r * 0.9))
-            # 花心纹理
-            Color(self.center_color[0] * 0.8, self.center_color[1] * 0.8, 0)
-            for i in range(6):
-                angle = math.radians(i * 60)
-                Ellipse(pos=(cx + r * 0.15 * math.cos(angle) - r * 0.08, cy + r * 0.15 * math.sin(angle) - r * 0.08), size=(r * 0.16, r * 0.16))
-            PopMatrix()
+        # 花瓣
+        self.paint('petal_color')
+        for i in range(self.petals):
+            angle = math.radians(i * (360 / self.petals))
+            px = r * 0.7 * math.cos(angle)
+            py = r * 0.7 * math.sin(angle)
+            self.add(Ellipse(pos=(px - r * 0.55, py - r * 0.55), size=(r * 1.1, r * 1.1)))
+        # 花心
+        self.paint('center_color')
+        self.add(Ellipse(pos=(-r * 0.45, -r * 0.45), size=(r * 0.9, r * 0.9)))
+        # 花心纹理
+        self.add(Color(self.center_color[0] * 0.8, self.center_color[1] * 0.8, 0))
+        for i in range(6):
+            angle = math.radians(i * 60)
+            self.add(Ellipse(pos=(r * 0.15 * math.cos(angle) - r * 0.08, r * 0.15 * math.sin(angle) - r * 0.08), size=(r * 0.16, r * 0.16)))
 
 
 class TreeWidget(Widget):
@@ -301,79 +265,95 @@ class MushroomWidget(Widget):
 # 动物类装饰
 # ============================================================
 
-class ButterflyWidget(Widget):
-    """可爱的蝴蝶"""
+class ButterflyWidget(TransformWidget):
+    """可爱的蝴蝶（扇翅膀只改翅膀的 Scale 指令）"""
     wing_angle = NumericProperty(0)
     
     def __init__(self, color=(0.9, 0.5, 0.9), **kwargs):
-        super().__init__(**kwargs)
         self.butterfly_color = color
-        self.bind(size=self.draw, pos=self.draw, wing_angle=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        self._wings = None
+        super().__init__(**kwargs)
+        self.bind(wing_angle=self._flap)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
+    def build(self):
         r = min(self.width, self.height) * 0.2
-        wing_scale = 1 + math.sin(math.radians(self.wing_angle)) * 0.15
-        with self.canvas:
-            # 上翅膀
-            Color(*self.butterfly_color)
-            Ellipse(pos=(cx - r * 1.8 * wing_scale, cy), size=(r * 1.5 * wing_scale, r * 1.8))
-            Ellipse(pos=(cx + r * 0.3 * wing_scale, cy), size=(r * 1.5 * wing_scale, r * 1.8))
-            # 下翅膀
-            Color(self.butterfly_color[0] * 0.8, self.butterfly_color[1] * 0.8, self.butterfly_color[2] * 0.8)
-            Ellipse(pos=(cx - r * 1.5 * wing_scale, cy - r * 1.2), size=(r * 1.2 * wing_scale, r * 1.3))
-            Ellipse(pos=(cx + r * 0.3 * wing_scale, cy - r * 1.2), size=(r * 1.2 * wing_scale, r * 1.3))
-            # 翅膀花纹
-            Color(1, 1, 1, 0.6)
-            Ellipse(pos=(cx - r * 1.3, cy + r * 0.4), size=(r * 0.5, r * 0.5))
-            Ellipse(pos=(cx + r * 0.8, cy + r * 0.4), size=(r * 0.5, r * 0.5))
-            # 身体
-            Color(0.3, 0.2, 0.1)
-            Ellipse(pos=(cx - r * 0.15, cy - r * 0.8), size=(r * 0.3, r * 1.8))
-            # 触角
-            Line(points=[cx, cy + r * 0.9, cx - r * 0.4, cy + r * 1.4], width=dp(1.5))
-            Line(points=[cx, cy + r * 0.9, cx + r * 0.4, cy + r * 1.4], width=dp(1.5))
-            Ellipse(pos=(cx - r * 0.5, cy + r * 1.3), size=(r * 0.15, r * 0.15))
-            Ellipse(pos=(cx + r * 0.35, cy + r * 1.3), size=(r * 0.15, r * 0.15))
+        add = self.add
+        # 翅膀沿 x 方向缩放（以身体为轴）
+        add(PushMatrix())
+        self._wings = add(Scale(1, 1, 1))
+        self._flap()
+        # 上翅膀
+        self.paint('butterfly_color')
+        add(Ellipse(pos=(-r * 1.8, 0), size=(r * 1.5, r * 1.8)))
+        add(Ellipse(pos=(r * 0.3, 0), size=(r * 1.5, r * 1.8)))
+        # 下翅膀
+        self.paint('butterfly_color', factor=0.8)
+        add(Ellipse(pos=(-r * 1.5, -r * 1.2), size=(r * 1.2, r * 1.3)))
+        add(Ellipse(pos=(r * 0.3, -r * 1.2), size=(r * 1.2, r * 1.3)))
+        add(PopMatrix())
+        # 翅膀花纹
+        add(Color(1, 1, 1, 0.6))
+        add(Ellipse(pos=(-r * 1.3, r * 0.4), size=(r * 0.5, r * 0.5)))
+        add(Ellipse(pos=(r * 0.8, r * 0.4), size=(r * 0.5, r * 0.5)))
+        # 身体
+        add(Color(0.3, 0.2, 0.1))
+        add(Ellipse(pos=(-r * 0.15, -r * 0.8), size=(r * 0.3, r * 1.8)))
+        # 触角
+        add(Line(points=[0, r * 0.9, -r * 0.4, r * 1.4], width=dp(1.5)))
+        add(Line(points=[0, r * 0.9, r * 0.4, r * 1.4], width=dp(1.5)))
+        add(Ellipse(pos=(-r * 0.5, r * 1.3), size=(r * 0.15, r * 0.15)))
+        add(Ellipse(pos=(r * 0.35, r * 1.3), size=(r * 0.15, r * 0.15)))
+    
+    def _flap(self, *args):
+        if self._wings is not None:
+            self._wings.x = 1 + math.sin(math.radians(self.wing_angle)) * 0.15
 
 
-class BeeWidget(Widget):
-    """可爱的小蜜蜂"""
+class BeeWidget(TransformWidget):
+    """可爱的小蜜蜂（扇翅膀只改翅膀的 Translate 指令）"""
     wing_angle = NumericProperty(0)
     
     def __init__(self, **kwargs):
+        self._wing_shift = ()
+        self._wing_r = 0
         super().__init__(**kwargs)
-        self.bind(size=self.draw, pos=self.draw, wing_angle=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        self.bind(wing_angle=self._flap)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.2
-        wing_offset = math.sin(math.radians(self.wing_angle)) * r * 0.3
-        with self.canvas:
-            # 翅膀
-            Color(0.9, 0.95, 1, 0.7)
-            Ellipse(pos=(cx - r * 1.5, cy + r * 0.3 + wing_offset), size=(r * 1.2, r * 1.5))
-            Ellipse(pos=(cx + r * 0.3, cy + r * 0.3 - wing_offset), size=(r * 1.2, r * 1.5))
-            # 身体
-            Color(1, 0.85, 0)
-            Ellipse(pos=(cx - r * 0.8, cy - r * 0.6), size=(r * 1.6, r * 1.2))
-            # 条纹
-            Color(0.1, 0.1, 0.1)
-            for i in range(3):
-                Rectangle(pos=(cx - r * 0.5 + i * r * 0.4, cy - r * 0.5), size=(r * 0.2, r * 1))
-            # 头
-            Color(1, 0.85, 0)
-            Ellipse(pos=(cx - r * 1.3, cy - r * 0.4), size=(r * 0.7, r * 0.8))
-            # 眼睛
-            Color(0, 0, 0)
-            Ellipse(pos=(cx - r * 1.15, cy), size=(r * 0.2, r * 0.2))
-            # 触角
-            Line(points=[cx - r * 1, cy + r * 0.3, cx - r * 1.2, cy + r * 0.7], width=dp(1.5))
-            Line(points=[cx - r * 0.8, cy + r * 0.3, cx - r * 0.6, cy + r * 0.7], width=dp(1.5))
+    def build(self):
+        r = self._wing_r = min(self.width, self.height) * 0.2
+        add = self.add
+        # 翅膀（左右上下错开扇动）
+        add(Color(0.9, 0.95, 1, 0.7))
+        shifts = []
+        for x in (-r * 1.5, r * 0.3):
+            add(PushMatrix())
+            shifts.append(add(Translate(0, 0)))
+            add(Ellipse(pos=(x, r * 0.3), size=(r * 1.2, r * 1.5)))
+            add(PopMatrix())
+        self._wing_shift = shifts
+        self._flap()
+        # 身体
+        add(Color(1, 0.85, 0))
+        add(Ellipse(pos=(-r * 0.8, -r * 0.6), size=(r * 1.6, r * 1.2)))
+        # 条纹
+        add(Color(0.1, 0.1, 0.1))
+        for i in range(3):
+            add(Rectangle(pos=(-r * 0.5 + i * r * 0.4, -r * 0.5), size=(r * 0.2, r * 1)))
+        # 头
+        add(Color(1, 0.85, 0))
+        add(Ellipse(pos=(-r * 1.3, -r * 0.4), size=(r * 0.7, r * 0.8)))
+        # 眼睛
+        add(Color(0, 0, 0))
+        add(Ellipse(pos=(-r * 1.15, 0), size=(r * 0.2, r * 0.2)))
+        # 触角
+        add(Line(points=[-r * 1, r * 0.3, -r * 1.2, r * 0.7], width=dp(1.5)))
+        add(Line(points=[-r * 0.8, r * 0.3, -r * 0.6, r * 0.7], width=dp(1.5)))
+    
+    def _flap(self, *args):
+        if self._wing_shift:
+            offset = math.sin(math.radians(self.wing_angle)) * self._wing_r * 0.3
+            self._wing_shift[0].y = offset
+            self._wing_shift[1].y = -offset
 
 
 class LadybugWidget(Widget):
@@ -612,33 +592,24 @@ class BalloonWidget(Widget):
             Line(bezier=[cx, cy - r * 0.7, cx - r * 0.2, cy - r * 1.5, cx + r * 0.1, cy - r * 2], width=dp(1.5))
 
 
-class CandyWidget(Widget):
+class CandyWidget(TransformWidget):
     """可爱的糖果"""
-    rotation = NumericProperty(0)
     
     def __init__(self, colors=None, **kwargs):
-        super().__init__(**kwargs)
         self.candy_colors = colors or [(1, 0.4, 0.4), (1, 1, 1)]
-        self.bind(size=self.draw, pos=self.draw, rotation=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        super().__init__(**kwargs)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
+    def build(self):
         r = min(self.width, self.height) * 0.2
-        with self.canvas:
-            PushMatrix()
-            Rotate(angle=self.rotation, origin=(cx, cy))
-            # 糖果本体（条纹）
-            for i in range(6):
-                Color(*self.candy_colors[i % 2])
-                angle_start = i * 60
-                Line(ellipse=(cx - r, cy - r, r * 2, r * 2, angle_start, angle_start + 60), width=r * 0.8)
-            # 包装纸
-            Color(1, 0.9, 0.5)
-            Triangle(points=[cx - r * 1.2, cy, cx - r * 2.2, cy + r * 0.5, cx - r * 2.2, cy - r * 0.5])
-            Triangle(points=[cx + r * 1.2, cy, cx + r * 2.2, cy + r * 0.5, cx + r * 2.2, cy - r * 0.5])
-            PopMatrix()
+        # 糖果本体（条纹）
+        for i in range(6):
+            self.add(Color(*self.candy_colors[i % 2]))
+            angle_start = i * 60
+            self.add(Line(ellipse=(-r, -r, r * 2, r * 2, angle_start, angle_start + 60), width=r * 0.8))
+        # 包装纸
+        self.add(Color(1, 0.9, 0.5))
+        self.add(Triangle(points=[-r * 1.2, 0, -r * 2.2, r * 0.5, -r * 2.2, -r * 0.5]))
+        self.add(Triangle(points=[r * 1.2, 0, r * 2.2, r * 0.5, r * 2.2, -r * 0.5]))
 
 
 class GiftBoxWidget(Widget):
@@ -747,16 +718,14 @@ def animate_float(widget, amplitude=15, duration=2):
     anim = Animation(y=original_y + dp(amplitude), duration=duration, t='in_out_sine')
     anim += Animation(y=original_y, duration=duration, t='in_out_sine')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_rotate(widget, duration=4):
     """旋转动画"""
     anim = Animation(rotation=360, duration=duration)
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_pulse(widget, min_scale=0.9, max_scale=1.1, duration=0.8):
@@ -764,8 +733,7 @@ def animate_pulse(widget, min_scale=0.9, max_scale=1.1, duration=0.8):
     anim = Animation(scale=max_scale, duration=duration/2, t='in_out_sine')
     anim += Animation(scale=min_scale, duration=duration/2, t='in_out_sine')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_heartbeat(widget, duration=0.6):
@@ -775,15 +743,14 @@ def animate_heartbeat(widget, duration=0.6):
     anim += Animation(scale=1.15, duration=duration * 0.1, t='out_quad')
     anim += Animation(scale=1, duration=duration * 0.6, t='out_quad')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_wing_flap(widget, duration=0.3):
     """翅膀扇动动画（适合蝴蝶、蜜蜂）"""
     def update_wing(dt):
         widget.wing_angle = (widget.wing_angle + 30) % 360
-    Clock.schedule_interval(update_wing, duration / 12)
+    return track_clock(widget, update_wing, duration / 12)
 
 
 def animate_bounce(widget, height=30, duration=0.5):
@@ -792,8 +759,7 @@ def animate_bounce(widget, height=30, duration=0.5):
     anim = Animation(y=original_y + dp(height), duration=duration * 0.4, t='out_quad')
     anim += Animation(y=original_y, duration=duration * 0.6, t='out_bounce')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_swing(widget, angle=15, duration=1):
@@ -802,8 +768,7 @@ def animate_swing(widget, angle=15, duration=1):
     anim += Animation(rotation=-angle, duration=duration, t='in_out_sine')
     anim += Animation(rotation=0, duration=duration/2, t='in_out_sine')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_twinkle(widget, duration=1):
@@ -811,8 +776,7 @@ def animate_twinkle(widget, duration=1):
     anim = Animation(opacity=0.3, duration=duration/2, t='in_out_sine')
     anim += Animation(opacity=1, duration=duration/2, t='in_out_sine')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_color_cycle(widget, colors, duration=2):
@@ -825,8 +789,11 @@ def animate_color_cycle(widget, colors, duration=2):
             widget.star_color = colors[widget._color_index]
         elif hasattr(widget, 'heart_color'):
             widget.heart_color = colors[widget._color_index]
-        widget.draw()
-    Clock.schedule_interval(cycle_color, duration / len(colors))
+        if hasattr(widget, 'recolor'):
+            widget.recolor()
+        else:
+            widget.draw()
+    return track_clock(widget, cycle_color, duration / len(colors))
 
 
 # ============================================================
@@ -836,101 +803,49 @@ def animate_color_cycle(widget, colors, duration=2):
 def create_confetti_burst(parent, x, y, count=15):
     """彩色纸屑爆炸效果"""
     colors = [(1, 0, 0), (1, 0.5, 0), (1, 1, 0), (0, 1, 0), (0, 0.7, 1), (0.6, 0, 0.8), (1, 0.4, 0.7)]
+    emitter = get_emitter(parent)
     
     for i in range(count):
-        confetti = Widget(size_hint=(None, None), size=(dp(12), dp(12)), pos=(x, y))
-        color = random.choice(colors)
-        shape = random.choice(['circle', 'rect', 'star'])
-        
-        with confetti.canvas:
-            Color(*color)
-            if shape == 'circle':
-                Ellipse(pos=(0, 0), size=(dp(12), dp(12)))
-            elif shape == 'rect':
-                Rectangle(pos=(0, 0), size=(dp(10), dp(10)))
-            else:
-                # 小星星
-                cx, cy = dp(6), dp(6)
-                r = dp(5)
-                points = []
-                for j in range(5):
-                    angle = math.radians(90 + j * 72)
-                    points.extend([cx + r * math.cos(angle), cy + r * math.sin(angle)])
-                    angle = math.radians(90 + j * 72 + 36)
-                    points.extend([cx + r * 0.4 * math.cos(angle), cy + r * 0.4 * math.sin(angle)])
-                Line(points=points, width=dp(1.5), close=True)
-        
-        parent.add_widget(confetti)
-        
-        end_x = x + random.randint(-180, 180)
-        end_y = y + random.randint(-50, 200)
-        
-        anim = Animation(
-            pos=(end_x, end_y), 
-            opacity=0, 
-            duration=random.uniform(0.8, 1.5), 
-            t='out_quad'
+        shape = random.choice(['circle', 'square', 'star'])
+        size = dp(10) if shape == 'square' else dp(12)
+        emitter.emit(
+            shape, x, y,
+            x + random.randint(-180, 180), y + random.randint(-50, 200),
+            size=size, color=random.choice(colors),
+            duration=random.uniform(0.8, 1.5)
         )
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        anim.start(confetti)
 
 
 def create_star_burst(parent, x, y, count=8):
     """星星爆炸效果"""
     colors = [(1, 0.9, 0), (1, 0.7, 0), (1, 1, 0.5), (1, 0.8, 0.3)]
+    emitter = get_emitter(parent)
     
     for i in range(count):
-        star = StarWidget(
-            color=random.choice(colors),
-            size_hint=(None, None),
-            size=(dp(25), dp(25)),
-            pos=(x - dp(12), y - dp(12))
-        )
-        parent.add_widget(star)
-        
         angle = math.radians(i * (360 / count))
         distance = random.randint(80, 150)
-        end_x = x + distance * math.cos(angle)
-        end_y = y + distance * math.sin(angle)
-        
-        anim = Animation(
-            pos=(end_x, end_y),
-            opacity=0,
-            rotation=360,
-            duration=random.uniform(0.6, 1),
-            t='out_quad'
+        emitter.emit(
+            'star', x, y,
+            x + distance * math.cos(angle), y + distance * math.sin(angle),
+            size=dp(20), color=random.choice(colors),
+            duration=random.uniform(0.6, 1), spin=360
         )
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        anim.start(star)
 
 
 def create_heart_burst(parent, x, y, count=6):
     """爱心爆炸效果"""
     colors = [(1, 0.3, 0.4), (1, 0.5, 0.6), (1, 0.4, 0.5), (1, 0.6, 0.7)]
+    emitter = get_emitter(parent)
     
     for i in range(count):
-        heart = HeartWidget(
-            color=random.choice(colors),
-            size_hint=(None, None),
-            size=(dp(20), dp(20)),
-            pos=(x - dp(10), y - dp(10))
-        )
-        parent.add_widget(heart)
-        
         angle = math.radians(random.randint(0, 360))
         distance = random.randint(60, 120)
-        end_x = x + distance * math.cos(angle)
-        end_y = y + distance * math.sin(angle)
-        
-        anim = Animation(
-            pos=(end_x, end_y),
-            opacity=0,
-            scale=0.3,
-            duration=random.uniform(0.8, 1.2),
-            t='out_quad'
+        emitter.emit(
+            'heart', x, y,
+            x + distance * math.cos(angle), y + distance * math.sin(angle),
+            size=dp(15), color=random.choice(colors),
+            duration=random.uniform(0.8, 1.2), end_scale=0.3
         )
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        anim.start(heart)
 
 
 def create_firework(parent, x, y):
@@ -943,52 +858,32 @@ def create_firework(parent, x, y):
         [(0.3, 1, 0.5), (0.5, 1, 0.7)],
     ]
     color_set = random.choice(colors)
+    emitter = get_emitter(parent)
     
     for i in range(12):
-        particle = Widget(size_hint=(None, None), size=(dp(8), dp(8)), pos=(x, y))
-        with particle.canvas:
-            Color(*random.choice(color_set))
-            Ellipse(pos=(0, 0), size=(dp(8), dp(8)))
-        
-        parent.add_widget(particle)
-        
         angle = math.radians(i * 30)
         distance = random.randint(100, 180)
-        end_x = x + distance * math.cos(angle)
-        end_y = y + distance * math.sin(angle)
-        
-        # 先上升再散开
-        anim = Animation(pos=(end_x, end_y), duration=0.5, t='out_quad')
-        anim += Animation(opacity=0, duration=0.5, t='in_quad')
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        anim.start(particle)
+        # 先散开（0.5秒）再淡出（0.5秒）
+        emitter.emit(
+            'circle', x, y,
+            x + distance * math.cos(angle), y + distance * math.sin(angle),
+            size=dp(8), color=random.choice(color_set),
+            duration=1.0, move_time=0.5, fade_out=0.5
+        )
 
 
 def create_bubble_float(parent, x, y, count=5):
     """气泡上升效果"""
+    emitter = get_emitter(parent)
     for i in range(count):
         size = random.randint(15, 35)
-        bubble = Widget(size_hint=(None, None), size=(dp(size), dp(size)), pos=(x + random.randint(-30, 30), y))
-        
-        with bubble.canvas:
-            Color(0.7, 0.9, 1, 0.6)
-            Ellipse(pos=(0, 0), size=(dp(size), dp(size)))
-            Color(1, 1, 1, 0.4)
-            Ellipse(pos=(dp(size * 0.2), dp(size * 0.5)), size=(dp(size * 0.3), dp(size * 0.3)))
-        
-        parent.add_widget(bubble)
-        
-        end_y = y + random.randint(200, 400)
-        end_x = x + random.randint(-50, 50)
-        
-        anim = Animation(
-            pos=(end_x, end_y),
-            opacity=0,
-            duration=random.uniform(2, 4),
-            t='out_quad'
+        start_x = x + random.randint(-30, 30)
+        emitter.emit(
+            'bubble', start_x, y,
+            x + random.randint(-50, 50), y + random.randint(200, 400),
+            size=dp(size), color=(0.7, 0.9, 1), alpha=0.6,
+            duration=random.uniform(2, 4), delay=i * 0.2
         )
-        Clock.schedule_once(lambda dt, a=anim, b=bubble: a.start(b), i * 0.2)
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
 
 
 # ============================================================
@@ -368,24 +368,21 @@ class EnglishListenScreen(Screen):
             self.current_item = random.choice(animals)
             english, chinese, emoji = self.current_item
             self.display_label.text = english
-            all_chinese = [a[1] for a in animals]
-            options = self.logic.get_random_options(chinese, all_chinese, count=4)
+            options = self.logic.get_random_options(chinese, animals, count=4, key=lambda a: a[1])
             self.correct_answer = chinese
         elif q_type == 'color':
             colors = EnglishData.get_colors()
             self.current_item = random.choice(colors)
             english, chinese, code, emoji = self.current_item
             self.display_label.text = english
-            all_chinese = [c[1] for c in colors]
-            options = self.logic.get_random_options(chinese, all_chinese, count=4)
+            options = self.logic.get_random_options(chinese, colors, count=4, key=lambda c: c[1])
             self.correct_answer = chinese
         else:
             numbers = EnglishData.get_numbers(10)
             self.current_item = random.choice(numbers)
             num, english, chinese = self.current_item
             self.display_label.text = english
-            all_chinese = [n[2] for n in numbers]
-            options = self.logic.get_random_options(chinese, all_chinese, count=4)
+            options = self.logic.get_random_options(chinese, numbers, count=4, key=lambda n: n[2])
             self.correct_answer = chinese
         
         self.answers_layout.clear_widgets()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+按需创建的 ScreenManager v1.0
+启动时只创建菜单页，其余页面第一次切换过去时才创建：
+- register(name, factory)：登记页面，factory() 返回 Screen 类或实例
+- register_class(name, "模块名", "类名")：连模块都等到用时再导入
+- 内存紧张时 evict_unused() 释放最近没用的页面（连同它的循环动画），下次进入重新创建
+- 首帧时间：measure_first_frame() 打印并记录启动到第一帧的耗时
+
+设置环境变量 LELE_EAGER_SCREENS=1 可以回到启动时全部创建，
+用来对比前后的首帧时间。
+"""
+import os
+import time
+import importlib
+from collections import OrderedDict
+
+from kivy.uix.screenmanager import ScreenManager, ScreenManagerException
+from kivy.core.window import Window
+from kivy.clock import Clock
+
+from anim_registry import release as release_animations, live_counts
+from particles import release_emitters
+
+try:
+    import startup_profiler
+    PROFILER_AVAILABLE = True
+except ImportError:
+    PROFILER_AVAILABLE = False
+
+# 模块导入的时间，近似看作进程启动时间
+PROCESS_START = time.perf_counter()
+
+EAGER_ENV = "LELE_EAGER_SCREENS"
+
+
+def eager_screens_enabled():
+    """是否启动时就创建全部页面（对比测量用）"""
+    return os.environ.get(EAGER_ENV, "") not in ("", "0")
+
+
+class LazyScreenManager(ScreenManager):
+    """第一次切换到某个页面时才创建它
+
+    Args:
+        max_alive: 最多保留多少个已创建的页面（None 表示不限制），
+                   超出时释放最久没用的页面
+    """
+
+    def __init__(self, max_alive=None, **kwargs):
+        self.max_alive = max_alive
+        self._factories = OrderedDict()   # 页面名 -> 工厂函数
+        self._recent = OrderedDict()      # 已创建的可释放页面，按最近使用排序
+        self.build_times = {}             # 页面名 -> 创建耗时（毫秒）
+        super().__init__(**kwargs)
+        # Android/iOS 内存告警时释放页面（旧版 Kivy 没有这个事件）
+        try:
+            Window.bind(on_memorywarning=lambda *args: self.evict_unused())
+        except Exception:
+            pass
+
+    # ---------- 登记 ----------
+
+    def register(self, name, factory):
+        """登记页面，factory() 返回 Screen 实例，或返回 Screen 类（会用 name 实例化）"""
+        self._factories[name] = factory
+
+    def register_class(self, name, module_name, class_name):
+        """登记页面类，模块到第一次使用时才导入"""
+        def factory():
+            module = importlib.import_module(module_name)
+            return getattr(module, class_name)
+        self.register(name, factory)
+
+    def is_registered(self, name):
+        return name in self._factories
+
+    def build_all(self):
+        """立即创建全部登记的页面"""
+        for name in self._factories:
+            self._ensure(name)
+
+    # ---------- 创建与释放 ----------
+
+    def _ensure(self, name):
+        if name in self.screen_names:
+            return
+        factory = self._factories.get(name)
+        if factory is None:
+            return
+        start = time.perf_counter()
+        screen = factory()
+        if isinstance(screen, type):
+            screen = screen(name=name)
+        self.add_widget(screen)
+        self.build_times[name] = (time.perf_counter() - start) * 1000
+        print(f"[screens] 创建页面 {name}: {self.build_times[name]:.0f}ms")
+
+    def get_screen(self, name):
+        self._ensure(name)
+        if name in self._factories:
+            self._recent[name] = True
+            self._recent.move_to_end(name)
+            if self.max_alive is not None:
+                Clock.schedule_once(lambda dt: self.evict_unused(self.max_alive), 0)
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+    def evict_unused(self, keep=0):
+        """释放最近没用的页面（当前页面和正在切换的页面除外），返回释放数量"""
+        current = self.current
+        evicted = 0
+        for name in list(self._recent):
+            if len(self._recent) <= keep:
+                break
+            if name == current or name not in self.screen_names:
+                continue
+            try:
+                screen = super().get_screen(name)
+            except ScreenManagerException:
+                continue
+            if screen.transition_progress not in (0, 1):
+                continue
+            self.remove_widget(screen)
+            release_animations(screen)
+            release_emitters(screen)
+            del self._recent[name]
+            evicted += 1
+        if evicted:
+            print(f"[screens] 已释放 {evicted} 个页面，动画 {live_counts()}")
+        return evicted
+
+
+def measure_first_frame(app, label="App", start=None):
+    """在第一帧画完时记录启动耗时到 app.first_frame_ms
+
+    Args:
+        start: 计时起点（time.perf_counter()），默认为本模块导入的时间
+    """
+    start = PROCESS_START if start is None else start
+
+    def on_draw(*args):
+        Window.unbind(on_draw=on_draw)
+        app.first_frame_ms = (time.perf_counter() - start) * 1000
+        mode = "全部预创建" if eager_screens_enabled() else "按需创建"
+        print(f"[{label}] 首帧用时: {app.first_frame_ms:.0f}ms（{mode}）")
+        if PROFILER_AVAILABLE:
+            startup_profiler.first_frame()
+    Window.bind(on_draw=on_draw)
+
+
+__all__ = [
+    'LazyScreenManager',
+    'measure_first_frame',
+    'eager_screens_enabled',
+    'PROCESS_START',
+]
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+粒子特效 v1.0
+答对后的纸屑、星星、爱心、烟花、徽章以前每个粒子都新建一个 Widget 和
+一个 Animation，结束后再删掉；连续答对时大量创建/回收对象，平板上会卡顿。
+这里改成：
+- 每个父控件一个 ParticleEmitter，所有粒子画在它自己的一块 canvas 上
+- 粒子槽位启动时一次建好（对象池），用完放回，不再创建 Widget
+- 每帧只有一个 Clock 回调，统一更新所有粒子的位置/旋转/缩放/透明度；
+  没有粒子时回调自动停止
+- 粒子总数有上限，满了就回收最老的粒子
+
+粒子的运动和原来的 Animation 一样：从起点按缓动曲线移动到终点，同时淡出。
+模拟部分（ParticlePool）不依赖 Kivy，可以单独测试。
+
+使用方法：
+    from particles import get_emitter
+    emitter = get_emitter(parent)
+    emitter.emit("star", x, y, end_x, end_y, size=dp(25), color=(1, 0.9, 0),
+                 duration=0.8, spin=360)
+"""
+import math
+
+try:
+    from kivy.uix.widget import Widget
+    from kivy.graphics import Color, Mesh, PushMatrix, PopMatrix, Translate, Rotate, Scale
+    from kivy.clock import Clock
+    KIVY_AVAILABLE = True
+except ImportError:
+    KIVY_AVAILABLE = False
+
+# 每个发射器最多同时存在的粒子数
+MAX_PARTICLES = 160
+
+
+# ============================================================
+# 缓动曲线（和 kivy.animation.AnimationTransition 同名）
+# ============================================================
+EASINGS = {
+    "linear": lambda p: p,
+    "out_quad": lambda p: -p * (p - 2.0),
+    "in_quad": lambda p: p * p,
+}
+
+
+# ============================================================
+# 粒子形状（单位坐标，半径约为 1，画的时候乘以 size / 2）
+# ============================================================
+def _ellipse(cx, cy, rx, ry, segments=12):
+    return [(cx + rx * math.cos(2 * math.pi * i / segments),
+             cy + ry * math.sin(2 * math.pi * i / segments)) for i in range(segments)]
+
+
+def _fan(points, cx=0.0, cy=0.0):
+    """凸多边形（或从中心看过去是星形的多边形）拆成三角形"""
+    triangles = []
+    n = len(points)
+    for i in range(n):
+        triangles.extend([(cx, cy), points[i], points[(i + 1) % n]])
+    return triangles
+
+
+def _circle(cx, cy, r, segments=12):
+    return _fan(_ellipse(cx, cy, r, r, segments), cx, cy)
+
+
+def _star(inner=0.4):
+    points = []
+    for i in range(5):
+        angle = math.radians(90 + i * 72)
+        points.append((math.cos(angle), math.sin(angle)))
+        angle = math.radians(90 + i * 72 + 36)
+        points.append((inner * math.cos(angle), inner * math.sin(angle)))
+    return _fan(points)
+
+
+def _heart():
+    # 和 HeartWidget 的画法一样：两个圆 + 一个倒三角
+    return (_circle(-0.4, 0.33, 0.47) + _circle(0.4, 0.33, 0.47)
+            + [(-0.93, 0.13), (0.93, 0.13), (0.0, -1.0)])
+
+
+def _paw(scale=1.0):
+    # 和 PawPrintWidget 的画法一样：一个大肉垫 + 四个脚趾
+    r = 0.3 * scale
+    return (_fan(_ellipse(0, -r * 0.75, r * 1.5, r * 1.25))
+            + _fan(_ellipse(-r * 1.55, r * 1.0, r * 0.65, r * 0.8), -r * 1.55, r * 1.0)
+            + _fan(_ellipse(-r * 0.15, r * 1.6, r * 0.65, r * 0.8), -r * 0.15, r * 1.6)
+            + _fan(_ellipse(r * 1.15, r * 1.0, r * 0.65, r * 0.8), r * 1.15, r * 1.0)
+            + _fan(_ellipse(r * 1.45, -r * 0.1, r * 0.55, r * 0.7), r * 1.45, -r * 0.1))
+
+
+def _bone():
+    # 和 BoneWidget 的画法一样：中间一段 + 两头各两个圆
+    body = [(-0.7, -0.2), (0.7, -0.2), (0.7, 0.2), (-0.7, -0.2), (0.7, 0.2), (-0.7, 0.2)]
+    for cx in (-0.8, 0.8):
+        for cy in (-0.2, 0.2):
+            body += _circle(cx, cy, 0.22, 8)
+    return body
+
+
+# 形状名 -> (主体三角形, 细节三角形, 细节颜色)
+SHAPES = {
+    "circle": (_circle(0, 0, 1.0), [], None),
+    "square": (_fan([(-0.85, -0.85), (0.85, -0.85), (0.85, 0.85), (-0.85, 0.85)]), [], None),
+    "star": (_star(), [], None),
+    "heart": (_heart(), [], None),
+    "bubble": (_circle(0, 0, 1.0), _circle(-0.3, 0.3, 0.3, 8), (1, 1, 1, 0.4)),
+    "badge": (_fan([(math.cos(math.radians(60 * i - 30)), math.sin(math.radians(60 * i - 30)))
+                    for i in range(6)]), _paw(0.7), (1, 1, 1, 1)),
+    "paw": (_paw(), [], None),
+    "bone": (_bone(), [], None),
+}
+
+
+def _mesh_data(triangles, radius):
+    """三角形列表 -> Mesh 的 vertices / indices（x, y, u, v）"""
+    vertices = []
+    for x, y in triangles:
+        vertices.extend((x * radius, y * radius, 0.0, 0.0))
+    return vertices, list(range(len(triangles)))
+
+
+# ============================================================
+# 粒子模拟（不依赖 Kivy）
+# ============================================================
+class Particle:
+    """一个粒子槽位（对象池中的元素，反复使用）"""
+
+    __slots__ = ("index", "alive", "shape", "size", "color", "alpha",
+                 "x0", "y0", "dx", "dy", "end_scale", "rotation", "spin", "ease",
+                 "delay", "duration", "move_time", "fade_in", "fade_out", "age",
+                 "x", "y", "scale", "angle", "opacity")
+
+    def __init__(self, index):
+        self.index = index
+        self.alive = False
+
+    def update(self):
+        """按 age 计算当前的位置、缩放、旋转和透明度"""
+        t = self.age - self.delay
+        if t < 0:
+            # 还没开始（延迟出现），先停在起点、不可见
+            self.x, self.y = self.x0, self.y0
+            self.scale, self.angle, self.opacity = 1.0, self.rotation, 0.0
+            return
+        move = EASINGS[self.ease](min(1.0, t / self.move_time)) if self.move_time > 0 else 1.0
+        self.x = self.x0 + self.dx * move
+        self.y = self.y0 + self.dy * move
+        self.scale = 1.0 + (self.end_scale - 1.0) * move
+        self.angle = self.rotation + self.spin * move
+        opacity = self.alpha
+        if self.fade_in > 0 and t < self.fade_in:
+            opacity *= t / self.fade_in
+        fade_start = self.duration - self.fade_out
+        if self.fade_out > 0 and t > fade_start:
+            opacity *= max(0.0, 1.0 - (t - fade_start) / self.fade_out)
+        self.opacity = opacity
+
+
+class ParticlePool:
+    """固定容量的粒子池：spawn() 取槽位，step(dt) 推进所有活着的粒子"""
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.particles = [Particle(i) for i in range(capacity)]
+        self._free = list(range(capacity - 1, -1, -1))
+        self.live = []          # 按生成顺序，最老的在前面
+        self.spawned = 0
+        self.recycled = 0       # 池满时回收的老粒子数
+
+    def spawn(self, shape, x, y, end_x, end_y, size, color, duration,
+              alpha=1.0, delay=0.0, move_time=None, fade_in=0.0, fade_out=None,
+              end_scale=1.0, rotation=0.0, spin=0.0, ease="out_quad"):
+        """取一个粒子槽位；池满时回收最老的粒子
+
+        Args:
+            rotation: 初始角度；spin: 移动过程中再转多少度
+            move_time: 从起点移动到终点用的时间，默认等于 duration
+            fade_out: 最后多少秒淡出，默认整个 duration 都在淡出（和原来的
+                      Animation(opacity=0) 一样）
+        """
+        if self._free:
+            p = self.particles[self._free.pop()]
+        else:
+            p = self.live.pop(0)
+            self.recycled += 1
+        p.alive = True
+        p.shape = shape
+        p.size = size
+        p.color = color
+        p.alpha = alpha
+        p.x0, p.y0 = x, y
+        p.dx, p.dy = end_x - x, end_y - y
+        p.end_scale = end_scale
+        p.rotation = rotation
+        p.spin = spin
+        p.ease = ease
+        p.delay = delay
+        p.duration = duration
+        p.move_time = duration if move_time is None else move_time
+        p.fade_in = fade_in
+        p.fade_out = duration if fade_out is None else fade_out
+        p.age = 0.0
+        p.update()
+        self.live.append(p)
+        self.spawned += 1
+        return p
+
+    def step(self, dt):
+        """推进 dt 秒，返回这一步结束的粒子（已经放回池子）"""
+        finished = []
+        still = []
+        for p in self.live:
+            p.age += dt
+            if p.age >= p.delay + p.duration:
+                p.alive = False
+                finished.append(p)
+                self._free.append(p.index)
+            else:
+                p.update()
+                still.append(p)
+        self.live = still
+        return finished
+
+    def clear(self):
+        finished = self.live
+        for p in finished:
+            p.alive = False
+            self._free.append(p.index)
+        self.live = []
+        return finished
+
+    def __len__(self):
+        return len(self.live)
+
+
+# ============================================================
+# Kivy 发射器
+# ============================================================
+if KIVY_AVAILABLE:
+
+    class _Slot:
+        """一个粒子槽位对应的 canvas 指令"""
+
+        __slots__ = ("translate", "rotate", "scale", "body_color", "body",
+                     "detail_color", "detail", "detail_alpha")
+
+    class ParticleEmitter(Widget):
+        """把所有粒子画在一块 canvas 上的发射器（加在父控件最上层）"""
+
+        def __init__(self, capacity=MAX_PARTICLES, **kwargs):
+            kwargs.setdefault("size_hint", (None, None))
+            kwargs.setdefault("size", (0, 0))
+            super().__init__(**kwargs)
+            self.pool = ParticlePool(capacity)
+            self._event = None
+            self._mesh_cache = {}
+            self._slots = []
+            with self.canvas:
+                for _ in range(capacity):
+                    slot = _Slot()
+                    PushMatrix()
+                    slot.translate = Translate(0, 0)
+                    slot.rotate = Rotate(angle=0, axis=(0, 0, 1))
+                    slot.scale = Scale(1, 1, 1)
+                    slot.body_color = Color(1, 1, 1, 0)
+                    slot.body = Mesh(vertices=[], indices=[], mode="triangles")
+                    slot.detail_color = Color(1, 1, 1, 0)
+                    slot.detail = Mesh(vertices=[], indices=[], mode="triangles")
+                    PopMatrix()
+                    slot.detail_alpha = 0
+                    self._slots.append(slot)
+
+        def emit(self, shape, x, y, end_x, end_y, size, color, duration, **options):
+            """发射一个粒子（参数见 ParticlePool.spawn），size 是直径（像素）"""
+            p = self.pool.spawn(shape, x, y, end_x, end_y, size, color, duration, **options)
+            slot = self._slots[p.index]
+            body, detail = self._meshes(shape, size)
+            slot.body.vertices, slot.body.indices = body
+            slot.detail.vertices, slot.detail.indices = detail
+            slot.body_color.rgb = color[:3]
+            detail_color = SHAPES[shape][2]
+            if detail_color:
+                slot.detail_color.rgb = detail_color[:3]
+                slot.detail_alpha = detail_color[3]
+            else:
+                slot.detail_alpha = 0
+            self._apply(p, slot)
+            if self._event is None:
+                self._event = Clock.schedule_interval(self._update, 0)
+            return p
+
+        def clear(self):
+            for p in self.pool.clear():
+                self._hide(self._slots[p.index])
+            self._stop()
+
+        def _meshes(self, shape, size):
+            key = (shape, round(size))
+            data = self._mesh_cache.get(key)
+            if data is None:
+                body, detail, _ = SHAPES[shape]
+                data = (_mesh_data(body, size / 2), _mesh_data(detail, size / 2))
+                if len(self._mesh_cache) < 256:
+                    self._mesh_cache[key] = data
+            return data
+
+        @staticmethod
+        def _apply(p, slot):
+            slot.translate.xy = (p.x, p.y)
+            slot.rotate.angle = p.angle
+            slot.scale.xyz = (p.scale, p.scale, 1)
+            slot.body_color.a = p.opacity
+            slot.detail_color.a = p.opacity * slot.detail_alpha
+
+        @staticmethod
+        def _hide(slot):
+            slot.body_color.a = 0
+            slot.detail_color.a = 0
+            slot.body.vertices, slot.body.indices = [], []
+            slot.detail.vertices, slot.detail.indices = [], []
+
+        def _update(self, dt):
+            """每帧一次：推进所有粒子并更新它们的指令"""
+            slots = self._slots
+            for p in self.pool.step(dt):
+                self._hide(slots[p.index])
+            for p in self.pool.live:
+                self._apply(p, slots[p.index])
+            if not self.pool.live:
+                self._stop()
+
+        def _stop(self):
+            if self._event is not None:
+                self._event.cancel()
+                self._event = None
+
+    def get_emitter(parent, capacity=MAX_PARTICLES):
+        """父控件共用的发射器（保证在父控件最上层）
+
+        发射器记在父控件自己身上（_particle_emitter），不放全局表：
+        发射器是父控件的子控件，会反过来引用父控件，放在全局表里父控件就永远释放不了。
+        """
+        emitter = getattr(parent, "_particle_emitter", None)
+        if emitter is None:
+            emitter = ParticleEmitter(capacity)
+            parent._particle_emitter = emitter
+        if emitter.parent is not parent:
+            if emitter.parent is not None:
+                emitter.parent.remove_widget(emitter)
+            parent.add_widget(emitter)
+        elif parent.children and parent.children[0] is not emitter:
+            # 之后加进来的控件会盖住粒子，挪回最上层
+            parent.remove_widget(emitter)
+            parent.add_widget(emitter)
+        return emitter
+
+    def release_emitters(root):
+        """页面被释放时调用：停掉 root 下所有发射器的粒子和每帧回调"""
+        for widget in root.walk(restrict=True):
+            emitter = getattr(widget, "_particle_emitter", None)
+            if emitter is not None:
+                emitter.clear()
+
+
+__all__ = [
+    'Particle',
+    'ParticlePool',
+    'SHAPES',
+    'MAX_PARTICLES',
+    'KIVY_AVAILABLE',
+]
+if KIVY_AVAILABLE:
+    __all__ += ['ParticleEmitter', 'get_emitter', 'release_emitters']
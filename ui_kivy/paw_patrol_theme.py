@@ -16,6 +16,11 @@ from kivy.utils import get_color_from_hex
 import random
 import math
 
+from particles import get_emitter
+from anim_registry import track_animation, track_clock
+from transform_widget import TransformWidget
+from texture_cache import blit_cached
+
 
 # ============================================================
 # 汪汪队配色方案
@@ -109,36 +114,28 @@ class PawPrintWidget(Widget):
             Ellipse(pos=(cx + r * 0.9, cy - r * 0.8), size=(r * 1.1, r * 1.4))
 
 
-class BoneWidget(Widget):
+class BoneWidget(TransformWidget):
     """骨头 - 狗狗最爱"""
-    rotation = 0
     
     def __init__(self, color=None, **kwargs):
-        super().__init__(**kwargs)
         self.bone_color = color or PAW_COLORS['bone']
-        self.bind(size=self.draw, pos=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
+        super().__init__(**kwargs)
     
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
+    def build(self):
         r = min(self.width, self.height) * 0.15
-        with self.canvas:
-            PushMatrix()
-            Rotate(angle=self.rotation, origin=(cx, cy))
-            Color(*self.bone_color)
-            # 骨头中间
-            Rectangle(pos=(cx - r * 1.5, cy - r * 0.4), size=(r * 3, r * 0.8))
-            # 左边两个圆头
-            Ellipse(pos=(cx - r * 2.2, cy - r * 0.1), size=(r * 0.9, r * 0.9))
-            Ellipse(pos=(cx - r * 2.2, cy - r * 0.8), size=(r * 0.9, r * 0.9))
-            # 右边两个圆头
-            Ellipse(pos=(cx + r * 1.3, cy - r * 0.1), size=(r * 0.9, r * 0.9))
-            Ellipse(pos=(cx + r * 1.3, cy - r * 0.8), size=(r * 0.9, r * 0.9))
-            # 高光
-            Color(1, 1, 1, 0.4)
-            Ellipse(pos=(cx - r * 0.8, cy + r * 0.1), size=(r * 0.4, r * 0.2))
-            PopMatrix()
+        add = self.add
+        self.paint('bone_color')
+        # 骨头中间
+        add(Rectangle(pos=(-r * 1.5, -r * 0.4), size=(r * 3, r * 0.8)))
+        # 左边两个圆头
+        add(Ellipse(pos=(-r * 2.2, -r * 0.1), size=(r * 0.9, r * 0.9)))
+        add(Ellipse(pos=(-r * 2.2, -r * 0.8), size=(r * 0.9, r * 0.9)))
+        # 右边两个圆头
+        add(Ellipse(pos=(r * 1.3, -r * 0.1), size=(r * 0.9, r * 0.9)))
+        add(Ellipse(pos=(r * 1.3, -r * 0.8), size=(r * 0.9, r * 0.9)))
+        # 高光
+        add(Color(1, 1, 1, 0.4))
+        add(Ellipse(pos=(-r * 0.8, r * 0.1), size=(r * 0.4, r * 0.2)))
 
 
 class DogBowlWidget(Widget):
@@ -264,248 +261,216 @@ class CollarWidget(Widget):
 # 汪汪队狗狗头像（简化版，适合装饰）
 # ============================================================
 
-class ChaseHeadWidget(Widget):
-    """阿奇头像 - 德国牧羊犬警察"""
+class PuppyHeadWidget(Widget):
+    """狗狗头像基类：每个（狗狗, 尺寸档位）只离屏画一次，之后贴缓存的纹理"""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.bind(size=self.draw, pos=self.draw)
         Clock.schedule_once(lambda dt: self.draw(), 0)
     
     def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.3
-        with self.canvas:
-            # 耳朵
-            Color(0.36, 0.25, 0.22)
-            Triangle(points=[cx - r * 1.1, cy + r * 0.5, cx - r * 0.5, cy + r * 1.8, cx - r * 0.1, cy + r * 0.5])
-            Triangle(points=[cx + r * 0.1, cy + r * 0.5, cx + r * 0.5, cy + r * 1.8, cx + r * 1.1, cy + r * 0.5])
-            # 头
-            Color(0.55, 0.43, 0.39)
-            Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.8))
-            # 脸（浅色）
-            Color(0.84, 0.80, 0.76)
-            Ellipse(pos=(cx - r * 0.65, cy - r * 0.6), size=(r * 1.3, r * 1.1))
-            # 眼睛
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r * 0.55, cy + r * 0.15), size=(r * 0.45, r * 0.45))
-            Ellipse(pos=(cx + r * 0.1, cy + r * 0.15), size=(r * 0.45, r * 0.45))
-            Color(0.2, 0.15, 0.1)
-            Ellipse(pos=(cx - r * 0.42, cy + r * 0.25), size=(r * 0.25, r * 0.25))
-            Ellipse(pos=(cx + r * 0.2, cy + r * 0.25), size=(r * 0.25, r * 0.25))
-            # 鼻子
-            Color(0.1, 0.1, 0.1)
-            Ellipse(pos=(cx - r * 0.18, cy - r * 0.2), size=(r * 0.36, r * 0.28))
-            # 警察帽
-            Color(*PAW_COLORS['chase'])
-            Ellipse(pos=(cx - r * 0.7, cy + r * 0.9), size=(r * 1.4, r * 0.5))
-            Rectangle(pos=(cx - r * 0.55, cy + r * 1.2), size=(r * 1.1, r * 0.4))
-            # 帽徽
-            Color(*PAW_COLORS['gold'])
-            Ellipse(pos=(cx - r * 0.15, cy + r * 1.25), size=(r * 0.3, r * 0.28))
+        side = min(self.width, self.height)
+        key = ('puppy', type(self).__name__)
+        if not blit_cached(self.canvas, key, self.center, side, self._paint):
+            self.canvas.clear()
+            self._paint(self.canvas, self.center_x, self.center_y, side)
+    
+    def _paint(self, canvas, cx, cy, side):
+        with canvas:
+            self.paint_head(cx, cy, side * 0.3)
+    
+    def paint_head(self, cx, cy, r):
+        """画头像（子类实现），r 是头的半径"""
 
 
-class MarshallHeadWidget(Widget):
+class ChaseHeadWidget(PuppyHeadWidget):
+    """阿奇头像 - 德国牧羊犬警察"""
+    def paint_head(self, cx, cy, r):
+        # 耳朵
+        Color(0.36, 0.25, 0.22)
+        Triangle(points=[cx - r * 1.1, cy + r * 0.5, cx - r * 0.5, cy + r * 1.8, cx - r * 0.1, cy + r * 0.5])
+        Triangle(points=[cx + r * 0.1, cy + r * 0.5, cx + r * 0.5, cy + r * 1.8, cx + r * 1.1, cy + r * 0.5])
+        # 头
+        Color(0.55, 0.43, 0.39)
+        Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.8))
+        # 脸（浅色）
+        Color(0.84, 0.80, 0.76)
+        Ellipse(pos=(cx - r * 0.65, cy - r * 0.6), size=(r * 1.3, r * 1.1))
+        # 眼睛
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r * 0.55, cy + r * 0.15), size=(r * 0.45, r * 0.45))
+        Ellipse(pos=(cx + r * 0.1, cy + r * 0.15), size=(r * 0.45, r * 0.45))
+        Color(0.2, 0.15, 0.1)
+        Ellipse(pos=(cx - r * 0.42, cy + r * 0.25), size=(r * 0.25, r * 0.25))
+        Ellipse(pos=(cx + r * 0.2, cy + r * 0.25), size=(r * 0.25, r * 0.25))
+        # 鼻子
+        Color(0.1, 0.1, 0.1)
+        Ellipse(pos=(cx - r * 0.18, cy - r * 0.2), size=(r * 0.36, r * 0.28))
+        # 警察帽
+        Color(*PAW_COLORS['chase'])
+        Ellipse(pos=(cx - r * 0.7, cy + r * 0.9), size=(r * 1.4, r * 0.5))
+        Rectangle(pos=(cx - r * 0.55, cy + r * 1.2), size=(r * 1.1, r * 0.4))
+        # 帽徽
+        Color(*PAW_COLORS['gold'])
+        Ellipse(pos=(cx - r * 0.15, cy + r * 1.25), size=(r * 0.3, r * 0.28))
+
+
+class MarshallHeadWidget(PuppyHeadWidget):
     """毛毛头像 - 斑点狗消防员"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.bind(size=self.draw, pos=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
-    
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.3
-        with self.canvas:
-            # 耳朵（垂下的）
-            Color(0.15, 0.15, 0.15)
-            Ellipse(pos=(cx - r * 1.3, cy + r * 0.2), size=(r * 0.6, r * 1))
-            Ellipse(pos=(cx + r * 0.7, cy + r * 0.2), size=(r * 0.6, r * 1))
-            # 头（白色）
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.8))
-            # 黑色斑点
-            Color(0.15, 0.15, 0.15)
-            Ellipse(pos=(cx - r * 0.8, cy + r * 0.5), size=(r * 0.35, r * 0.35))
-            Ellipse(pos=(cx + r * 0.5, cy + r * 0.6), size=(r * 0.3, r * 0.3))
-            Ellipse(pos=(cx + r * 0.2, cy - r * 0.1), size=(r * 0.25, r * 0.25))
-            # 眼睛
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r * 0.55, cy + r * 0.1), size=(r * 0.45, r * 0.45))
-            Ellipse(pos=(cx + r * 0.1, cy + r * 0.1), size=(r * 0.45, r * 0.45))
-            Color(0.2, 0.15, 0.1)
-            Ellipse(pos=(cx - r * 0.42, cy + r * 0.2), size=(r * 0.25, r * 0.25))
-            Ellipse(pos=(cx + r * 0.2, cy + r * 0.2), size=(r * 0.25, r * 0.25))
-            # 鼻子
-            Color(0.1, 0.1, 0.1)
-            Ellipse(pos=(cx - r * 0.18, cy - r * 0.25), size=(r * 0.36, r * 0.28))
-            # 消防帽
-            Color(*PAW_COLORS['marshall'])
-            Ellipse(pos=(cx - r * 0.75, cy + r * 0.95), size=(r * 1.5, r * 0.55))
-            # 帽子前沿
-            Color(0.1, 0.1, 0.1)
-            Rectangle(pos=(cx - r * 0.6, cy + r * 0.9), size=(r * 1.2, r * 0.15))
-
-
-class SkyeHeadWidget(Widget):
+    def paint_head(self, cx, cy, r):
+        # 耳朵（垂下的）
+        Color(0.15, 0.15, 0.15)
+        Ellipse(pos=(cx - r * 1.3, cy + r * 0.2), size=(r * 0.6, r * 1))
+        Ellipse(pos=(cx + r * 0.7, cy + r * 0.2), size=(r * 0.6, r * 1))
+        # 头（白色）
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.8))
+        # 黑色斑点
+        Color(0.15, 0.15, 0.15)
+        Ellipse(pos=(cx - r * 0.8, cy + r * 0.5), size=(r * 0.35, r * 0.35))
+        Ellipse(pos=(cx + r * 0.5, cy + r * 0.6), size=(r * 0.3, r * 0.3))
+        Ellipse(pos=(cx + r * 0.2, cy - r * 0.1), size=(r * 0.25, r * 0.25))
+        # 眼睛
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r * 0.55, cy + r * 0.1), size=(r * 0.45, r * 0.45))
+        Ellipse(pos=(cx + r * 0.1, cy + r * 0.1), size=(r * 0.45, r * 0.45))
+        Color(0.2, 0.15, 0.1)
+        Ellipse(pos=(cx - r * 0.42, cy + r * 0.2), size=(r * 0.25, r * 0.25))
+        Ellipse(pos=(cx + r * 0.2, cy + r * 0.2), size=(r * 0.25, r * 0.25))
+        # 鼻子
+        Color(0.1, 0.1, 0.1)
+        Ellipse(pos=(cx - r * 0.18, cy - r * 0.25), size=(r * 0.36, r * 0.28))
+        # 消防帽
+        Color(*PAW_COLORS['marshall'])
+        Ellipse(pos=(cx - r * 0.75, cy + r * 0.95), size=(r * 1.5, r * 0.55))
+        # 帽子前沿
+        Color(0.1, 0.1, 0.1)
+        Rectangle(pos=(cx - r * 0.6, cy + r * 0.9), size=(r * 1.2, r * 0.15))
+
+
+class SkyeHeadWidget(PuppyHeadWidget):
     """天天头像 - 可卡犬飞行员"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.bind(size=self.draw, pos=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
-    
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.3
-        with self.canvas:
-            # 耳朵（长长的卷毛）
-            Color(0.85, 0.65, 0.45)
-            Ellipse(pos=(cx - r * 1.4, cy - r * 0.2), size=(r * 0.7, r * 1.4))
-            Ellipse(pos=(cx + r * 0.7, cy - r * 0.2), size=(r * 0.7, r * 1.4))
-            # 头
-            Color(0.9, 0.75, 0.55)
-            Ellipse(pos=(cx - r, cy - r * 0.4), size=(r * 2, r * 1.7))
-            # 头顶毛发
-            Color(0.85, 0.65, 0.45)
-            Ellipse(pos=(cx - r * 0.5, cy + r * 0.8), size=(r * 1, r * 0.6))
-            # 眼睛（大大的）
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r * 0.6, cy + r * 0.1), size=(r * 0.5, r * 0.5))
-            Ellipse(pos=(cx + r * 0.1, cy + r * 0.1), size=(r * 0.5, r * 0.5))
-            Color(*PAW_COLORS['skye'])
-            Ellipse(pos=(cx - r * 0.48, cy + r * 0.2), size=(r * 0.3, r * 0.3))
-            Ellipse(pos=(cx + r * 0.2, cy + r * 0.2), size=(r * 0.3, r * 0.3))
-            Color(0, 0, 0)
-            Ellipse(pos=(cx - r * 0.42, cy + r * 0.25), size=(r * 0.15, r * 0.15))
-            Ellipse(pos=(cx + r * 0.26, cy + r * 0.25), size=(r * 0.15, r * 0.15))
-            # 鼻子
-            Color(0.1, 0.1, 0.1)
-            Ellipse(pos=(cx - r * 0.15, cy - r * 0.15), size=(r * 0.3, r * 0.22))
-            # 飞行眼镜（在头顶）
-            Color(*PAW_COLORS['skye'])
-            Line(ellipse=(cx - r * 0.7, cy + r * 0.85, r * 0.55, r * 0.4, 0, 360), width=dp(2))
-            Line(ellipse=(cx + r * 0.15, cy + r * 0.85, r * 0.55, r * 0.4, 0, 360), width=dp(2))
-            Line(points=[cx - r * 0.15, cy + r * 1.05, cx + r * 0.15, cy + r * 1.05], width=dp(2))
-
-
-class RubbleHeadWidget(Widget):
+    def paint_head(self, cx, cy, r):
+        # 耳朵（长长的卷毛）
+        Color(0.85, 0.65, 0.45)
+        Ellipse(pos=(cx - r * 1.4, cy - r * 0.2), size=(r * 0.7, r * 1.4))
+        Ellipse(pos=(cx + r * 0.7, cy - r * 0.2), size=(r * 0.7, r * 1.4))
+        # 头
+        Color(0.9, 0.75, 0.55)
+        Ellipse(pos=(cx - r, cy - r * 0.4), size=(r * 2, r * 1.7))
+        # 头顶毛发
+        Color(0.85, 0.65, 0.45)
+        Ellipse(pos=(cx - r * 0.5, cy + r * 0.8), size=(r * 1, r * 0.6))
+        # 眼睛（大大的）
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r * 0.6, cy + r * 0.1), size=(r * 0.5, r * 0.5))
+        Ellipse(pos=(cx + r * 0.1, cy + r * 0.1), size=(r * 0.5, r * 0.5))
+        Color(*PAW_COLORS['skye'])
+        Ellipse(pos=(cx - r * 0.48, cy + r * 0.2), size=(r * 0.3, r * 0.3))
+        Ellipse(pos=(cx + r * 0.2, cy + r * 0.2), size=(r * 0.3, r * 0.3))
+        Color(0, 0, 0)
+        Ellipse(pos=(cx - r * 0.42, cy + r * 0.25), size=(r * 0.15, r * 0.15))
+        Ellipse(pos=(cx + r * 0.26, cy + r * 0.25), size=(r * 0.15, r * 0.15))
+        # 鼻子
+        Color(0.1, 0.1, 0.1)
+        Ellipse(pos=(cx - r * 0.15, cy - r * 0.15), size=(r * 0.3, r * 0.22))
+        # 飞行眼镜（在头顶）
+        Color(*PAW_COLORS['skye'])
+        Line(ellipse=(cx - r * 0.7, cy + r * 0.85, r * 0.55, r * 0.4, 0, 360), width=dp(2))
+        Line(ellipse=(cx + r * 0.15, cy + r * 0.85, r * 0.55, r * 0.4, 0, 360), width=dp(2))
+        Line(points=[cx - r * 0.15, cy + r * 1.05, cx + r * 0.15, cy + r * 1.05], width=dp(2))
+
+
+class RubbleHeadWidget(PuppyHeadWidget):
     """小砾头像 - 英国斗牛犬工程师"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.bind(size=self.draw, pos=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
-    
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.3
-        with self.canvas:
-            # 耳朵（小小的）
-            Color(0.55, 0.45, 0.35)
-            Ellipse(pos=(cx - r * 1.1, cy + r * 0.5), size=(r * 0.4, r * 0.5))
-            Ellipse(pos=(cx + r * 0.7, cy + r * 0.5), size=(r * 0.4, r * 0.5))
-            # 头（宽宽的）
-            Color(0.65, 0.55, 0.4)
-            Ellipse(pos=(cx - r * 1.1, cy - r * 0.5), size=(r * 2.2, r * 1.6))
-            # 脸部（浅色）
-            Color(0.9, 0.85, 0.75)
-            Ellipse(pos=(cx - r * 0.7, cy - r * 0.6), size=(r * 1.4, r * 1))
-            # 眼睛
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r * 0.55, cy + r * 0.05), size=(r * 0.4, r * 0.4))
-            Ellipse(pos=(cx + r * 0.15, cy + r * 0.05), size=(r * 0.4, r * 0.4))
-            Color(0.2, 0.15, 0.1)
-            Ellipse(pos=(cx - r * 0.45, cy + r * 0.12), size=(r * 0.22, r * 0.22))
-            Ellipse(pos=(cx + r * 0.23, cy + r * 0.12), size=(r * 0.22, r * 0.22))
-            # 鼻子（大大的）
-            Color(0.1, 0.1, 0.1)
-            Ellipse(pos=(cx - r * 0.22, cy - r * 0.35), size=(r * 0.44, r * 0.32))
-            # 工程帽
-            Color(*PAW_COLORS['rubble'])
-            Ellipse(pos=(cx - r * 0.8, cy + r * 0.7), size=(r * 1.6, r * 0.6))
-            Rectangle(pos=(cx - r * 0.65, cy + r * 1.1), size=(r * 1.3, r * 0.35))
-            # 帽子前沿
-            Color(0.2, 0.2, 0.2)
-            Rectangle(pos=(cx - r * 0.75, cy + r * 0.65), size=(r * 1.5, r * 0.12))
-
-
-class RockyHeadWidget(Widget):
+    def paint_head(self, cx, cy, r):
+        # 耳朵（小小的）
+        Color(0.55, 0.45, 0.35)
+        Ellipse(pos=(cx - r * 1.1, cy + r * 0.5), size=(r * 0.4, r * 0.5))
+        Ellipse(pos=(cx + r * 0.7, cy + r * 0.5), size=(r * 0.4, r * 0.5))
+        # 头（宽宽的）
+        Color(0.65, 0.55, 0.4)
+        Ellipse(pos=(cx - r * 1.1, cy - r * 0.5), size=(r * 2.2, r * 1.6))
+        # 脸部（浅色）
+        Color(0.9, 0.85, 0.75)
+        Ellipse(pos=(cx - r * 0.7, cy - r * 0.6), size=(r * 1.4, r * 1))
+        # 眼睛
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r * 0.55, cy + r * 0.05), size=(r * 0.4, r * 0.4))
+        Ellipse(pos=(cx + r * 0.15, cy + r * 0.05), size=(r * 0.4, r * 0.4))
+        Color(0.2, 0.15, 0.1)
+        Ellipse(pos=(cx - r * 0.45, cy + r * 0.12), size=(r * 0.22, r * 0.22))
+        Ellipse(pos=(cx + r * 0.23, cy + r * 0.12), size=(r * 0.22, r * 0.22))
+        # 鼻子（大大的）
+        Color(0.1, 0.1, 0.1)
+        Ellipse(pos=(cx - r * 0.22, cy - r * 0.35), size=(r * 0.44, r * 0.32))
+        # 工程帽
+        Color(*PAW_COLORS['rubble'])
+        Ellipse(pos=(cx - r * 0.8, cy + r * 0.7), size=(r * 1.6, r * 0.6))
+        Rectangle(pos=(cx - r * 0.65, cy + r * 1.1), size=(r * 1.3, r * 0.35))
+        # 帽子前沿
+        Color(0.2, 0.2, 0.2)
+        Rectangle(pos=(cx - r * 0.75, cy + r * 0.65), size=(r * 1.5, r * 0.12))
+
+
+class RockyHeadWidget(PuppyHeadWidget):
     """灰灰头像 - 混血狗环保员"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.bind(size=self.draw, pos=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
-    
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.3
-        with self.canvas:
-            # 耳朵（一只竖一只垂）
-            Color(0.5, 0.5, 0.5)
-            Triangle(points=[cx - r * 1, cy + r * 0.5, cx - r * 0.5, cy + r * 1.6, cx - r * 0.1, cy + r * 0.5])
-            Ellipse(pos=(cx + r * 0.6, cy + r * 0.3), size=(r * 0.5, r * 0.9))
-            # 头
-            Color(0.6, 0.6, 0.6)
-            Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.7))
-            # 脸部斑纹
-            Color(0.45, 0.45, 0.45)
-            Ellipse(pos=(cx - r * 0.3, cy + r * 0.3), size=(r * 0.8, r * 0.6))
-            # 眼睛
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r * 0.55, cy + r * 0.1), size=(r * 0.42, r * 0.42))
-            Ellipse(pos=(cx + r * 0.13, cy + r * 0.1), size=(r * 0.42, r * 0.42))
-            Color(0.2, 0.5, 0.2)
-            Ellipse(pos=(cx - r * 0.45, cy + r * 0.18), size=(r * 0.25, r * 0.25))
-            Ellipse(pos=(cx + r * 0.22, cy + r * 0.18), size=(r * 0.25, r * 0.25))
-            # 鼻子
-            Color(0.1, 0.1, 0.1)
-            Ellipse(pos=(cx - r * 0.16, cy - r * 0.2), size=(r * 0.32, r * 0.25))
-            # 环保帽
-            Color(*PAW_COLORS['rocky'])
-            Ellipse(pos=(cx - r * 0.7, cy + r * 0.9), size=(r * 1.4, r * 0.5))
-            # 回收标志
-            Color(1, 1, 1)
-            # 简化的回收箭头
-            Line(points=[cx - r * 0.15, cy + r * 1.05, cx, cy + r * 1.2, cx + r * 0.15, cy + r * 1.05], width=dp(2))
-
-
-class ZumaHeadWidget(Widget):
+    def paint_head(self, cx, cy, r):
+        # 耳朵（一只竖一只垂）
+        Color(0.5, 0.5, 0.5)
+        Triangle(points=[cx - r * 1, cy + r * 0.5, cx - r * 0.5, cy + r * 1.6, cx - r * 0.1, cy + r * 0.5])
+        Ellipse(pos=(cx + r * 0.6, cy + r * 0.3), size=(r * 0.5, r * 0.9))
+        # 头
+        Color(0.6, 0.6, 0.6)
+        Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.7))
+        # 脸部斑纹
+        Color(0.45, 0.45, 0.45)
+        Ellipse(pos=(cx - r * 0.3, cy + r * 0.3), size=(r * 0.8, r * 0.6))
+        # 眼睛
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r * 0.55, cy + r * 0.1), size=(r * 0.42, r * 0.42))
+        Ellipse(pos=(cx + r * 0.13, cy + r * 0.1), size=(r * 0.42, r * 0.42))
+        Color(0.2, 0.5, 0.2)
+        Ellipse(pos=(cx - r * 0.45, cy + r * 0.18), size=(r * 0.25, r * 0.25))
+        Ellipse(pos=(cx + r * 0.22, cy + r * 0.18), size=(r * 0.25, r * 0.25))
+        # 鼻子
+        Color(0.1, 0.1, 0.1)
+        Ellipse(pos=(cx - r * 0.16, cy - r * 0.2), size=(r * 0.32, r * 0.25))
+        # 环保帽
+        Color(*PAW_COLORS['rocky'])
+        Ellipse(pos=(cx - r * 0.7, cy + r * 0.9), size=(r * 1.4, r * 0.5))
+        # 回收标志
+        Color(1, 1, 1)
+        # 简化的回收箭头
+        Line(points=[cx - r * 0.15, cy + r * 1.05, cx, cy + r * 1.2, cx + r * 0.15, cy + r * 1.05], width=dp(2))
+
+
+class ZumaHeadWidget(PuppyHeadWidget):
     """路马头像 - 拉布拉多水上救援"""
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.bind(size=self.draw, pos=self.draw)
-        Clock.schedule_once(lambda dt: self.draw(), 0)
-    
-    def draw(self, *args):
-        self.canvas.clear()
-        cx, cy = self.center_x, self.center_y
-        r = min(self.width, self.height) * 0.3
-        with self.canvas:
-            # 耳朵（垂下的）
-            Color(0.5, 0.35, 0.2)
-            Ellipse(pos=(cx - r * 1.2, cy + r * 0.1), size=(r * 0.55, r * 1))
-            Ellipse(pos=(cx + r * 0.65, cy + r * 0.1), size=(r * 0.55, r * 1))
-            # 头
-            Color(0.6, 0.45, 0.25)
-            Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.8))
-            # 眼睛
-            Color(1, 1, 1)
-            Ellipse(pos=(cx - r * 0.55, cy + r * 0.15), size=(r * 0.45, r * 0.45))
-            Ellipse(pos=(cx + r * 0.1, cy + r * 0.15), size=(r * 0.45, r * 0.45))
-            Color(0.3, 0.2, 0.1)
-            Ellipse(pos=(cx - r * 0.42, cy + r * 0.25), size=(r * 0.25, r * 0.25))
-            Ellipse(pos=(cx + r * 0.2, cy + r * 0.25), size=(r * 0.25, r * 0.25))
-            # 鼻子
-            Color(0.15, 0.1, 0.05)
-            Ellipse(pos=(cx - r * 0.18, cy - r * 0.15), size=(r * 0.36, r * 0.28))
-            # 潜水头盔/帽子
-            Color(*PAW_COLORS['zuma'])
-            Ellipse(pos=(cx - r * 0.75, cy + r * 0.85), size=(r * 1.5, r * 0.6))
-            # 护目镜
-            Color(0.5, 0.8, 1, 0.7)
-            Line(ellipse=(cx - r * 0.5, cy + r * 0.9, r * 1, r * 0.4, 0, 360), width=dp(2))
+    def paint_head(self, cx, cy, r):
+        # 耳朵（垂下的）
+        Color(0.5, 0.35, 0.2)
+        Ellipse(pos=(cx - r * 1.2, cy + r * 0.1), size=(r * 0.55, r * 1))
+        Ellipse(pos=(cx + r * 0.65, cy + r * 0.1), size=(r * 0.55, r * 1))
+        # 头
+        Color(0.6, 0.45, 0.25)
+        Ellipse(pos=(cx - r, cy - r * 0.5), size=(r * 2, r * 1.8))
+        # 眼睛
+        Color(1, 1, 1)
+        Ellipse(pos=(cx - r * 0.55, cy + r * 0.15), size=(r * 0.45, r * 0.45))
+        Ellipse(pos=(cx + r * 0.1, cy + r * 0.15), size=(r * 0.45, r * 0.45))
+        Color(0.3, 0.2, 0.1)
+        Ellipse(pos=(cx - r * 0.42, cy + r * 0.25), size=(r * 0.25, r * 0.25))
+        Ellipse(pos=(cx + r * 0.2, cy + r * 0.25), size=(r * 0.25, r * 0.25))
+        # 鼻子
+        Color(0.15, 0.1, 0.05)
+        Ellipse(pos=(cx - r * 0.18, cy - r * 0.15), size=(r * 0.36, r * 0.28))
+        # 潜水头盔/帽子
+        Color(*PAW_COLORS['zuma'])
+        Ellipse(pos=(cx - r * 0.75, cy + r * 0.85), size=(r * 1.5, r * 0.6))
+        # 护目镜
+        Color(0.5, 0.8, 1, 0.7)
+        Line(ellipse=(cx - r * 0.5, cy + r * 0.9, r * 1, r * 0.4, 0, 360), width=dp(2))
 
 
 # ============================================================
@@ -518,16 +483,14 @@ def animate_paw_bounce(widget, height=20, duration=0.6):
     anim = Animation(y=original_y + dp(height), duration=duration * 0.4, t='out_quad')
     anim += Animation(y=original_y, duration=duration * 0.6, t='out_bounce')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_bone_spin(widget, duration=2):
     """骨头旋转动画"""
     def update_rotation(dt):
         widget.rotation = (widget.rotation + 5) % 360
-        widget.draw()
-    Clock.schedule_interval(update_rotation, duration / 72)
+    return track_clock(widget, update_rotation, duration / 72)
 
 
 def animate_tail_wag(widget, angle=20, duration=0.3):
@@ -536,8 +499,7 @@ def animate_tail_wag(widget, angle=20, duration=0.3):
     anim += Animation(rotation=-angle, duration=duration, t='in_out_sine')
     anim += Animation(rotation=0, duration=duration/2, t='in_out_sine')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 def animate_badge_shine(widget, duration=1.5):
@@ -545,8 +507,7 @@ def animate_badge_shine(widget, duration=1.5):
     anim = Animation(opacity=0.6, duration=duration/2, t='in_out_sine')
     anim += Animation(opacity=1, duration=duration/2, t='in_out_sine')
     anim.repeat = True
-    anim.start(widget)
-    return anim
+    return track_animation(widget, anim)
 
 
 # ============================================================
@@ -555,73 +516,48 @@ def animate_badge_shine(widget, duration=1.5):
 
 def create_paw_trail(parent, start_x, start_y, count=5):
     """创建爪印轨迹"""
+    emitter = get_emitter(parent)
     for i in range(count):
-        paw = PawPrintWidget(
-            color=PAW_COLORS['paw'],
-            size_hint=(None, None),
-            size=(dp(30), dp(30)),
-            pos=(start_x + i * dp(50), start_y + (i % 2) * dp(10))
+        x = start_x + i * dp(50) + dp(15)
+        y = start_y + (i % 2) * dp(10) + dp(15)
+        # 依次出现：0.3秒淡入，停1秒，0.5秒淡出
+        emitter.emit(
+            'paw', x, y, x, y,
+            size=dp(30), color=PAW_COLORS['paw'], alpha=0.7,
+            duration=1.8, delay=i * 0.3, fade_in=0.3, fade_out=0.5
         )
-        paw.opacity = 0
-        parent.add_widget(paw)
-        
-        # 依次出现
-        anim = Animation(opacity=0.7, duration=0.3)
-        anim += Animation(opacity=0.7, duration=1)
-        anim += Animation(opacity=0, duration=0.5)
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        Clock.schedule_once(lambda dt, p=paw, a=anim: a.start(p), i * 0.3)
 
 
 def create_bone_rain(parent, count=8):
     """骨头雨效果"""
     from kivy.core.window import Window
     
+    emitter = get_emitter(parent)
     for i in range(count):
-        bone = BoneWidget(
-            size_hint=(None, None),
-            size=(dp(40), dp(25)),
-            pos=(random.randint(50, int(Window.width - 50)), Window.height + dp(50))
+        x = random.randint(50, int(Window.width - 50))
+        emitter.emit(
+            'bone', x, Window.height + dp(50), x, random.randint(-50, 100),
+            size=dp(16), color=PAW_COLORS['bone'],
+            duration=random.uniform(2, 4), delay=i * 0.2,
+            rotation=random.randint(-30, 30), ease='in_quad'
         )
-        bone.rotation = random.randint(-30, 30)
-        parent.add_widget(bone)
-        
-        end_y = random.randint(-50, 100)
-        duration = random.uniform(2, 4)
-        
-        anim = Animation(y=end_y, duration=duration, t='in_quad')
-        anim &= Animation(opacity=0, duration=duration)
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        Clock.schedule_once(lambda dt, b=bone, a=anim: a.start(b), i * 0.2)
 
 
 def create_badge_burst(parent, x, y, count=6):
     """徽章爆炸效果"""
     colors = [PAW_COLORS['chase'], PAW_COLORS['marshall'], PAW_COLORS['skye'], 
               PAW_COLORS['rubble'], PAW_COLORS['rocky'], PAW_COLORS['zuma']]
+    emitter = get_emitter(parent)
     
     for i in range(count):
-        badge = PawBadgeWidget(
-            color=colors[i % len(colors)],
-            size_hint=(None, None),
-            size=(dp(35), dp(35)),
-            pos=(x - dp(17), y - dp(17))
-        )
-        parent.add_widget(badge)
-        
         angle = math.radians(i * (360 / count))
         distance = random.randint(80, 140)
-        end_x = x + distance * math.cos(angle)
-        end_y = y + distance * math.sin(angle)
-        
-        anim = Animation(
-            pos=(end_x, end_y),
-            opacity=0,
-            duration=random.uniform(0.8, 1.2),
-            t='out_quad'
+        emitter.emit(
+            'badge', x, y,
+            x + distance * math.cos(angle), y + distance * math.sin(angle),
+            size=dp(28), color=colors[i % len(colors)],
+            duration=random.uniform(0.8, 1.2)
         )
-        anim.bind(on_complete=lambda a, w: parent.remove_widget(w))
-        anim.start(badge)
 
 
 def create_puppy_celebration(parent, x, y):
@@ -751,7 +687,7 @@ def create_paw_patrol_scene(parent, style='full'):
             anim = Animation(y=original_y + dp(15), duration=2 + i * 0.3, t='in_out_sine')
             anim += Animation(y=original_y, duration=2 + i * 0.3, t='in_out_sine')
             anim.repeat = True
-            anim.start(bone)
+            track_animation(bone, anim)
     
     elif style == 'corners':
         create_paw_patrol_corners(parent)
@@ -6,13 +6,102 @@ from kivy.uix.widget import Widget
 from kivy.graphics import Color, Ellipse, Line, Rectangle, Triangle
 from kivy.metrics import dp
 
+from texture_cache import blit_cached
+
 
 class PictureCanvas(Widget):
-    """绘制汉字对应图片的画布"""
+    """绘制汉字对应图片的画布
+
+    每个（汉字, 尺寸档位）只离屏画一次，缓存成纹理（见 texture_cache），
+    之后尺寸/位置变化只是重新贴一张纹理。
+    """
+    
+    # 汉字 -> 绘图方法名（类属性，只建一次）
+    DRAW_FUNCS = {
+        '日': 'draw_sun',
+        '月': 'draw_moon',
+        '水': 'draw_water',
+        '火': 'draw_fire',
+        '山': 'draw_mountain',
+        '石': 'draw_stone',
+        '田': 'draw_field',
+        '土': 'draw_soil',
+        '人': 'draw_person',
+        '口': 'draw_mouth',
+        '手': 'draw_hand',
+        '足': 'draw_foot',
+        '大': 'draw_big',
+        '小': 'draw_small',
+        '上': 'draw_up',
+        '下': 'draw_down',
+        '天': 'draw_sky',
+        '地': 'draw_earth',
+        '花': 'draw_flower',
+        '草': 'draw_grass',
+        '树': 'draw_tree',
+        '鸟': 'draw_bird',
+        '爸': 'draw_father',
+        '妈': 'draw_mother',
+        '爷': 'draw_grandpa',
+        '奶': 'draw_grandma',
+        '哥': 'draw_brother',
+        '姐': 'draw_sister',
+        '弟': 'draw_young_brother',
+        '妹': 'draw_young_sister',
+        '吃': 'draw_eat',
+        '喝': 'draw_drink',
+        '看': 'draw_see',
+        '听': 'draw_hear',
+        '左': 'draw_left',
+        '右': 'draw_right',
+        # 新增汉字绘图
+        '风': 'draw_wind',
+        '宝': 'draw_baby',
+        '开': 'draw_open',
+        '关': 'draw_close',
+        '里': 'draw_inside',
+        '他': 'draw_he',
+        '工': 'draw_worker',
+        '儿': 'draw_child',
+        '老': 'draw_old',
+        '好': 'draw_good',
+        '饭': 'draw_rice',
+        '玩': 'draw_play',
+        '叔': 'draw_uncle',
+        '自': 'draw_self',
+        '姑': 'draw_aunt',
+        '娘': 'draw_girl',
+        '电': 'draw_electric',
+        '木': 'draw_wood',
+        '比': 'draw_compare',
+        '图': 'draw_picture',
+        '一': 'draw_one',
+        '三': 'draw_three',
+        '四': 'draw_four',
+        '五': 'draw_five',
+        '羊': 'draw_sheep',
+        '白': 'draw_white',
+        '牛': 'draw_cow',
+        '鼠': 'draw_mouse',
+        '心': 'draw_heart',
+        '可': 'draw_ok',
+        '说': 'draw_speak',
+        '两': 'draw_two',
+        '男': 'draw_boy',
+        '你': 'draw_you',
+        '不': 'draw_no',
+        '子': 'draw_kid',
+        '在': 'draw_at',
+        '头': 'draw_head',
+        '我': 'draw_me',
+        '房': 'draw_house',
+    }
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_char = None
+        # draw_xxx 画在 paper 上：平时是自己的 canvas，缓存时是离屏 Fbo
+        self.paper = self.canvas
         self.bind(size=self.redraw, pos=self.redraw)
     
     def redraw(self, *args):
@@ -22,98 +111,23 @@ class PictureCanvas(Widget):
     def draw_char(self, char):
         """根据汉字绘制对应图形"""
         self.current_char = char
+        side = min(self.width, self.height)
+        if blit_cached(self.canvas, ('picture', char), self.center, side, self._paint):
+            return
         self.canvas.clear()
-        
-        cx = self.center_x
-        cy = self.center_y
-        size = min(self.width, self.height) * 0.8
-        
-        draw_funcs = {
-            '日': self.draw_sun,
-            '月': self.draw_moon,
-            '水': self.draw_water,
-            '火': self.draw_fire,
-            '山': self.draw_mountain,
-            '石': self.draw_stone,
-            '田': self.draw_field,
-            '土': self.draw_soil,
-            '人': self.draw_person,
-            '口': self.draw_mouth,
-            '手': self.draw_hand,
-            '足': self.draw_foot,
-            '大': self.draw_big,
-            '小': self.draw_small,
-            '上': self.draw_up,
-            '下': self.draw_down,
-            '天': self.draw_sky,
-            '地': self.draw_earth,
-            '花': self.draw_flower,
-            '草': self.draw_grass,
-            '树': self.draw_tree,
-            '鸟': self.draw_bird,
-            '爸': self.draw_father,
-            '妈': self.draw_mother,
-            '爷': self.draw_grandpa,
-            '奶': self.draw_grandma,
-            '哥': self.draw_brother,
-            '姐': self.draw_sister,
-            '弟': self.draw_young_brother,
-            '妹': self.draw_young_sister,
-            '吃': self.draw_eat,
-            '喝': self.draw_drink,
-            '看': self.draw_see,
-            '听': self.draw_hear,
-            '左': self.draw_left,
-            '右': self.draw_right,
-            # 新增汉字绘图
-            '风': self.draw_wind,
-            '宝': self.draw_baby,
-            '开': self.draw_open,
-            '关': self.draw_close,
-            '里': self.draw_inside,
-            '他': self.draw_he,
-            '工': self.draw_worker,
-            '儿': self.draw_child,
-            '老': self.draw_old,
-            '好': self.draw_good,
-            '饭': self.draw_rice,
-            '玩': self.draw_play,
-            '叔': self.draw_uncle,
-            '自': self.draw_self,
-            '姑': self.draw_aunt,
-            '娘': self.draw_girl,
-            '电': self.draw_electric,
-            '木': self.draw_wood,
-            '比': self.draw_compare,
-            '图': self.draw_picture,
-            '一': self.draw_one,
-            '三': self.draw_three,
-            '四': self.draw_four,
-            '五': self.draw_five,
-            '羊': self.draw_sheep,
-            '白': self.draw_white,
-            '牛': self.draw_cow,
-            '鼠': self.draw_mouse,
-            '心': self.draw_heart,
-            '可': self.draw_ok,
-            '说': self.draw_speak,
-            '两': self.draw_two,
-            '男': self.draw_boy,
-            '你': self.draw_you,
-            '不': self.draw_no,
-            '子': self.draw_kid,
-            '在': self.draw_at,
-            '头': self.draw_head,
-            '我': self.draw_me,
-            '房': self.draw_house,
-        }
-        
-        func = draw_funcs.get(char, self.draw_default)
-        func(cx, cy, size)
+        self._paint(self.canvas, self.center_x, self.center_y, side)
+    
+    def _paint(self, canvas, cx, cy, side):
+        func = getattr(self, self.DRAW_FUNCS.get(self.current_char, 'draw_default'))
+        self.paper = canvas
+        try:
+            func(cx, cy, side * 0.8)
+        finally:
+            self.paper = self.canvas
     
     def draw_sun(self, cx, cy, size):
         """画太阳"""
-        with self.canvas:
+        with self.paper:
             # 太阳本体 - 黄色圆
             Color(1, 0.8, 0)
             r = size * 0.25
@@ -131,7 +145,7 @@ class PictureCanvas(Widget):
     
     def draw_moon(self, cx, cy, size):
         """画月亮"""
-        with self.canvas:
+        with self.paper:
             Color(1, 0.95, 0.6)
             r = size * 0.3
             Ellipse(pos=(cx - r, cy - r), size=(r*2, r*2))
@@ -141,7 +155,7 @@ class PictureCanvas(Widget):
 
     def draw_water(self, cx, cy, size):
         """画水滴"""
-        with self.canvas:
+        with self.paper:
             Color(0.2, 0.6, 1)
             # 水滴形状用线条
             r = size * 0.25
@@ -162,7 +176,7 @@ class PictureCanvas(Widget):
     
     def draw_fire(self, cx, cy, size):
         """画火焰"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 外层火焰 - 橙色
             Color(1, 0.5, 0)
@@ -191,7 +205,7 @@ class PictureCanvas(Widget):
     
     def draw_mountain(self, cx, cy, size):
         """画山"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             # 大山
             Color(0.4, 0.7, 0.3)
@@ -206,7 +220,7 @@ class PictureCanvas(Widget):
     
     def draw_stone(self, cx, cy, size):
         """画石头"""
-        with self.canvas:
+        with self.paper:
             Color(0.6, 0.6, 0.6)
             r = size * 0.3
             # 不规则石头形状
@@ -225,7 +239,7 @@ class PictureCanvas(Widget):
     
     def draw_field(self, cx, cy, size):
         """画田地"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             # 外框
             Color(0.6, 0.4, 0.2)
@@ -241,7 +255,7 @@ class PictureCanvas(Widget):
     
     def draw_soil(self, cx, cy, size):
         """画土"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.6, 0.4, 0.2)
             # 土堆形状
@@ -256,7 +270,7 @@ class PictureCanvas(Widget):
 
     def draw_person(self, cx, cy, size):
         """画人"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.9, 0.7, 0.5)
             # 头
@@ -272,7 +286,7 @@ class PictureCanvas(Widget):
     
     def draw_mouth(self, cx, cy, size):
         """画嘴巴/口"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(1, 0.6, 0.6)
             # 嘴唇外框
@@ -283,7 +297,7 @@ class PictureCanvas(Widget):
     
     def draw_hand(self, cx, cy, size):
         """画手"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.9, 0.75, 0.6)
             # 手掌
@@ -295,7 +309,7 @@ class PictureCanvas(Widget):
     
     def draw_foot(self, cx, cy, size):
         """画脚"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.9, 0.75, 0.6)
             # 脚掌
@@ -306,7 +320,7 @@ class PictureCanvas(Widget):
     
     def draw_big(self, cx, cy, size):
         """画大 - 一个大圆"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(1, 0.5, 0.3)
             Ellipse(pos=(cx - r, cy - r), size=(r*2, r*2))
@@ -315,14 +329,14 @@ class PictureCanvas(Widget):
     
     def draw_small(self, cx, cy, size):
         """画小 - 一个小圆"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.12
             Color(0.5, 0.8, 1)
             Ellipse(pos=(cx - r, cy - r), size=(r*2, r*2))
     
     def draw_up(self, cx, cy, size):
         """画上 - 向上箭头"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.3, 0.7, 0.3)
             # 箭头
@@ -331,7 +345,7 @@ class PictureCanvas(Widget):
     
     def draw_down(self, cx, cy, size):
         """画下 - 向下箭头"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.8, 0.4, 0.3)
             # 箭头
@@ -340,7 +354,7 @@ class PictureCanvas(Widget):
     
     def draw_left(self, cx, cy, size):
         """画左 - 向左箭头"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.3, 0.5, 0.8)
             Line(points=[cx + r, cy, cx - r*0.8, cy], width=dp(4))
@@ -348,7 +362,7 @@ class PictureCanvas(Widget):
     
     def draw_right(self, cx, cy, size):
         """画右 - 向右箭头"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.8, 0.5, 0.3)
             Line(points=[cx - r, cy, cx + r*0.8, cy], width=dp(4))
@@ -356,7 +370,7 @@ class PictureCanvas(Widget):
 
     def draw_sky(self, cx, cy, size):
         """画天空"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             # 蓝天
             Color(0.5, 0.8, 1)
@@ -372,7 +386,7 @@ class PictureCanvas(Widget):
     
     def draw_earth(self, cx, cy, size):
         """画大地"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             # 地面
             Color(0.6, 0.4, 0.2)
@@ -388,7 +402,7 @@ class PictureCanvas(Widget):
     
     def draw_flower(self, cx, cy, size):
         """画花"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.25
             # 花瓣
             Color(1, 0.5, 0.7)
@@ -409,7 +423,7 @@ class PictureCanvas(Widget):
     
     def draw_grass(self, cx, cy, size):
         """画草"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.3, 0.7, 0.3)
             # 多根草
@@ -423,7 +437,7 @@ class PictureCanvas(Widget):
     
     def draw_tree(self, cx, cy, size):
         """画树"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             # 树干
             Color(0.5, 0.3, 0.1)
@@ -436,7 +450,7 @@ class PictureCanvas(Widget):
     
     def draw_bird(self, cx, cy, size):
         """画鸟"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 身体
             Color(1, 0.8, 0.3)
@@ -455,7 +469,7 @@ class PictureCanvas(Widget):
 
     def draw_father(self, cx, cy, size):
         """画爸爸"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 头
             Color(0.9, 0.75, 0.6)
@@ -476,7 +490,7 @@ class PictureCanvas(Widget):
     
     def draw_mother(self, cx, cy, size):
         """画妈妈"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 头
             Color(0.9, 0.75, 0.6)
@@ -499,7 +513,7 @@ class PictureCanvas(Widget):
     
     def draw_grandpa(self, cx, cy, size):
         """画爷爷"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 头
             Color(0.9, 0.78, 0.65)
@@ -517,7 +531,7 @@ class PictureCanvas(Widget):
     
     def draw_grandma(self, cx, cy, size):
         """画奶奶"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 头
             Color(0.9, 0.78, 0.65)
@@ -536,7 +550,7 @@ class PictureCanvas(Widget):
     
     def draw_brother(self, cx, cy, size):
         """画哥哥"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             # 头
             Color(0.9, 0.75, 0.6)
@@ -554,7 +568,7 @@ class PictureCanvas(Widget):
     
     def draw_sister(self, cx, cy, size):
         """画姐姐"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             # 头
             Color(0.9, 0.75, 0.6)
@@ -573,7 +587,7 @@ class PictureCanvas(Widget):
     
     def draw_young_brother(self, cx, cy, size):
         """画弟弟"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.25
             # 头 - 稍大显得可爱
             Color(0.9, 0.75, 0.6)
@@ -591,7 +605,7 @@ class PictureCanvas(Widget):
     
     def draw_young_sister(self, cx, cy, size):
         """画妹妹"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.25
             # 头
             Color(0.9, 0.75, 0.6)
@@ -611,7 +625,7 @@ class PictureCanvas(Widget):
 
     def draw_eat(self, cx, cy, size):
         """画吃 - 碗和筷子"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 碗
             Color(1, 1, 1)
@@ -628,7 +642,7 @@ class PictureCanvas(Widget):
     
     def draw_drink(self, cx, cy, size):
         """画喝 - 杯子"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             # 杯子
             Color(0.8, 0.9, 1)
@@ -642,7 +656,7 @@ class PictureCanvas(Widget):
     
     def draw_see(self, cx, cy, size):
         """画看 - 眼睛"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             # 眼睛轮廓
             Color(1, 1, 1)
@@ -664,7 +678,7 @@ class PictureCanvas(Widget):
     
     def draw_hear(self, cx, cy, size):
         """画听 - 耳朵"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             # 耳朵外轮廓
             Color(0.9, 0.75, 0.6)
@@ -680,7 +694,7 @@ class PictureCanvas(Widget):
     
     def draw_default(self, cx, cy, size):
         """默认图形 - 问号"""
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.7, 0.7, 0.7)
             # 问号
@@ -690,7 +704,7 @@ class PictureCanvas(Widget):
     # ========== 新增汉字绘图函数 ==========
     
     def draw_wind(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.6, 0.8, 0.9)
             for i in range(3):
@@ -698,7 +712,7 @@ class PictureCanvas(Widget):
                 Line(points=[cx - r*0.8, cy + y_offset, cx + r*0.8, cy + y_offset], width=dp(3))
 
     def draw_baby(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.95, 0.8, 0.7)
             Ellipse(pos=(cx - r*0.4, cy + r*0.1), size=(r*0.8, r*0.8))
@@ -706,7 +720,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.35, cy - r*0.5), size=(r*0.7, r*0.6))
 
     def draw_open(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.6, 0.4, 0.2)
             Line(rectangle=(cx - r*0.6, cy - r*0.8, r*1.2, r*1.6), width=dp(3))
@@ -714,13 +728,13 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.5, cy - r*0.7), size=(r*0.8, r*1.4))
 
     def draw_close(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.5, 0.35, 0.2)
             Rectangle(pos=(cx - r*0.45, cy - r*0.75), size=(r*0.9, r*1.5))
 
     def draw_inside(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.8, 0.6, 0.4)
             Line(rectangle=(cx - r*0.6, cy - r*0.5, r*1.2, r*1.0), width=dp(3))
@@ -728,7 +742,7 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx - r*0.15, cy - r*0.15), size=(r*0.3, r*0.3))
 
     def draw_he(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.3, cy + r*0.3), size=(r*0.6, r*0.6))
@@ -736,7 +750,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.3, cy - r*0.4), size=(r*0.6, r*0.7))
 
     def draw_worker(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(1, 0.8, 0)
             Ellipse(pos=(cx - r*0.35, cy + r*0.5), size=(r*0.7, r*0.4))
@@ -746,7 +760,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.35, cy - r*0.5), size=(r*0.7, r*0.7))
 
     def draw_child(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.25
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.35, cy + r*0.25), size=(r*0.7, r*0.7))
@@ -754,7 +768,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.3, cy - r*0.4), size=(r*0.6, r*0.65))
 
     def draw_old(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.9, 0.78, 0.65)
             Ellipse(pos=(cx - r*0.3, cy + r*0.25), size=(r*0.6, r*0.6))
@@ -764,14 +778,14 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.3, cy - r*0.5), size=(r*0.6, r*0.75))
 
     def draw_good(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.9, 0.75, 0.6)
             Rectangle(pos=(cx - r*0.15, cy - r*0.6), size=(r*0.3, r*0.8))
             Ellipse(pos=(cx - r*0.2, cy + r*0.1), size=(r*0.4, r*0.5))
 
     def draw_rice(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.3, 0.5, 0.8)
             Line(points=[cx - r*0.5, cy, cx - r*0.35, cy - r*0.5, cx + r*0.35, cy - r*0.5, cx + r*0.5, cy], width=dp(3))
@@ -779,7 +793,7 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx - r*0.35, cy - r*0.1), size=(r*0.7, r*0.35))
 
     def draw_play(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(1, 0.4, 0.4)
             Ellipse(pos=(cx - r*0.5, cy - r*0.5), size=(r*1.0, r*1.0))
@@ -787,7 +801,7 @@ class PictureCanvas(Widget):
             Line(points=[cx - r*0.35, cy, cx + r*0.35, cy], width=dp(3))
 
     def draw_uncle(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.3, cy + r*0.3), size=(r*0.6, r*0.6))
@@ -795,7 +809,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.35, cy - r*0.45), size=(r*0.7, r*0.75))
 
     def draw_self(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.3, cy + r*0.2), size=(r*0.6, r*0.6))
@@ -803,7 +817,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.3, cy - r*0.5), size=(r*0.6, r*0.7))
 
     def draw_aunt(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.3, cy + r*0.3), size=(r*0.6, r*0.6))
@@ -811,7 +825,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.3, cy - r*0.45), size=(r*0.6, r*0.75))
 
     def draw_girl(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.3, cy + r*0.3), size=(r*0.6, r*0.6))
@@ -819,20 +833,20 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.35, cy - r*0.5), size=(r*0.7, r*0.8))
 
     def draw_electric(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(1, 0.9, 0.2)
             Line(points=[cx, cy + r*0.8, cx + r*0.2, cy, cx - r*0.1, cy, cx + r*0.1, cy - r*0.8], width=dp(5))
 
     def draw_wood(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.6, 0.4, 0.2)
             Rectangle(pos=(cx - r*0.15, cy - r*0.8), size=(r*0.3, r*1.2))
             Line(points=[cx - r*0.5, cy + r*0.2, cx, cy + r*0.4, cx + r*0.5, cy + r*0.2], width=dp(3))
 
     def draw_compare(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.25
             Color(0.4, 0.6, 0.9)
             Ellipse(pos=(cx - r*1.0, cy + r*0.3), size=(r*0.5, r*0.5))
@@ -842,7 +856,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx + r*0.55, cy - r*0.2), size=(r*0.4, r*0.7))
 
     def draw_picture(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.9, 0.85, 0.7)
             Rectangle(pos=(cx - r*0.6, cy - r*0.5), size=(r*1.2, r*1.0))
@@ -850,13 +864,13 @@ class PictureCanvas(Widget):
             Line(rectangle=(cx - r*0.6, cy - r*0.5, r*1.2, r*1.0), width=dp(3))
 
     def draw_one(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.9, 0.3, 0.3)
             Line(points=[cx - r*0.6, cy, cx + r*0.6, cy], width=dp(8))
 
     def draw_three(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.3, 0.7, 0.4)
             Line(points=[cx - r*0.5, cy + r*0.4, cx + r*0.5, cy + r*0.4], width=dp(6))
@@ -864,7 +878,7 @@ class PictureCanvas(Widget):
             Line(points=[cx - r*0.5, cy - r*0.4, cx + r*0.5, cy - r*0.4], width=dp(6))
 
     def draw_four(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.3, 0.5, 0.8)
             Line(rectangle=(cx - r*0.5, cy - r*0.5, r*1.0, r*1.0), width=dp(4))
@@ -872,14 +886,14 @@ class PictureCanvas(Widget):
             Line(points=[cx, cy - r*0.5, cx, cy + r*0.5], width=dp(3))
 
     def draw_five(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.8, 0.5, 0.2)
             Line(points=[cx - r*0.5, cy + r*0.5, cx + r*0.5, cy + r*0.5], width=dp(5))
             Line(points=[cx - r*0.5, cy - r*0.5, cx + r*0.5, cy - r*0.5], width=dp(5))
 
     def draw_sheep(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(1, 1, 1)
             Ellipse(pos=(cx - r*0.5, cy - r*0.3), size=(r*1.0, r*0.7))
@@ -889,7 +903,7 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx + r*0.02, cy + r*0.4), size=(dp(5), dp(5)))
 
     def draw_white(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(1, 1, 1)
             Ellipse(pos=(cx - r*0.5, cy - r*0.5), size=(r*1.0, r*1.0))
@@ -897,7 +911,7 @@ class PictureCanvas(Widget):
             Line(circle=(cx, cy, r*0.5), width=dp(2))
 
     def draw_cow(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.9, 0.85, 0.8)
             Ellipse(pos=(cx - r*0.6, cy - r*0.4), size=(r*1.2, r*0.8))
@@ -907,7 +921,7 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx + r*0.05, cy + r*0.35), size=(dp(6), dp(6)))
 
     def draw_mouse(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.7, 0.7, 0.7)
             Ellipse(pos=(cx - r*0.5, cy - r*0.3), size=(r*1.0, r*0.6))
@@ -917,14 +931,14 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx + r*0.15, cy + r*0.2), size=(r*0.35, r*0.4))
 
     def draw_heart(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(1, 0.3, 0.4)
             Ellipse(pos=(cx - r*0.5, cy), size=(r*0.5, r*0.5))
             Ellipse(pos=(cx, cy), size=(r*0.5, r*0.5))
 
     def draw_ok(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.3, 0.8, 0.4)
             Ellipse(pos=(cx - r*0.5, cy - r*0.5), size=(r*1.0, r*1.0))
@@ -932,7 +946,7 @@ class PictureCanvas(Widget):
             Line(points=[cx - r*0.25, cy, cx - r*0.05, cy - r*0.25, cx + r*0.3, cy + r*0.25], width=dp(5))
 
     def draw_speak(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.6, cy - r*0.1), size=(r*0.6, r*0.6))
@@ -940,14 +954,14 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx + r*0.1, cy + r*0.1), size=(r*0.7, r*0.5))
 
     def draw_two(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.9, 0.5, 0.3)
             Ellipse(pos=(cx - r*0.8, cy - r*0.3), size=(r*0.6, r*0.6))
             Ellipse(pos=(cx + r*0.2, cy - r*0.3), size=(r*0.6, r*0.6))
 
     def draw_boy(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.28
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.35, cy + r*0.3), size=(r*0.7, r*0.7))
@@ -955,21 +969,21 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.35, cy - r*0.45), size=(r*0.7, r*0.75))
 
     def draw_you(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.9, 0.75, 0.6)
             Rectangle(pos=(cx - r*0.6, cy - r*0.1), size=(r*0.8, r*0.25))
             Ellipse(pos=(cx + r*0.2, cy - r*0.15), size=(r*0.35, r*0.35))
 
     def draw_no(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(1, 0.3, 0.3)
             Line(circle=(cx, cy, r*0.5), width=dp(4))
             Line(points=[cx - r*0.35, cy + r*0.35, cx + r*0.35, cy - r*0.35], width=dp(4))
 
     def draw_kid(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.25
             Color(0.95, 0.8, 0.7)
             Ellipse(pos=(cx - r*0.4, cy + r*0.2), size=(r*0.8, r*0.8))
@@ -977,7 +991,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.35, cy - r*0.45), size=(r*0.7, r*0.65))
 
     def draw_at(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.35
             Color(0.8, 0.6, 0.4)
             Line(rectangle=(cx - r*0.5, cy - r*0.5, r*1.0, r*0.8), width=dp(3))
@@ -985,7 +999,7 @@ class PictureCanvas(Widget):
             Line(points=[cx - r*0.6, cy + r*0.3, cx, cy + r*0.8, cx + r*0.6, cy + r*0.3], width=dp(3))
 
     def draw_head(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.45, cy - r*0.1), size=(r*0.9, r*0.9))
@@ -993,7 +1007,7 @@ class PictureCanvas(Widget):
             Ellipse(pos=(cx - r*0.4, cy + r*0.5), size=(r*0.8, r*0.35))
 
     def draw_me(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.3
             Color(0.9, 0.75, 0.6)
             Ellipse(pos=(cx - r*0.3, cy + r*0.2), size=(r*0.6, r*0.6))
@@ -1001,7 +1015,7 @@ class PictureCanvas(Widget):
             Rectangle(pos=(cx - r*0.3, cy - r*0.5), size=(r*0.6, r*0.7))
 
     def draw_house(self, cx, cy, size):
-        with self.canvas:
+        with self.paper:
             r = size * 0.4
             Color(0.9, 0.85, 0.7)
             Rectangle(pos=(cx - r*0.5, cy - r*0.5), size=(r*1.0, r*0.8))
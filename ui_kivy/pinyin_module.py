@@ -22,6 +22,7 @@ import random
 
 from core.data_pinyin import PinyinData
 from core.game_logic import GameLogic, GameType
+from core.sampling import sample_distinct
 
 Window.size = (900, 700)
 
@@ -263,8 +264,7 @@ class PinyinQuizScreen(Screen):
         self.display_label.text = pinyin
         
         self.answers_layout.clear_widgets()
-        all_sounds = [p[1] for p in all_pinyin]
-        options = self.logic.get_random_options(sound, all_sounds, count=4)
+        options = self.logic.get_random_options(sound, all_pinyin, count=4, key=lambda p: p[1])
         
         for opt in options:
             btn = Button(text=opt, font_size='24sp',
@@ -387,8 +387,7 @@ class PinyinPictureScreen(Screen):
         self.desc_label.text = desc
         
         self.answers_layout.clear_widgets()
-        all_letters = [p[0] for p in all_pinyin]
-        options = self.logic.get_random_options(pinyin, all_letters, count=4)
+        options = self.logic.get_random_options(pinyin, all_pinyin, count=4, key=lambda p: p[0])
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4']
         for i, opt in enumerate(options):
@@ -716,7 +715,7 @@ class PinyinWhackScreen(Screen):
         mole_positions = random.sample(range(9), num_moles)
         
         # 确保目标拼音在其中
-        others = random.sample([p for p in all_pinyin if p[0] != self.target_pinyin], num_moles - 1)
+        others = sample_distinct(all_pinyin, num_moles - 1, exclude=(self.target_pinyin,), key=lambda p: p[0])
         pinyin_list = [self.target_pinyin] + [p[0] for p in others]
         random.shuffle(pinyin_list)
         
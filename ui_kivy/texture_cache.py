@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+离屏纹理缓存 v1.0
+看图识字的图片（PictureCanvas）和汪汪队狗狗头像由几十个 Kivy 图元拼成，
+每次尺寸/位置变化都要 canvas.clear() 再全部重建。
+这里改成：
+- 每个（图形, 尺寸档位）只画一次，画到离屏 Fbo 里得到一张纹理
+- 纹理放进 LRU 缓存（按显存字节数限制），之后每帧只是一个贴图矩形
+- 位置变化、同一档位内的尺寸变化都不再重画
+
+尺寸按 SIZE_STEP 像素分档，档位内略微缩放贴图，避免拖动窗口时反复重画。
+设置环境变量 LELE_TEXTURE_CACHE=0 可以关闭缓存，回到直接绘制。
+
+使用方法：
+    def paint(canvas, cx, cy, side):
+        with canvas:
+            Color(1, 0.8, 0)
+            Ellipse(pos=(cx - side / 4, cy - side / 4), size=(side / 2, side / 2))
+
+    blit_cached(widget.canvas, ("picture", "日"), widget.center, widget.width, paint)
+    print(get_texture_cache().stats())
+"""
+import math
+import os
+from collections import OrderedDict
+
+try:
+    from kivy.graphics import Fbo, ClearColor, ClearBuffers, Color, Rectangle
+    KIVY_AVAILABLE = True
+except ImportError:
+    KIVY_AVAILABLE = False
+
+# 尺寸档位（像素）
+SIZE_STEP = 32
+
+# 纹理比控件大一圈，画出控件范围一点点的图形（耳朵、光芒）也不会被裁掉
+MARGIN = 1.5
+
+# 缓存上限：24MB（RGBA 每像素 4 字节）
+DEFAULT_MAX_BYTES = 24 * 1024 * 1024
+
+
+def cache_enabled():
+    return os.environ.get("LELE_TEXTURE_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def size_bucket(side, step=SIZE_STEP):
+    """控件边长 -> 纹理边长（含 MARGIN，向上取整到 step 的倍数）"""
+    return max(step, int(math.ceil(side * MARGIN / step)) * step)
+
+
+class TextureCache:
+    """按字节数限制的 LRU 缓存（值可以是任何对象，方便不用 Kivy 测试）"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()     # key -> (value, nbytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def put(self, key, value, nbytes):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._items[key] = (value, nbytes)
+        self.bytes += nbytes
+        # 最近用过的至少保留一个
+        while self.bytes > self.max_bytes and len(self._items) > 1:
+            _, (_, size) = self._items.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+        return value
+
+    def get_or_create(self, key, nbytes, create):
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, create(), nbytes)
+        return value
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {"items": len(self._items), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
+_cache = None
+
+
+def get_texture_cache():
+    """获取全局纹理缓存"""
+    global _cache
+    if _cache is None:
+        _cache = TextureCache()
+    return _cache
+
+
+def render_texture(px, paint):
+    """把 paint(canvas, cx, cy, side) 画到 px x px 的离屏 Fbo 里，返回 Fbo（纹理是 fbo.texture）
+
+    保留 Fbo 本身：安卓切后台丢失 GL 上下文后，Fbo 会用自己的指令重画纹理。
+    """
+    fbo = Fbo(size=(px, px))
+    with fbo:
+        ClearColor(0, 0, 0, 0)
+        ClearBuffers()
+    paint(fbo, px / 2, px / 2, px / MARGIN)
+    fbo.draw()
+    return fbo
+
+
+def blit_cached(canvas, key, center, side, paint):
+    """在 canvas 上贴出缓存的图形；没有缓存时先离屏画一次
+
+    paint(canvas, cx, cy, side) 在给定的画布上画图（和直接画在控件上时一样），
+    side 是控件的边长。返回 False 表示没法用缓存（已关闭或 Fbo 不可用），
+    调用方应该直接画。
+    """
+    if not (KIVY_AVAILABLE and cache_enabled()) or side <= 0:
+        return False
+    px = size_bucket(side)
+    try:
+        fbo = get_texture_cache().get_or_create(
+            key + (px,), px * px * 4, lambda: render_texture(px, paint))
+    except Exception as e:
+        print(f"[texture_cache] 离屏绘制失败，改为直接绘制: {e}")
+        return False
+    shown = side * MARGIN
+    canvas.clear()
+    with canvas:
+        Color(1, 1, 1, 1)
+        Rectangle(texture=fbo.texture, pos=(center[0] - shown / 2, center[1] - shown / 2),
+                  size=(shown, shown))
+    return True
+
+
+__all__ = [
+    'TextureCache',
+    'get_texture_cache',
+    'size_bucket',
+    'render_texture',
+    'blit_cached',
+    'cache_enabled',
+    'SIZE_STEP',
+    'MARGIN',
+]
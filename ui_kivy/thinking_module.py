@@ -22,6 +22,7 @@ import random
 
 from core.data_thinking import ThinkingData
 from core.game_logic import GameLogic, GameType
+from core.sampling import sample_distinct
 
 Window.size = (900, 700)
 
@@ -149,7 +150,7 @@ class FindDifferentScreen(Screen):
         base = random.choice(shapes)
         items = [base] * 4
         self.correct_idx = random.randint(0, 3)
-        different = random.choice([s for s in shapes if s != base])
+        different = sample_distinct(shapes, 1, exclude=(base,))[0]
         items[self.correct_idx] = different
         
         self.items_layout.clear_widgets()
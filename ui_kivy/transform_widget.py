@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+变换装饰控件 v1.0
+星星、太阳、花朵这些装饰控件以前绑定了 rotation / scale，属性一变就
+canvas.clear() 再重新算一遍三角函数、重新建全部图形；配合 animate_rotate，
+屏幕上每颗星星每帧都要重建一次。
+这里改成：
+- 图形以控件中心为原点只建一次，放在 InstructionGroup 里
+- 位置变化只改 Translate，rotation 只改 Rotate.angle，scale 只改 Scale
+- 颜色变化（animate_color_cycle）只改对应的 Color 指令
+- 只有尺寸变化时才重建图形
+
+使用方法：
+    class StarWidget(TransformWidget):
+        def build(self):
+            r = min(self.width, self.height) * 0.4
+            self.paint('star_color')
+            self.add(Line(points=star_points(r), close=True))
+
+    star.rotation = 45          # 只改 Rotate 指令
+    star.star_color = (1, 0, 0)
+    star.recolor()              # 只改 Color 指令
+"""
+import math
+
+try:
+    from kivy.uix.widget import Widget
+    from kivy.properties import NumericProperty
+    from kivy.graphics import Color, PushMatrix, PopMatrix, Translate, Rotate, Scale
+    from kivy.graphics.instructions import InstructionGroup
+    from kivy.clock import Clock
+    KIVY_AVAILABLE = True
+except ImportError:
+    KIVY_AVAILABLE = False
+
+
+def star_points(r, inner=0.4, tips=5):
+    """五角星轮廓（以原点为中心，尖角朝上），返回 [x0, y0, x1, y1, ...]"""
+    points = []
+    step = 360 / tips
+    for i in range(tips):
+        angle = math.radians(90 + i * step)
+        points.extend([r * math.cos(angle), r * math.sin(angle)])
+        angle = math.radians(90 + i * step + step / 2)
+        points.extend([r * inner * math.cos(angle), r * inner * math.sin(angle)])
+    return points
+
+
+if KIVY_AVAILABLE:
+
+    class TransformWidget(Widget):
+        """只在尺寸变化时重建图形的装饰控件
+
+        子类实现 build()：以 (0, 0) 为控件中心，用 add() 添加会旋转的图形，
+        add_fixed() 添加不旋转的图形（例如太阳的脸），paint() 添加颜色。
+        canvas 结构：Translate(中心) -> Scale -> [Rotate -> 旋转部分] -> 固定部分
+        """
+        rotation = NumericProperty(0)
+        scale = NumericProperty(1)
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self._paints = []           # [(Color 指令, 属性名, 亮度系数, 透明度)]
+            self._built_size = None
+            self._translate = Translate(*self.center)
+            self._scale = Scale(self.scale)
+            self._rotate = Rotate(angle=self.rotation)
+            self._body = InstructionGroup()
+            self._fixed = InstructionGroup()
+            for instruction in (PushMatrix(), self._translate, self._scale,
+                                PushMatrix(), self._rotate, self._body, PopMatrix(),
+                                self._fixed, PopMatrix()):
+                self.canvas.add(instruction)
+            self.bind(size=self._on_size, pos=self._on_pos,
+                      rotation=self._on_rotation, scale=self._on_scale)
+            Clock.schedule_once(lambda dt: self.draw(), 0)
+
+        # ---------- 子类用 ----------
+
+        def build(self):
+            """建图形（子类实现），只在尺寸变化时调用"""
+
+        def add(self, instruction):
+            """添加跟着 rotation 旋转的图形"""
+            self._body.add(instruction)
+            return instruction
+
+        def add_fixed(self, instruction):
+            """添加不旋转的图形（仍然跟着平移和缩放）"""
+            self._fixed.add(instruction)
+            return instruction
+
+        def paint(self, attr, factor=1, alpha=None, fixed=False):
+            """添加一个取自 self.<attr> 的颜色，recolor() 时原地更新"""
+            color = Color(*self._color_of(attr, factor, alpha))
+            self._paints.append((color, attr, factor, alpha))
+            return self.add_fixed(color) if fixed else self.add(color)
+
+        # ---------- 对外 ----------
+
+        def draw(self, *args):
+            """强制重建图形（兼容原来的 draw() 调用）"""
+            self._built_size = None
+            self._on_size()
+
+        def recolor(self):
+            """颜色属性改了之后调用，只更新 Color 指令"""
+            for color, attr, factor, alpha in self._paints:
+                color.rgba = self._color_of(attr, factor, alpha)
+
+        # ---------- 内部 ----------
+
+        def _color_of(self, attr, factor, alpha):
+            value = getattr(self, attr)
+            rgb = [c * factor for c in value[:3]]
+            if alpha is None:
+                alpha = value[3] if len(value) > 3 else 1
+            return rgb + [alpha]
+
+        def _on_size(self, *args):
+            self._on_pos()
+            size = (self.width, self.height)
+            if size == self._built_size:
+                return
+            self._built_size = size
+            self._body.clear()
+            self._fixed.clear()
+            self._paints = []
+            self.build()
+
+        def _on_pos(self, *args):
+            self._translate.xy = self.center
+
+        def _on_rotation(self, instance, value):
+            self._rotate.angle = value
+
+        def _on_scale(self, instance, value):
+            self._scale.xyz = (value, value, 1)
+
+
+__all__ = ['TransformWidget', 'star_points', 'KIVY_AVAILABLE']
@@ -368,8 +368,7 @@ class VehiclesQuizScreen(Screen):
         name, vtype, emoji, color, desc = self.current_vehicle
         self.display_label.text = desc
         self.answers_layout.clear_widgets()
-        all_names = [v[0] for v in vehicles]
-        options = self.logic.get_random_options(name, all_names, count=4)
+        options = self.logic.get_random_options(name, vehicles, count=4, key=lambda v: v[0])
         for opt in options:
             btn = Button(text=opt, font_size='20sp',
                         background_color=get_color_from_hex('#64B5F6'), background_normal='')
@@ -1,12 +1,22 @@
 """
-语音配置共享模块 v1.2
+语音配置共享模块 v1.3
 用于在各个学习模块之间共享语音风格设置
 集成学习数据管理、休息提醒、安全退出
 优化：使用ui_config统一路径管理
+优化：语音配置缓存在内存里，每次说话取语音不再读文件；
+      最多每 CONFIG_CHECK_INTERVAL 秒看一次文件修改时间，改了才重新读，
+      save_voice_config() 经 config_manager 保存，订阅了语音配置的模块立即收到；
+      别处直接改了文件时调用 notify_voice_config_changed()
+
+使用方法：
+    voice = get_voice()                      # 内存里取，不读文件
+    save_voice_config({"style": "温柔姐姐"})  # 保存并刷新缓存
+    notify_voice_config_changed()            # 别处写了配置文件后通知
 """
 
 import os
 import json
+import time
 import threading
 from datetime import datetime
 
@@ -189,23 +199,127 @@ if UI_CONFIG_AVAILABLE:
 else:
     CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "voice_config.json")
 
-def load_voice_config():
-    """加载语音配置"""
+# 检查配置文件有没有被改过的最短间隔（秒）
+CONFIG_CHECK_INTERVAL = 2.0
+
+DEFAULT_STYLE = "汪汪队风格"
+
+_config_lock = threading.Lock()
+# 缓存：配置、风格名、风格、文件标记（修改时间+大小）、上次检查时间
+_config_cache = None
+
+
+def _file_stamp():
+    """配置文件的 (修改时间, 大小)；文件不存在时为 None"""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_config_file():
+    """读配置文件，返回 (配置, 文件标记)；文件不存在或读不了时用默认配置"""
+    mtime = _file_stamp()
+    if mtime is None:
+        return {"style": DEFAULT_STYLE}, None
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if isinstance(config, dict):
+            return config, mtime
     except:
         pass
-    return {"style": "汪汪队风格"}
+    return {"style": DEFAULT_STYLE}, mtime
 
-def get_current_style():
-    """获取当前语音风格"""
-    config = load_voice_config()
-    style_name = config.get("style", "汪汪队风格")
+
+def _make_cache(config, mtime, now):
+    style_name = config.get("style", DEFAULT_STYLE)
     if style_name not in VOICE_STYLES:
-        style_name = "汪汪队风格"
-    return style_name, VOICE_STYLES[style_name]
+        style_name = DEFAULT_STYLE
+    return {"config": config, "style_name": style_name,
+            "style": VOICE_STYLES[style_name], "mtime": mtime, "checked": now}
+
+
+def _get_cache():
+    """取缓存的配置；到了检查间隔才看一眼文件修改时间"""
+    global _config_cache
+    cache = _config_cache
+    now = time.monotonic()
+    if cache is not None and now - cache["checked"] < CONFIG_CHECK_INTERVAL:
+        return cache
+    with _config_lock:
+        cache = _config_cache
+        if cache is not None and now - cache["checked"] < CONFIG_CHECK_INTERVAL:
+            return cache
+        mtime = _file_stamp()
+        if cache is not None and mtime == cache["mtime"]:
+            cache["checked"] = now
+            return cache
+        config, mtime = _read_config_file()
+        _config_cache = _make_cache(config, mtime, now)
+        return _config_cache
+
+
+def notify_voice_config_changed():
+    """配置文件被改过了（设置界面保存后调用），下次取配置时重新读"""
+    global _config_cache
+    with _config_lock:
+        _config_cache = None
+
+
+def load_voice_config():
+    """加载语音配置（返回副本，改了不影响缓存）"""
+    return dict(_get_cache()["config"])
+
+
+def _on_voice_config_changed(config_name, changes, snapshot):
+    """配置管理器里的语音配置改了：直接换缓存，不等下次检查文件"""
+    global _config_cache
+    with _config_lock:
+        _config_cache = _make_cache(dict(snapshot), _file_stamp(), time.monotonic())
+
+
+# 语音配置经配置管理器保存，改了以后推送给所有订阅者（包括本模块的缓存）
+try:
+    from config_manager import config_manager as _config_manager
+    _config_manager.subscribe("voice", _on_voice_config_changed)
+except ImportError:
+    _config_manager = None
+
+
+def _write_config_file(config):
+    try:
+        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+        return True
+    except Exception as e:
+        print(f"保存配置失败: {e}")
+        return False
+
+
+def save_voice_config(config):
+    """保存语音配置（立即写入），并立即刷新缓存
+
+    有配置管理器时经它保存，订阅了语音配置的模块马上收到新风格。
+    """
+    global _config_cache
+    if _config_manager is not None:
+        ok = _config_manager.save("voice", config)
+    else:
+        ok = _write_config_file(config)
+    if not ok:
+        notify_voice_config_changed()
+        return False
+    with _config_lock:
+        _config_cache = _make_cache(dict(config), _file_stamp(), time.monotonic())
+    return True
+
+
+def get_current_style():
+    """获取当前语音风格（内存缓存）"""
+    cache = _get_cache()
+    return cache["style_name"], cache["style"]
 
 def get_voice():
     """获取当前语音"""
@@ -240,7 +354,7 @@ def get_learning_data():
             _learning_data = None
     return _learning_data
 
-def record_answer(module, points, is_correct, question_data=None):
+def record_answer(module, points, is_correct, question_data=None, response_time=None):
     """记录答题结果
     
     Args:
@@ -248,6 +362,7 @@ def record_answer(module, points, is_correct, question_data=None):
         points: 得分
         is_correct: 是否正确
         question_data: 错题数据（可选）
+        response_time: 答题用时（秒，可选）
     
     Returns:
         dict: {"badges": 新徽章列表, "level_change": 难度变化("up"/"down"/None), "new_level": 新等级}
@@ -259,7 +374,7 @@ def record_answer(module, points, is_correct, question_data=None):
     # 记录答题前的等级
     old_level = ld.get_level(module)
     
-    new_badges = ld.add_score(module, points, is_correct)
+    new_badges = ld.add_score(module, points, is_correct, response_time)
     
     # 记录错题
     if not is_correct and question_data:
@@ -1,5 +1,5 @@
 @echo off
 chcp 65001 >nul
 title 乐乐的交通乐园
-python kids_vehicles.py
+python kids_vehicles.py %*
 pause
@@ -1,5 +1,5 @@
 @echo off
 chcp 65001 >nul
 title 乐乐的学习乐园
-python kids_learning_main.py
+python kids_learning_main.py %*
 pause
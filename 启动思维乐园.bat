@@ -1,5 +1,5 @@
 @echo off
 chcp 65001 >nul
 title 乐乐的思维乐园
-python kids_thinking.py
+python kids_thinking.py %*
 pause
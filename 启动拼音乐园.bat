@@ -1,5 +1,5 @@
 @echo off
 chcp 65001 >nul
 title 乐乐的拼音乐园
-python kids_pinyin.py
+python kids_pinyin.py %*
 pause
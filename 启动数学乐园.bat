@@ -1,4 +1,4 @@
 @echo off
 title 乐乐的数学乐园
-python kids_math.py
+python kids_math.py %*
 pause
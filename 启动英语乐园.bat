@@ -1,5 +1,5 @@
 @echo off
 chcp 65001 >nul
 title 乐乐的英语乐园
-python kids_english.py
+python kids_english.py %*
 pause
@@ -2,5 +2,5 @@
 chcp 65001 >nul
 title 乐乐的识字乐园
 cd /d "%~dp0"
-python ui_kivy/chinese_app.py
+python ui_kivy/chinese_app.py %*
 pause
@@ -1,5 +1,5 @@
 
 @echo off
 title 乐乐的识字小课堂
-python kids_game_v3.py
+python kids_game_v3.py %*
 pause